@@ -0,0 +1,111 @@
+import asyncio
+from typing import Dict, List, Optional, Set, Tuple
+from client_keycloak import AsyncKeycloakClient
+from client_emf import AsyncEMFClient
+from credentials import iter_org_projects
+from config import Config
+from tracing import get_tracer
+from utils import ONBOARDING_SUFFIX
+
+SINGLE_ORG = "single-org"
+SINGLE_ONBOARDING = "single-onboarding"
+
+class Violation:
+    __slots__ = ("user_id", "username", "rule", "detail")
+
+    def __init__(self, user_id: str, username: str, rule: str, detail: str):
+        self.user_id = user_id
+        self.username = username
+        self.rule = rule
+        self.detail = detail
+
+    def to_dict(self) -> Dict[str, str]:
+        return {"username": self.username, "user_id": self.user_id, "rule": self.rule, "detail": self.detail}
+
+class TenancyAudit:
+    """
+    Realm-wide check of the multi-tenancy rules that validate_user_constraints
+    only approximates per user: every user belongs to at most one Org and to
+    at most one Edge-Onboarding-Group.
+
+    Everything is loaded once: the Orgs, each Org's Projects (as its
+    {org}-admin, from `credentials`) for the Project -> Org UUID map, the
+    group index, and the members of every tenant group. The rules are then
+    set operations over {user: group ids}, with no per-user requests.
+    Groups of Projects whose Org has no credentials cannot be attributed to
+    an Org; they are counted in `unmapped` and never reported as violations.
+    """
+    def __init__(self, kc: AsyncKeycloakClient, emf: AsyncEMFClient, credentials: Optional[Dict[str, str]] = None,
+                 workers: int = Config.BULK_WORKERS):
+        self.kc = kc
+        self.emf = emf
+        self.credentials = credentials or {}
+        self.workers = workers
+        self.org_names: Dict[str, str] = {}        # Org UUID -> name
+        self.owner: Dict[str, str] = {}            # Org or Project UUID -> Org UUID
+        self.labels: Dict[str, str] = {}           # Org or Project UUID -> "org" / "org/project"
+        self.groups: Dict[str, Tuple[str, str]] = {}   # group id -> (UUID, suffix)
+        self.members: Dict[str, Set[str]] = {}     # user id -> tenant group ids
+        self.usernames: Dict[str, str] = {}
+        self.unmapped: Set[str] = set()
+        self.errors: List[str] = []
+
+    async def load(self):
+        with get_tracer().span("audit load"):
+            records, _ = await asyncio.gather(self.emf.list_org_records(), self.kc.groups.load())
+            live = {}
+            for r in records:
+                if r.name and r.uid:
+                    live[r.name] = r.uid
+                    self.org_names[r.uid] = self.labels[r.uid] = r.name
+                    self.owner[r.uid] = r.uid
+            targets = {o: p for o, p in self.credentials.items() if o in live}
+            async for org, projects, error in iter_org_projects(targets, self.workers):
+                if error:
+                    self.errors.append(f"{org}: cannot list projects: {error}")
+                for p in projects:
+                    if p.uid:
+                        self.owner[p.uid] = live[org]
+                        self.labels[p.uid] = f"{org}/{p.name}"
+            await self._load_members()
+
+    async def _load_members(self):
+        slots = asyncio.Semaphore(Config.MEMBERSHIP_CONCURRENCY)
+
+        async def members(group: Dict):
+            async with slots:
+                try:
+                    return group["id"], await self.kc.group_members(group["id"])
+                except Exception as e:
+                    self.errors.append(f"{group['name']}: cannot list members: {e}")
+                    return group["id"], []
+
+        for uuid, by_suffix in self.kc.groups.by_uuid.items():
+            for suffix, g in by_suffix.items():
+                self.groups[g["id"]] = (uuid, suffix)
+        tenant_groups = [g for by_suffix in self.kc.groups.by_uuid.values() for g in by_suffix.values()]
+        for group_id, users in await asyncio.gather(*(members(g) for g in tenant_groups)):
+            for u in users:
+                self.members.setdefault(u["id"], set()).add(group_id)
+                self.usernames[u["id"]] = u["username"]
+
+    @property
+    def memberships(self) -> int:
+        return sum(len(g) for g in self.members.values())
+
+    def check(self) -> List[Violation]:
+        violations = []
+        for user_id, group_ids in self.members.items():
+            uuids = {self.groups[g][0] for g in group_ids}
+            self.unmapped |= uuids - self.owner.keys()
+            orgs = {self.owner[u] for u in uuids if u in self.owner}
+            username = self.usernames[user_id]
+            if len(orgs) > 1:
+                names = sorted(self.org_names.get(o, o) for o in orgs)
+                violations.append(Violation(user_id, username, SINGLE_ORG, ", ".join(names)))
+            onboarding = {self.groups[g][0] for g in group_ids if self.groups[g][1] == ONBOARDING_SUFFIX}
+            if len(onboarding) > 1:
+                names = sorted(self.labels.get(u, u) for u in onboarding)
+                violations.append(Violation(user_id, username, SINGLE_ONBOARDING, ", ".join(names)))
+        violations.sort(key=lambda v: (v.username, v.rule))
+        return violations
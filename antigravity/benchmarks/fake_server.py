@@ -0,0 +1,647 @@
+"""
+In-process stand-in for the EMF tenancy API and the Keycloak endpoints the
+clients use, for measuring round trips and wall time without a live cluster.
+
+Orgs and Projects go through STATUS_INDICATION_IN_PROGRESS and become IDLE
+after `provision_delay` seconds; their Keycloak groups only appear then, as
+with the real tenant controller. Every request can be delayed (`latency` +
+random `jitter`) and answered with a 429 or 5xx at the given rates. Each
+Project gets `hosts` Edge Infrastructure Manager hosts once it is IDLE;
+edge clusters built from them are ready about `cluster_delay` seconds after
+creation (or fail if a node is not one of the Project's hosts).
+
+    python benchmarks/fake_server.py --port 8080 --provision-delay 2 --latency 0.02
+    KEYCLOAK_URL=http://127.0.0.1:8080 EMF_API_URL=http://127.0.0.1:8080 python main.py org list
+"""
+import argparse
+import asyncio
+import math
+import random
+import secrets
+import threading
+import time
+import uuid
+from typing import Dict, List, Optional, Tuple
+from aiohttp import web
+
+STATUS_IN_PROGRESS = "STATUS_INDICATION_IN_PROGRESS"
+STATUS_IDLE = "STATUS_INDICATION_IDLE"
+
+ORG_SUFFIXES = ["Project-Manager-Group"]
+PROJECT_SUFFIXES = ["Edge-Manager-Group", "Edge-Onboarding-Group", "Edge-Operator-Group", "Host-Manager-Group"]
+TEMPLATES = [
+    {"name": "baseline", "version": "v2.0.0", "kubernetesVersion": "v1.30.6+rke2r1", "description": "Baseline cluster"},
+    {"name": "privileged", "version": "v2.0.0", "kubernetesVersion": "v1.30.6+rke2r1", "description": "Privileged pods"},
+]
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile; 0.0 for an empty list."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+class RequestLog:
+    """Every request the fake served: (method, route template, status, seconds)."""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.entries: List[Tuple[str, str, int, float]] = []
+
+    def add(self, method: str, route: str, status: int, seconds: float):
+        with self._lock:
+            self.entries.append((method, route, status, seconds))
+
+    def reset(self) -> List[Tuple[str, str, int, float]]:
+        with self._lock:
+            entries, self.entries = self.entries, []
+        return entries
+
+    def summary(self) -> Dict:
+        with self._lock:
+            entries = list(self.entries)
+        routes: Dict[str, int] = {}
+        for method, route, _, _ in entries:
+            key = f"{method} {route}"
+            routes[key] = routes.get(key, 0) + 1
+        latencies = [e[3] for e in entries]
+        return {
+            "requests": len(entries),
+            "errors": sum(1 for e in entries if e[2] == 429 or e[2] >= 500),
+            "p50": percentile(latencies, 50),
+            "p99": percentile(latencies, 99),
+            "routes": routes,
+        }
+
+class FakeCluster:
+    def __init__(
+        self,
+        realm: str = "master",
+        admin_user: str = "admin",
+        admin_pass: str = "admin",
+        provision_delay: float = 1.0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_429: float = 0.0,
+        error_5xx: float = 0.0,
+        token_lifetime: int = 300,
+        hosts: int = 0,
+        cluster_delay: float = 3.0,
+        seed: Optional[int] = None,
+    ):
+        self.realm = realm
+        self.provision_delay = provision_delay
+        self.latency = latency
+        self.jitter = jitter
+        self.error_429 = error_429
+        self.error_5xx = error_5xx
+        self.token_lifetime = token_lifetime
+        self.hosts_per_project = hosts
+        self.cluster_delay = cluster_delay
+        self.random = random.Random(seed)
+        self.log = RequestLog()
+
+        self.users: Dict[str, Dict] = {}          # id -> user
+        self.passwords: Dict[str, str] = {}       # username -> password
+        self.groups: Dict[str, Dict] = {}         # id -> group
+        self.members: Dict[str, set] = {}         # user id -> group ids
+        self.tokens: Dict[str, Tuple[str, float]] = {}   # access token -> (username, expires)
+        self.refresh_tokens: Dict[str, str] = {}  # refresh token -> username
+        self.orgs: Dict[str, Dict] = {}
+        self.projects: Dict[Tuple[Optional[str], str], Dict] = {}  # (org uuid, name) -> project
+        self.hosts: Dict[str, List[Dict]] = {}    # project uuid -> hosts ordered by resourceId
+        self.clusters: Dict[str, Dict[str, Dict]] = {}   # project uuid -> name -> edge cluster
+
+        admin_id = self._add_user(admin_user, admin_pass)
+        self.members[admin_id] = {self._add_group("org-admin-group")["id"]}
+
+        self.url: Optional[str] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._runner: Optional[web.AppRunner] = None
+        self._thread: Optional[threading.Thread] = None
+
+    # State
+
+    def _add_user(self, username: str, password: str, email: Optional[str] = None) -> str:
+        user_id = str(uuid.uuid4())
+        self.users[user_id] = {
+            "id": user_id, "username": username.lower(), "enabled": True,
+            "email": email, "createdTimestamp": int(time.time() * 1000),
+        }
+        self.passwords[username.lower()] = password
+        return user_id
+
+    def _add_group(self, name: str) -> Dict:
+        group = {"id": str(uuid.uuid4()), "name": name, "path": f"/{name}", "subGroups": []}
+        self.groups[group["id"]] = group
+        return group
+
+    def _user_by_name(self, username: str) -> Optional[Dict]:
+        username = username.lower()
+        return next((u for u in self.users.values() if u["username"] == username), None)
+
+    def _settle(self):
+        """
+        Moves resources whose provisioning delay elapsed to IDLE and creates
+        their groups; removes deleted ones (and their groups) once it elapsed.
+        """
+        now = time.monotonic()
+        for table in (self.orgs, self.projects):
+            for key in [k for k, rec in table.items() if rec.get("delete_at", now + 1) <= now]:
+                self._purge(table.pop(key)["uid"])
+        for rec, suffixes in [(o, ORG_SUFFIXES) for o in self.orgs.values()] + \
+                             [(p, PROJECT_SUFFIXES) for p in self.projects.values()]:
+            if rec["status"] == STATUS_IN_PROGRESS and now >= rec["ready_at"]:
+                rec["status"] = STATUS_IDLE
+                for s in suffixes:
+                    self._add_group(f"{rec['uid']}_{s}")
+                if suffixes is PROJECT_SUFFIXES:
+                    self.hosts[rec["uid"]] = [self._new_host(i) for i in range(self.hosts_per_project)]
+
+    def _purge(self, uid: str):
+        """Drops the groups, hosts and clusters of a deleted Org or Project."""
+        gone = {gid for gid, g in self.groups.items() if g["name"].startswith(f"{uid}_")}
+        for gid in gone:
+            del self.groups[gid]
+        for groups in self.members.values():
+            groups -= gone
+        self.hosts.pop(uid, None)
+        self.clusters.pop(uid, None)
+
+    def _new_host(self, i: int) -> Dict:
+        states = ["Running"] * 8 + ["Error", "Provisioning"]
+        return {
+            "resourceId": f"host-{secrets.token_hex(4)}", "name": f"edge-{i:05d}",
+            "uuid": str(uuid.uuid4()), "serialNumber": f"SN{i:08d}",
+            "hostStatus": self.random.choice(states),
+            "site": {"resourceId": "site-0000abcd"} if i % 5 else None,
+        }
+
+    def _org_scope(self, username: str) -> Optional[str]:
+        """The org UUID a user administers (via its Project-Manager-Group), else None."""
+        user = self._user_by_name(username)
+        for gid in self.members.get(user["id"], ()) if user else ():
+            name = self.groups[gid]["name"]
+            if name.endswith("_Project-Manager-Group"):
+                return name.split("_", 1)[0]
+        return None
+
+    @staticmethod
+    def _record(kind: str, rec: Dict, with_name: bool) -> Dict:
+        data = {
+            "spec": {"description": rec["description"]},
+            "status": {f"{kind}Status": {
+                "statusIndicator": rec["status"],
+                "message": "Deleting" if "delete_at" in rec else "Ready" if rec["status"] == STATUS_IDLE else "Provisioning",
+                "timeStamp": rec["timestamp"],
+                "uID": rec["uid"],
+            }},
+        }
+        if with_name:
+            data["name"] = rec["name"]
+        return data
+
+    def _new_resource(self, name: str, description: str) -> Dict:
+        return {
+            "name": name, "description": description, "uid": str(uuid.uuid4()),
+            "status": STATUS_IN_PROGRESS, "ready_at": time.monotonic() + self.provision_delay,
+            "timestamp": int(time.time()),
+        }
+
+    # Middleware
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        start = time.monotonic()
+        route = request.match_info.route.resource
+        template = route.canonical if route is not None else request.path
+        try:
+            delay = self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0)
+            if delay:
+                await asyncio.sleep(delay)
+            self._settle()
+            roll = self.random.random()
+            if roll < self.error_429:
+                resp = web.json_response({"error": "Too Many Requests"}, status=429, headers={"Retry-After": "1"})
+            elif roll < self.error_429 + self.error_5xx:
+                resp = web.json_response({"error": "Service Unavailable"}, status=503)
+            else:
+                resp = await handler(request)
+        except web.HTTPException as e:
+            resp = web.Response(status=e.status, text=e.text, content_type=e.content_type)
+        self.log.add(request.method, template, resp.status, time.monotonic() - start)
+        return resp
+
+    def _caller(self, request: web.Request) -> str:
+        auth = request.headers.get("Authorization", "")
+        entry = self.tokens.get(auth[len("Bearer "):]) if auth.startswith("Bearer ") else None
+        if not entry or entry[1] < time.time():
+            raise web.HTTPUnauthorized(text='{"error":"HTTP 401 Unauthorized"}', content_type="application/json")
+        return entry[0]
+
+    # Keycloak
+
+    async def token(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        grant = form.get("grant_type")
+        if grant == "password":
+            username = (form.get("username") or "").lower()
+            if self.passwords.get(username) != form.get("password"):
+                return web.json_response({"error": "invalid_grant", "error_description": "Invalid user credentials"}, status=401)
+        elif grant == "refresh_token":
+            username = self.refresh_tokens.pop(form.get("refresh_token"), None)
+            if username is None:
+                return web.json_response({"error": "invalid_grant", "error_description": "Token is not active"}, status=400)
+        else:
+            return web.json_response({"error": "unsupported_grant_type"}, status=400)
+
+        access, refresh = secrets.token_hex(16), secrets.token_hex(16)
+        self.tokens[access] = (username, time.time() + self.token_lifetime)
+        self.refresh_tokens[refresh] = username
+        return web.json_response({
+            "access_token": access, "expires_in": self.token_lifetime,
+            "refresh_token": refresh, "refresh_expires_in": 1800, "token_type": "Bearer",
+        })
+
+    async def realm_info(self, request: web.Request) -> web.Response:
+        self._caller(request)
+        return web.json_response({"realm": self.realm, "passwordPolicy": "length(8)"})
+
+    async def list_users(self, request: web.Request) -> web.Response:
+        self._caller(request)
+        q = request.query
+        users = sorted(self.users.values(), key=lambda u: u["createdTimestamp"])
+        if "username" in q:
+            name = q["username"].lower()
+            exact = q.get("exact") == "true"
+            users = [u for u in users if (u["username"] == name if exact else name in u["username"])]
+        if "search" in q:
+            term = q["search"].lower()
+            users = [u for u in users if term in u["username"] or term in (u["email"] or "")]
+        first, count = int(q.get("first", 0)), int(q.get("max", 100))
+        return web.json_response(users[first:first + count])
+
+    async def create_user(self, request: web.Request) -> web.Response:
+        self._caller(request)
+        body = await request.json()
+        if self._user_by_name(body["username"]):
+            return web.json_response({"errorMessage": "User exists with same username"}, status=409)
+        password = next((c["value"] for c in body.get("credentials", []) if c.get("type") == "password"), "")
+        user_id = self._add_user(body["username"], password, body.get("email"))
+        return web.Response(status=201, headers={"Location": f"{request.url.origin()}{request.path}/{user_id}"})
+
+    async def partial_import(self, request: web.Request) -> web.Response:
+        self._caller(request)
+        body = await request.json()
+        results = []
+        for spec in body.get("users", []):
+            user = self._user_by_name(spec["username"])
+            if user:
+                action = "SKIPPED"
+            else:
+                password = next((c["value"] for c in spec.get("credentials", []) if c.get("type") == "password"), "")
+                user = self.users[self._add_user(spec["username"], password, spec.get("email"))]
+                action = "ADDED"
+            results.append({"action": action, "resourceType": "USER", "resourceName": user["username"], "id": user["id"]})
+        return web.json_response({"results": results})
+
+    async def list_groups(self, request: web.Request) -> web.Response:
+        self._caller(request)
+        q = request.query
+        groups = list(self.groups.values())
+        if "search" in q:
+            term = q["search"].lower()
+            groups = [g for g in groups if term in g["name"].lower()]
+        first, count = int(q.get("first", 0)), int(q.get("max", 100))
+        return web.json_response(groups[first:first + count])
+
+    async def user_groups(self, request: web.Request) -> web.Response:
+        self._caller(request)
+        user_id = request.match_info["user_id"]
+        if user_id not in self.users:
+            return web.json_response({"error": "User not found"}, status=404)
+        return web.json_response([self.groups[g] for g in self.members.get(user_id, ())])
+
+    async def join_group(self, request: web.Request) -> web.Response:
+        self._caller(request)
+        user_id, group_id = request.match_info["user_id"], request.match_info["group_id"]
+        if user_id not in self.users or group_id not in self.groups:
+            return web.json_response({"error": "Not found"}, status=404)
+        self.members.setdefault(user_id, set()).add(group_id)
+        return web.Response(status=204)
+
+    async def delete_user(self, request: web.Request) -> web.Response:
+        self._caller(request)
+        user = self.users.pop(request.match_info["user_id"], None)
+        if not user:
+            return web.json_response({"error": "User not found"}, status=404)
+        self.members.pop(user["id"], None)
+        self.passwords.pop(user["username"], None)
+        return web.Response(status=204)
+
+    async def group_members(self, request: web.Request) -> web.Response:
+        self._caller(request)
+        group_id = request.match_info["group_id"]
+        if group_id not in self.groups:
+            return web.json_response({"error": "Could not find group by id"}, status=404)
+        members = [u for u in self.users.values() if group_id in self.members.get(u["id"], ())]
+        first, count = int(request.query.get("first", 0)), int(request.query.get("max", 100))
+        return web.json_response(members[first:first + count])
+
+    async def leave_group(self, request: web.Request) -> web.Response:
+        self._caller(request)
+        user_id, group_id = request.match_info["user_id"], request.match_info["group_id"]
+        self.members.get(user_id, set()).discard(group_id)
+        return web.Response(status=204)
+
+    # EMF tenancy
+
+    async def put_org(self, request: web.Request) -> web.Response:
+        self._caller(request)
+        name = request.match_info["name"]
+        body = await request.json()
+        if name in self.orgs:
+            self.orgs[name]["description"] = body.get("description", "")
+        else:
+            self.orgs[name] = self._new_resource(name, body.get("description", ""))
+        return web.json_response({})
+
+    async def get_org(self, request: web.Request) -> web.Response:
+        self._caller(request)
+        org = self.orgs.get(request.match_info["name"])
+        if not org:
+            return web.json_response({"message": "not found"}, status=404)
+        return web.json_response(self._record("org", org, with_name=False))
+
+    async def list_orgs(self, request: web.Request) -> web.Response:
+        self._caller(request)
+        return web.json_response([self._record("org", o, with_name=True) for o in self.orgs.values()])
+
+    def _delete(self, table: Dict, key, blocked: bool, kind: str) -> web.Response:
+        """Marks a record for removal after the provisioning delay, like the tenant controller."""
+        rec = table.get(key)
+        if not rec:
+            return web.json_response({"message": "not found"}, status=404)
+        if blocked:
+            return web.json_response({"message": f"{kind} has child resources"}, status=409)
+        rec.setdefault("delete_at", time.monotonic() + self.provision_delay)
+        return web.json_response({})
+
+    async def delete_org(self, request: web.Request) -> web.Response:
+        self._caller(request)
+        org = self.orgs.get(request.match_info["name"])
+        blocked = bool(org) and any(o == org["uid"] for o, _ in self.projects)
+        return self._delete(self.orgs, request.match_info["name"], blocked, "org")
+
+    def _projects_for(self, username: str) -> Dict[str, Dict]:
+        """Projects of the caller's org; project-group members (e.g. onboarding users) see only theirs."""
+        scope = self._org_scope(username)
+        user = self._user_by_name(username)
+        member_of = {self.groups[g]["name"].split("_", 1)[0] for g in self.members.get(user["id"], ())} if user else set()
+        if scope is None:
+            own = {name: p for (_, name), p in self.projects.items() if p["uid"] in member_of}
+            return own or {name: p for (_, name), p in self.projects.items()}
+        return {name: p for (org, name), p in self.projects.items() if org == scope}
+
+    async def put_project(self, request: web.Request) -> web.Response:
+        username = self._caller(request)
+        name = request.match_info["name"]
+        body = await request.json()
+        key = (self._org_scope(username), name)
+        if key in self.projects:
+            self.projects[key]["description"] = body.get("description", "")
+        else:
+            self.projects[key] = self._new_resource(name, body.get("description", ""))
+        return web.json_response({})
+
+    async def get_project(self, request: web.Request) -> web.Response:
+        username = self._caller(request)
+        project = self._projects_for(username).get(request.match_info["name"])
+        if not project:
+            return web.json_response({"message": "not found"}, status=404)
+        return web.json_response(self._record("project", project, with_name=False))
+
+    async def delete_project(self, request: web.Request) -> web.Response:
+        key = (self._org_scope(self._caller(request)), request.match_info["name"])
+        return self._delete(self.projects, key, False, "project")
+
+    async def list_projects(self, request: web.Request) -> web.Response:
+        username = self._caller(request)
+        return web.json_response([self._record("project", p, with_name=True)
+                                  for p in self._projects_for(username).values()])
+
+    # Edge Infrastructure Manager
+
+    def _project_hosts(self, request: web.Request) -> List[Dict]:
+        project = self._projects_for(self._caller(request)).get(request.match_info["project"])
+        if not project:
+            raise web.HTTPNotFound(text='{"message":"project not found"}', content_type="application/json")
+        hosts = self.hosts.get(project["uid"], [])
+        # Equality on top-level fields and resourceId > "..." clauses joined by AND
+        for clause in filter(None, request.query.get("filter", "").split(" AND ")):
+            clause = clause.strip("() ")
+            if clause.startswith("resourceId >"):
+                after = clause.split(">", 1)[1].strip(' "')
+                hosts = [h for h in hosts if h["resourceId"] > after]
+            elif "=" in clause:
+                key, value = (x.strip(' "') for x in clause.split("=", 1))
+                hosts = [h for h in hosts if str(h.get(key)) == value]
+        return hosts
+
+    async def list_hosts(self, request: web.Request) -> web.Response:
+        offset, page_size = int(request.query.get("offset", 0)), int(request.query.get("pageSize", 20))
+        if not 0 <= offset <= 10000 or not 1 <= page_size <= 100:
+            return web.json_response({"message": "invalid offset or pageSize"}, status=400)
+        hosts = sorted(self._project_hosts(request), key=lambda h: h["resourceId"])
+        page = hosts[offset:offset + page_size]
+        return web.json_response({"hosts": page, "hasNext": offset + len(page) < len(hosts), "totalElements": len(hosts)})
+
+    async def register_host(self, request: web.Request) -> web.Response:
+        project = self._projects_for(self._caller(request)).get(request.match_info["project"])
+        if not project:
+            return web.json_response({"message": "project not found"}, status=404)
+        body = await request.json()
+        serial, host_uuid = body.get("serialNumber"), body.get("uuid")
+        if not serial and not host_uuid:
+            return web.json_response({"message": "serialNumber or uuid is required"}, status=400)
+        hosts = self.hosts.setdefault(project["uid"], [])
+        if any((serial and h["serialNumber"] == serial) or (host_uuid and h["uuid"] == host_uuid) for h in hosts):
+            return web.json_response({"message": "host already registered"}, status=409)
+        host = {
+            "resourceId": f"host-{secrets.token_hex(4)}", "name": body.get("name", ""),
+            "uuid": host_uuid, "serialNumber": serial, "hostStatus": "Registered", "site": None,
+        }
+        hosts.append(host)
+        return web.json_response(host, status=201, headers={"Location": f"{request.path[:-len('/register')]}/{host['resourceId']}"})
+
+    async def host_summary(self, request: web.Request) -> web.Response:
+        hosts = self._project_hosts(request)
+        return web.json_response({
+            "total": len(hosts),
+            "running": sum(1 for h in hosts if h["hostStatus"] == "Running"),
+            "error": sum(1 for h in hosts if h["hostStatus"] == "Error"),
+            "unallocated": sum(1 for h in hosts if not h["site"]),
+        })
+
+    # Cluster Manager
+
+    def _project_uid(self, request: web.Request) -> str:
+        project = self._projects_for(self._caller(request)).get(request.match_info["project"])
+        if not project:
+            raise web.HTTPNotFound(text='{"message":"project not found"}', content_type="application/json")
+        return project["uid"]
+
+    @staticmethod
+    def _cluster_state(cluster: Dict) -> str:
+        """Clusters whose nodes are all known hosts become ready after cluster_delay; others fail."""
+        if time.monotonic() < cluster["ready_at"]:
+            return "in_progress"
+        return "ready" if cluster["valid"] else "error"
+
+    def _cluster_info(self, cluster: Dict) -> Dict:
+        state = self._cluster_state(cluster)
+        indicator, message = {
+            "in_progress": (STATUS_IN_PROGRESS, "provisioning"),
+            "ready": (STATUS_IDLE, "active"),
+            "error": ("STATUS_INDICATION_ERROR", "node is not a registered host"),
+        }[state]
+        status = {"indicator": indicator, "message": message, "timestamp": cluster["timestamp"]}
+        return {
+            "name": cluster["name"], "labels": cluster["labels"], "kubernetesVersion": "v1.30.6+rke2r1",
+            "nodeQuantity": len(cluster["nodes"]), "lifecyclePhase": status, "providerStatus": status,
+            "controlPlaneReady": status, "infrastructureReady": status, "nodeHealth": status,
+        }
+
+    async def list_clusters(self, request: web.Request) -> web.Response:
+        clusters = sorted(self.clusters.get(self._project_uid(request), {}).values(), key=lambda c: c["name"])
+        offset, page_size = int(request.query.get("offset", 0)), int(request.query.get("pageSize", 20))
+        if offset < 0 or not 1 <= page_size <= 100:
+            return web.json_response({"message": "invalid offset or pageSize"}, status=400)
+        page = clusters[offset:offset + page_size]
+        return web.json_response({"clusters": [self._cluster_info(c) for c in page], "totalElements": len(clusters)})
+
+    async def create_cluster(self, request: web.Request) -> web.Response:
+        uid = self._project_uid(request)
+        body = await request.json()
+        name, nodes = body.get("name"), body.get("nodes") or []
+        if not name or not nodes:
+            return web.json_response({"message": "name and nodes are required"}, status=400)
+        template = body.get("template") or "baseline-v2.0.0"
+        if template not in {f"{t['name']}-{t['version']}" for t in TEMPLATES}:
+            return web.json_response({"message": f"template {template} not found"}, status=400)
+        clusters = self.clusters.setdefault(uid, {})
+        if name in clusters:
+            return web.json_response({"message": f"cluster {name} already exists"}, status=409)
+        known = {h["uuid"] for h in self.hosts.get(uid, [])}
+        clusters[name] = {
+            "name": name, "nodes": nodes, "template": template, "labels": body.get("labels") or {},
+            "valid": all(n.get("id") in known for n in nodes),
+            "ready_at": time.monotonic() + self.cluster_delay * self.random.uniform(0.5, 1.5),
+            "timestamp": int(time.time()),
+        }
+        return web.json_response(f"cluster {name} creation request sent", status=201)
+
+    async def cluster_summary(self, request: web.Request) -> web.Response:
+        states = [self._cluster_state(c) for c in self.clusters.get(self._project_uid(request), {}).values()]
+        return web.json_response({
+            "totalClusters": len(states), "ready": states.count("ready"), "error": states.count("error"),
+            "inProgress": states.count("in_progress"), "unknown": 0,
+        })
+
+    async def list_templates(self, request: web.Request) -> web.Response:
+        self._project_uid(request)
+        return web.json_response({
+            "templateInfoList": TEMPLATES, "totalElements": len(TEMPLATES),
+            "defaultTemplateInfo": {"name": "baseline", "version": "v2.0.0"},
+        })
+
+    # Server
+
+    def app(self) -> web.Application:
+        app = web.Application(middlewares=[self._middleware])
+        kc = f"/admin/realms/{self.realm}"
+        app.add_routes([
+            web.post(f"/realms/{self.realm}/protocol/openid-connect/token", self.token),
+            web.get(kc, self.realm_info),
+            web.get(f"{kc}/users", self.list_users),
+            web.post(f"{kc}/users", self.create_user),
+            web.post(f"{kc}/partialImport", self.partial_import),
+            web.get(f"{kc}/groups", self.list_groups),
+            web.get(f"{kc}/users/{{user_id}}/groups", self.user_groups),
+            web.put(f"{kc}/users/{{user_id}}/groups/{{group_id}}", self.join_group),
+            web.delete(f"{kc}/users/{{user_id}}/groups/{{group_id}}", self.leave_group),
+            web.delete(f"{kc}/users/{{user_id}}", self.delete_user),
+            web.get(f"{kc}/groups/{{group_id}}/members", self.group_members),
+            web.get("/v1/orgs", self.list_orgs),
+            web.put("/v1/orgs/{name}", self.put_org),
+            web.get("/v1/orgs/{name}", self.get_org),
+            web.delete("/v1/orgs/{name}", self.delete_org),
+            web.get("/v1/projects", self.list_projects),
+            web.put("/v1/projects/{name}", self.put_project),
+            web.get("/v1/projects/{name}", self.get_project),
+            web.delete("/v1/projects/{name}", self.delete_project),
+            web.get("/v1/projects/{project}/compute/hosts", self.list_hosts),
+            web.get("/v1/projects/{project}/compute/hosts/summary", self.host_summary),
+            web.post("/v1/projects/{project}/compute/hosts/register", self.register_host),
+            web.get("/v2/projects/{project}/clusters", self.list_clusters),
+            web.post("/v2/projects/{project}/clusters", self.create_cluster),
+            web.get("/v2/projects/{project}/clusters/summary", self.cluster_summary),
+            web.get("/v2/projects/{project}/templates", self.list_templates),
+        ])
+        return app
+
+    async def _start(self, host: str, port: int) -> str:
+        self._runner = web.AppRunner(self.app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound = self._runner.addresses[0][1]
+        return f"http://{host}:{bound}"
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Serves on a background thread with its own event loop; returns the base URL."""
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="fake-cluster", daemon=True)
+        self._thread.start()
+        self.url = asyncio.run_coroutine_threadsafe(self._start(host, port), self._loop).result()
+        return self.url
+
+    def stop(self):
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop = None
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake EMF tenancy API + Keycloak admin API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--admin-user", default="admin")
+    parser.add_argument("--admin-pass", default="admin")
+    parser.add_argument("--provision-delay", type=float, default=1.0, help="Seconds until an Org/Project is IDLE")
+    parser.add_argument("--latency", type=float, default=0.0, help="Added seconds per request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random seconds per request (0..jitter)")
+    parser.add_argument("--error-429", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--error-5xx", type=float, default=0.0, help="Fraction of requests answered with 503")
+    parser.add_argument("--hosts", type=int, default=0, help="Hosts created in every Project once it is IDLE")
+    parser.add_argument("--cluster-delay", type=float, default=3.0, help="Average seconds until an edge cluster is ready")
+    opts = parser.parse_args()
+
+    cluster = FakeCluster(
+        admin_user=opts.admin_user, admin_pass=opts.admin_pass, provision_delay=opts.provision_delay,
+        latency=opts.latency, jitter=opts.jitter, error_429=opts.error_429, error_5xx=opts.error_5xx,
+        hosts=opts.hosts, cluster_delay=opts.cluster_delay,
+    )
+    url = cluster.start(opts.host, opts.port)
+    print(f"Fake cluster on {url} (KEYCLOAK_URL and EMF_API_URL); Ctrl+C to stop")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        summary = cluster.log.summary()
+        print(f"\n{summary['requests']} requests, {summary['errors']} injected errors")
+        cluster.stop()
+
+if __name__ == "__main__":
+    main()
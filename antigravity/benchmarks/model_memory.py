@@ -0,0 +1,65 @@
+"""
+Memory and decode time of generated models vs. plain dicts for a large
+host listing (the shape GET /compute/hosts returns).
+
+    python benchmarks/model_memory.py
+    python benchmarks/model_memory.py --hosts 100000
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.infra import Host  # noqa: E402
+
+def host_json(i: int) -> dict:
+    return {
+        "resourceId": f"host-{i:08x}", "name": f"edge-{i:05d}", "uuid": str(uuid.UUID(int=i)),
+        "serialNumber": f"SN{i:08d}", "hostname": f"edge-{i:05d}.plant.example.com",
+        "hostStatus": "Running", "hostStatusIndicator": "STATUS_INDICATION_IDLE", "hostStatusTimestamp": 1700000000,
+        "onboardingStatus": "Onboarded", "onboardingStatusIndicator": "STATUS_INDICATION_IDLE",
+        "registrationStatus": "Host is registered", "registrationStatusIndicator": "STATUS_INDICATION_IDLE",
+        "currentState": "HOST_STATE_ONBOARDED", "desiredState": "HOST_STATE_ONBOARDED",
+        "currentPowerState": "POWER_STATE_ON", "desiredPowerState": "POWER_STATE_ON",
+        "cpuArchitecture": "x86_64", "cpuCores": 16, "cpuModel": "Intel(R) Xeon(R)", "cpuSockets": 1, "cpuThreads": 32,
+        "memoryBytes": "68719476736", "biosVendor": "Intel", "biosVersion": "1.0", "productName": "Edge Node",
+        "siteId": "site-0000abcd", "site": {"resourceId": "site-0000abcd", "name": "plant-1"},
+        "metadata": [{"key": "rack", "value": str(i % 40)}],
+        "hostNics": [{"deviceName": "eth0", "mtu": 1500, "macAddr": "00:00:00:00:00:01"}],
+        "timestamps": {"createdAt": "2024-01-01T00:00:00Z", "updatedAt": "2024-01-01T00:00:00Z"},
+    }
+
+def measure(payload: bytes, decode) -> tuple:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    items = decode(json.loads(payload)["hosts"])
+    seconds = time.perf_counter() - start
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del items
+    return retained, seconds
+
+def main():
+    parser = argparse.ArgumentParser(description="Generated models vs dicts for a host listing")
+    parser.add_argument("--hosts", type=int, default=20000)
+    opts = parser.parse_args()
+
+    payload = json.dumps({"hosts": [host_json(i) for i in range(opts.hosts)], "hasNext": False,
+                          "totalElements": opts.hosts}).encode()
+    dict_bytes, dict_s = measure(payload, lambda hosts: hosts)
+    model_bytes, model_s = measure(payload, Host.from_list)
+    print(f"{opts.hosts} hosts, {len(payload) / 2**20:.1f} MiB of JSON")
+    print(f"  dicts:  {dict_bytes / 2**20:7.1f} MiB retained  {dict_s:.2f}s")
+    print(f"  models: {model_bytes / 2**20:7.1f} MiB retained  {model_s:.2f}s  "
+          f"({model_bytes / dict_bytes:.0%} of dicts)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Cold-start benchmark for the CLI.
+
+Runs a few commands in fresh interpreters with the API endpoints pointed at a
+closed local port, so each run measures import + argument parsing up to the
+first network call. Medians are compared against startup_budget.json and the
+script exits non-zero when a command is slower than its budget.
+
+    python benchmarks/startup.py            # check against the budget
+    python benchmarks/startup.py --update   # record the current timings
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+MAIN = os.path.join(os.path.dirname(HERE), "main.py")
+BUDGET = os.path.join(HERE, "startup_budget.json")
+
+COMMANDS = {
+    "help": ["--help"],
+    "org list": ["org", "list"],
+    "user list": ["user", "list", "--limit", "1"],
+}
+
+def _env() -> dict:
+    env = dict(os.environ)
+    # Nothing listens on the discard port: the command fails on its first request
+    env.update({
+        "KEYCLOAK_URL": "http://127.0.0.1:9",
+        "EMF_API_URL": "http://127.0.0.1:9",
+        "KEYCLOAK_ADMIN_USER": "bench",
+        "KEYCLOAK_ADMIN_PASS": "bench",
+        "TOKEN_CACHE": "false",
+        # Fail on the first refused connection instead of timing the retry backoff
+        "HTTP_RETRIES": "0",
+        "PYTHONDONTWRITEBYTECODE": "",
+    })
+    return env
+
+def measure(args, runs: int) -> float:
+    env = _env()
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, MAIN, *args], env=env, cwd=HERE,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--update", action="store_true", help="Rewrite the budget from this run")
+    parser.add_argument("--tolerance", type=float, default=1.25,
+                        help="Allowed slowdown factor over the budget (default 1.25)")
+    opts = parser.parse_args()
+
+    results = {name: measure(args, opts.runs) for name, args in COMMANDS.items()}
+
+    if opts.update:
+        with open(BUDGET, "w") as f:
+            json.dump({k: round(v, 3) for k, v in results.items()}, f, indent=2)
+            f.write("\n")
+        for name, t in results.items():
+            print(f"{name:<12} {t * 1000:7.0f} ms  (recorded)")
+        return 0
+
+    try:
+        with open(BUDGET) as f:
+            budget = json.load(f)
+    except FileNotFoundError:
+        budget = {}
+
+    failed = False
+    for name, t in results.items():
+        limit = budget.get(name)
+        if limit is None:
+            print(f"{name:<12} {t * 1000:7.0f} ms  (no budget)")
+            continue
+        ok = t <= limit * opts.tolerance
+        failed |= not ok
+        print(f"{name:<12} {t * 1000:7.0f} ms  budget {limit * 1000:.0f} ms  {'ok' if ok else 'REGRESSION'}")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+"""
+Offline throughput benchmark: runs the real CLI commands in-process against
+benchmarks/fake_server.py and reports, per command, HTTP requests issued,
+request latency (p50/p99), command wall time (p50/p99), and for `apply`
+the number of tenants provisioned per minute.
+
+    python benchmarks/throughput.py
+    python benchmarks/throughput.py --latency 0.05 --jitter 0.05 --tenants 50 --json
+    python benchmarks/throughput.py --error-429 0.02 --error-5xx 0.01
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+sys.path.insert(0, HERE)
+
+from fake_server import FakeCluster, percentile  # noqa: E402
+
+ADMIN_USER, ADMIN_PASS = "admin", "admin-pass"
+PASSWORD = "Bench-Passw0rd!"
+
+def _configure(url: str, poll_interval: float):
+    # Must run before the CLI modules import config.py
+    os.environ.update({
+        "KEYCLOAK_URL": url,
+        "EMF_API_URL": url,
+        "KEYCLOAK_REALM": "master",
+        "KEYCLOAK_ADMIN_USER": ADMIN_USER,
+        "KEYCLOAK_ADMIN_PASS": ADMIN_PASS,
+        "TOKEN_CACHE": "false",
+        "TOKEN_CACHE_PATH": os.path.join(tempfile.gettempdir(), "antigravity-bench-tokens.json"),
+        "METADATA_CACHE": "false",
+        "POLL_INTERVAL": str(poll_interval),
+        "POLL_MAX_INTERVAL": str(poll_interval * 4),
+    })
+
+class Scenario:
+    def __init__(self, name: str, args: Callable[[int], List[str]], input: Callable[[int], str] = lambda i: ""):
+        self.name = name
+        self.args = args
+        self.input = input
+
+SCENARIOS = [
+    Scenario("org create", lambda i: ["org", "create", "--name", f"bench-org-{i}",
+                                      "--create-admin", "--org-admin-pass", PASSWORD]),
+    Scenario("org list", lambda i: ["org", "list"]),
+    Scenario("project create", lambda i: ["project", "create", "--project-name", f"bench-proj-{i}",
+                                          "--org-name", "bench-org-0", "--org-admin-pass", PASSWORD],
+             lambda i: f"y\n{PASSWORD}\n{PASSWORD}\n"),
+    Scenario("user manage", lambda i: ["user", "manage"],
+             lambda i: f"create-new\nbench-user-{i}\n{PASSWORD}\n{PASSWORD}\nbench-org-0\nall\nProject User\n"),
+    Scenario("user list", lambda i: ["user", "list", "--limit", "100"]),
+]
+
+def run_command(runner, app, scenario: Scenario, i: int, cluster: FakeCluster) -> Dict:
+    from cli_common import state
+    from tokens import get_token_manager
+    # Each CLI invocation is a fresh process: start without cached clients or tokens
+    state["kc"] = state["emf"] = None
+    get_token_manager().clear()
+    cluster.log.reset()
+    start = time.perf_counter()
+    result = runner.invoke(app, scenario.args(i), input=scenario.input(i))
+    wall = time.perf_counter() - start
+    entries = cluster.log.reset()
+    return {
+        "ok": result.exit_code == 0,
+        "wall": wall,
+        "requests": len(entries),
+        "latencies": [e[3] for e in entries],
+        "output": result.output,
+    }
+
+def bench_commands(cluster: FakeCluster, iterations: int) -> List[Dict]:
+    from typer.testing import CliRunner
+    from main import app
+    runner = CliRunner()
+    rows = []
+    for scenario in SCENARIOS:
+        runs = [run_command(runner, app, scenario, i, cluster) for i in range(iterations)]
+        failed = [r for r in runs if not r["ok"]]
+        latencies = [x for r in runs for x in r["latencies"]]
+        walls = [r["wall"] for r in runs]
+        rows.append({
+            "command": scenario.name,
+            "runs": len(runs),
+            "failed": len(failed),
+            "requests_per_command": sum(r["requests"] for r in runs) / len(runs),
+            "request_p50_ms": percentile(latencies, 50) * 1000,
+            "request_p99_ms": percentile(latencies, 99) * 1000,
+            "wall_p50_s": percentile(walls, 50),
+            "wall_p99_s": percentile(walls, 99),
+        })
+        if failed:
+            print(f"{scenario.name}: {len(failed)} failed run(s); last output:\n{failed[-1]['output'][-800:]}",
+                  file=sys.stderr)
+    return rows
+
+def bench_apply(cluster: FakeCluster, tenants: int, users: int, workers: int) -> Dict:
+    import yaml
+    from typer.testing import CliRunner
+    from cli_common import state
+    from main import app
+    from tokens import get_token_manager
+
+    manifest = {"orgs": [{
+        "name": f"tenant-{i}",
+        "admin": {"password": PASSWORD},
+        "projects": [{
+            "name": "site-1",
+            "onboarding": {"password": PASSWORD},
+            "users": [{"username": f"tenant-{i}-user-{u}", "password": PASSWORD} for u in range(users)],
+        }],
+    } for i in range(tenants)]}
+    with tempfile.NamedTemporaryFile("w", suffix=".yaml", delete=False) as f:
+        yaml.safe_dump(manifest, f)
+
+    state["kc"] = state["emf"] = None
+    get_token_manager().clear()
+    cluster.log.reset()
+    start = time.perf_counter()
+    try:
+        result = CliRunner().invoke(app, ["apply", "--file", f.name, "--workers", str(workers)])
+    finally:
+        os.unlink(f.name)
+    wall = time.perf_counter() - start
+    entries = cluster.log.reset()
+    if result.exit_code != 0:
+        print(f"apply failed:\n{result.output[-800:]}", file=sys.stderr)
+    latencies = [e[3] for e in entries]
+    return {
+        "tenants": tenants,
+        "ok": result.exit_code == 0,
+        "wall_s": wall,
+        "requests": len(entries),
+        "requests_per_tenant": len(entries) / tenants,
+        "request_p50_ms": percentile(latencies, 50) * 1000,
+        "request_p99_ms": percentile(latencies, 99) * 1000,
+        "tenants_per_minute": tenants / wall * 60,
+    }
+
+def print_report(rows: List[Dict], apply: Dict):
+    from rich.console import Console
+    from rich.table import Table
+    table = Table(title="Per-command cost")
+    for col in ["Command", "Runs", "Failed", "Requests", "Req p50", "Req p99", "Wall p50", "Wall p99"]:
+        table.add_column(col)
+    for r in rows:
+        table.add_row(r["command"], str(r["runs"]), str(r["failed"]), f"{r['requests_per_command']:.1f}",
+                      f"{r['request_p50_ms']:.1f} ms", f"{r['request_p99_ms']:.1f} ms",
+                      f"{r['wall_p50_s']:.2f} s", f"{r['wall_p99_s']:.2f} s")
+    console = Console()
+    console.print(table)
+    console.print(
+        f"apply: {apply['tenants']} tenants in {apply['wall_s']:.1f}s -> "
+        f"[bold]{apply['tenants_per_minute']:.1f} tenants/min[/bold], "
+        f"{apply['requests_per_tenant']:.1f} requests/tenant, "
+        f"req p50 {apply['request_p50_ms']:.1f} ms / p99 {apply['request_p99_ms']:.1f} ms"
+        + ("" if apply["ok"] else " [red](failures)[/red]")
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description="CLI throughput benchmark against the fake cluster")
+    parser.add_argument("--iterations", type=int, default=5, help="Runs per command")
+    parser.add_argument("--tenants", type=int, default=20, help="Orgs in the generated apply manifest")
+    parser.add_argument("--users", type=int, default=3, help="Users per tenant project")
+    parser.add_argument("--workers", type=int, default=8, help="apply --workers")
+    parser.add_argument("--provision-delay", type=float, default=0.5)
+    parser.add_argument("--poll-interval", type=float, default=0.25)
+    parser.add_argument("--latency", type=float, default=0.005)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-429", type=float, default=0.0)
+    parser.add_argument("--error-5xx", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+    opts = parser.parse_args()
+
+    cluster = FakeCluster(
+        admin_user=ADMIN_USER, admin_pass=ADMIN_PASS, provision_delay=opts.provision_delay,
+        latency=opts.latency, jitter=opts.jitter, error_429=opts.error_429, error_5xx=opts.error_5xx,
+        seed=opts.seed,
+    )
+    _configure(cluster.start(), opts.poll_interval)
+    try:
+        rows = bench_commands(cluster, opts.iterations)
+        apply = bench_apply(cluster, opts.tenants, opts.users, opts.workers)
+    finally:
+        cluster.stop()
+
+    if opts.json:
+        print(json.dumps({"commands": rows, "apply": apply}, indent=2))
+    else:
+        print_report(rows, apply)
+    return 0 if all(r["failed"] == 0 for r in rows) and apply["ok"] else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+import yaml
+from client_keycloak import AsyncKeycloakClient
+from client_emf import AsyncEMFClient
+from config import Config
+from transport import run_sync
+from tracing import get_tracer
+from poller import Poller, org_source, project_source, group_source
+from utils import read_secret
+
+ROLES = ["Project Admin", "Project User", "Onboarding"]
+
+def load_manifest(path: str) -> List[Dict]:
+    """
+    Loads and validates a tenants manifest (YAML or JSON):
+
+    orgs:
+      - name: acme
+        admin: {password_env: ACME_ADMIN_PASS}
+        projects:
+          - name: plant1
+            onboarding: {password: ...}
+            users:
+              - {username: alice, password_env: ALICE_PASS, role: Project User}
+    """
+    with open(path) as f:
+        data = yaml.safe_load(f) or {}
+
+    orgs = data.get("orgs")
+    if not isinstance(orgs, list) or not orgs:
+        raise ValueError("Manifest must contain a non-empty 'orgs' list")
+
+    seen = set()
+    for org in orgs:
+        name = org.get("name")
+        if not name:
+            raise ValueError("Every org needs a 'name'")
+        if name in seen:
+            raise ValueError(f"Duplicate org '{name}'")
+        seen.add(name)
+
+        org.setdefault("description", f"Description for {name}")
+        org.setdefault("projects", [])
+        if org.get("admin"):
+            org["admin"]["password"] = read_secret(org["admin"], f"{name}-admin")
+        elif org["projects"]:
+            raise ValueError(f"Org '{name}' has projects but no 'admin' (needed to create them)")
+
+        for proj in org["projects"]:
+            p_name = proj.get("name")
+            if not p_name:
+                raise ValueError(f"Org '{name}': every project needs a 'name'")
+            proj.setdefault("description", f"Project {p_name} in {name}")
+            if proj.get("onboarding"):
+                proj["onboarding"]["password"] = read_secret(proj["onboarding"], f"{name}-{p_name}-onboard")
+            for user in proj.setdefault("users", []):
+                if not user.get("username"):
+                    raise ValueError(f"Project '{p_name}': every user needs a 'username'")
+                user.setdefault("role", "Project User")
+                if user["role"] not in ROLES:
+                    raise ValueError(f"User '{user['username']}': role must be one of {ROLES}")
+                user["password"] = read_secret(user, user["username"])
+    return orgs
+
+class Task:
+    def __init__(self, key: str, tenant: str, label: str, fn: Callable[[], Awaitable[Any]], deps: Iterable[str]):
+        self.key = key
+        self.tenant = tenant
+        self.label = label
+        self.fn = fn
+        self.deps = list(deps)
+        self.status = "pending"
+        self.error: Optional[str] = None
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+
+    @property
+    def duration(self) -> float:
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+    async def run(self):
+        self.started = time.time()
+        try:
+            with get_tracer().span(f"{self.tenant}: {self.label}"):
+                await self.fn()
+            self.status = "ok"
+        except Exception as e:
+            self.status = "failed"
+            self.error = str(e)
+        finally:
+            self.finished = time.time()
+        return self
+
+class TaskGraph:
+    """
+    Dependency graph of coroutines executed on the shared event loop.
+    A task starts once all its dependencies succeeded; dependents of a
+    failed task are skipped, independent branches keep running.
+    At most `workers` tasks run at the same time.
+    """
+    def __init__(self):
+        self.tasks: Dict[str, Task] = {}
+
+    def add(self, key: str, tenant: str, label: str, fn: Callable[[], Awaitable[Any]], deps: Iterable[str] = ()):
+        for d in deps:
+            if d not in self.tasks:
+                raise ValueError(f"Task {key} depends on unknown task {d}")
+        self.tasks[key] = Task(key, tenant, label, fn, deps)
+
+    def _skip_dependents(self, key: str, dependents: Dict[str, List[str]]):
+        for child in dependents.get(key, []):
+            task = self.tasks[child]
+            if task.status == "pending":
+                task.status = "skipped"
+                task.error = f"dependency {key} failed"
+                self._skip_dependents(child, dependents)
+
+    async def run_async(self, workers: int = Config.BULK_WORKERS, on_done: Optional[Callable[[Task], None]] = None):
+        waiting = {k: len(t.deps) for k, t in self.tasks.items()}
+        dependents: Dict[str, List[str]] = {}
+        for k, t in self.tasks.items():
+            for d in t.deps:
+                dependents.setdefault(d, []).append(k)
+
+        slots = asyncio.Semaphore(workers)
+
+        async def limited(task: Task) -> Task:
+            async with slots:
+                return await task.run()
+
+        running = {asyncio.create_task(limited(t)) for t in self.tasks.values() if not t.deps}
+        while running:
+            done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for fut in done:
+                task = fut.result()
+                if on_done:
+                    on_done(task)
+                if task.status != "ok":
+                    self._skip_dependents(task.key, dependents)
+                    continue
+                for child in dependents.get(task.key, []):
+                    waiting[child] -= 1
+                    if waiting[child] == 0 and self.tasks[child].status == "pending":
+                        running.add(asyncio.create_task(limited(self.tasks[child])))
+
+    def run(self, workers: int = Config.BULK_WORKERS, on_done: Optional[Callable[[Task], None]] = None):
+        run_sync(self.run_async(workers, on_done))
+
+    def tenant_report(self) -> List[Dict]:
+        """Per-tenant summary: wall time from first task start to last task end."""
+        report: Dict[str, Dict] = {}
+        for t in self.tasks.values():
+            r = report.setdefault(t.tenant, {"tenant": t.tenant, "ok": 0, "failed": 0, "skipped": 0,
+                                             "start": None, "end": None, "errors": []})
+            if t.status in ("ok", "failed", "skipped"):
+                r[t.status] += 1
+            if t.error and t.status == "failed":
+                r["errors"].append(f"{t.label}: {t.error}")
+            if t.started is not None:
+                r["start"] = t.started if r["start"] is None else min(r["start"], t.started)
+                r["end"] = t.finished if r["end"] is None else max(r["end"], t.finished)
+        for r in report.values():
+            r["duration"] = (r["end"] - r["start"]) if r["start"] is not None else 0.0
+        return list(report.values())
+
+class Provisioner:
+    """
+    Create-and-wait steps for Orgs and Projects. One shared poller makes a
+    single list call per tick for every pending org, project and group.
+    """
+    def __init__(self, kc: AsyncKeycloakClient, emf: AsyncEMFClient, poll_history: Optional[int] = None):
+        self.kc = kc
+        self.emf = emf
+        self.org_uuids: Dict[str, str] = {}
+        self.proj_uuids: Dict[str, str] = {}
+        self._org_clients: Dict[str, AsyncEMFClient] = {}
+        # One lock per Org: logins of different Orgs run concurrently, one Org's are serialized
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self.poller = Poller(history=poll_history)
+        self.poller.add_source("orgs", org_source(emf))
+        self.poller.add_source("groups", group_source(kc))
+
+    async def org_client(self, org: Dict, force: bool = False) -> AsyncEMFClient:
+        """
+        EMF client authenticated as the org admin (projects are scoped by its token).
+        force=True logs in again, e.g. after the admin was added to the org's groups.
+        The cached session is only reused for the password it was created with.
+        """
+        name = org["name"]
+        async with self._locks.setdefault(name, asyncio.Lock()):
+            client = self._org_clients.get(name)
+            if client is not None and not client.auth.has_password(org["admin"]["password"]):
+                # Another password than the session's: only a successful login may replace it
+                client = None
+            if client is None:
+                kc_org = AsyncKeycloakClient()
+                await kc_org.login(username=f"{name}-admin", password=org["admin"]["password"], force=force)
+                client = AsyncEMFClient(auth=kc_org)
+                self._org_clients[name] = client
+                self.poller.add_source(f"projects:{name}", project_source(client))
+            elif force:
+                await client.auth.login(username=f"{name}-admin", password=org["admin"]["password"], force=True)
+            return client
+
+    def forget_org(self, name: str):
+        """Drops the cached Org Admin session and UUIDs of a deleted Org (its name may be reused)."""
+        self._org_clients.pop(name, None)
+        self._locks.pop(name, None)
+        self.poller.sources.pop(f"projects:{name}", None)
+        self.org_uuids.pop(name, None)
+        for key in [k for k in self.proj_uuids if k.startswith(f"{name}/")]:
+            del self.proj_uuids[key]
+
+    async def wait_org(self, name: str):
+        org_rec = await self.poller.watch("orgs", name, lambda r: r is not None and r.ready)
+        if not org_rec.uid:
+            raise Exception(f"No UUID for org {name}")
+        self.org_uuids[name] = org_rec.uid
+
+    async def create_org(self, org: Dict):
+        await self.emf.create_org(org["name"], org["description"])
+        await self.wait_org(org["name"])
+
+    async def wait_project(self, org: Dict, p_name: str):
+        await self.org_client(org)
+        project = await self.poller.watch(f"projects:{org['name']}", p_name, lambda r: r is not None and r.ready)
+        if not project.uid:
+            raise Exception(f"No UUID for project {p_name}")
+        self.proj_uuids[f"{org['name']}/{p_name}"] = project.uid
+
+    async def create_project(self, org: Dict, proj: Dict):
+        emf_org = await self.org_client(org)
+        await emf_org.create_project(proj["name"], proj["description"])
+        await self.wait_project(org, proj["name"])
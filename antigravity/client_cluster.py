@@ -0,0 +1,142 @@
+import asyncio
+from typing import AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
+from config import Config
+from utils import handle_request_error
+from transport import AsyncTransport, get_transport, sync_iter, sync_method
+from models.cluster import ClusterInfo, ClusterSummary, TemplateInfoList
+
+ERROR = "STATUS_INDICATION_ERROR"
+IDLE = "STATUS_INDICATION_IDLE"
+
+class ClusterFailed(Exception):
+    pass
+
+def cluster_state(cluster: Optional[ClusterInfo]) -> str:
+    """
+    "ready" once the lifecycle phase and every other reported status is
+    IDLE, "error" if any of them is ERROR, else "in_progress" (also for a
+    cluster that is not listed yet).
+    """
+    if cluster is None or cluster.lifecycle_phase is None:
+        return "in_progress"
+    statuses = [s for s in (cluster.lifecycle_phase, cluster.provider_status, cluster.control_plane_ready,
+                            cluster.infrastructure_ready, cluster.node_health) if s is not None]
+    if any(s.indicator == ERROR for s in statuses):
+        return "error"
+    return "ready" if all(s.indicator == IDLE for s in statuses) else "in_progress"
+
+def cluster_ready(cluster: Optional[ClusterInfo]) -> bool:
+    """Poller check: True when ready, raises ClusterFailed when the cluster reports an error."""
+    state = cluster_state(cluster)
+    if state == "error":
+        raise ClusterFailed(cluster.lifecycle_phase.message or "cluster reported an error")
+    return state == "ready"
+
+class AsyncClusterClient:
+    """
+    Cluster Manager API (/v2/projects/{project}/clusters and /templates).
+    `auth` must belong to a user of the project's Org (e.g. {org}-admin).
+    """
+    def __init__(self, token: Optional[str] = None, transport: Optional[AsyncTransport] = None, auth=None):
+        self.base_url = Config.EMF_API_URL
+        self.token = token
+        self.auth = auth
+        self.http = transport or get_transport()
+
+    async def _headers(self):
+        if self.auth:
+            self.token = await self.auth.access_token()
+        return {
+            "Authorization": f"Bearer {self.token}",
+            "Content-Type": "application/json",
+            "accept": "application/json"
+        }
+
+    def _url(self, project: str, path: str = "clusters") -> str:
+        return f"{self.base_url}/v2/projects/{project}/{path}"
+
+    async def list_clusters(self, project: str, offset: int = 0, page_size: int = Config.CLUSTER_PAGE_SIZE,
+                            filter: Optional[str] = None) -> Tuple[List[ClusterInfo], int]:
+        """One page of clusters and the total count."""
+        params = {"offset": str(offset), "pageSize": str(page_size), "orderBy": "name"}
+        if filter:
+            params["filter"] = filter
+        resp = await self.http.get(self._url(project), headers=await self._headers(), params=params)
+        if resp.status_code != 200:
+            handle_request_error(resp, f"List clusters in {project}")
+        data = resp.json()
+        return ClusterInfo.from_list(data.get("clusters")), data.get("totalElements") or 0
+
+    async def iter_clusters(self, project: str, filter: Optional[str] = None,
+                            page_size: int = Config.CLUSTER_PAGE_SIZE) -> AsyncIterator[ClusterInfo]:
+        offset = 0
+        while True:
+            clusters, total = await self.list_clusters(project, offset, page_size, filter)
+            for c in clusters:
+                yield c
+            offset += len(clusters)
+            if not clusters or offset >= total:
+                return
+
+    async def all_clusters(self, project: str, filter: Optional[str] = None) -> List[ClusterInfo]:
+        return [c async for c in self.iter_clusters(project, filter)]
+
+    async def cluster_summary(self, project: str) -> ClusterSummary:
+        """Server-side counts: total_clusters, ready, error, in_progress, unknown."""
+        resp = await self.http.get(self._url(project, "clusters/summary"), headers=await self._headers())
+        if resp.status_code != 200:
+            handle_request_error(resp, f"Cluster summary for {project}")
+        return ClusterSummary.from_json(resp.json())
+
+    async def cluster_summaries(self, projects: Iterable[str], workers: int = Config.BULK_WORKERS
+                                ) -> List[Tuple[str, Optional[ClusterSummary], Optional[str]]]:
+        """(project, summary, error) for each project, `workers` requests at a time."""
+        slots = asyncio.Semaphore(workers)
+
+        async def one(project: str):
+            async with slots:
+                try:
+                    return project, await self.cluster_summary(project), None
+                except Exception as e:
+                    return project, None, str(e)
+
+        return await asyncio.gather(*(one(p) for p in projects))
+
+    async def list_templates(self, project: str) -> TemplateInfoList:
+        """Cluster templates available in a project, with the default one."""
+        resp = await self.http.get(self._url(project, "templates"), headers=await self._headers())
+        if resp.status_code != 200:
+            handle_request_error(resp, f"List templates in {project}")
+        return TemplateInfoList.from_json(resp.json())
+
+    async def create_cluster(self, project: str, spec: Dict) -> bool:
+        """
+        Requests a cluster ({"name", "template"?, "nodes": [{"id", "role"}], "labels"?}).
+        Returns False if a cluster of that name already exists (409), which
+        also makes the request safe for the transport to retry. A 409 on a
+        retry counts as created.
+        """
+        payload = {k: v for k, v in spec.items() if v not in (None, "", {})}
+        resp = await self.http.post(self._url(project), headers=await self._headers(), json=payload, idempotent=True)
+        if resp.status_code == 409:
+            # On a retry, an earlier attempt whose response was lost most likely created it
+            return resp.attempts > 1
+        if resp.status_code not in (200, 201):
+            handle_request_error(resp, f"Create cluster {spec.get('name')} in {project}")
+        return True
+
+class ClusterClient:
+    """Blocking wrapper over AsyncClusterClient, executed on the shared event loop."""
+    def __init__(self, token: Optional[str] = None, transport: Optional[AsyncTransport] = None, auth=None):
+        self.aio = AsyncClusterClient(token, transport, auth)
+
+    def iter_clusters(self, project: str, filter: Optional[str] = None,
+                      page_size: int = Config.CLUSTER_PAGE_SIZE) -> Iterator[ClusterInfo]:
+        return sync_iter(self.aio.iter_clusters(project, filter, page_size))
+
+    list_clusters = sync_method("list_clusters")
+    all_clusters = sync_method("all_clusters")
+    cluster_summary = sync_method("cluster_summary")
+    cluster_summaries = sync_method("cluster_summaries")
+    list_templates = sync_method("list_templates")
+    create_cluster = sync_method("create_cluster")
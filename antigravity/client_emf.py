@@ -1,128 +1,270 @@
-import requests
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, List, Optional, Tuple
 from config import Config
 from utils import handle_request_error
+from transport import AsyncTransport, get_transport, sync_method
+from metadata import MetadataCache, get_metadata_cache
+from models.tenancy import OrgListItem, OrgListItemStatusOrgStatus, ProjectListItem
 
-class EMFClient:
-    def __init__(self, token: str):
+STATUS_IDLE = "STATUS_INDICATION_IDLE"
+_NO_STATUS = OrgListItemStatusOrgStatus.from_json({})
+
+class Resource:
+    """One Org or Project as returned by the tenancy API, parsed once."""
+    __slots__ = ("kind", "name", "description", "uid", "status", "message", "timestamp")
+
+    def __init__(self, kind: str, name: Optional[str], description: Optional[str], uid: Optional[str],
+                 status: Optional[str], message: Optional[str], timestamp: Optional[int]):
+        self.kind = kind
+        self.name = name
+        self.description = description
+        self.uid = uid
+        self.status = status
+        self.message = message
+        self.timestamp = timestamp
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"name": self.name, "uid": self.uid, "status": self.status, "message": self.message,
+                "description": self.description, "timestamp": self.timestamp}
+
+    @classmethod
+    def from_json(cls, kind: str, data: Dict, name: Optional[str] = None) -> "Resource":
+        # Single GETs omit "name"; list items carry it (same schema otherwise)
+        if kind == "org":
+            item = OrgListItem.from_json(data)
+            status = item.status.org_status if item.status else None
+        else:
+            item = ProjectListItem.from_json(data)
+            status = item.status.project_status if item.status else None
+        status = status or _NO_STATUS
+        return cls(
+            kind,
+            item.name or name,
+            item.spec.description if item.spec else None,
+            status.u_id,
+            status.status_indicator,
+            status.message,
+            status.time_stamp,
+        )
+
+    @property
+    def ready(self) -> bool:
+        return self.status == STATUS_IDLE
+
+    def __repr__(self):
+        return f"Resource({self.kind}={self.name!r}, uid={self.uid!r}, status={self.status!r})"
+
+class ResponseMemo:
+    """Short-lived (kind, name) -> Resource memo shared by one client for the length of a run."""
+    def __init__(self, ttl: float = Config.EMF_MEMO_TTL):
+        self.ttl = ttl
+        self._entries: Dict[Tuple[str, str], Tuple[float, Resource]] = {}
+
+    def get(self, kind: str, name: str) -> Optional[Resource]:
+        entry = self._entries.get((kind, name))
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def put(self, record: Resource):
+        if record.name:
+            self._entries[(record.kind, record.name)] = (time.monotonic() + self.ttl, record)
+
+    def invalidate(self, kind: str, name: str):
+        self._entries.pop((kind, name), None)
+
+class AsyncEMFClient:
+    def __init__(self, token: Optional[str] = None, transport: Optional[AsyncTransport] = None, auth=None,
+                 cache: Optional[MetadataCache] = None):
+        """
+        token: a fixed bearer token, or
+        auth: an AsyncKeycloakClient whose token is renewed before it expires.
+        cache: persistent name -> UUID cache (defaults to the shared one).
+        """
         self.base_url = Config.EMF_API_URL
         self.token = token
+        self.auth = auth
+        self.http = transport or get_transport()
+        self.memo = ResponseMemo()
+        self.cache = cache or get_metadata_cache()
+
+    def _scope(self, kind: str) -> str:
+        # Orgs are global; the projects a caller sees depend on its org
+        if kind == "org":
+            return self.base_url
+        return f"{self.base_url}|{self.auth.username if self.auth else 'token'}"
 
-    def _headers(self):
+    async def _headers(self):
+        if self.auth:
+            self.token = await self.auth.access_token()
         return {
             "Authorization": f"Bearer {self.token}",
             "Content-Type": "application/json",
             "accept": "application/json"
         }
 
-    def create_org(self, name: str, description: str):
+    async def create_org(self, name: str, description: str):
         url = f"{self.base_url}/v1/orgs/{name}"
         payload = {"description": description}
         # kc-utils.sh sends "accept: application" for create
-        headers = self._headers()
+        headers = await self._headers()
         headers["accept"] = "application"
-        resp = requests.put(url, headers=headers, json=payload, verify=Config.VERIFY_SSL) 
+        resp = await self.http.put(url, headers=headers, json=payload) 
         if resp.status_code != 200:
              handle_request_error(resp, f"Create Org {name}")
+        self.memo.invalidate("org", name)
+        self.cache.invalidate("org", self._scope("org"), name)
 
-    def get_org_status(self, name: str) -> Optional[str]:
-        url = f"{self.base_url}/v1/orgs/{name}"
-        resp = requests.get(url, headers=self._headers(), verify=Config.VERIFY_SSL)
-        if resp.status_code != 200:
-            return None # Or raise
-        
-        data = resp.json()
-        return data.get("status", {}).get("orgStatus", {}).get("statusIndicator")
+    async def get_org(self, name: str, fresh: bool = False) -> Optional[Resource]:
+        """Single GET /v1/orgs/{name}; served from the memo unless fresh=True."""
+        return await self._get("org", name, fresh)
 
-    def get_org_uuid(self, name: str) -> Optional[str]:
-        url = f"{self.base_url}/v1/orgs/{name}"
-        resp = requests.get(url, headers=self._headers(), verify=Config.VERIFY_SSL)
-        if resp.status_code != 200:
-            return None
-        
-        data = resp.json()
-        return data.get("status", {}).get("orgStatus", {}).get("uID")
+    async def get_org_status(self, name: str) -> Optional[str]:
+        org = await self.get_org(name)
+        return org.status if org else None
+
+    async def get_org_uuid(self, name: str) -> Optional[str]:
+        """Served from the metadata cache when possible, else one GET."""
+        return await self._uuid("org", name)
 
-    def create_project(self, name: str, description: str):
+    async def create_project(self, name: str, description: str):
         url = f"{self.base_url}/v1/projects/{name}"
         payload = {"description": description}
         # kc-utils.sh sends "accept: application" for create
-        headers = self._headers()
+        headers = await self._headers()
         headers["accept"] = "application/json"
         
         # update_if_exists only if explicitly needed? Script didn't use it in createProjectInOrg but did in other places? 
         # kc-utils.sh line 129: curl ... -d ...
         # No Params.
-        resp = requests.put(url, headers=headers, json=payload, verify=Config.VERIFY_SSL)
+        resp = await self.http.put(url, headers=headers, json=payload)
         if resp.status_code != 200:
              handle_request_error(resp, f"Create Project {name}")
+        self.memo.invalidate("project", name)
+        self.cache.invalidate("project", self._scope("project"), name)
 
-    def get_project_status(self, name: str) -> Optional[str]:
-        url = f"{self.base_url}/v1/projects/{name}"
-        resp = requests.get(url, headers=self._headers(), verify=Config.VERIFY_SSL)
-        if resp.status_code != 200:
-            return None
-        
-        data = resp.json()
-        return data.get("status", {}).get("projectStatus", {}).get("statusIndicator")
+    async def get_project(self, name: str, fresh: bool = False) -> Optional[Resource]:
+        """Single GET /v1/projects/{name}; served from the memo unless fresh=True."""
+        return await self._get("project", name, fresh)
 
-    def get_project_uuid(self, name: str) -> Optional[str]:
-        url = f"{self.base_url}/v1/projects/{name}"
-        resp = requests.get(url, headers=self._headers(), verify=Config.VERIFY_SSL)
-        if resp.status_code != 200:
-            return None
-        
-        data = resp.json()
-        return data.get("status", {}).get("projectStatus", {}).get("uID")
+    async def get_project_status(self, name: str) -> Optional[str]:
+        project = await self.get_project(name)
+        return project.status if project else None
+
+    async def get_project_uuid(self, name: str) -> Optional[str]:
+        """Served from the metadata cache when possible, else one GET."""
+        return await self._uuid("project", name)
+
+    async def delete_org(self, name: str) -> bool:
+        """Requests deletion of an Org (its Projects must be gone); False if it did not exist."""
+        return await self._delete("org", name)
+
+    async def delete_project(self, name: str) -> bool:
+        """Requests deletion of a Project in the caller's Org; False if it did not exist."""
+        return await self._delete("project", name)
 
-    def list_orgs(self, details: bool = False) -> Any:
-        """Returns name:uuid dict, or list of detailed dicts if details=True"""
-        url = f"{self.base_url}/v1/orgs"
-        resp = requests.get(url, headers=self._headers(), verify=Config.VERIFY_SSL)
+    async def _delete(self, kind: str, name: str) -> bool:
+        # Deletion is asynchronous: the record stays listed until the tenant controller removes it
+        url = f"{self.base_url}/v1/{kind}s/{name}"
+        resp = await self.http.delete(url, headers=await self._headers())
+        self.memo.invalidate(kind, name)
+        self.cache.invalidate(kind, self._scope(kind), name)
+        if resp.status_code == 404:
+            return False
+        if resp.status_code not in (200, 204):
+            handle_request_error(resp, f"Delete {kind.capitalize()} {name}")
+        return True
+
+    async def _uuid(self, kind: str, name: str) -> Optional[str]:
+        cached = self.cache.get(kind, self._scope(kind), name)
+        if cached:
+            return cached[0]
+        record = await self._get(kind, name, fresh=False)
+        return record.uid if record else None
+
+    async def _get(self, kind: str, name: str, fresh: bool) -> Optional[Resource]:
+        if not fresh:
+            cached = self.memo.get(kind, name)
+            if cached:
+                return cached
+
+        url = f"{self.base_url}/v1/{kind}s/{name}"
+        resp = await self.http.get(url, headers=await self._headers())
+        if resp.status_code == 404:
+            return None
         if resp.status_code != 200:
-            return [] if details else {}
-        
-        data = resp.json()
-        if details:
-            results = []
-            for item in data:
-                name = item.get("name")
-                status = item.get("status", {}).get("orgStatus", {})
-                uuid = status.get("uID")
-                indicator = status.get("statusIndicator")
-                results.append({"name": name, "uuid": uuid, "status": indicator})
-            return results
-
-        orgs = {}
-        for item in data:
-            name = item.get("name")
-            uuid = item.get("status", {}).get("orgStatus", {}).get("uID")
-            if name and uuid:
-                orgs[name] = uuid
-        return orgs
-
-    def list_projects(self, details: bool = False) -> Any:
-        """Returns name:uuid dict, or list of detailed dicts if details=True"""
-        url = f"{self.base_url}/v1/projects"
-        resp = requests.get(url, headers=self._headers(), verify=Config.VERIFY_SSL)
+            handle_request_error(resp, f"Get {kind.capitalize()} {name}")
+
+        record = Resource.from_json(kind, resp.json(), name)
+        self.memo.put(record)
+        self.cache.put(kind, self._scope(kind), name, record.uid, record.status, record.ready)
+        return record
+
+    async def _list(self, kind: str) -> List[Resource]:
+        url = f"{self.base_url}/v1/{kind}s"
+        resp = await self.http.get(url, headers=await self._headers())
         if resp.status_code != 200:
-            return [] if details else {}
-        
-        data = resp.json()
-        if details:
-            results = []
-            for item in data:
-                name = item.get("name")
-                status = item.get("status", {}).get("projectStatus", {})
-                uuid = status.get("uID")
-                indicator = status.get("statusIndicator")
-                results.append({"name": name, "uuid": uuid, "status": indicator})
-            return results
-
-        projects = {}
-        for item in data:
-            name = item.get("name")
-            uuid = item.get("status", {}).get("projectStatus", {}).get("uID")
-            if name and uuid:
-                projects[name] = uuid
-        return projects
+            # An empty list would read as "everything deleted" to the poller and the planners
+            handle_request_error(resp, f"List {kind.capitalize()}s")
+
+        records = [Resource.from_json(kind, item) for item in resp.json()]
+        for r in records:
+            self.memo.put(r)
+        self.cache.put_all(kind, self._scope(kind), ((r.name, r.uid, r.status, r.ready) for r in records))
+        return records
+
+    async def _names(self, kind: str, fresh: bool) -> Dict[str, str]:
+        if not fresh:
+            cached = self.cache.get_all(kind, self._scope(kind))
+            if cached is not None:
+                return cached
+        return {r.name: r.uid for r in await self._list(kind) if r.name and r.uid}
+
+    async def list_org_records(self) -> List[Resource]:
+        return await self._list("org")
+
+    async def list_project_records(self) -> List[Resource]:
+        return await self._list("project")
+
+    async def list_orgs(self, details: bool = False, fresh: bool = False) -> Any:
+        """
+        Returns name:uuid dict (from the metadata cache unless fresh=True),
+        or the live Resource records if details=True
+        """
+        if not details:
+            return await self._names("org", fresh)
+        return await self._list("org")
+
+    async def list_projects(self, details: bool = False, fresh: bool = False) -> Any:
+        """
+        Returns name:uuid dict (from the metadata cache unless fresh=True),
+        or the live Resource records if details=True
+        """
+        if not details:
+            return await self._names("project", fresh)
+        return await self._list("project")
+
+class EMFClient:
+    """Blocking wrapper over AsyncEMFClient, executed on the shared event loop."""
+    def __init__(self, token: Optional[str] = None, transport: Optional[AsyncTransport] = None, auth=None,
+                 cache: Optional[MetadataCache] = None):
+        self.aio = AsyncEMFClient(token, transport, auth, cache)
+
+    @property
+    def token(self) -> str:
+        return self.aio.token
+
+    create_org = sync_method("create_org")
+    get_org = sync_method("get_org")
+    get_org_status = sync_method("get_org_status")
+    get_org_uuid = sync_method("get_org_uuid")
+    delete_org = sync_method("delete_org")
+    create_project = sync_method("create_project")
+    get_project = sync_method("get_project")
+    get_project_status = sync_method("get_project_status")
+    get_project_uuid = sync_method("get_project_uuid")
+    delete_project = sync_method("delete_project")
+    list_orgs = sync_method("list_orgs")
+    list_org_records = sync_method("list_org_records")
+    list_project_records = sync_method("list_project_records")
+    list_projects = sync_method("list_projects")
@@ -0,0 +1,242 @@
+import asyncio
+from typing import AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import aiohttp
+from config import Config
+from utils import handle_request_error
+from transport import AsyncTransport, TokenBucket, get_transport, sync_iter, sync_method
+from models.infra import Host, HostsList, HostsSummary
+
+# The hosts API rejects offsets above this; paging continues by resourceId instead
+MAX_OFFSET = 10000
+
+class AsyncInfraClient:
+    """
+    Edge Infrastructure Manager (EIM) inventory API. Paths are project-scoped,
+    so `auth` must belong to a user of the project's Org (e.g. {org}-admin).
+    """
+    def __init__(self, token: Optional[str] = None, transport: Optional[AsyncTransport] = None, auth=None):
+        self.base_url = Config.EMF_API_URL
+        self.token = token
+        self.auth = auth
+        self.http = transport or get_transport()
+
+    async def _headers(self):
+        if self.auth:
+            self.token = await self.auth.access_token()
+        return {
+            "Authorization": f"Bearer {self.token}",
+            "Content-Type": "application/json",
+            "accept": "application/json"
+        }
+
+    def _hosts_url(self, project: str) -> str:
+        return f"{self.base_url}/v1/projects/{project}/compute/hosts"
+
+    async def list_hosts(self, project: str, offset: int = 0, page_size: int = Config.INFRA_PAGE_SIZE,
+                         filter: Optional[str] = None, order_by: Optional[str] = None) -> HostsList:
+        """One page: hosts, has_next, total_elements."""
+        params = {"offset": str(offset), "pageSize": str(page_size)}
+        if filter:
+            params["filter"] = filter
+        if order_by:
+            params["orderBy"] = order_by
+        resp = await self.http.get(self._hosts_url(project), headers=await self._headers(), params=params)
+        if resp.status_code != 200:
+            handle_request_error(resp, f"List hosts in {project}")
+        return HostsList.from_json(resp.json())
+
+    async def iter_host_pages(self, project: str, filter: Optional[str] = None,
+                              page_size: int = Config.INFRA_PAGE_SIZE) -> AsyncIterator[Sequence[Host]]:
+        """
+        Yields hosts page by page, ordered by resourceId. The next page is
+        requested while the current one is being consumed, so at most two
+        pages are in memory. Beyond MAX_OFFSET the listing continues after the
+        last resourceId seen (keyset paging), so large projects are complete.
+        """
+        offset, after = 0, None
+
+        def fetch():
+            query = filter
+            if after:
+                clause = f'resourceId > "{after}"'
+                query = f"({filter}) AND {clause}" if filter else clause
+            return asyncio.ensure_future(self.list_hosts(project, offset, page_size, query, "resourceId"))
+
+        pending = fetch()
+        try:
+            while pending:
+                page = await pending
+                pending = None
+                hosts = page.hosts or ()
+                if page.has_next and hosts:
+                    offset += len(hosts)
+                    if offset > MAX_OFFSET:
+                        offset, after = 0, hosts[-1].resource_id
+                    pending = fetch()
+                if hosts:
+                    yield hosts
+        finally:
+            if pending:
+                pending.cancel()
+                # Waits for the cancelled request to unwind, so no request outlives the iterator
+                await asyncio.gather(pending, return_exceptions=True)
+
+    async def iter_hosts(self, project: str, filter: Optional[str] = None,
+                         page_size: int = Config.INFRA_PAGE_SIZE, limit: Optional[int] = None) -> AsyncIterator[Host]:
+        """Streams hosts one by one across pages, stopping after `limit` hosts."""
+        if limit is not None:
+            page_size = min(page_size, max(limit, 1))
+        if limit == 0:
+            return
+        count = 0
+        pages = self.iter_host_pages(project, filter, page_size)
+        try:
+            async for page in pages:
+                for host in page:
+                    count += 1
+                    yield host
+                    if count == limit:
+                        return
+        finally:
+            # Cancels the prefetched page now rather than whenever the generator is collected
+            await pages.aclose()
+
+    async def scan_hosts(self, projects: Iterable[str], filter: Optional[str] = None, workers: int = Config.BULK_WORKERS,
+                         page_size: int = Config.INFRA_PAGE_SIZE) -> AsyncIterator[Tuple[str, Sequence[Host], Optional[str]]]:
+        """
+        Streams (project, hosts, error) pages from many projects, `workers`
+        projects at a time, in arrival order. Pages go through a bounded queue,
+        so producers pause while the consumer is behind and memory stays flat.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=workers)
+        slots = asyncio.Semaphore(workers)
+        done = object()
+
+        async def produce(project: str):
+            async with slots:
+                try:
+                    async for page in self.iter_host_pages(project, filter, page_size):
+                        await queue.put((project, page, None))
+                except Exception as e:
+                    await queue.put((project, [], str(e)))
+                await queue.put(done)
+
+        tasks = [asyncio.ensure_future(produce(p)) for p in projects]
+        remaining = len(tasks)
+        try:
+            while remaining:
+                item = await queue.get()
+                if item is done:
+                    remaining -= 1
+                    continue
+                yield item
+        finally:
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def host_summary(self, project: str, filter: Optional[str] = None) -> HostsSummary:
+        """Server-side counts: total, running, error, unallocated."""
+        params = {"filter": filter} if filter else None
+        resp = await self.http.get(f"{self._hosts_url(project)}/summary", headers=await self._headers(), params=params)
+        if resp.status_code != 200:
+            handle_request_error(resp, f"Host summary for {project}")
+        return HostsSummary.from_json(resp.json())
+
+    async def host_summaries(self, projects: Iterable[str], filter: Optional[str] = None,
+                             workers: int = Config.BULK_WORKERS) -> List[Tuple[str, Optional[HostsSummary], Optional[str]]]:
+        """(project, summary, error) for each project, `workers` requests at a time."""
+        slots = asyncio.Semaphore(workers)
+
+        async def one(project: str):
+            async with slots:
+                try:
+                    return project, await self.host_summary(project, filter), None
+                except Exception as e:
+                    return project, None, str(e)
+
+        return await asyncio.gather(*(one(p) for p in projects))
+
+    async def register_host(self, project: str, host: Dict, retries: int = Config.HOST_REGISTER_RETRIES,
+                            limiter: Optional[TokenBucket] = None) -> Optional[Host]:
+        """
+        Pre-registers one host ({"name", "serialNumber"?, "uuid"?, "autoOnboard"?}).
+        Returns the new Host, or None if it is already registered (409).
+        Waits for `limiter` first. A repeated registration only yields a 409,
+        so the transport may retry it on 5xx and connection errors too; a 409
+        on a retry is looked up and returned as registered.
+        """
+        url = f"{self._hosts_url(project)}/register"
+        payload = {k: v for k, v in host.items() if v not in (None, "")}
+        label = host.get("serialNumber") or host.get("uuid")
+        if limiter:
+            await limiter.acquire()
+        try:
+            resp = await self.http.post(url, headers=await self._headers(), json=payload,
+                                        idempotent=True, retries=retries)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise Exception(f"Error Register host {label}: {e or type(e).__name__}")
+        if resp.status_code == 409:
+            if resp.attempts > 1:
+                # An earlier attempt whose response was lost most likely registered the host
+                return await self.find_host(project, host)
+            return None
+        if resp.status_code not in (200, 201):
+            handle_request_error(resp, f"Register host {label}")
+        return Host.from_json(resp.json())
+
+    async def find_host(self, project: str, host: Dict) -> Optional[Host]:
+        """The registered host with the serial number (else UUID) of a host spec, or None."""
+        field = "serialNumber" if host.get("serialNumber") else "uuid"
+        page = await self.list_hosts(project, 0, 1, f'{field}="{host[field]}"')
+        return page.hosts[0] if page.hosts else None
+
+    async def register_hosts(self, project: str, hosts: Iterable[Dict], workers: int = Config.HOST_REGISTER_WORKERS,
+                             rate: float = Config.HOST_REGISTER_RATE, retries: int = Config.HOST_REGISTER_RETRIES,
+                             on_result: Optional[Callable[[Dict], None]] = None) -> Dict[str, int]:
+        """
+        Registers hosts through `workers` concurrent senders sharing one rate
+        limit of `rate` hosts/s. Each outcome
+        {"name", "serialNumber", "uuid", "status": registered|exists|failed,
+        "resourceId", "error"} goes to on_result as soon as it is known.
+        Returns counts per status.
+        """
+        limiter = TokenBucket(rate)
+        counts = {"registered": 0, "exists": 0, "failed": 0}
+        pending = iter(hosts)
+
+        async def sender():
+            # Senders pull from one iterator, so at most `workers` hosts are in flight
+            for host in pending:
+                result = {k: host.get(k) for k in ("name", "serialNumber", "uuid")}
+                try:
+                    created = await self.register_host(project, host, retries, limiter)
+                    result.update(status="registered" if created else "exists",
+                                  resourceId=created.resource_id if created else None, error=None)
+                except Exception as e:
+                    result.update(status="failed", resourceId=None, error=str(e))
+                counts[result["status"]] += 1
+                if on_result:
+                    on_result(result)
+
+        await asyncio.gather(*(sender() for _ in range(max(1, workers))))
+        return counts
+
+class InfraClient:
+    """Blocking wrapper over AsyncInfraClient, executed on the shared event loop."""
+    def __init__(self, token: Optional[str] = None, transport: Optional[AsyncTransport] = None, auth=None):
+        self.aio = AsyncInfraClient(token, transport, auth)
+
+    def iter_hosts(self, project: str, filter: Optional[str] = None,
+                   page_size: int = Config.INFRA_PAGE_SIZE, limit: Optional[int] = None) -> Iterator[Host]:
+        return sync_iter(self.aio.iter_hosts(project, filter, page_size, limit))
+
+    def scan_hosts(self, projects: Iterable[str], filter: Optional[str] = None, workers: int = Config.BULK_WORKERS,
+                   page_size: int = Config.INFRA_PAGE_SIZE) -> Iterator[Tuple[str, Sequence[Host], Optional[str]]]:
+        return sync_iter(self.aio.scan_hosts(projects, filter, workers, page_size))
+
+    list_hosts = sync_method("list_hosts")
+    host_summary = sync_method("host_summary")
+    host_summaries = sync_method("host_summaries")
+    register_host = sync_method("register_host")
+    register_hosts = sync_method("register_hosts")
@@ -1,69 +1,165 @@
-import requests
-from typing import List, Dict, Optional
+import asyncio
+import hmac
+import time
+from typing import AsyncIterator, Iterable, Iterator, List, Dict, Optional
 from config import Config
-from utils import handle_request_error
+from utils import handle_request_error, split_group_name
+from transport import AsyncTransport, get_transport, run_sync, sync_iter, sync_method
+from tokens import TokenManager, get_token_manager
 
-class KeycloakClient:
-    def __init__(self):
+class LoginFailed(Exception):
+    """The token endpoint rejected the credentials (401)."""
+
+class GroupIndex:
+    """
+    In-memory index of the realm's top-level groups, keyed by exact name and
+    by {uuid: {suffix: group}}. Loaded with one paginated listing on first use;
+    afterwards only lookups that miss cause a refresh, done as one `?search=`
+    per missing UUID prefix (or a full reload when too many prefixes miss).
+    """
+    def __init__(self, kc: "AsyncKeycloakClient", search_limit: int = Config.GROUP_INDEX_SEARCH_LIMIT):
+        self.kc = kc
+        self.search_limit = search_limit
+        self.by_name: Dict[str, Dict] = {}
+        self.by_uuid: Dict[str, Dict[str, Dict]] = {}
+        self.loaded = False
+        self._lock = asyncio.Lock()
+
+    def _add(self, group: Dict):
+        self.by_name[group["name"]] = group
+        uuid, suffix = split_group_name(group["name"])
+        if uuid:
+            self.by_uuid.setdefault(uuid, {})[suffix] = group
+
+    async def load(self):
+        groups = await self.kc.list_all_groups()
+        self.by_name, self.by_uuid = {}, {}
+        for g in groups:
+            self._add(g)
+        self.loaded = True
+
+    async def _refresh(self, missing: List[str]):
+        prefixes = {split_group_name(n)[0] or n for n in missing}
+        if len(prefixes) > self.search_limit:
+            await self.load()
+            return
+        pages = await asyncio.gather(*(self.kc.list_all_groups(search=p) for p in prefixes))
+        for page in pages:
+            for g in page:
+                self._add(g)
+
+    async def resolve(self, names: Iterable[str], refresh: bool = True) -> Dict[str, Optional[Dict]]:
+        """Looks up a batch of group names; returns {name: group or None}."""
+        names = list(names)
+        async with self._lock:
+            if not self.loaded:
+                await self.load()
+            elif refresh:
+                missing = [n for n in names if n not in self.by_name]
+                if missing:
+                    await self._refresh(missing)
+        return {n: self.by_name.get(n) for n in names}
+
+    async def get(self, name: str) -> Optional[Dict]:
+        return (await self.resolve([name]))[name]
+
+    def for_uuid(self, uuid: str) -> Dict[str, Dict]:
+        """{suffix: group} for every indexed group of an Org or Project UUID."""
+        return self.by_uuid.get(uuid, {})
+
+class AsyncKeycloakClient:
+    def __init__(self, transport: Optional[AsyncTransport] = None, tokens: Optional[TokenManager] = None):
         self.base_url = Config.KEYCLOAK_URL
         self.realm = Config.KEYCLOAK_REALM
         self.token = None
+        self.http = transport or get_transport()
+        self.tokens = tokens or get_token_manager()
+        self._session: Optional[Dict] = None
+        self._credentials = None
+        self.groups = GroupIndex(self)
 
-    def login(self, username: str = None, password: str = None):
+    async def login(self, username: str = None, password: str = None, force: bool = False):
+        """
+        Authenticates through the shared TokenManager: a cached or refreshed
+        token is used when possible, the password grant only as a fallback.
+        force=True bypasses the cached access token (e.g. after group changes).
+        """
         if not username:
              username = Config.KEYCLOAK_ADMIN_USER
         if not password:
              password = Config.KEYCLOAK_ADMIN_PASS
-        
+
+        self._credentials = (username, password)
+        self._session = await self.tokens.token_for(self, username, password, force=force)
+        self.token = self._session["access_token"]
+
+    def has_password(self, password: str) -> bool:
+        """Whether the client logged in with this password (constant-time comparison)."""
+        return bool(self._credentials) and hmac.compare_digest(self._credentials[1].encode(), password.encode())
+
+    @property
+    def username(self) -> str:
+        """The user this client authenticates as."""
+        return self._credentials[0] if self._credentials else Config.KEYCLOAK_ADMIN_USER
+
+    async def access_token(self) -> str:
+        """Current access token, renewed shortly before it expires."""
+        if not self._session:
+            await self.login()
+        elif self._session["expires_at"] - self.tokens.skew <= time.time():
+            await self.login(*self._credentials)
+        return self.token
+
+    async def _token_request(self, data: Dict, context: str) -> Dict:
         url = f"{self.base_url}/realms/{self.realm}/protocol/openid-connect/token"
-        data = {
+        data = dict(data, client_id=Config.KEYCLOAK_CLIENT_ID)
+        resp = await self.http.post(url, data=data, idempotent=True)
+        if resp.status_code != 200:
+            handle_request_error(resp, context, LoginFailed if resp.status_code == 401 else Exception)
+        return resp.json()
+
+    async def password_grant(self, username: str, password: str) -> Dict:
+        return await self._token_request({
             "username": username,
             "password": password,
             "grant_type": "password",
-            "client_id": Config.KEYCLOAK_CLIENT_ID,
             "scope": Config.KEYCLOAK_SCOPE,
-        }
-        resp = requests.post(url, data=data, verify=Config.VERIFY_SSL) 
-        if resp.status_code != 200:
-            handle_request_error(resp, "Login failed")
-        self.token = resp.json()["access_token"]
+        }, "Login failed")
+
+    async def refresh_grant(self, refresh_token: str) -> Dict:
+        return await self._token_request({
+            "grant_type": "refresh_token",
+            "refresh_token": refresh_token,
+        }, "Token refresh failed")
 
-    def _headers(self):
-        if not self.token:
-            self.login()
+    async def _headers(self):
         return {
-            "Authorization": f"Bearer {self.token}",
+            "Authorization": f"Bearer {await self.access_token()}",
             "Content-Type": "application/json"
         }
     
-    def get_realm_password_policy(self) -> str:
+    async def get_realm_password_policy(self) -> str:
         """Fetches the password policy description from the realm."""
         url = f"{self.base_url}/admin/realms/{self.realm}"
-        resp = requests.get(url, headers=self._headers(), verify=Config.VERIFY_SSL)
+        resp = await self.http.get(url, headers=await self._headers())
         if resp.status_code != 200:
              handle_request_error(resp, "Get Realm Policy")
         
         data = resp.json()
         return data.get("passwordPolicy", "No explicit policy found (check Keycloak Console)")
 
-    def get_user(self, username: str) -> Optional[Dict]:
+    async def get_user(self, username: str) -> Optional[Dict]:
         url = f"{self.base_url}/admin/realms/{self.realm}/users"
-        resp = requests.get(url, headers=self._headers(), params={"username": username, "exact": "true"}, verify=Config.VERIFY_SSL)
+        resp = await self.http.get(url, headers=await self._headers(), params={"username": username, "exact": "true"})
         if resp.status_code != 200:
             handle_request_error(resp, f"Get user {username}")
         
         users = resp.json()
         return users[0] if users else None
 
-    def create_user(self, username: str, password: str, email: Optional[str] = None) -> str:
-        """Creates a user and returns their ID."""
-        # Check if exists
-        existing = self.get_user(username)
-        if existing:
-            return existing["id"]
-
-        url = f"{self.base_url}/admin/realms/{self.realm}/users"
-        payload = {
+    @staticmethod
+    def _user_payload(username: str, password: str, email: Optional[str] = None) -> Dict:
+        return {
             "username": username,
             "enabled": True,
             "email": email or f"{username}@{Config.KEYCLOAK_REALM}",
@@ -74,61 +170,254 @@ class KeycloakClient:
                 "temporary": False
             }]
         }
-        resp = requests.post(url, headers=self._headers(), json=payload, verify=Config.VERIFY_SSL)
+
+    async def _post_user(self, username: str, password: str, email: Optional[str] = None) -> Optional[str]:
+        """POSTs a user; returns the new ID from the Location header, or None if it already exists."""
+        url = f"{self.base_url}/admin/realms/{self.realm}/users"
+        payload = self._user_payload(username, password, email)
+        # A repeated POST only yields a 409, so it is safe to retry
+        resp = await self.http.post(url, headers=await self._headers(), json=payload, idempotent=True)
+        if resp.status_code == 409:
+            if resp.attempts > 1:
+                # An earlier attempt whose response was lost most likely created the user
+                user = await self.get_user(username)
+                return user["id"] if user else None
+            return None
         if resp.status_code != 201:
             handle_request_error(resp, f"Create user {username}")
-        
-        # Fetch ID
-        return self.get_user(username)["id"]
 
-    def search_users(self, query: str) -> List[Dict]:
+        location = resp.headers.get("Location", "")
+        if location:
+            return location.rstrip("/").rsplit("/", 1)[-1]
+        # Older Keycloak without Location: look the ID up
+        return (await self.get_user(username))["id"]
+
+    async def create_user(self, username: str, password: str, email: Optional[str] = None) -> str:
+        """Creates a user and returns their ID (the existing ID if the user already exists)."""
+        user_id = await self._post_user(username, password, email)
+        if user_id:
+            return user_id
+        return (await self.get_user(username))["id"]
+
+    async def user_snapshot(self) -> Dict[str, str]:
+        """{username: id} for every user in the realm, from one paginated listing."""
+        snapshot = {}
+        async for page in self.iter_user_pages(brief=True):
+            for u in page:
+                snapshot[u["username"].lower()] = u["id"]
+        return snapshot
+
+    async def create_users(self, users: List[Dict], existing: Optional[Dict[str, str]] = None) -> List[Dict]:
+        """
+        Creates many users concurrently (bounded by the transport).
+        users: [{"username", "password", "email"?}]
+        existing: {username: id} snapshot; users found there are not POSTed.
+        Returns one result per user: {"username", "id", "status": created|exists|failed, "error"}.
+        """
+        existing = existing or {}
+
+        async def one(spec: Dict) -> Dict:
+            username = spec["username"]
+            known = existing.get(username.lower())
+            if known:
+                return {"username": username, "id": known, "status": "exists", "error": None}
+            try:
+                user_id = await self._post_user(username, spec["password"], spec.get("email"))
+                if user_id:
+                    return {"username": username, "id": user_id, "status": "created", "error": None}
+                # Created by someone else since the snapshot
+                user = await self.get_user(username)
+                return {"username": username, "id": user["id"] if user else None, "status": "exists", "error": None}
+            except Exception as e:
+                return {"username": username, "id": None, "status": "failed", "error": str(e)}
+
+        return list(await asyncio.gather(*(one(u) for u in users)))
+
+    async def partial_import_users(self, users: List[Dict], batch_size: int = Config.KEYCLOAK_IMPORT_BATCH) -> List[Dict]:
+        """
+        Creates users through the realm partialImport endpoint, `batch_size`
+        users per request, skipping those that already exist.
+        Same result format as create_users.
+        """
+        url = f"{self.base_url}/admin/realms/{self.realm}/partialImport"
+        results: List[Dict] = []
+        for i in range(0, len(users), batch_size):
+            batch = users[i:i + batch_size]
+            payload = {
+                "ifResourceExists": "SKIP",
+                "users": [self._user_payload(u["username"], u["password"], u.get("email")) for u in batch],
+            }
+            # Not retried: a batch re-sent after a lost response would report its own users as SKIPPED.
+            # A failed batch is reported as failed, and importing the file again is safe.
+            resp = await self.http.post(url, headers=await self._headers(), json=payload)
+            if resp.status_code != 200:
+                error = f"{resp.status_code} - {resp.text}"
+                results.extend({"username": u["username"], "id": None, "status": "failed", "error": error} for u in batch)
+                continue
+
+            by_name = {}
+            for r in resp.json().get("results", []):
+                if r.get("resourceType") == "USER":
+                    by_name[r.get("resourceName", "").lower()] = r
+            for u in batch:
+                r = by_name.get(u["username"].lower(), {})
+                status = {"ADDED": "created", "SKIPPED": "exists", "OVERWRITTEN": "created"}.get(r.get("action"), "failed")
+                results.append({"username": u["username"], "id": r.get("id"), "status": status,
+                                "error": None if status != "failed" else "missing from import result"})
+        return results
+
+    async def search_users(self, query: str) -> List[Dict]:
         """Search users by username, email, etc."""
         url = f"{self.base_url}/admin/realms/{self.realm}/users"
         # 'search' param does fuzzy search across fields
-        resp = requests.get(url, headers=self._headers(), params={"search": query}, verify=Config.VERIFY_SSL)
+        resp = await self.http.get(url, headers=await self._headers(), params={"search": query})
         if resp.status_code != 200:
             handle_request_error(resp, f"Search users {query}")
         return resp.json()
 
-    def get_group_by_path(self, path: str) -> Optional[Dict]:
-        # Keycloak API for group path usually is not direct search, using search instead
-        # Or poll for it.
-        # EMF creates groups like "[OrgUUID]_Project-Manager-Group"
-        # We can search for the name.
+    async def list_users(self, query: Optional[str] = None, first: int = 0,
+                         max: int = Config.KEYCLOAK_PAGE_SIZE, brief: bool = True) -> List[Dict]:
+        """One page of users (first/max), optionally filtered by a fuzzy search."""
+        url = f"{self.base_url}/admin/realms/{self.realm}/users"
+        params = {"first": str(first), "max": str(max), "briefRepresentation": str(brief).lower()}
+        if query:
+            params["search"] = query
+        resp = await self.http.get(url, headers=await self._headers(), params=params)
+        if resp.status_code != 200:
+            handle_request_error(resp, "List users")
+        return resp.json()
+
+    async def iter_user_pages(self, query: Optional[str] = None, brief: bool = True,
+                              page_size: int = Config.KEYCLOAK_PAGE_SIZE) -> AsyncIterator[List[Dict]]:
+        """
+        Yields users page by page. The next page is requested while the
+        current one is being consumed, so at most two pages are in memory.
+        """
+        first = 0
+        pending = asyncio.ensure_future(self.list_users(query, first, page_size, brief))
+        try:
+            while pending:
+                page = await pending
+                pending = None
+                if len(page) == page_size:
+                    first += page_size
+                    pending = asyncio.ensure_future(self.list_users(query, first, page_size, brief))
+                if page:
+                    yield page
+        finally:
+            if pending:
+                pending.cancel()
+                # Waits for the cancelled request to unwind, so no request outlives the iterator
+                await asyncio.gather(pending, return_exceptions=True)
+
+    async def iter_users(self, query: Optional[str] = None, brief: bool = True,
+                         page_size: int = Config.KEYCLOAK_PAGE_SIZE, limit: Optional[int] = None) -> AsyncIterator[Dict]:
+        """Streams users one by one across pages, stopping after `limit` users."""
+        if limit is not None:
+            page_size = min(page_size, max(limit, 1))
+        if limit == 0:
+            return
+        count = 0
+        pages = self.iter_user_pages(query, brief, page_size)
+        try:
+            async for page in pages:
+                for user in page:
+                    count += 1
+                    yield user
+                    if count == limit:
+                        return
+        finally:
+            # Cancels the prefetched page now rather than whenever the generator is collected
+            await pages.aclose()
+
+    async def get_group_by_path(self, path: str) -> Optional[Dict]:
+        # EMF creates groups like "[OrgUUID]_Project-Manager-Group" at the realm root.
+        # Served from the group index; a miss triggers a targeted refresh.
+        return await self.groups.get(path)
+
+    async def list_groups(self, search: Optional[str] = None, first: Optional[int] = None,
+                          max: Optional[int] = None) -> List[Dict]:
+        """One page of top-level realm groups (EMF creates its groups at the root)."""
         url = f"{self.base_url}/admin/realms/{self.realm}/groups"
-        # Searching by name
-        resp = requests.get(url, headers=self._headers(), params={"search": path}, verify=Config.VERIFY_SSL)
+        params = {"briefRepresentation": "true"}
+        if search:
+            params["search"] = search
+        if first is not None:
+            params["first"] = str(first)
+        if max is not None:
+            params["max"] = str(max)
+        resp = await self.http.get(url, headers=await self._headers(), params=params)
         if resp.status_code != 200:
-             handle_request_error(resp, f"Get group {path}")
-        
-        groups = resp.json()
-        # Filter for exact match or reliable partial
-        for g in groups:
-            if path == g["name"]: 
-                return g
-        return None
+             handle_request_error(resp, "List groups")
+        return resp.json()
 
-    def add_user_to_group(self, user_id: str, group_id: str):
+    async def list_all_groups(self, search: Optional[str] = None,
+                              page_size: int = Config.KEYCLOAK_PAGE_SIZE) -> List[Dict]:
+        """Every top-level group, fetched page by page with first/max."""
+        groups: List[Dict] = []
+        first = 0
+        while True:
+            page = await self.list_groups(search, first, page_size)
+            groups.extend(page)
+            if len(page) < page_size:
+                return groups
+            first += page_size
+
+    async def group_members(self, group_id: str, page_size: int = Config.KEYCLOAK_PAGE_SIZE) -> List[Dict]:
+        """Every (brief) user that is a direct member of a group, fetched page by page."""
+        url = f"{self.base_url}/admin/realms/{self.realm}/groups/{group_id}/members"
+        members: List[Dict] = []
+        first = 0
+        while True:
+            params = {"first": str(first), "max": str(page_size), "briefRepresentation": "true"}
+            resp = await self.http.get(url, headers=await self._headers(), params=params)
+            if resp.status_code == 404:
+                return members
+            if resp.status_code != 200:
+                handle_request_error(resp, f"List members of group {group_id}")
+            page = resp.json()
+            members.extend(page)
+            if len(page) < page_size:
+                return members
+            first += page_size
+
+    async def delete_user(self, user_id: str) -> bool:
+        """Deletes a user; False if it was already gone."""
+        url = f"{self.base_url}/admin/realms/{self.realm}/users/{user_id}"
+        resp = await self.http.delete(url, headers=await self._headers())
+        if resp.status_code == 404:
+            return False
+        if resp.status_code not in [204, 200]:
+            handle_request_error(resp, f"Delete user {user_id}")
+        return True
+
+    async def add_user_to_group(self, user_id: str, group_id: str):
         url = f"{self.base_url}/admin/realms/{self.realm}/users/{user_id}/groups/{group_id}"
-        resp = requests.put(url, headers=self._headers(), verify=Config.VERIFY_SSL)
+        resp = await self.http.put(url, headers=await self._headers())
         if resp.status_code not in [204, 200]: # 204 No Content is success
              handle_request_error(resp, f"Add user {user_id} to group {group_id}")
 
-    def get_user_groups(self, user_id: str) -> List[Dict]:
+    async def remove_user_from_group(self, user_id: str, group_id: str):
+        url = f"{self.base_url}/admin/realms/{self.realm}/users/{user_id}/groups/{group_id}"
+        resp = await self.http.delete(url, headers=await self._headers())
+        if resp.status_code not in [204, 200]:
+             handle_request_error(resp, f"Remove user {user_id} from group {group_id}")
+
+    async def get_user_groups(self, user_id: str) -> List[Dict]:
         url = f"{self.base_url}/admin/realms/{self.realm}/users/{user_id}/groups"
-        resp = requests.get(url, headers=self._headers(), verify=Config.VERIFY_SSL)
+        resp = await self.http.get(url, headers=await self._headers())
         if resp.status_code != 200:
              handle_request_error(resp, f"Get groups for user {user_id}")
         return resp.json()
 
-    def validate_user_constraints(self, user_id: str, new_group_name: str):
+    async def validate_user_constraints(self, user_id: str, new_group_name: str):
         """
         Enforce constraints:
         1. Single Organization (Group format: [UUID]_Project-Manager-Group or similar)
         2. Single Edge-Onboarding-Group
         3. Do not add exact duplicate group (idempotency check done by caller usually, but good to know)
         """
-        current_groups = self.get_user_groups(user_id)
+        current_groups = await self.get_user_groups(user_id)
         
         # Check 1: Edge-Onboarding-Group uniqueness
         if "Edge-Onboarding-Group" in new_group_name:
@@ -160,3 +449,43 @@ class KeycloakClient:
                             import logging
                             logging.warning(f"Potential Multi-Org violation: User belongs to {existing_uuid}, adding to {new_org_uuid}. Proceeding cautiously.")
                             # raise ValueError(f"User belongs to another Org ({existing_uuid}). Cannot add to {new_org_uuid}.")
+
+class KeycloakClient:
+    """Blocking wrapper over AsyncKeycloakClient, executed on the shared event loop."""
+    def __init__(self, transport: Optional[AsyncTransport] = None, tokens: Optional[TokenManager] = None):
+        self.aio = AsyncKeycloakClient(transport, tokens)
+
+    @property
+    def token(self) -> Optional[str]:
+        return self.aio.token
+
+    @property
+    def groups(self) -> GroupIndex:
+        return self.aio.groups
+
+    def iter_users(self, query: Optional[str] = None, brief: bool = True,
+                   page_size: int = Config.KEYCLOAK_PAGE_SIZE, limit: Optional[int] = None) -> Iterator[Dict]:
+        return sync_iter(self.aio.iter_users(query, brief, page_size, limit))
+
+    def resolve_groups(self, names: Iterable[str]) -> Dict[str, Optional[Dict]]:
+        return run_sync(self.aio.groups.resolve(names))
+
+    login = sync_method("login")
+    access_token = sync_method("access_token")
+    get_realm_password_policy = sync_method("get_realm_password_policy")
+    get_user = sync_method("get_user")
+    create_user = sync_method("create_user")
+    user_snapshot = sync_method("user_snapshot")
+    create_users = sync_method("create_users")
+    partial_import_users = sync_method("partial_import_users")
+    search_users = sync_method("search_users")
+    list_users = sync_method("list_users")
+    get_group_by_path = sync_method("get_group_by_path")
+    list_groups = sync_method("list_groups")
+    list_all_groups = sync_method("list_all_groups")
+    group_members = sync_method("group_members")
+    delete_user = sync_method("delete_user")
+    add_user_to_group = sync_method("add_user_to_group")
+    remove_user_from_group = sync_method("remove_user_from_group")
+    get_user_groups = sync_method("get_user_groups")
+    validate_user_constraints = sync_method("validate_user_constraints")
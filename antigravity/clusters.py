@@ -0,0 +1,134 @@
+import asyncio
+import re
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import yaml
+from client_cluster import AsyncClusterClient, cluster_ready
+from config import Config
+from poller import Poller, cluster_source
+from tracing import get_tracer
+
+CLUSTER_NAME = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9.-]{0,61}[a-zA-Z0-9]$")
+NODE_ROLES = ("all", "controlplane", "worker")
+
+def load_clusters(path: str, template: Optional[str] = None) -> List[Dict]:
+    """
+    Loads edge clusters to create from YAML/JSON:
+
+    defaults: {template: baseline-v2.0.0, labels: {site: plant1}}
+    clusters:
+      - project: plant1
+        name: line-1
+        nodes: [4c4c4544-0041-3510-8052-b9c04f4e5733]      # host UUIDs (role: all)
+      - {project: plant2, name: line-2, nodes: [{id: ..., role: controlplane}, {id: ..., role: worker}]}
+
+    Returns [{"project", "name", "template", "nodes": [{"id", "role"}], "labels"}].
+    """
+    with open(path) as f:
+        data = yaml.safe_load(f) or {}
+    entries = data.get("clusters") if isinstance(data, dict) else data
+    if not isinstance(entries, list) or not entries:
+        raise ValueError("File must contain a non-empty 'clusters' list")
+    defaults = data.get("defaults", {}) if isinstance(data, dict) else {}
+
+    clusters, seen, used = [], set(), {}
+    for i, entry in enumerate(entries, 1):
+        project, name = entry.get("project"), str(entry.get("name") or "")
+        if not project:
+            raise ValueError(f"Cluster {i}: 'project' is required")
+        if not CLUSTER_NAME.match(name):
+            raise ValueError(f"Cluster {i}: invalid name '{name}' (1-63 of a-z A-Z 0-9 . -)")
+        if (project, name) in seen:
+            raise ValueError(f"Cluster {i}: duplicate cluster '{name}' in {project}")
+        seen.add((project, name))
+        nodes = []
+        for node in entry.get("nodes") or []:
+            node = {"id": node, "role": "all"} if isinstance(node, str) else dict(node)
+            node.setdefault("role", "all")
+            if not node.get("id"):
+                raise ValueError(f"Cluster '{name}': every node needs an 'id'")
+            if node["role"] not in NODE_ROLES:
+                raise ValueError(f"Cluster '{name}': node role must be one of {list(NODE_ROLES)}")
+            other = used.setdefault((project, node["id"]), name)
+            if other != name:
+                raise ValueError(f"Cluster '{name}': node {node['id']} is already used by '{other}'")
+            nodes.append({"id": node["id"], "role": node["role"]})
+        if not nodes:
+            raise ValueError(f"Cluster '{name}': 'nodes' is required")
+        clusters.append({
+            "project": project, "name": name, "nodes": nodes,
+            "template": entry.get("template") or template or defaults.get("template"),
+            "labels": {**(defaults.get("labels") or {}), **(entry.get("labels") or {})},
+        })
+    return clusters
+
+class ClusterProvisioner:
+    """
+    Creates edge clusters `workers` at a time and, with wait=True, watches
+    every pending one through a shared poller: one summary call per Project
+    per tick, however many clusters are pending there.
+
+    Progress goes to on_result as {"project", "name", "status", "seconds",
+    "error"} whenever a cluster's status changes: created | exists | failed
+    after the create request, then ready | error | timeout, with the seconds
+    from creation (or from the start of watching) to ready.
+    """
+    def __init__(self, clusters: AsyncClusterClient, workers: int = Config.BULK_WORKERS,
+                 timeout: float = Config.CLUSTER_READY_TIMEOUT, wait: bool = True,
+                 on_result: Optional[Callable[[Dict], None]] = None):
+        self.clusters = clusters
+        self.workers = workers
+        self.wait = wait
+        self.on_result = on_result
+        self.counts: Dict[str, int] = {}
+        self.poller = Poller(interval=Config.CLUSTER_POLL_INTERVAL,
+                             max_interval=max(Config.POLL_MAX_INTERVAL, Config.CLUSTER_POLL_INTERVAL), timeout=timeout)
+
+    def _report(self, result: Dict, status: str, error: Optional[str] = None, final: bool = True):
+        result.update(status=status, error=error)
+        if final:
+            self.counts[status] = self.counts.get(status, 0) + 1
+        if self.on_result:
+            self.on_result(dict(result))
+
+    async def _wait_ready(self, result: Dict, start: float):
+        source = f"clusters:{result['project']}"
+        if source not in self.poller.sources:
+            self.poller.add_source(source, cluster_source(self.clusters, result["project"]))
+        try:
+            await self.poller.watch(source, result["name"], cluster_ready)
+            result["seconds"] = time.monotonic() - start
+            self._report(result, "ready")
+        except TimeoutError as e:
+            self._report(result, "timeout", str(e))
+        except Exception as e:
+            result["seconds"] = time.monotonic() - start
+            self._report(result, "error", str(e))
+
+    async def create(self, specs: Iterable[Dict]) -> Dict[str, int]:
+        """Creates each {"project", "name", "template", "nodes", "labels"}; returns counts of final statuses."""
+        slots = asyncio.Semaphore(self.workers)
+
+        async def one(spec: Dict):
+            result = {"project": spec["project"], "name": spec["name"], "seconds": None}
+            start = time.monotonic()
+            async with slots:
+                try:
+                    with get_tracer().span(f"{spec['project']}: create cluster {spec['name']}"):
+                        created = await self.clusters.create_cluster(
+                            spec["project"], {k: spec.get(k) for k in ("name", "template", "nodes", "labels")})
+                except Exception as e:
+                    self._report(result, "failed", str(e))
+                    return
+            self._report(result, "created" if created else "exists", final=not self.wait)
+            if self.wait:
+                await self._wait_ready(result, start)
+
+        await asyncio.gather(*(one(s) for s in specs))
+        return self.counts
+
+    async def watch(self, pending: Iterable[Tuple[str, str]]) -> Dict[str, int]:
+        """Waits for existing (project, name) clusters; returns counts of ready | error | timeout."""
+        start = time.monotonic()
+        await asyncio.gather(*(self._wait_ready({"project": p, "name": n, "seconds": None}, start) for p, n in pending))
+        return self.counts
@@ -0,0 +1,263 @@
+import re
+import typer
+from config import Config
+from cli_common import console, get_spinner, select_projects, output_format, RecordWriter
+
+app = typer.Typer(help="Edge clusters (Cluster Manager)")
+
+STATE_STYLE = {"ready": "green", "error": "red", "in_progress": "yellow"}
+CLUSTER_FIELDS = ("project", "name", "state", "nodeQuantity", "kubernetesVersion", "labels", "lifecyclePhase")
+TEMPLATE_FIELDS = ("project", "name", "version", "kubernetesVersion", "description", "default")
+
+def _clusters(org_name: str, org_admin_pass: str, projects: str, purpose: str):
+    """Logs in as the Org Admin and returns (ClusterClient, project names)."""
+    from client_cluster import ClusterClient
+    kc_org, selected = select_projects(org_name, org_admin_pass, projects, purpose)
+    return ClusterClient(auth=kc_org.aio), selected
+
+def _per_host_specs(infra, projects, template: str, prefix: str, host_filter: str, limit: int):
+    """One single-node cluster per host with a UUID, named {prefix}{host name}."""
+    specs = []
+    for project in projects:
+        for h in infra.iter_hosts(project, host_filter, limit=limit):
+            if not h.uuid:
+                continue
+            name = re.sub(r"[^a-z0-9.-]+", "-", f"{prefix}{h.name or h.resource_id}".lower()).strip(".-")[:63]
+            specs.append({"project": project, "name": name, "template": template,
+                          "nodes": [{"id": h.uuid, "role": "all"}], "labels": {}})
+    return specs
+
+@app.command("templates")
+def list_templates(
+    org_name: str = typer.Option(None, help="Organization Name (skips prompt)"),
+    projects: str = typer.Option("all", help="Comma separated project names, or 'all'"),
+    org_admin_pass: str = typer.Option(None, help="Password for Org Admin"),
+    output: str = typer.Option(None, "--output", "-o", help="table, json, ndjson or csv (default: the global --output)"),
+):
+    """List cluster templates per project (* marks the default)."""
+    from rich.table import Table
+    fmt = output_format(output)
+    clusters, selected = _clusters(org_name, org_admin_pass, projects, "list cluster templates")
+
+    out = RecordWriter(fmt, TEMPLATE_FIELDS) if fmt != "table" else None
+    table = Table(title="Cluster Templates")
+    for col in ("Project", "Template", "Kubernetes", "Description"):
+        table.add_column(col)
+    failed = False
+    for project in selected:
+        with get_spinner(f"Fetching templates for {project}...") as p:
+            p.add_task("Querying...")
+            try:
+                info = clusters.list_templates(project)
+            except Exception as e:
+                failed = True
+                if out:
+                    console.print(f"[red]{project}: {e}[/red]")
+                else:
+                    table.add_row(project, f"[red]{e}[/red]", "", "")
+                continue
+        default = info.default_template_info
+        for t in info.template_info_list or ():
+            is_default = bool(default and t.name == default.name and (not default.version or t.version == default.version))
+            if out:
+                out.write(dict(t.to_json(), project=project, default=is_default))
+                continue
+            mark = " *" if is_default else ""
+            table.add_row(project, f"[cyan]{t.name}-{t.version}[/cyan]{mark}", t.kubernetes_version or "",
+                          t.description or "")
+    if out:
+        out.close()
+    else:
+        console.print(table)
+    if failed:
+        raise typer.Exit(1)
+
+@app.command("list")
+def list_clusters(
+    org_name: str = typer.Option(None, help="Organization Name (skips prompt)"),
+    projects: str = typer.Option("all", help="Comma separated project names, or 'all'"),
+    org_admin_pass: str = typer.Option(None, help="Password for Org Admin"),
+    filter: str = typer.Option(None, help='AIP-160 filter, e.g. name="line-1"'),
+    output: str = typer.Option(None, "--output", "-o", help="table, json, ndjson or csv (default: the global --output)"),
+):
+    """List clusters and their readiness across projects."""
+    from client_cluster import cluster_state
+    fmt = output_format(output)
+    clusters, selected = _clusters(org_name, org_admin_pass, projects, "list clusters")
+
+    out = RecordWriter(fmt, CLUSTER_FIELDS) if fmt != "table" else None
+    count, failed = 0, False
+    for project in selected:
+        try:
+            for c in clusters.iter_clusters(project, filter):
+                if out:
+                    out.write(dict(c.to_json(), project=project, state=cluster_state(c)))
+                    count += 1
+                    continue
+                if count == 0:
+                    console.print(f"[bold]{'Project':<20} {'Name':<30} {'Nodes':>5}  {'Kubernetes':<18} Status[/bold]")
+                state = cluster_state(c)
+                message = c.lifecycle_phase.message if c.lifecycle_phase else ""
+                console.print(
+                    f"[cyan]{project:<20}[/cyan] [magenta]{c.name:<30}[/magenta] {c.node_quantity or 0:>5}  "
+                    f"{c.kubernetes_version or '':<18} [{STATE_STYLE[state]}]{state}[/{STATE_STYLE[state]}] "
+                    f"[dim]{message or ''}[/dim]",
+                    highlight=False
+                )
+                count += 1
+        except Exception as e:
+            failed = True
+            console.print(f"[red]{project}: {e}[/red]")
+    if out:
+        out.close()
+    elif not count:
+        console.print("[yellow]No clusters found.[/yellow]")
+    if failed:
+        raise typer.Exit(1)
+
+@app.command("summary")
+def cluster_summary(
+    org_name: str = typer.Option(None, help="Organization Name (skips prompt)"),
+    projects: str = typer.Option("all", help="Comma separated project names, or 'all'"),
+    org_admin_pass: str = typer.Option(None, help="Password for Org Admin"),
+    workers: int = typer.Option(Config.BULK_WORKERS, help="Projects queried concurrently"),
+):
+    """Cluster counts per project from the server-side summary endpoint."""
+    from rich.table import Table
+    clusters, selected = _clusters(org_name, org_admin_pass, projects, "summarize clusters")
+
+    with get_spinner("Fetching cluster summaries...") as p:
+        p.add_task("Querying...")
+        results = clusters.cluster_summaries(selected, workers)
+
+    table = Table(title="Clusters")
+    table.add_column("Project", style="magenta")
+    columns = {"total_clusters": "Total", "ready": "Ready", "in_progress": "In Progress", "error": "Error", "unknown": "Unknown"}
+    for col in columns.values():
+        table.add_column(col, justify="right")
+    totals = dict.fromkeys(columns, 0)
+    failed = []
+    for project, summary, error in results:
+        if error:
+            failed.append(project)
+            table.add_row(project, f"[red]{error}[/red]", *[""] * (len(columns) - 1))
+            continue
+        counts = {k: getattr(summary, k) or 0 for k in columns}
+        for k in totals:
+            totals[k] += counts[k]
+        table.add_row(project, *(str(counts[k]) for k in columns))
+    if len(results) > 1:
+        table.add_row("[bold]All[/bold]", *(f"[bold]{totals[k]}[/bold]" for k in columns))
+    console.print(table)
+    if failed:
+        raise typer.Exit(1)
+
+def _track(clusters, total: int, label: str, run, creating: bool = True, workers: int = Config.BULK_WORKERS,
+           timeout: float = Config.CLUSTER_READY_TIMEOUT, wait: bool = True):
+    """
+    Runs run(provisioner) (ClusterProvisioner.create or .watch) with live
+    progress, prints the outcome and time-to-ready; returns the counts.
+    """
+    import time
+    from rich.progress import Progress, BarColumn, MofNCompleteColumn, TimeElapsedColumn
+    from clusters import ClusterProvisioner
+    from transport import run_sync
+
+    start = time.time()
+    with Progress("[progress.description]{task.description}", BarColumn(), MofNCompleteColumn(), TimeElapsedColumn(),
+                  console=console) as progress:
+        requested = progress.add_task(label, total=total, visible=creating)
+        ready = progress.add_task("Ready" if creating else label, total=total, visible=wait)
+        waits = []
+
+        def on_result(r):
+            status = r["status"]
+            if status in ("created", "exists", "failed"):
+                progress.advance(requested)
+            if status in ("ready", "error", "timeout", "failed"):
+                progress.advance(ready)
+            if status == "ready":
+                waits.append(r["seconds"])
+            if status in ("failed", "error", "timeout"):
+                progress.console.print(f"[red]✗ {r['project']}/{r['name']}: {status}: {r['error']}[/red]")
+
+        provisioner = ClusterProvisioner(clusters.aio, workers, timeout, wait, on_result)
+        counts = run_sync(run(provisioner))
+    elapsed = time.time() - start
+
+    console.print(", ".join(f"{n} {s}" for s, n in sorted(counts.items())) + f" in {elapsed:.1f}s")
+    waits.sort()
+    if waits:
+        console.print(
+            f"[dim]Time to ready: p50 {waits[len(waits) // 2]:.1f}s, max {waits[-1]:.1f}s "
+            f"({len(waits)} clusters, {provisioner.poller.list_calls} polls)[/dim]"
+        )
+    return counts
+
+@app.command("create")
+def create_clusters(
+    file: str = typer.Option(None, "--file", "-f", help="YAML/JSON list of clusters (see clusters.load_clusters)"),
+    org_name: str = typer.Option(None, help="Organization Name (skips prompt)"),
+    org_admin_pass: str = typer.Option(None, help="Password for Org Admin"),
+    per_host: bool = typer.Option(False, help="Create one single-node cluster per host instead of reading --file"),
+    projects: str = typer.Option("all", help="With --per-host: comma separated project names, or 'all'"),
+    host_filter: str = typer.Option(None, help='With --per-host: AIP-160 host filter, e.g. site.resourceId="site-3b382a11"'),
+    prefix: str = typer.Option("", help="With --per-host: cluster name prefix"),
+    limit: int = typer.Option(None, help="With --per-host: at most this many hosts per project"),
+    template: str = typer.Option(None, help="Template (name-version) for clusters that do not set one; default: the project's"),
+    workers: int = typer.Option(Config.BULK_WORKERS, help="Concurrent create requests"),
+    wait: bool = typer.Option(True, help="Wait until every new cluster is ready"),
+    timeout: int = typer.Option(Config.CLUSTER_READY_TIMEOUT, help="Seconds to wait for readiness"),
+):
+    """Create clusters from templates in bulk and track them until ready."""
+    from clusters import load_clusters
+    from client_infra import InfraClient
+    if bool(file) == per_host:
+        console.print("[red]Pass either --file or --per-host.[/red]")
+        raise typer.Exit(1)
+
+    if file:
+        try:
+            specs = load_clusters(file, template)
+        except Exception as e:
+            console.print(f"[red]Invalid cluster file: {e}[/red]")
+            raise typer.Exit(1)
+        wanted = ",".join(sorted({s["project"] for s in specs}))
+        clusters, _ = _clusters(org_name, org_admin_pass, wanted, "create clusters")
+    else:
+        clusters, selected = _clusters(org_name, org_admin_pass, projects, "create clusters")
+        with get_spinner("Listing hosts...") as p:
+            p.add_task("Querying...")
+            specs = _per_host_specs(InfraClient(auth=clusters.aio.auth), selected, template, prefix, host_filter, limit)
+        if not specs:
+            console.print("[yellow]No hosts with a UUID found.[/yellow]")
+            raise typer.Exit(0)
+
+    label = f"Creating {len(specs)} clusters in {len({s['project'] for s in specs})} projects"
+    counts = _track(clusters, len(specs), label, lambda prov: prov.create(specs), True, workers, timeout, wait)
+    if any(counts.get(s) for s in ("failed", "error", "timeout")):
+        raise typer.Exit(1)
+
+@app.command("watch")
+def watch_clusters(
+    org_name: str = typer.Option(None, help="Organization Name (skips prompt)"),
+    projects: str = typer.Option("all", help="Comma separated project names, or 'all'"),
+    org_admin_pass: str = typer.Option(None, help="Password for Org Admin"),
+    timeout: int = typer.Option(Config.CLUSTER_READY_TIMEOUT, help="Seconds to wait for readiness"),
+):
+    """Wait until every cluster still provisioning is ready."""
+    from client_cluster import cluster_state
+    clusters, selected = _clusters(org_name, org_admin_pass, projects, "watch clusters")
+
+    with get_spinner("Listing clusters...") as p:
+        p.add_task("Querying...")
+        pending = [(project, c.name) for project in selected for c in clusters.all_clusters(project)
+                   if cluster_state(c) == "in_progress"]
+    if not pending:
+        console.print("[green]No clusters are provisioning.[/green]")
+        return
+
+    label = f"Watching {len(pending)} clusters"
+    counts = _track(clusters, len(pending), label, lambda prov: prov.watch(pending), creating=False, timeout=timeout)
+    if any(counts.get(s) for s in ("error", "timeout")):
+        raise typer.Exit(1)
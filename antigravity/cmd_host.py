@@ -0,0 +1,185 @@
+import typer
+from config import Config
+from cli_common import console, get_spinner, ask_password, select_projects, output_format, RecordWriter
+
+app = typer.Typer(help="Edge Infrastructure Manager host inventory")
+
+# CSV columns; json/ndjson records carry every field the API returned
+HOST_FIELDS = ("project", "resourceId", "name", "hostname", "serialNumber", "uuid", "hostStatus",
+               "currentState", "desiredState", "site")
+
+def _select_projects(org_name: str, org_admin_pass: str, projects: str, purpose: str):
+    """Logs in as the Org Admin and returns (InfraClient, project names)."""
+    from client_infra import InfraClient
+    kc_org, selected = select_projects(org_name, org_admin_pass, projects, purpose)
+    return InfraClient(auth=kc_org.aio), selected
+
+@app.command("list")
+def list_hosts(
+    org_name: str = typer.Option(None, help="Organization Name (skips prompt)"),
+    projects: str = typer.Option("all", help="Comma separated project names, or 'all'"),
+    org_admin_pass: str = typer.Option(None, help="Password for Org Admin"),
+    filter: str = typer.Option(None, help='AIP-160 filter, e.g. serialNumber="ABC123"'),
+    limit: int = typer.Option(None, help="Stop after this many hosts"),
+    output: str = typer.Option(None, "--output", "-o", "--format", help="table, json, ndjson or csv (default: the global --output)"),
+    workers: int = typer.Option(Config.BULK_WORKERS, help="Projects scanned concurrently"),
+):
+    """List hosts across projects, streamed page by page."""
+    fmt = output_format(output)
+    infra, selected = _select_projects(org_name, org_admin_pass, projects, "list hosts")
+
+    page_size = min(Config.INFRA_PAGE_SIZE, max(limit, 1)) if limit else Config.INFRA_PAGE_SIZE
+    count, failed = 0, []
+    out = RecordWriter(fmt, HOST_FIELDS) if fmt != "table" else None
+    pages = infra.scan_hosts(selected, filter, workers, page_size)
+    try:
+        for project, hosts, error in pages:
+            if error:
+                failed.append(project)
+                console.print(f"[red]{project}: {error}[/red]")
+                continue
+            for h in hosts:
+                if limit is not None and count >= limit:
+                    break
+                if out:
+                    out.write(dict(h.to_json(), project=project))
+                else:
+                    if count == 0:
+                        console.print(f"[bold]{'Project':<20} {'Resource ID':<14} {'Name':<20} "
+                                      f"{'Serial':<20} {'UUID':<36}  Status[/bold]")
+                    console.print(
+                        f"[cyan]{project:<20}[/cyan] [dim]{h.resource_id or 'N/A':<14}[/dim] "
+                        f"[magenta]{h.name or '':<20}[/magenta] {h.serial_number or '':<20} "
+                        f"[dim]{h.uuid or '':<36}[/dim]  [green]{h.host_status or 'Unknown'}[/green]",
+                        highlight=False
+                    )
+                count += 1
+            if limit is not None and count >= limit:
+                break
+    finally:
+        pages.close()
+        if out:
+            out.close()
+
+    if fmt == "table":
+        if not count:
+            console.print("[yellow]No hosts found.[/yellow]")
+        else:
+            console.print(f"[dim]{count} hosts in {len(selected) - len(failed)} projects[/dim]")
+    if failed:
+        raise typer.Exit(1)
+
+@app.command("summary")
+def host_summary(
+    org_name: str = typer.Option(None, help="Organization Name (skips prompt)"),
+    projects: str = typer.Option("all", help="Comma separated project names, or 'all'"),
+    org_admin_pass: str = typer.Option(None, help="Password for Org Admin"),
+    filter: str = typer.Option(None, help='AIP-160 filter, e.g. site.resourceId="site-3b382a11"'),
+    workers: int = typer.Option(Config.BULK_WORKERS, help="Projects queried concurrently"),
+):
+    """Host counts per project from the server-side summary endpoint."""
+    from rich.table import Table
+    infra, selected = _select_projects(org_name, org_admin_pass, projects, "summarize hosts")
+
+    with get_spinner("Fetching host summaries...") as p:
+        p.add_task("Querying...")
+        results = infra.host_summaries(selected, filter, workers)
+
+    table = Table(title="Hosts")
+    table.add_column("Project", style="magenta")
+    for col in ("Total", "Running", "Error", "Unallocated"):
+        table.add_column(col, justify="right")
+    totals = {"total": 0, "running": 0, "error": 0, "unallocated": 0}
+    failed = []
+    for project, summary, error in results:
+        if error:
+            failed.append(project)
+            table.add_row(project, f"[red]{error}[/red]", "", "", "")
+            continue
+        counts = {k: getattr(summary, k) or 0 for k in totals}
+        for k in totals:
+            totals[k] += counts[k]
+        table.add_row(project, *(str(counts[k]) for k in totals))
+    if len(results) > 1:
+        table.add_row("[bold]All[/bold]", *(f"[bold]{totals[k]}[/bold]" for k in totals))
+    console.print(table)
+    if failed:
+        raise typer.Exit(1)
+
+@app.command("register")
+def register_hosts(
+    file: str = typer.Option(..., "--file", "-f", help="CSV: name,serialNumber,uuid[,autoOnboard]"),
+    org_name: str = typer.Option(..., help="Organization the project belongs to"),
+    project_name: str = typer.Option(..., help="Project to register the hosts in"),
+    onboard_user: str = typer.Option(None, help="User to register as (default: {org}-{project}-onboard)"),
+    onboard_pass: str = typer.Option(None, help="Password for the onboarding user"),
+    results: str = typer.Option(None, help="Per-host results CSV; rows already done there are skipped (default: <file>.results.csv)"),
+    auto_onboard: bool = typer.Option(False, help="Default autoOnboard for rows without the column"),
+    workers: int = typer.Option(Config.HOST_REGISTER_WORKERS, help="Concurrent registrations"),
+    rate: float = typer.Option(Config.HOST_REGISTER_RATE, help="Max registration requests per second (0: unlimited)"),
+    retries: int = typer.Option(Config.HOST_REGISTER_RETRIES, help="Retries per host on 429/5xx/connection errors"),
+):
+    """Pre-register many hosts from a CSV, resuming from the results file."""
+    import csv
+    import os
+    import time
+    from rich.progress import Progress, BarColumn, MofNCompleteColumn, TimeRemainingColumn
+    from hosts import load_hosts, load_done_hosts, host_key
+    from client_infra import InfraClient
+    from client_keycloak import KeycloakClient
+
+    try:
+        hosts = load_hosts(file, auto_onboard)
+    except Exception as e:
+        console.print(f"[red]Invalid host file: {e}[/red]")
+        raise typer.Exit(1)
+    results = results or f"{os.path.splitext(file)[0]}.results.csv"
+    done = load_done_hosts(results)
+    todo = [h for h in hosts if host_key(h) not in done]
+    if done:
+        console.print(f"[dim]{len(hosts) - len(todo)} hosts already done in {results}, skipping[/dim]")
+    if not todo:
+        console.print("[green]Nothing to register.[/green]")
+        return
+
+    # The onboarding user is the only identity needed; no Platform Admin login
+    username = onboard_user or f"{org_name}-{project_name}-onboard"
+    if not onboard_pass:
+        onboard_pass = ask_password(f"Password for {username}", confirm=False)
+    kc = KeycloakClient()
+    try:
+        with get_spinner(f"Authenticating as {username}..."):
+            kc.login(username=username, password=onboard_pass)
+    except Exception as e:
+        console.print(f"[red]Failed to login as {username}: {e}[/red]")
+        raise typer.Exit(1)
+
+    new_file = not os.path.exists(results) or os.path.getsize(results) == 0
+    start = time.time()
+    with open(results, "a", newline="") as out, Progress(
+        "[progress.description]{task.description}", BarColumn(), MofNCompleteColumn(), TimeRemainingColumn(),
+        console=console,
+    ) as progress:
+        writer = csv.DictWriter(out, fieldnames=["name", "serialNumber", "uuid", "status", "resourceId", "error"])
+        if new_file:
+            writer.writeheader()
+        task = progress.add_task(f"Registering in {project_name}", total=len(todo))
+
+        def on_result(r):
+            # Flushed per row so an interrupted run resumes where it stopped
+            writer.writerow(r)
+            out.flush()
+            progress.advance(task)
+            if r["status"] == "failed":
+                progress.console.print(f"[red]✗ {r['serialNumber'] or r['uuid']}: {r['error']}[/red]")
+
+        counts = InfraClient(auth=kc.aio).register_hosts(project_name, todo, workers, rate, retries, on_result)
+    elapsed = time.time() - start
+
+    console.print(
+        f"[green]{counts['registered']} registered[/green], {counts['exists']} already registered, "
+        f"[red]{counts['failed']} failed[/red] in {elapsed:.1f}s ({len(todo) / max(elapsed, 1e-9):.1f} hosts/s). "
+        f"Results: {results}"
+    )
+    if counts["failed"]:
+        raise typer.Exit(1)
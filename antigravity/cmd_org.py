@@ -0,0 +1,183 @@
+import typer
+from config import Config
+from cli_common import console, state, get_spinner, ensure_auth, ask_password, run_task_graph, output_format, RecordWriter
+
+app = typer.Typer(help="Manage Organizations")
+
+def run_teardown(credentials: dict, keep_users: bool, workers: int, dry_run: bool, yes: bool) -> bool:
+    """
+    Snapshots, prints and (after confirmation) runs a cascading Teardown of
+    the Orgs in `credentials` ({org: admin password}). Returns True if every
+    step succeeded.
+    """
+    from rich.prompt import Confirm
+    from teardown import Teardown
+    from transport import run_sync
+    ensure_auth()
+
+    teardown = Teardown(state["kc"].aio, state["emf"].aio, credentials, keep_users, workers)
+    with get_spinner("Reading live state...") as p:
+        p.add_task("Listing orgs, projects, users and group members...")
+        run_sync(teardown.take_snapshot())
+    for o in teardown.missing:
+        console.print(f"[yellow]{o}: not found, skipping[/yellow]")
+    for err in teardown.errors:
+        console.print(f"[red]{err}[/red]")
+    for username, reason in sorted(teardown.kept):
+        console.print(f"[dim]Keeping user {username} ({reason})[/dim]")
+
+    actions = teardown.plan()
+    if not actions:
+        console.print("[green]Nothing to delete.[/green]")
+        return not teardown.errors
+    for a in actions:
+        console.print(f" [red]-[/red] {a.tenant}: {a.label}", highlight=False)
+    counts = {}
+    for a in actions:
+        counts[a.kind] = counts.get(a.kind, 0) + 1
+    console.print("Plan: " + ", ".join(f"{n} {kind}" for kind, n in counts.items()))
+    if dry_run:
+        return not teardown.errors
+    if not yes and not Confirm.ask(f"Delete {len(teardown.orgs)} organizations and everything above?", default=False):
+        raise typer.Exit(1)
+
+    graph = teardown.build(actions)
+    failed = run_task_graph(graph, workers, "Teardown Summary", "deleted")
+    poller = teardown.provisioner.poller
+    if poller.list_calls:
+        console.print(f"[dim]Polling: {len(poller.metrics())} deletions confirmed via {poller.list_calls} list calls[/dim]")
+    return not failed and not teardown.errors
+
+@app.command("create")
+def create_org(
+    name: str = typer.Option(..., prompt="Organization Name"),
+    description: str = typer.Option(None, help="Description (optional)"),
+    create_admin: bool = typer.Option(True, prompt="Create default Org Admin?", help="Create an admin user for this org"),
+    org_admin_pass: str = typer.Option(None, help="Password for Org Admin (if creating)")
+):
+    """Create a new Organization and optionally an Admin User."""
+    from poller import wait_for_one, org_source, group_source
+    from tracing import get_tracer
+    from transport import run_sync
+    ensure_auth()
+    tracer = get_tracer()
+    if not description:
+        description = f"Description for {name}"
+
+    emf = state["emf"]
+    kc = state["kc"]
+
+    # 1. Create Org
+    # 1. Create Org
+    with get_spinner(f"Creating Org {name}...") as progress:
+        task_id = progress.add_task(f"sending request...")
+        with tracer.span("create org"):
+            emf.create_org(name, description)
+        
+        def org_ready(org):
+            if org is not None and org.ready:
+                return True
+            status = org.status if org else None
+            progress.update(task_id, description=f"Provisioning... Current Status: {status}")
+            return False
+
+        # One listing per tick gives both the status and the UUID
+        org = run_sync(wait_for_one(org_source(emf.aio), name, org_ready))
+        org_uuid = org.uid
+
+    console.print(f"[green]✓ Organization {name} Created (UUID: {org_uuid})[/green]")
+
+    # 2. Create Admin
+    if create_admin:
+        admin_user = f"{name}-admin"
+        if not org_admin_pass:
+            org_admin_pass = ask_password(f"Password for {admin_user}")
+        
+        with get_spinner(f"Creating User {admin_user}...") as progress:
+            progress.add_task("Creating in Keycloak...")
+            with tracer.span("create admin user"):
+                user_id = kc.create_user(admin_user, org_admin_pass)
+            
+            group_name = f"{org_uuid}_Project-Manager-Group"
+            
+            try:
+                group = run_sync(wait_for_one(group_source(kc.aio), group_name))
+                with tracer.span("assign admin group"):
+                    kc.validate_user_constraints(user_id, group_name)
+                    kc.add_user_to_group(user_id, group["id"])
+            except Exception as e:
+                console.print(f"[red]Failed to assign admin group: {e}[/red]")
+                raise typer.Exit(1)
+        
+        console.print(f"[green]✓ User {admin_user} created and made Admin of {name}[/green]")
+
+@app.command("list")
+def list_orgs(
+    output: str = typer.Option(None, "--output", "-o", help="table, json, ndjson or csv (default: the global --output)"),
+):
+    """List all Organizations."""
+    fmt = output_format(output)
+    ensure_auth()
+    emf = state["emf"]
+    
+    with get_spinner("Fetching Organizations...") as p:
+        p.add_task("Querying...")
+        orgs = emf.list_orgs(details=True)
+
+    if fmt != "table":
+        with RecordWriter(fmt, ("name", "uid", "status", "message", "description", "timestamp")) as out:
+            for o in orgs:
+                out.write(o.to_dict())
+        return
+        
+    if not orgs:
+        console.print("[yellow]No Organizations found.[/yellow]")
+        return
+
+    from rich.table import Table
+    table = Table(title="Organizations")
+    table.add_column("Name", style="cyan")
+    table.add_column("UUID", style="dim")
+    table.add_column("Status", style="green")
+    
+    for o in orgs:
+        table.add_row(o.name, o.uid or "N/A", o.status or "Unknown")
+        
+    console.print(table)
+
+@app.command("delete")
+def delete_org(
+    name: str = typer.Option(..., prompt="Organization Name"),
+    cascade: bool = typer.Option(False, help="Also delete its Projects and the users that belong only to it"),
+    keep_users: bool = typer.Option(False, help="With --cascade: keep the Keycloak users"),
+    org_admin_pass: str = typer.Option(None, help="Password for Org Admin (needed with --cascade)"),
+    yes: bool = typer.Option(False, "--yes", "-y", help="Do not ask for confirmation"),
+):
+    """Delete an Organization (it must have no Projects unless --cascade)."""
+    from rich.prompt import Confirm
+    if cascade:
+        if not org_admin_pass:
+            org_admin_pass = ask_password(f"Password for {name}-admin", confirm=False)
+        if not run_teardown({name: org_admin_pass}, keep_users, Config.TEARDOWN_WORKERS, False, yes):
+            raise typer.Exit(1)
+        return
+
+    from poller import wait_for_one, org_source
+    from transport import run_sync
+    ensure_auth()
+    emf = state["emf"]
+    if not yes and not Confirm.ask(f"Delete Organization {name}?", default=False):
+        raise typer.Exit(1)
+    with get_spinner(f"Deleting Org {name}...") as progress:
+        task_id = progress.add_task("sending request...")
+        try:
+            if not emf.delete_org(name):
+                console.print(f"[yellow]Organization {name} not found.[/yellow]")
+                return
+        except Exception as e:
+            console.print(f"[red]{e}[/red]")
+            console.print("[yellow]Use --cascade to delete its Projects first.[/yellow]")
+            raise typer.Exit(1)
+        progress.update(task_id, description="Waiting for removal...")
+        run_sync(wait_for_one(org_source(emf.aio), name, lambda org: org is None))
+    console.print(f"[green]✓ Organization {name} deleted[/green]")
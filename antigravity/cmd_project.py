@@ -0,0 +1,241 @@
+import typer
+from config import Config
+from cli_common import console, state, get_spinner, ensure_auth, ask_password, select_org, login_org_admin, \
+    output_format, RecordWriter
+
+app = typer.Typer(help="Manage Projects")
+
+PROJECT_FIELDS = ("org", "name", "uid", "status", "message", "description", "timestamp")
+
+@app.command("create")
+def create_project(
+    project_name: str = typer.Option(..., prompt="Project Name"),
+    description: str = typer.Option(None),
+    org_name: str = typer.Option(None, help="Organization Name (skips prompt)"),
+    org_admin_pass: str = typer.Option(None, help="Password for Org Admin (for context)")
+):
+    """Create a new Project within a selected Organization."""
+    from rich.prompt import Confirm
+    from client_emf import EMFClient
+    from memberships import apply_memberships
+    from poller import Poller, wait_for_one, project_source, group_source
+    from tracing import get_tracer
+    from transport import run_sync
+    from utils import ORG_ADMIN_PROJECT_SUFFIXES
+    ensure_auth()
+    tracer = get_tracer()
+    # default EMF/KC are Platform Admin
+    kc_admin = state["kc"] 
+    
+    # 1. Select Org
+    emf_global = state["emf"]
+    
+    selected_org, org_uuid = select_org(emf_global, org_name)
+
+    if not description:
+        description = f"Project {project_name} in {selected_org}"
+
+    # 2. Login as Org Admin (required for Project Creation context)
+    kc_org = login_org_admin(selected_org, org_admin_pass, "create a project")
+
+    emf_org = EMFClient(auth=kc_org.aio)
+
+    # 3. Create Project
+    # 3. Create Project
+    with get_spinner(f"Creating Project {project_name}...") as p:
+        task_id = p.add_task("Requesting...")
+        with tracer.span("create project"):
+            emf_org.create_project(project_name, description)
+        
+        def project_ready(project):
+            if project is not None and project.ready:
+                return True
+            status = project.status if project else None
+            p.update(task_id, description=f"Provisioning... Current Status: {status}")
+            return False
+
+        # We might need to poll using the global admin if the org admin loses context? 
+        # But usually polling with same token is fine.
+        project = run_sync(wait_for_one(project_source(emf_org.aio), project_name, project_ready))
+        
+        # UUID comes from the same record (Org Admin token)
+        proj_uuid = project.uid
+
+    console.print(f"[green]✓ Project {project_name} Created ({proj_uuid})[/green]")
+
+    # 3. Create "Organization Project Admin" (The Onboarding User)
+    # User Request: "create a default 'Organization Project Admin', this user will have the Onboarding permissions."
+    # Naming convention: [org]-proj-admin? Or [project]-onboarding?
+    # Request says: "I want the Organization Admin account to be updated to have all permissions OTHER THAN Edge-Onboarding-Group...".
+    # And "Create a default 'Organization Project Admin' ... will have Onboarding permissions."
+    
+    proj_admin_user = f"{selected_org}-proj-admin" # or maybe just unique to project?
+    # To be safe and unique: {project_name}-admin is safer? 
+    # But prompt says "Organization Project Admin". Let's ask.
+    
+    # ask specifically for Onboarding User
+    create_onboarding = Confirm.ask(f"Create Onboarding User for {project_name}?", default=True)
+    if create_onboarding:
+        # A. Onboarding User
+        onboarding_user = f"{selected_org}-{project_name}-onboard"
+        onboarding_pass = ask_password(f"Password for {onboarding_user}")
+        
+        with get_spinner(f"Creating Onboarding User {onboarding_user}...") as p:
+            with tracer.span("create onboarding user"):
+                uid = kc_admin.create_user(onboarding_user, onboarding_pass)
+            
+            # Assign Onboarding Group
+            g_name = f"{proj_uuid}_Edge-Onboarding-Group"
+            g = run_sync(wait_for_one(group_source(kc_admin.aio), g_name))
+            
+            with tracer.span("assign onboarding group"):
+                kc_admin.validate_user_constraints(uid, g_name)
+                kc_admin.add_user_to_group(uid, g["id"])
+        console.print(f"[green]✓ Onboarding User {onboarding_user} created[/green]")
+
+    # B. Update Org Admin (Always, unless skipped by error)
+    org_admin_name = f"{selected_org}-admin"
+    console.print(f"Updating Org Admin {org_admin_name} with Project permissions...")
+    
+    oa_id = None
+    try:
+            # Find user ID - Use kc_admin (Platform Admin)
+            u = kc_admin.get_user(org_admin_name)
+            if u:
+                oa_id = u["id"]
+                console.print(f"[dim]Found Org Admin ID: {oa_id}[/dim]")
+            else:
+                console.print(f"[yellow]User {org_admin_name} not found via get_user (exact match).[/yellow]")
+    except Exception as e:
+        console.print(f"[red]Error searching for {org_admin_name}: {e}[/red]")
+
+    if oa_id:
+        groups_to_add = ORG_ADMIN_PROJECT_SUFFIXES # "Project-Manager-Group" is Org level? 
+        # createProjectAdmin script uses: "Edge-Manager-Group" "Edge-Onboarding-Group" "Edge-Operator-Group" "Host-Manager-Group"
+        # But here we want ALL EXCEPT Onboarding.
+        
+        with get_spinner("Assigning groups to Org Admin...") as p, tracer.span("update org admin"):
+            # Use polling because groups creation is async by EMF-Orchestrator
+            # A single group listing per tick covers all project groups
+            poller = Poller()
+            poller.add_source("groups", group_source(kc_admin.aio))
+            g_names = [f"{proj_uuid}_{s}" for s in groups_to_add]
+            run_sync(poller.wait_for("groups", g_names))
+            # Note: Org Admin might have other project groups.
+            # We trust the relationship here (Project is in the Org), so we skip the strict single-tenant constraint check
+            # which might confuse Project UUIDs with Org UUIDs.
+            changes = run_sync(apply_memberships(kc_admin.aio, {oa_id: g_names}))
+        for c in changes:
+            if c["status"] != "ok":
+                console.print(f"[yellow]Skipped {c['group']}: {c['error']}[/yellow]")
+        console.print(f"[green]✓ Org Admin updated[/green]")
+    else:
+        console.print(f"[yellow]Org Admin {org_admin_name} not found, skipping update.[/yellow]")
+
+@app.command("list")
+def list_projects(
+    org_name: str = typer.Option(None, help="Organization Name (skips prompt)"),
+    org_admin_pass: str = typer.Option(None, help="Password for Org Admin"),
+    all_orgs: bool = typer.Option(False, "--all-orgs", help="List Projects of every Org in the credentials file"),
+    credentials: str = typer.Option(Config.ORG_CREDENTIALS_FILE or None, help="Org Admin passwords (YAML/JSON) for --all-orgs"),
+    workers: int = typer.Option(Config.BULK_WORKERS, help="Orgs queried concurrently with --all-orgs"),
+    output: str = typer.Option(None, "--output", "-o", help="table, json, ndjson or csv (default: the global --output)"),
+):
+    """List Projects within an Organization (requires Org Admin)."""
+    from client_emf import EMFClient
+    fmt = output_format(output)
+    ensure_auth()
+    emf_global = state["emf"]
+
+    if all_orgs:
+        _list_all_projects(emf_global, credentials, workers, fmt)
+        return
+    
+    # 1. Select Org
+    selected_org, _ = select_org(emf_global, org_name)
+         
+    # 2. Authenticate as Org Admin
+    kc_org = login_org_admin(selected_org, org_admin_pass, "list projects")
+
+    emf_org = EMFClient(auth=kc_org.aio)
+    
+    # 3. List Projects
+    with get_spinner(f"Fetching Projects for {selected_org}...") as p:
+        p.add_task("Querying...")
+        projs = emf_org.list_projects(details=True)
+
+    if fmt != "table":
+        with RecordWriter(fmt, PROJECT_FIELDS) as out:
+            for p in projs:
+                out.write(dict(p.to_dict(), org=selected_org))
+        return
+        
+    if not projs:
+        console.print(f"[yellow]No Projects found in {selected_org}.[/yellow]")
+        return
+
+    from rich.table import Table
+    table = Table(title=f"Projects in {selected_org}")
+    table.add_column("Name", style="magenta")
+    table.add_column("UUID", style="dim")
+    table.add_column("Status", style="green")
+    
+    for p in projs:
+        table.add_row(p.name, p.uid or "N/A", p.status or "Unknown")
+        
+    console.print(table)
+
+
+def _list_all_projects(emf_global, credentials: str, workers: int, fmt: str = "table"):
+    """Logs in to every Org concurrently and prints rows as each Org finishes."""
+    from credentials import load_credentials, iter_org_projects
+    from transport import sync_iter
+    if not credentials:
+        console.print("[red]--all-orgs needs --credentials (or ORG_CREDENTIALS_FILE).[/red]")
+        raise typer.Exit(1)
+    try:
+        passwords = load_credentials(credentials)
+    except (OSError, ValueError) as e:
+        console.print(f"[red]Invalid credentials file: {e}[/red]")
+        raise typer.Exit(1)
+
+    with get_spinner("Fetching Organizations...") as p:
+        p.add_task("loading...")
+        orgs = emf_global.list_orgs()
+    unknown = sorted(set(passwords) - set(orgs))
+    missing = sorted(set(orgs) - set(passwords))
+    if unknown:
+        console.print(f"[yellow]Not found, skipping: {', '.join(unknown)}[/yellow]")
+    if missing:
+        console.print(f"[yellow]No credentials, skipping: {', '.join(missing)}[/yellow]")
+    targets = {o: passwords[o] for o in sorted(orgs) if o in passwords}
+    if not targets:
+        console.print("[yellow]No Organizations to query.[/yellow]")
+        return
+
+    out = RecordWriter(fmt, PROJECT_FIELDS) if fmt != "table" else None
+    if not out:
+        console.print(f"[bold]{'Org':<24} {'Project':<24} {'UUID':<36}  Status[/bold]")
+    count, failed = 0, []
+    for org, records, error in sync_iter(iter_org_projects(targets, workers)):
+        if error:
+            failed.append(org)
+            console.print(f"[red]{org}: {error}[/red]")
+            continue
+        for r in sorted(records, key=lambda r: r.name or ""):
+            if out:
+                out.write(dict(r.to_dict(), org=org))
+            else:
+                console.print(
+                    f"[cyan]{org:<24}[/cyan] [magenta]{r.name or 'N/A':<24}[/magenta] "
+                    f"[dim]{r.uid or 'N/A':<36}[/dim]  [green]{r.status or 'Unknown'}[/green]",
+                    highlight=False
+                )
+            count += 1
+    if out:
+        out.close()
+
+    summary = f"{count} projects in {len(targets) - len(failed)} organizations"
+    console.print(f"[dim]{summary}[/dim]" + (f" [red]({len(failed)} failed)[/red]" if failed else ""))
+    if failed:
+        raise typer.Exit(1)
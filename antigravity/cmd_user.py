@@ -0,0 +1,359 @@
+import typer
+from config import Config
+from cli_common import console, state, get_spinner, ensure_auth, ask_password, print_membership_changes, \
+    output_format, RecordWriter, select_projects
+
+app = typer.Typer(help="Manage Users")
+
+USER_FIELDS = ("id", "username", "email", "firstName", "lastName", "enabled", "emailVerified", "createdTimestamp")
+
+@app.command("manage")
+def manage_user():
+    """Add or Update a user with specific permissions."""
+    from rich.prompt import Prompt, Confirm
+    from memberships import apply_memberships
+    from transport import run_sync
+    from tracing import get_tracer
+    from utils import PROJECT_USER_SUFFIXES
+    ensure_auth()
+    emf = state["emf"]
+    kc = state["kc"]
+
+    # 1. Select User Action
+    action = Prompt.ask("Action", choices=["create-new", "update-existing"])
+    
+    username = Prompt.ask("Username")
+    user_id = None
+    
+    if action == "create-new":
+        password = ask_password("Password")
+        with get_tracer().span("create user"):
+            user_id = kc.create_user(username, password)
+        console.print(f"[green]User {username} created[/green]")
+    else:
+        users = kc.search_users(username)
+        # simplistic match
+        for u in users:
+            if u["username"] == username:
+                user_id = u["id"]
+                break
+        if not user_id:
+            console.print("[red]User not found[/red]")
+            raise typer.Exit(1)
+        console.print(f"[green]Found User {username}[/green]")
+
+    # 2. Select Org (Context)
+    with get_spinner("Fetching Orgs...") as p:
+        orgs = emf.list_orgs()
+    
+    org_choice = Prompt.ask("Select Organization context", choices=list(orgs.keys()))
+    # org_uuid = orgs[org_choice] # Maybe used for validation if strict
+
+    # 3. Select Projects
+    with get_spinner("Fetching Projects...") as p:
+        projects = emf.list_projects()
+    
+    # Simple multi-select via iteration or comma separated?
+    # Typer/Rich prompt doesn't have native multi-select checkbox easily without `inquirer` style libs.
+    # We will do Comma Separated.
+    console.print("Available Projects:")
+    p_names = list(projects.keys())
+    for pn in p_names:
+        console.print(f" - {pn}")
+    
+    selected_projs_str = Prompt.ask("Select Projects (comma separated, or 'all')")
+    if selected_projs_str.lower() == 'all':
+        selected_projs = p_names
+    else:
+        selected_projs = [s.strip() for s in selected_projs_str.split(",") if s.strip() in projects]
+    
+    if not selected_projs:
+        console.print("[yellow]No valid projects selected.[/yellow]")
+        return
+
+    # 4. Select Roles
+    console.print("Roles:")
+    console.print("1. Project Admin (Manager + Operator + Host + Onboarding?)") # Definition varies in prompt.
+    # Prompt says: "- Project Admin: as represented in createProjectAdmin function"
+    # createProjectAdmin script: adds `[Org_UUID]_Project-Manager-Group`. Wait, that's Org Admin?
+    # Wait, createProjectAdmin (line 139) adds `[Org_UUID]_Project-Manager-Group`. 
+    # BUT createProjectUser (line 173) adds `[Proj_UUID]_(Manager,Onboarding,Operator,Host)`.
+    # AND "Organization Project Admin" is mentioned in prompt Item 2 as having "Onboarding".
+    
+    # Prompt Item 3:
+    # - Project Admin: as represented in createProjectAdmin
+    # - Project User: as represented in createProjectUser
+    # - Optional: Onboarding, Org Admin.
+    
+    # Correction: createProjectAdmin in script (line 163) adds `[OrgUUID]_Project-Manager-Group`.
+    # It essentially makes them a full Org Admin?
+    # The script comments say "Creating Project Admin...".
+    # This implies in this schema, "Project Admin" might just be "Org Admin"? Or the script naming is confusing.
+    # Let's stick to the User Request text: "Project Admin: as represented in createProjectAdmin function".
+    
+    role = Prompt.ask("Select Role", choices=["Project Admin", "Project User", "Custom"])
+    
+    groups_to_add = []
+    
+    if role == "Project Admin":
+        # Based on script createProjectAdmin: Add to Org-Level Project-Manager-Group?
+        # That seems to grant access to ALL projects in Org?
+        # If the user selected specific projects, this might be overkill.
+        # But we must follow the definition.
+        # Wait, if they select "Project Admin", maybe they become Admin for THAT project?
+        # But the script uses Org UUID.
+        # I will assume "Project Admin" means adding the Org-Level Manager group.
+        # Check `kc-utils.sh` line 163: `project_user_groups=("${org_uuid}_Project-Manager-Group")`
+        org_uuid = orgs[org_choice]
+        groups_to_add.append(f"{org_uuid}_Project-Manager-Group")
+
+    elif role == "Project User":
+        # createProjectUser script: 
+        # groups=("Edge-Manager-Group" "Edge-Onboarding-Group" "Edge-Operator-Group" "Host-Manager-Group")
+        # Prefixed with Project UUID.
+        base_suffixes = PROJECT_USER_SUFFIXES
+        for p_name in selected_projs:
+            p_uuid = projects[p_name]
+            for s in base_suffixes:
+                groups_to_add.append(f"{p_uuid}_{s}")
+    
+    elif role == "Custom":
+        suffixes = []
+        if Confirm.ask("Add Edge-Manager?"): suffixes.append("Edge-Manager-Group")
+        if Confirm.ask("Add Edge-Operator?"): suffixes.append("Edge-Operator-Group")
+        if Confirm.ask("Add Host-Manager?"): suffixes.append("Host-Manager-Group")
+        if Confirm.ask("Add Edge-Onboarding?"): suffixes.append("Edge-Onboarding-Group")
+        
+        for p_name in selected_projs:
+            p_uuid = projects[p_name]
+            for s in suffixes:
+                groups_to_add.append(f"{p_uuid}_{s}")
+        
+        if Confirm.ask("Add Org Admin (Project-Manager-Group)?"):
+             org_uuid = orgs[org_choice]
+             groups_to_add.append(f"{org_uuid}_Project-Manager-Group")
+
+    # 5. Apply
+    with get_spinner("Applying permissions...") as p:
+        # Diff against the user's current groups; only missing memberships are PUT
+        changes = run_sync(apply_memberships(kc.aio, {user_id: groups_to_add}))
+    print_membership_changes(changes)
+    already = len(set(groups_to_add)) - len(changes)
+    if already > 0:
+        console.print(f"[dim]{already} groups already assigned[/dim]")
+    
+    console.print("[green]Done.[/green]")
+
+@app.command("list")
+def list_users(
+    search: str = typer.Option(None, help="Search term (username, email)"),
+    limit: int = typer.Option(None, help="Stop after this many users"),
+    output: str = typer.Option(None, "--output", "-o", "--format", help="table, json, ndjson or csv (default: the global --output)"),
+    full: bool = typer.Option(False, help="Fetch full user representations (slower)")
+):
+    """List or search users, streamed page by page."""
+    fmt = output_format(output)
+    ensure_auth()
+    kc = state["kc"]
+    
+    query = search if search else ""
+    if fmt == "table":
+        if not query:
+            console.print("[dim]Fetching all users...[/dim]")
+        else:
+            console.print(f"[dim]Searching for '{query}'...[/dim]")
+
+    count = 0
+    out = RecordWriter(fmt, USER_FIELDS) if fmt != "table" else None
+    for u in kc.iter_users(query, brief=not full, limit=limit):
+        if out:
+            out.write(u)
+        else:
+            if count == 0:
+                console.print(f"[bold]{'Username':<32} {'ID':<36}  {'Email':<40} Enabled[/bold]")
+            console.print(
+                f"[cyan]{u.get('username', 'N/A'):<32}[/cyan] [dim]{u.get('id', 'N/A'):<36}[/dim]  "
+                f"[blue]{u.get('email', '') or '':<40}[/blue] [green]{u.get('enabled', False)}[/green]",
+                highlight=False
+            )
+        count += 1
+    if out:
+        out.close()
+
+    if fmt == "table":
+        if not count:
+            console.print("[yellow]No users found.[/yellow]")
+        else:
+            console.print(f"[dim]{count} users[/dim]")
+
+@app.command("audit")
+def audit_users(
+    credentials: str = typer.Option(Config.ORG_CREDENTIALS_FILE or None, help="Org Admin passwords (YAML/JSON) to map Projects to Orgs"),
+    workers: int = typer.Option(Config.BULK_WORKERS, help="Orgs queried concurrently for their Projects"),
+    output: str = typer.Option(None, "--output", "-o", help="table, json, ndjson or csv (default: the global --output)"),
+):
+    """Check every user against the single-Org and single-onboarding-group rules in one pass."""
+    from audit import TenancyAudit
+    from credentials import load_credentials
+    from transport import get_transport, run_sync
+    fmt = output_format(output)
+    passwords = {}
+    if credentials:
+        try:
+            passwords = load_credentials(credentials)
+        except (OSError, ValueError) as e:
+            console.print(f"[red]Invalid credentials file: {e}[/red]")
+            raise typer.Exit(1)
+    else:
+        console.print("[yellow]No --credentials: Project groups cannot be mapped to Orgs, only Org groups are checked.[/yellow]")
+
+    ensure_auth()
+    audit = TenancyAudit(state["kc"].aio, state["emf"].aio, passwords, workers)
+    before = get_transport().stats.snapshot()["requests"]
+    with get_spinner("Loading groups and memberships...") as p:
+        p.add_task("Listing orgs, projects, groups and group members...")
+        run_sync(audit.load())
+    violations = audit.check()
+    reads = get_transport().stats.snapshot()["requests"] - before
+    for err in audit.errors:
+        console.print(f"[yellow]{err}[/yellow]")
+
+    if fmt != "table":
+        with RecordWriter(fmt, ("username", "user_id", "rule", "detail")) as out:
+            for v in violations:
+                out.write(v.to_dict())
+    elif violations:
+        from rich.table import Table
+        table = Table(title="Tenancy Violations")
+        table.add_column("Username", style="cyan")
+        table.add_column("Rule", style="red")
+        table.add_column("Groups of")
+        for v in violations:
+            table.add_row(v.username, v.rule, v.detail)
+        console.print(table)
+    else:
+        console.print("[green]No violations.[/green]")
+
+    console.print(
+        f"[dim]{len(audit.members)} users, {audit.memberships} memberships in {len(audit.groups)} tenant groups "
+        f"checked with {reads} requests; {len(violations)} violations[/dim]"
+    )
+    if audit.unmapped:
+        console.print(f"[yellow]{len(audit.unmapped)} tenant UUIDs could not be mapped to an Org "
+                      "(Projects of Orgs without credentials, or deleted tenants).[/yellow]")
+    if violations or audit.errors:
+        raise typer.Exit(1)
+
+@app.command("grant")
+def grant_role(
+    users: str = typer.Option(..., help="Comma separated usernames"),
+    role: str = typer.Option(..., help="Project Admin, Project User or Onboarding"),
+    org_name: str = typer.Option(..., help="Organization the projects belong to"),
+    projects: str = typer.Option("all", help="Comma separated project names, or 'all'"),
+    org_admin_pass: str = typer.Option(None, help="Password for Org Admin (to resolve the Org's projects)"),
+    sync: bool = typer.Option(False, help="Also remove role groups of the selected projects that are not granted")
+):
+    """Grant a role across many projects to many users, issuing only the missing calls."""
+    from client_emf import EMFClient
+    from memberships import apply_memberships, resolve_user_ids
+    from transport import run_sync
+    from utils import ROLE_SUFFIXES, role_groups, split_group_name
+    if role not in ROLE_SUFFIXES:
+        console.print(f"[red]Unknown role: {role}[/red]")
+        raise typer.Exit(1)
+    ensure_auth()
+    emf = state["emf"]
+    kc = state["kc"]
+
+    if role == "Project Admin":
+        # Org-wide role: no Project needs resolving
+        with get_spinner(f"Resolving Organization {org_name}...") as p:
+            p.add_task("Resolving...")
+            org_uuid = emf.get_org_uuid(org_name)
+        if not org_uuid:
+            console.print(f"[red]Organization {org_name} not found.[/red]")
+            raise typer.Exit(1)
+        wanted = role_groups(role, org_uuid)
+    else:
+        # Projects are only listed for the Org Admin, as in `project create`
+        kc_org, selected = select_projects(org_name, org_admin_pass, projects, "grant roles")
+        with get_spinner("Resolving projects...") as p:
+            p.add_task("Resolving...")
+            org_uuid = emf.get_org_uuid(org_name)
+            all_projects = EMFClient(auth=kc_org.aio).list_projects()
+        wanted = sorted({g for p in selected for g in role_groups(role, org_uuid, all_projects[p])})
+
+    with get_spinner("Resolving users...") as p:
+        p.add_task("Resolving...")
+        user_ids = run_sync(resolve_user_ids(kc.aio, [u.strip() for u in users.split(",") if u.strip()]))
+    for name, uid in user_ids.items():
+        if not uid:
+            console.print(f"[yellow]User {name} not found. Skipping.[/yellow]")
+    in_scope = {split_group_name(g)[0] for g in wanted}
+    desired = {uid: wanted for uid in user_ids.values() if uid}
+
+    with get_spinner(f"Applying {role} to {len(desired)} users...") as p:
+        p.add_task("Applying...")
+        changes = run_sync(apply_memberships(
+            kc.aio, desired, sync=sync,
+            scope=lambda name: split_group_name(name)[0] in in_scope
+        ))
+    failed = [c for c in changes if c["status"] == "failed"]
+    for c in changes:
+        if c["status"] != "ok":
+            console.print(f"[yellow]{c['user_id']}: {c['action']} {c['group']}: {c['error']}[/yellow]")
+    console.print(
+        f"[green]{len(changes) - len(failed)} membership changes applied[/green], "
+        f"{len(desired) * len(wanted) - sum(1 for c in changes if c['action'] != 'remove')} already in place"
+    )
+    if failed:
+        raise typer.Exit(1)
+
+@app.command("import")
+def import_users(
+    file: str = typer.Option(..., "--file", "-f", help="CSV (username,password,email) or YAML/JSON list"),
+    partial_import: bool = typer.Option(False, help="Use Keycloak's partialImport endpoint in batches"),
+    precheck: bool = typer.Option(True, help="Skip users found in one paginated snapshot of the realm"),
+    results: str = typer.Option(None, help="Write per-user results to this CSV file")
+):
+    """Create many users at once."""
+    from users import load_users
+    import csv
+    import time
+
+    try:
+        users = load_users(file)
+    except Exception as e:
+        console.print(f"[red]Invalid user file: {e}[/red]")
+        raise typer.Exit(1)
+
+    ensure_auth()
+    kc = state["kc"]
+    start = time.time()
+    with get_spinner(f"Creating {len(users)} users...") as p:
+        p.add_task(f"Creating {len(users)} users...")
+        if partial_import:
+            outcome = kc.partial_import_users(users)
+        else:
+            existing = kc.user_snapshot() if precheck else None
+            outcome = kc.create_users(users, existing)
+    elapsed = time.time() - start
+
+    counts = {"created": 0, "exists": 0, "failed": 0}
+    for r in outcome:
+        counts[r["status"]] += 1
+        if r["status"] == "failed":
+            console.print(f"[red]✗ {r['username']}: {r['error']}[/red]")
+
+    if results:
+        with open(results, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=["username", "id", "status", "error"])
+            writer.writeheader()
+            writer.writerows(outcome)
+
+    console.print(
+        f"[green]{counts['created']} created[/green], {counts['exists']} already existed, "
+        f"[red]{counts['failed']} failed[/red] in {elapsed:.1f}s"
+    )
+    if counts["failed"]:
+        raise typer.Exit(1)
@@ -1,8 +1,16 @@
 import os
 from typing import Optional
-from dotenv import load_dotenv
 
-load_dotenv()
+def _load_dotenv():
+    # Only pay for importing python-dotenv when there is a .env to read
+    for base in (os.getcwd(), os.path.dirname(os.path.abspath(__file__))):
+        path = os.path.join(base, ".env")
+        if os.path.isfile(path):
+            from dotenv import load_dotenv
+            load_dotenv(path)
+            return
+
+_load_dotenv()
 
 class Config:
     # Base Domain
@@ -19,6 +27,16 @@ class Config:
     KEYCLOAK_SCOPE: str = os.getenv("KEYCLOAK_SCOPE", "openid")
     KEYCLOAK_ADMIN_USER: str = os.getenv("KEYCLOAK_ADMIN_USER", "admin")
     KEYCLOAK_ADMIN_PASS: str = os.getenv("KEYCLOAK_ADMIN_PASS", "admin")
+    # Token cache shared across CLI invocations (access + refresh tokens)
+    TOKEN_CACHE: bool = os.getenv("TOKEN_CACHE", "true").lower() == "true"
+    TOKEN_CACHE_PATH: str = os.getenv("TOKEN_CACHE_PATH", "~/.cache/antigravity/tokens.json")
+    # Renew tokens this many seconds before they expire
+    TOKEN_REFRESH_SKEW: int = int(os.getenv("TOKEN_REFRESH_SKEW", "30"))
+    KEYCLOAK_PAGE_SIZE: int = int(os.getenv("KEYCLOAK_PAGE_SIZE", "500"))
+    # Users per partialImport request for bulk user creation
+    KEYCLOAK_IMPORT_BATCH: int = int(os.getenv("KEYCLOAK_IMPORT_BATCH", "500"))
+    # Group index misses spanning more UUIDs than this trigger a full re-list
+    GROUP_INDEX_SEARCH_LIMIT: int = int(os.getenv("GROUP_INDEX_SEARCH_LIMIT", "5"))
 
     # EMF
     # If EMF_API_URL is set, use it. Else derive from FQDN.
@@ -26,12 +44,66 @@ class Config:
     if not EMF_API_URL and CLUSTER_FQDN:
         EMF_API_URL = f"https://api.{CLUSTER_FQDN}"
 
+    # Hosts per page for Edge Infrastructure Manager listings (API max 100)
+    INFRA_PAGE_SIZE: int = int(os.getenv("INFRA_PAGE_SIZE", "100"))
+
+    # host register: concurrent requests, requests per second, retries per host
+    HOST_REGISTER_WORKERS: int = int(os.getenv("HOST_REGISTER_WORKERS", "16"))
+    HOST_REGISTER_RATE: float = float(os.getenv("HOST_REGISTER_RATE", "20"))
+    HOST_REGISTER_RETRIES: int = int(os.getenv("HOST_REGISTER_RETRIES", "5"))
+
+    # Cluster Manager: clusters per page, seconds to wait for a new cluster to be ready
+    CLUSTER_PAGE_SIZE: int = int(os.getenv("CLUSTER_PAGE_SIZE", "100"))
+    CLUSTER_READY_TIMEOUT: int = int(os.getenv("CLUSTER_READY_TIMEOUT", "1800"))
+    # Seconds between readiness checks of pending clusters (one summary call per Project)
+    CLUSTER_POLL_INTERVAL: float = float(os.getenv("CLUSTER_POLL_INTERVAL", "10"))
+
+    # Seconds a fetched Org/Project record is reused within one run
+    EMF_MEMO_TTL: float = float(os.getenv("EMF_MEMO_TTL", "30"))
+    # Org/Project name -> UUID cache shared across CLI invocations
+    METADATA_CACHE: bool = os.getenv("METADATA_CACHE", "true").lower() == "true"
+    METADATA_CACHE_PATH: str = os.getenv("METADATA_CACHE_PATH", "~/.cache/antigravity/metadata.sqlite")
+    METADATA_CACHE_TTL: float = float(os.getenv("METADATA_CACHE_TTL", "3600"))
+
     # SSL Config
     VERIFY_SSL: bool = os.getenv("VERIFY_SSL", "true").lower() == "true"
 
+    # HTTP Transport
+    HTTP_POOL_SIZE: int = int(os.getenv("HTTP_POOL_SIZE", "10"))
+    HTTP_MAX_IN_FLIGHT: int = int(os.getenv("HTTP_MAX_IN_FLIGHT", "100"))
+    HTTP_CONNECT_TIMEOUT: float = float(os.getenv("HTTP_CONNECT_TIMEOUT", "10"))
+    HTTP_READ_TIMEOUT: float = float(os.getenv("HTTP_READ_TIMEOUT", "60"))
+    # Retries per request on 429 (any method) and on 5xx/connection errors (idempotent methods)
+    HTTP_RETRIES: int = int(os.getenv("HTTP_RETRIES", "4"))
+    # Requests per second to Keycloak / the EMF API (0: unlimited); halved while the server answers 429
+    KEYCLOAK_RATE: float = float(os.getenv("KEYCLOAK_RATE", "0"))
+    EMF_RATE: float = float(os.getenv("EMF_RATE", "0"))
+    # Consecutive failures (5xx/connection errors) that open a backend's circuit, and seconds it stays open
+    HTTP_BREAKER_THRESHOLD: int = int(os.getenv("HTTP_BREAKER_THRESHOLD", "10"))
+    HTTP_BREAKER_COOLDOWN: float = float(os.getenv("HTTP_BREAKER_COOLDOWN", "30"))
+
+    # Bulk Provisioning
+    BULK_WORKERS: int = int(os.getenv("BULK_WORKERS", "8"))
+    # Org Admin passwords for cross-org commands (see credentials.load_credentials)
+    ORG_CREDENTIALS_FILE: str = os.getenv("ORG_CREDENTIALS_FILE", "")
+    # Concurrent teardown steps; a step holds its slot while waiting for the deletion to finish
+    TEARDOWN_WORKERS: int = int(os.getenv("TEARDOWN_WORKERS", "32"))
+
+    # `serve` daemon: bind address, concurrent operations, queued operations before 503, optional bearer token
+    SERVE_HOST: str = os.getenv("SERVE_HOST", "127.0.0.1")
+    SERVE_PORT: int = int(os.getenv("SERVE_PORT", "8686"))
+    SERVE_WORKERS: int = int(os.getenv("SERVE_WORKERS", "16"))
+    SERVE_QUEUE_SIZE: int = int(os.getenv("SERVE_QUEUE_SIZE", "256"))
+    SERVE_TOKEN: str = os.getenv("SERVE_TOKEN", "")
+
+    # Concurrent group membership PUT/DELETE calls
+    MEMBERSHIP_CONCURRENCY: int = int(os.getenv("MEMBERSHIP_CONCURRENCY", "16"))
+
     # Polling Defaults
-    POLL_INTERVAL: int = int(os.getenv("POLL_INTERVAL", "2"))
+    POLL_INTERVAL: float = float(os.getenv("POLL_INTERVAL", "2"))
     POLL_TIMEOUT: int = int(os.getenv("POLL_TIMEOUT", "300"))
+    # Upper bound for the adaptive poller's back-off between list calls
+    POLL_MAX_INTERVAL: float = float(os.getenv("POLL_MAX_INTERVAL", "10"))
 
     @classmethod
     def validate(cls):
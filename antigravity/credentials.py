@@ -0,0 +1,60 @@
+import asyncio
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+import yaml
+from client_keycloak import AsyncKeycloakClient
+from client_emf import AsyncEMFClient, Resource
+from config import Config
+from tracing import get_tracer
+from utils import read_secret
+
+def load_credentials(path: str) -> Dict[str, str]:
+    """
+    Loads Org Admin passwords for cross-org commands from YAML/JSON, keyed by org:
+
+    acme: {password_env: ACME_ADMIN_PASS}
+    globex: {password_file: /run/secrets/globex-admin}
+    initech: s3cret
+
+    A tenants manifest (see load_manifest) works too; its `admin` entries are used.
+    """
+    with open(path) as f:
+        data = yaml.safe_load(f) or {}
+    if not isinstance(data, dict):
+        raise ValueError("Credentials file must map org names to passwords")
+
+    if isinstance(data.get("orgs"), list):
+        entries = {o.get("name"): o["admin"] for o in data["orgs"] if o.get("admin")}
+    else:
+        entries = data
+    credentials = {}
+    for org, spec in entries.items():
+        if not org:
+            raise ValueError("Every org needs a 'name'")
+        credentials[str(org)] = read_secret(spec if isinstance(spec, dict) else {"password": spec}, f"{org}-admin")
+    return credentials
+
+async def iter_org_projects(credentials: Dict[str, str], workers: int = Config.BULK_WORKERS
+                            ) -> AsyncIterator[Tuple[str, List[Resource], Optional[str]]]:
+    """
+    Logs in as each {org}-admin and lists its projects, `workers` orgs at a
+    time. Yields (org, records, error) in completion order.
+    """
+    slots = asyncio.Semaphore(workers)
+
+    async def one(org: str, password: str):
+        async with slots:
+            with get_tracer().span(f"{org}: list projects"):
+                try:
+                    kc_org = AsyncKeycloakClient()
+                    await kc_org.login(username=f"{org}-admin", password=password)
+                    return org, await AsyncEMFClient(auth=kc_org).list_project_records(), None
+                except Exception as e:
+                    return org, [], str(e)
+
+    tasks = [asyncio.ensure_future(one(org, password)) for org, password in credentials.items()]
+    try:
+        for fut in asyncio.as_completed(tasks):
+            yield await fut
+    finally:
+        for t in tasks:
+            t.cancel()
@@ -0,0 +1,54 @@
+import csv
+import os
+import re
+import uuid
+from typing import Dict, List
+
+HOST_NAME = re.compile(r"^[a-zA-Z-_0-9./: ]{0,20}$")
+HOST_SERIAL = re.compile(r"^[A-Za-z0-9]{5,20}$")
+TRUE = {"1", "true", "yes", "y"}
+
+def host_key(row: Dict) -> str:
+    """Identity of a host row: its serial number, else its UUID."""
+    return (row.get("serialNumber") or row.get("uuid") or "").strip().lower()
+
+def load_hosts(path: str, auto_onboard: bool = False) -> List[Dict]:
+    """
+    Loads hosts to pre-register from CSV, header: name,serialNumber,uuid[,autoOnboard]
+    (`serial` is accepted for serialNumber). Each row needs a serial number or a UUID.
+    """
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+
+    hosts, seen = [], set()
+    for i, row in enumerate(rows, 2):
+        row = {k.strip(): (v or "").strip() for k, v in row.items() if k}
+        name = row.get("name", "")
+        serial = row.get("serialNumber") or row.get("serial", "")
+        uid = row.get("uuid", "")
+        if not serial and not uid:
+            raise ValueError(f"Line {i}: 'serialNumber' or 'uuid' is required")
+        if not HOST_NAME.match(name):
+            raise ValueError(f"Line {i}: invalid name '{name}' (max 20 of a-z A-Z 0-9 - _ . / : space)")
+        if serial and not HOST_SERIAL.match(serial):
+            raise ValueError(f"Line {i}: invalid serialNumber '{serial}' (5-20 alphanumerics)")
+        if uid:
+            try:
+                uid = str(uuid.UUID(uid))
+            except ValueError:
+                raise ValueError(f"Line {i}: invalid uuid '{uid}'")
+        host = {"name": name, "serialNumber": serial or None, "uuid": uid or None,
+                "autoOnboard": row["autoOnboard"].lower() in TRUE if row.get("autoOnboard") else auto_onboard}
+        key = host_key(host)
+        if key in seen:
+            raise ValueError(f"Line {i}: duplicate host '{key}'")
+        seen.add(key)
+        hosts.append(host)
+    return hosts
+
+def load_done_hosts(path: str) -> set:
+    """Keys (see host_key) of hosts a previous `host register` run registered or found registered."""
+    if not os.path.exists(path):
+        return set()
+    with open(path, newline="") as f:
+        return {host_key(r) for r in csv.DictReader(f) if r.get("status") in ("registered", "exists")}
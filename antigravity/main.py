@@ -1,593 +1,213 @@
 import typer
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.prompt import Prompt, Confirm
-from typing import List, Optional
-from client_keycloak import KeycloakClient
-from client_emf import EMFClient
 from config import Config
-from utils import poll_until
-import sys
+from cli_common import console, state, get_spinner, ensure_auth, print_http_stats, print_trace, export_trace, run_task_graph, output_format
+import cmd_cluster
+import cmd_host
+import cmd_org
+import cmd_project
+import cmd_user
 
 # Apps
+# Subcommand modules only import typer/rich at load time; clients, aiohttp,
+# YAML etc. are imported inside the commands that use them.
 app = typer.Typer(help="Antigravity EMF Multi-Tenancy Manager")
-org_app = typer.Typer(help="Manage Organizations")
-project_app = typer.Typer(help="Manage Projects")
-user_app = typer.Typer(help="Manage Users")
-
-app.add_typer(org_app, name="org")
-app.add_typer(project_app, name="project")
-app.add_typer(user_app, name="user")
-
-console = Console()
-state = {"kc": None, "emf": None}
-
-def get_spinner(description: str):
-    return Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        transient=True
-    )
-
-def ensure_auth():
-    """Ensures we have clients ready."""
-    if state["kc"] and state["emf"]:
-        return
-
-    # Prompt or Env?
-    # CLI constraints say we can prompt. 
-    # But basic auth flows usually rely on config/env for "admin" creds to the tool itself.
-    # The user request mentioned "Prompt user (or read from ENV)".
-    # Our KeycloakClient uses ENV by default. Let's stick to that for the *Platform Admin* credential.
-    
-    with get_spinner("Authenticating...") as progress:
-        progress.add_task("Connecting to Keycloak...")
-        try:
-            kc = KeycloakClient()
-            kc.login() # Uses ENV vars or fail
-            state["kc"] = kc
-            
-            # Helper: Ensure Admin has 'org-admin-group' rights (required for EMF)
-            # 1-create-org.sh does this explicitly.
-            admin_user = Config.KEYCLOAK_ADMIN_USER
-            try:
-                # Find Admin User UUID
-                users = kc.search_users(admin_user)
-                uid = None
-                for u in users:
-                     if u["username"] == admin_user:
-                         uid = u["id"]
-                         break
-                
-                if uid:
-                    # Check groups
-                    user_groups = kc.get_user_groups(uid)
-                    has_group = any(g["name"] == "org-admin-group" for g in user_groups)
-                    
-                    if not has_group:
-                        console.print(f"[yellow]Adding {admin_user} to org-admin-group...[/yellow]")
-                        g_info = kc.get_group_by_path("org-admin-group")
-                        if g_info:
-                             kc.add_user_to_group(uid, g_info["id"])
-                             # Re-login to get updated token Claims
-                             console.print("Refreshing token...")
-                             kc.login() 
-                        else:
-                             console.print("[red]Warning: org-admin-group not found![/red]")
-            except Exception as e:
-                console.print(f"[yellow]Permission check failed: {e}[/yellow]")
-
-            state["emf"] = EMFClient(kc.token)
-        except Exception as e:
-            console.print(f"[red]Authentication Failed: {e}[/red]")
-            console.print("Ensure CLUSTER_FQDN (or KEYCLOAK_URL), KEYCLOAK_ADMIN_USER, KEYCLOAK_ADMIN_PASS are set.")
-            sys.exit(1)
-
-def ask_password(prompt_text: str, confirm: bool = True) -> str:
-    """Fetches password policy and prompts user."""
-    kc = state.get("kc")
-    # If not logged in, we can't get policy easily unless we use a temporary unrestricted client (rare).
-    # Just proceed if we can't get it.
-    if kc and kc.token: 
-        try:
-            policy = kc.get_realm_password_policy()
-            console.print(f"[bold cyan]Password Policy: {policy}[/bold cyan]")
-        except:
-            pass
-    while True:
-        pwd = Prompt.ask(prompt_text, password=True)
-        if not pwd:
-            console.print("[red]Password cannot be empty.[/red]")
-            continue
-        
-        if not confirm:
-            return pwd
-            
-        pwd_confirm = Prompt.ask("Confirm Password", password=True)
-        if pwd != pwd_confirm:
-            console.print("[red]Passwords do not match. Please try again.[/red]")
-            continue
-            
-        return pwd
-
-@org_app.command("create")
-def create_org(
-    name: str = typer.Option(..., prompt="Organization Name"),
-    description: str = typer.Option(None, help="Description (optional)"),
-    create_admin: bool = typer.Option(True, prompt="Create default Org Admin?", help="Create an admin user for this org"),
-    org_admin_pass: str = typer.Option(None, help="Password for Org Admin (if creating)")
+app.add_typer(cmd_org.app, name="org")
+app.add_typer(cmd_project.app, name="project")
+app.add_typer(cmd_user.app, name="user")
+app.add_typer(cmd_host.app, name="host")
+app.add_typer(cmd_cluster.app, name="cluster")
+
+@app.callback()
+def main_callback(
+    ctx: typer.Context,
+    http_stats: bool = typer.Option(False, "--http-stats", help="Print connection reuse statistics on exit"),
+    trace: bool = typer.Option(False, "--trace", help="Print a timing tree of every step and HTTP call on exit"),
+    trace_out: str = typer.Option(None, "--trace-out", help="Write the trace to this file"),
+    trace_format: str = typer.Option("json", "--trace-format", help="Trace file format: json or prometheus"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the Org/Project metadata cache"),
+    output: str = typer.Option("table", "--output", "-o", help="List output: table, json, ndjson or csv (streamed to stdout)"),
 ):
-    """Create a new Organization and optionally an Admin User."""
-    ensure_auth()
-    if not description:
-        description = f"Description for {name}"
-
-    emf = state["emf"]
-    kc = state["kc"]
-
-    # 1. Create Org
-    # 1. Create Org
-    with get_spinner(f"Creating Org {name}...") as progress:
-        task_id = progress.add_task(f"sending request...")
-        emf.create_org(name, description)
-        
-        def check_status_func():
-            return emf.get_org_status(name)
-        
-        def on_retry(status):
-            progress.update(task_id, description=f"Provisioning... Current Status: {status}")
-
-        poll_until(
-            check_status_func, 
-            lambda x: x == "STATUS_INDICATION_IDLE",
-            description="Org Provisioning",
-            on_retry=on_retry
-        )
-        org_uuid = emf.get_org_uuid(name)
-
-    console.print(f"[green]✓ Organization {name} Created (UUID: {org_uuid})[/green]")
+    output_format(output)
+    if no_cache:
+        from metadata import get_metadata_cache
+        get_metadata_cache().enabled = False
+    if http_stats:
+        ctx.call_on_close(print_http_stats)
+    if trace or trace_out:
+        from tracing import get_tracer
+        if trace_format not in ("json", "prometheus"):
+            raise typer.BadParameter("must be 'json' or 'prometheus'", param_hint="--trace-format")
+        get_tracer().enabled = True
+        if trace:
+            ctx.call_on_close(print_trace)
+        if trace_out:
+            ctx.call_on_close(lambda: export_trace(trace_out, trace_format))
+
+@app.command("cache-clear")
+def cache_clear():
+    """Forget cached Org/Project names and UUIDs."""
+    from metadata import get_metadata_cache
+    get_metadata_cache().clear()
+    console.print("[green]Metadata cache cleared.[/green]")
+
+@app.command("logout")
+def logout():
+    """Forget cached Keycloak tokens."""
+    from tokens import get_token_manager
+    get_token_manager().clear()
+    console.print("[green]Token cache cleared.[/green]")
+
+def _reconciler(file: str, workers: int):
+    """Loads the manifest, snapshots live state and returns (reconciler, plan)."""
+    from bulk import load_manifest
+    from reconcile import Reconciler
+    from transport import get_transport, run_sync
 
-    # 2. Create Admin
-    if create_admin:
-        admin_user = f"{name}-admin"
-        if not org_admin_pass:
-            org_admin_pass = ask_password(f"Password for {admin_user}")
-        
-        with get_spinner(f"Creating User {admin_user}...") as progress:
-            progress.add_task("Creating in Keycloak...")
-            user_id = kc.create_user(admin_user, org_admin_pass)
-            
-            group_name = f"{org_uuid}_Project-Manager-Group"
-            def check_group():
-                return kc.get_group_by_path(group_name)
-            
-            try:
-                group = poll_until(lambda: check_group(), lambda x: x is not None, description="Group Sync")
-                kc.validate_user_constraints(user_id, group_name)
-                kc.add_user_to_group(user_id, group["id"])
-            except Exception as e:
-                console.print(f"[red]Failed to assign admin group: {e}[/red]")
-                raise typer.Exit(1)
-        
-        console.print(f"[green]✓ User {admin_user} created and made Admin of {name}[/green]")
+    try:
+        orgs = load_manifest(file)
+    except Exception as e:
+        console.print(f"[red]Invalid manifest: {e}[/red]")
+        raise typer.Exit(1)
 
-@org_app.command("list")
-def list_orgs():
-    """List all Organizations."""
     ensure_auth()
-    emf = state["emf"]
-    
-    with get_spinner("Fetching Organizations...") as p:
-        p.add_task("Querying...")
-        orgs = emf.list_orgs(details=True)
-        
-    if not orgs:
-        console.print("[yellow]No Organizations found.[/yellow]")
+    reconciler = Reconciler(state["kc"].aio, state["emf"].aio, workers=workers)
+    reconciler.load(orgs)
+    before = get_transport().stats.snapshot()["requests"]
+    with get_spinner("Reading live state...") as p:
+        p.add_task("Listing orgs, projects, users, groups and memberships...")
+        run_sync(reconciler.take_snapshot())
+    reads = get_transport().stats.snapshot()["requests"] - before
+    for err in reconciler.snapshot.errors:
+        console.print(f"[red]{err}[/red]")
+    if reconciler.snapshot.failed:
+        console.print(f"[red]Not planned (snapshot failed): {', '.join(sorted(reconciler.snapshot.failed))}[/red]")
+    actions = reconciler.plan()
+    console.print(f"[dim]Snapshot: {reads} requests[/dim]")
+    return reconciler, actions
+
+def _print_plan(actions, excluded=()):
+    if not actions:
+        if excluded:
+            console.print("[yellow]No changes for the other organizations.[/yellow]")
+        else:
+            console.print("[green]No changes. Live state matches the manifest.[/green]")
         return
-
-    from rich.table import Table
-    table = Table(title="Organizations")
-    table.add_column("Name", style="cyan")
-    table.add_column("UUID", style="dim")
-    table.add_column("Status", style="green")
-    
-    for o in orgs:
-        status_str = o.get("status") or "Unknown"
-        table.add_row(o["name"], o["uuid"] or "N/A", status_str)
-        
-    console.print(table)
-
-@project_app.command("create")
-def create_project(
-    project_name: str = typer.Option(..., prompt="Project Name"),
-    description: str = typer.Option(None),
-    org_name: str = typer.Option(None, help="Organization Name (skips prompt)"),
-    org_admin_pass: str = typer.Option(None, help="Password for Org Admin (for context)")
+    for a in actions:
+        mark = "[yellow]~[/yellow]" if a.kind.startswith("wait") else "[green]+[/green]"
+        console.print(f" {mark} {a.tenant}: {a.label}", highlight=False)
+    counts = {}
+    for a in actions:
+        counts[a.kind] = counts.get(a.kind, 0) + 1
+    summary = ", ".join(f"{n} {kind}" for kind, n in counts.items())
+    console.print(f"Plan: {summary} ({sum(a.writes for a in actions)} API writes)")
+
+@app.command("plan")
+def plan_manifest(
+    file: str = typer.Option(..., "--file", "-f", help="Tenants manifest (YAML or JSON)"),
+    workers: int = typer.Option(Config.BULK_WORKERS, help="Max concurrent per-org snapshot reads")
 ):
-    """Create a new Project within a selected Organization."""
-    ensure_auth()
-    # default EMF/KC are Platform Admin
-    kc_admin = state["kc"] 
-    
-    # 1. Select Org
-    emf_global = state["emf"]
-    
-    with get_spinner("Fetching Organizations...") as p:
-        p.add_task("loading...")
-        orgs = emf_global.list_orgs()
-    
-    if not orgs:
-        console.print("[red]No Organizations found.[/red]")
-        raise typer.Exit(1)
-
-    org_names = list(orgs.keys())
-    
-    selected_org = org_name
-    if not selected_org:
-        console.print("Available Organizations:")
-        for o in org_names:
-            console.print(f" - {o}")
-        selected_org = Prompt.ask("Select Organization", choices=org_names)
-    elif selected_org not in org_names:
-        console.print(f"[red]Organization {selected_org} not found in available list.[/red]")
-        # Optional: Allow creating anyway? No, safer to fail.
+    """Show the API calls needed to make live state match a manifest, without changing anything."""
+    reconciler, actions = _reconciler(file, workers)
+    _print_plan(actions, reconciler.snapshot.failed)
+    if reconciler.snapshot.failed:
         raise typer.Exit(1)
 
-    org_uuid = orgs[selected_org]
-
-    if not description:
-        description = f"Project {project_name} in {selected_org}"
-
-    # 2. Login as Org Admin (required for Project Creation context)
-    org_admin_user = f"{selected_org}-admin"
-    if not org_admin_pass:
-        console.print(f"[yellow]To create a project in {selected_org}, we need {org_admin_user} credentials.[/yellow]")
-        org_admin_pass = ask_password(f"Password for {org_admin_user}", confirm=False)
-
-    # Authenticate as Org Admin
-    # Authenticate as Org Admin
-    kc_org = KeycloakClient()
-    try:
-        with get_spinner(f"Authenticating as {org_admin_user}...") as p:
-             kc_org.login(username=org_admin_user, password=org_admin_pass)
-    except Exception as e:
-        console.print(f"[red]Failed to login as {org_admin_user}: {e}[/red]")
-        raise typer.Exit(1)
-
-    emf_org = EMFClient(kc_org.token)
-
-    # 3. Create Project
-    # 3. Create Project
-    with get_spinner(f"Creating Project {project_name}...") as p:
-        task_id = p.add_task("Requesting...")
-        emf_org.create_project(project_name, description)
-        
-        def check_status_func():
-            return emf_org.get_project_status(project_name)
-
-        def on_retry(status):
-            p.update(task_id, description=f"Provisioning... Current Status: {status}")
+@app.command("apply")
+def apply_manifest(
+    file: str = typer.Option(..., "--file", "-f", help="Tenants manifest (YAML or JSON)"),
+    workers: int = typer.Option(Config.BULK_WORKERS, help="Max concurrent provisioning steps")
+):
+    """Reconcile Orgs, Projects, Users and memberships with a manifest, in parallel."""
+    reconciler, actions = _reconciler(file, workers)
+    _print_plan(actions, reconciler.snapshot.failed)
+    if not actions:
+        if reconciler.snapshot.failed:
+            raise typer.Exit(1)
+        return
 
-        # We might need to poll using the global admin if the org admin loses context? 
-        # But usually polling with same token is fine.
-        poll_until(
-            check_status_func, 
-            lambda x: x == "STATUS_INDICATION_IDLE", 
-            description="Provisioning",
-            on_retry=on_retry
+    graph = reconciler.build(actions)
+    tenants = len({a.tenant for a in actions})
+    console.print(f"Applying {len(graph.tasks)} steps for {tenants} organizations ({workers} workers)...")
+
+    failed = run_task_graph(graph, workers, "Provisioning Summary", "reconciled")
+    poller = reconciler.provisioner.poller
+    waits = [m["seconds"] for m in poller.metrics()]
+    if waits:
+        console.print(
+            f"[dim]Polling: {len(waits)} resources via {poller.list_calls} list calls, "
+            f"time-to-ready avg {sum(waits) / len(waits):.1f}s, max {max(waits):.1f}s[/dim]"
         )
-        
-        # Get UUID (using Org Admin token)
-        proj_uuid = emf_org.get_project_uuid(project_name)
-
-    console.print(f"[green]✓ Project {project_name} Created ({proj_uuid})[/green]")
-
-    # 3. Create "Organization Project Admin" (The Onboarding User)
-    # User Request: "create a default 'Organization Project Admin', this user will have the Onboarding permissions."
-    # Naming convention: [org]-proj-admin? Or [project]-onboarding?
-    # Request says: "I want the Organization Admin account to be updated to have all permissions OTHER THAN Edge-Onboarding-Group...".
-    # And "Create a default 'Organization Project Admin' ... will have Onboarding permissions."
-    
-    proj_admin_user = f"{selected_org}-proj-admin" # or maybe just unique to project?
-    # To be safe and unique: {project_name}-admin is safer? 
-    # But prompt says "Organization Project Admin". Let's ask.
-    
-    # ask specifically for Onboarding User
-    create_onboarding = Confirm.ask(f"Create Onboarding User for {project_name}?", default=True)
-    if create_onboarding:
-        # A. Onboarding User
-        onboarding_user = f"{selected_org}-{project_name}-onboard"
-        onboarding_pass = ask_password(f"Password for {onboarding_user}")
-        
-        with get_spinner(f"Creating Onboarding User {onboarding_user}...") as p:
-            uid = kc_admin.create_user(onboarding_user, onboarding_pass)
-            
-            # Assign Onboarding Group
-            g_name = f"{proj_uuid}_Edge-Onboarding-Group"
-            g = poll_until(lambda: kc_admin.get_group_by_path(g_name), lambda x: x, description="Group Sync")
-            
-            kc_admin.validate_user_constraints(uid, g_name)
-            kc_admin.add_user_to_group(uid, g["id"])
-        console.print(f"[green]✓ Onboarding User {onboarding_user} created[/green]")
-
-    # B. Update Org Admin (Always, unless skipped by error)
-    org_admin_name = f"{selected_org}-admin"
-    console.print(f"Updating Org Admin {org_admin_name} with Project permissions...")
-    
-    oa_id = None
-    try:
-            # Find user ID - Use kc_admin (Platform Admin)
-            u = kc_admin.get_user(org_admin_name)
-            if u:
-                oa_id = u["id"]
-                console.print(f"[dim]Found Org Admin ID: {oa_id}[/dim]")
-            else:
-                console.print(f"[yellow]User {org_admin_name} not found via get_user (exact match).[/yellow]")
-    except Exception as e:
-        console.print(f"[red]Error searching for {org_admin_name}: {e}[/red]")
-
-    if oa_id:
-        groups_to_add = ["Edge-Manager-Group", "Edge-Operator-Group", "Host-Manager-Group"] # "Project-Manager-Group" is Org level? 
-        # createProjectAdmin script uses: "Edge-Manager-Group" "Edge-Onboarding-Group" "Edge-Operator-Group" "Host-Manager-Group"
-        # But here we want ALL EXCEPT Onboarding.
-        
-        with get_spinner("Assigning groups to Org Admin...") as p:
-            for suffix in groups_to_add:
-                g_name = f"{proj_uuid}_{suffix}"
-                # Use polling because groups creation is async by EMF-Orchestrator
-                g = poll_until(lambda: kc_admin.get_group_by_path(g_name), lambda x: x, description=f"Sync {suffix}")
-                
-                if g:
-                    try:
-                        # Note: Org Admin might have other project groups.
-                        # We trust the relationship here (Project is in the Org), so we skip the strict single-tenant constraint check
-                        # which might confuse Project UUIDs with Org UUIDs.
-                        # kc_admin.validate_user_constraints(oa_id, g_name)
-                        kc_admin.add_user_to_group(oa_id, g["id"])
-                    except Exception as e:
-                        console.print(f"[yellow]Skipped {g_name}: {e}[/yellow]")
-        console.print(f"[green]✓ Org Admin updated[/green]")
-    else:
-        console.print(f"[yellow]Org Admin {org_admin_name} not found, skipping update.[/yellow]")
+    if failed or reconciler.snapshot.failed:
+        raise typer.Exit(1)
 
-@project_app.command("list")
-def list_projects(
-    org_name: str = typer.Option(None, help="Organization Name (skips prompt)"),
-    org_admin_pass: str = typer.Option(None, help="Password for Org Admin")
+@app.command("destroy")
+def destroy_tenants(
+    file: str = typer.Option(..., "--file", "-f", help="Org Admin credentials or tenants manifest; its Orgs are deleted"),
+    match: str = typer.Option(None, help="Only Orgs whose name matches this glob, e.g. 'ci-*'"),
+    keep_users: bool = typer.Option(False, help="Delete Orgs and Projects only, keep their Keycloak users"),
+    dry_run: bool = typer.Option(False, help="Print the plan without deleting anything"),
+    yes: bool = typer.Option(False, "--yes", "-y", help="Do not ask for confirmation"),
+    workers: int = typer.Option(Config.TEARDOWN_WORKERS, help="Max concurrent teardown steps")
 ):
-    """List Projects within an Organization (requires Org Admin)."""
-    ensure_auth()
-    emf_global = state["emf"]
-    
-    # 1. Select Org
-    with get_spinner("Fetching Organizations...") as p:
-        orgs = emf_global.list_orgs()
-    
-    if not orgs:
-        console.print("[red]No Organizations found.[/red]")
-        raise typer.Exit(1)
-        
-    org_names = list(orgs.keys())
-    selected_org = org_name
-    if not selected_org:
-        console.print("Available Organizations:")
-        for o in org_names:
-            console.print(f" - {o}")
-        selected_org = Prompt.ask("Select Organization", choices=org_names)
-    elif selected_org not in org_names:
-         console.print(f"[red]Organization {selected_org} not found.[/red]")
-         raise typer.Exit(1)
-         
-    # 2. Authenticate as Org Admin
-    org_admin_user = f"{selected_org}-admin"
-    if not org_admin_pass:
-        console.print(f"[yellow]To list projects in {selected_org}, we need {org_admin_user} credentials.[/yellow]")
-        org_admin_pass = ask_password(f"Password for {org_admin_user}", confirm=False)
-        
-    kc_org = KeycloakClient()
+    """Delete whole tenants in parallel: Projects, then Orgs, then users that belonged only to them."""
+    from fnmatch import fnmatch
+    from credentials import load_credentials
+
     try:
-        with get_spinner(f"Authenticating as {org_admin_user}...") as p:
-             kc_org.login(username=org_admin_user, password=org_admin_pass)
+        credentials = load_credentials(file)
     except Exception as e:
-        console.print(f"[red]Failed to login as {org_admin_user}: {e}[/red]")
+        console.print(f"[red]Invalid credentials file: {e}[/red]")
         raise typer.Exit(1)
-
-    emf_org = EMFClient(kc_org.token)
-    
-    # 3. List Projects
-    with get_spinner(f"Fetching Projects for {selected_org}...") as p:
-        p.add_task("Querying...")
-        projs = emf_org.list_projects(details=True)
-        
-    if not projs:
-        console.print(f"[yellow]No Projects found in {selected_org}.[/yellow]")
+    if match:
+        credentials = {o: p for o, p in credentials.items() if fnmatch(o, match)}
+    if not credentials:
+        console.print("[yellow]No organizations selected.[/yellow]")
         return
+    if not cmd_org.run_teardown(credentials, keep_users, workers, dry_run, yes):
+        raise typer.Exit(1)
 
-    from rich.table import Table
-    table = Table(title=f"Projects in {selected_org}")
-    table.add_column("Name", style="magenta")
-    table.add_column("UUID", style="dim")
-    table.add_column("Status", style="green")
-    
-    for p in projs:
-        status_str = p.get("status") or "Unknown"
-        table.add_row(p["name"], p["uuid"] or "N/A", status_str)
-        
-    console.print(table)
-
-@user_app.command("manage")
-def manage_user():
-    """Add or Update a user with specific permissions."""
-    ensure_auth()
-    emf = state["emf"]
-    kc = state["kc"]
-
-    # 1. Select User Action
-    action = Prompt.ask("Action", choices=["create-new", "update-existing"])
-    
-    username = Prompt.ask("Username")
-    user_id = None
-    
-    if action == "create-new":
-        password = ask_password("Password")
-        user_id = kc.create_user(username, password)
-        console.print(f"[green]User {username} created[/green]")
-    else:
-        users = kc.search_users(username)
-        # simplistic match
-        for u in users:
-            if u["username"] == username:
-                user_id = u["id"]
-                break
-        if not user_id:
-            console.print("[red]User not found[/red]")
+@app.command("serve")
+def serve(
+    host: str = typer.Option(Config.SERVE_HOST, help="Address to bind (other than loopback only with SERVE_TOKEN set)"),
+    port: int = typer.Option(Config.SERVE_PORT, help="Port to listen on"),
+    workers: int = typer.Option(Config.SERVE_WORKERS, help="Operations run concurrently; the rest wait in the queue"),
+    queue_size: int = typer.Option(Config.SERVE_QUEUE_SIZE, help="Waiting operations before requests get 503"),
+    credentials: str = typer.Option(Config.ORG_CREDENTIALS_FILE or None, help="Org Admin passwords (YAML/JSON) for org-scoped routes"),
+):
+    """Run as a daemon serving org/project/user operations over a local HTTP API with warm sessions."""
+    import signal
+    import threading
+    from credentials import load_credentials
+    from server import Server
+    from transport import run_sync
+
+    passwords = {}
+    if credentials:
+        try:
+            passwords = load_credentials(credentials)
+        except Exception as e:
+            console.print(f"[red]Invalid credentials file: {e}[/red]")
             raise typer.Exit(1)
-        console.print(f"[green]Found User {username}[/green]")
-
-    # 2. Select Org (Context)
-    with get_spinner("Fetching Orgs...") as p:
-        orgs = emf.list_orgs()
-    
-    org_choice = Prompt.ask("Select Organization context", choices=list(orgs.keys()))
-    # org_uuid = orgs[org_choice] # Maybe used for validation if strict
-
-    # 3. Select Projects
-    with get_spinner("Fetching Projects...") as p:
-        projects = emf.list_projects()
-    
-    # Simple multi-select via iteration or comma separated?
-    # Typer/Rich prompt doesn't have native multi-select checkbox easily without `inquirer` style libs.
-    # We will do Comma Separated.
-    console.print("Available Projects:")
-    p_names = list(projects.keys())
-    for pn in p_names:
-        console.print(f" - {pn}")
-    
-    selected_projs_str = Prompt.ask("Select Projects (comma separated, or 'all')")
-    if selected_projs_str.lower() == 'all':
-        selected_projs = p_names
-    else:
-        selected_projs = [s.strip() for s in selected_projs_str.split(",") if s.strip() in projects]
-    
-    if not selected_projs:
-        console.print("[yellow]No valid projects selected.[/yellow]")
-        return
-
-    # 4. Select Roles
-    console.print("Roles:")
-    console.print("1. Project Admin (Manager + Operator + Host + Onboarding?)") # Definition varies in prompt.
-    # Prompt says: "- Project Admin: as represented in createProjectAdmin function"
-    # createProjectAdmin script: adds `[Org_UUID]_Project-Manager-Group`. Wait, that's Org Admin?
-    # Wait, createProjectAdmin (line 139) adds `[Org_UUID]_Project-Manager-Group`. 
-    # BUT createProjectUser (line 173) adds `[Proj_UUID]_(Manager,Onboarding,Operator,Host)`.
-    # AND "Organization Project Admin" is mentioned in prompt Item 2 as having "Onboarding".
-    
-    # Prompt Item 3:
-    # - Project Admin: as represented in createProjectAdmin
-    # - Project User: as represented in createProjectUser
-    # - Optional: Onboarding, Org Admin.
-    
-    # Correction: createProjectAdmin in script (line 163) adds `[OrgUUID]_Project-Manager-Group`.
-    # It essentially makes them a full Org Admin?
-    # The script comments say "Creating Project Admin...".
-    # This implies in this schema, "Project Admin" might just be "Org Admin"? Or the script naming is confusing.
-    # Let's stick to the User Request text: "Project Admin: as represented in createProjectAdmin function".
-    
-    role = Prompt.ask("Select Role", choices=["Project Admin", "Project User", "Custom"])
-    
-    groups_to_add = []
-    
-    if role == "Project Admin":
-        # Based on script createProjectAdmin: Add to Org-Level Project-Manager-Group?
-        # That seems to grant access to ALL projects in Org?
-        # If the user selected specific projects, this might be overkill.
-        # But we must follow the definition.
-        # Wait, if they select "Project Admin", maybe they become Admin for THAT project?
-        # But the script uses Org UUID.
-        # I will assume "Project Admin" means adding the Org-Level Manager group.
-        # Check `kc-utils.sh` line 163: `project_user_groups=("${org_uuid}_Project-Manager-Group")`
-        org_uuid = orgs[org_choice]
-        groups_to_add.append(f"{org_uuid}_Project-Manager-Group")
-
-    elif role == "Project User":
-        # createProjectUser script: 
-        # groups=("Edge-Manager-Group" "Edge-Onboarding-Group" "Edge-Operator-Group" "Host-Manager-Group")
-        # Prefixed with Project UUID.
-        base_suffixes = ["Edge-Manager-Group", "Edge-Onboarding-Group", "Edge-Operator-Group", "Host-Manager-Group"]
-        for p_name in selected_projs:
-            p_uuid = projects[p_name]
-            for s in base_suffixes:
-                groups_to_add.append(f"{p_uuid}_{s}")
-    
-    elif role == "Custom":
-        suffixes = []
-        if Confirm.ask("Add Edge-Manager?"): suffixes.append("Edge-Manager-Group")
-        if Confirm.ask("Add Edge-Operator?"): suffixes.append("Edge-Operator-Group")
-        if Confirm.ask("Add Host-Manager?"): suffixes.append("Host-Manager-Group")
-        if Confirm.ask("Add Edge-Onboarding?"): suffixes.append("Edge-Onboarding-Group")
-        
-        for p_name in selected_projs:
-            p_uuid = projects[p_name]
-            for s in suffixes:
-                groups_to_add.append(f"{p_uuid}_{s}")
-        
-        if Confirm.ask("Add Org Admin (Project-Manager-Group)?"):
-             org_uuid = orgs[org_choice]
-             groups_to_add.append(f"{org_uuid}_Project-Manager-Group")
-
-    # 5. Apply
-    with get_spinner("Applying permissions...") as p:
-        for g_name in groups_to_add:
-            if not g:
-                console.print(f"[yellow]Group {g_name} not found. Skipping.[/yellow]")
-                continue
-            
-            try:
-                # kc.validate_user_constraints(user_id, g_name) # Warn only now
-                kc.add_user_to_group(user_id, g["id"])
-                console.print(f" - Added to {g_name}")
-            except Exception as e:
-                console.print(f"[red]Failed to add to {g_name}: {e}[/red]")
-    
-    console.print("[green]Done.[/green]")
-
-@user_app.command("list")
-def list_users(search: str = typer.Option(None, help="Search term (username, email)")):
-    """List or search users."""
     ensure_auth()
-    kc = state["kc"]
-    
-    query = search if search else ""
-    if not query:
-        # Prompt if empty? or just search all (empty string searches all in KC usually, or specific arg?)
-        # kc.search_users("") returns first 100 usually.
-        console.print("[dim]Fetching all users (limit might apply)...[/dim]")
-    else:
-        console.print(f"[dim]Searching for '{query}'...[/dim]")
+    server = Server(state["kc"].aio, state["emf"].aio, passwords, workers, queue_size)
+    try:
+        run_sync(server.start(host, port))
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1)
+    except OSError as e:
+        console.print(f"[red]Cannot listen on {host}:{port}: {e}[/red]")
+        raise typer.Exit(1)
+    console.print(f"[green]Serving on http://{host}:{port}[/green] [dim]({workers} workers, queue {queue_size})[/dim]")
 
-    with get_spinner("Fetching Users...") as p:
-        users = kc.search_users(query)
-    
-    if not users:
-        console.print("[yellow]No users found.[/yellow]")
-        return
-        
-    from rich.table import Table
-    table = Table(title="Users")
-    table.add_column("Username", style="cyan")
-    table.add_column("ID", style="dim")
-    table.add_column("Email", style="blue")
-    table.add_column("Enabled", style="green")
-    
-    for u in users:
-        table.add_row(
-            u.get("username", "N/A"), 
-            u.get("id", "N/A"), 
-            u.get("email", ""), 
-            str(u.get("enabled", False))
-        )
-    
-    console.print(table)
+    stopping = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stopping.set())
+    try:
+        stopping.wait()
+    except KeyboardInterrupt:
+        pass
+    console.print("Shutting down...")
+    run_sync(server.stop())
 
 if __name__ == "__main__":
     app()
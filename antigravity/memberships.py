@@ -0,0 +1,76 @@
+import asyncio
+from typing import Callable, Dict, Iterable, List, Optional
+from client_keycloak import AsyncKeycloakClient
+from config import Config
+from tracing import get_tracer
+
+async def resolve_user_ids(kc: AsyncKeycloakClient, usernames: Iterable[str]) -> Dict[str, Optional[str]]:
+    """{username: id or None}, looked up concurrently."""
+    usernames = list(usernames)
+    users = await asyncio.gather(*(kc.get_user(u) for u in usernames))
+    return {name: (u["id"] if u else None) for name, u in zip(usernames, users)}
+
+async def plan_memberships(
+    kc: AsyncKeycloakClient,
+    desired: Dict[str, Iterable[str]],
+    sync: bool = False,
+    scope: Optional[Callable[[str], bool]] = None,
+) -> List[Dict]:
+    """
+    Diffs each user's current groups against the desired group names.
+    desired: {user_id: [group names]}
+    sync: also plan removals of current groups that are not desired,
+          limited to groups for which scope(name) is True.
+    Returns changes: {"user_id", "group", "group_id", "action": add|remove|missing}.
+    """
+    user_ids = list(desired)
+    current_lists = await asyncio.gather(*(kc.get_user_groups(u) for u in user_ids))
+    wanted_names = {n for names in desired.values() for n in names}
+    groups = await kc.groups.resolve(wanted_names)
+
+    changes: List[Dict] = []
+    for user_id, current in zip(user_ids, current_lists):
+        current_by_name = {g["name"]: g for g in current}
+        wanted = set(desired[user_id])
+        for name in sorted(wanted - set(current_by_name)):
+            g = groups.get(name)
+            action = "add" if g else "missing"
+            changes.append({"user_id": user_id, "group": name, "group_id": g["id"] if g else None, "action": action})
+        if sync:
+            for name in sorted(set(current_by_name) - wanted):
+                if scope is None or scope(name):
+                    changes.append({"user_id": user_id, "group": name,
+                                    "group_id": current_by_name[name]["id"], "action": "remove"})
+    return changes
+
+async def apply_memberships(
+    kc: AsyncKeycloakClient,
+    desired: Dict[str, Iterable[str]],
+    sync: bool = False,
+    scope: Optional[Callable[[str], bool]] = None,
+    concurrency: int = Config.MEMBERSHIP_CONCURRENCY,
+) -> List[Dict]:
+    """
+    Applies only the missing PUT/DELETE calls for many users, `concurrency` at a time.
+    Each returned change carries "status": ok|failed|missing and "error".
+    """
+    tracer = get_tracer()
+    with tracer.span("plan memberships"):
+        changes = await plan_memberships(kc, desired, sync, scope)
+    slots = asyncio.Semaphore(concurrency)
+
+    async def run(change: Dict) -> Dict:
+        if change["action"] == "missing":
+            return dict(change, status="missing", error="group not found")
+        async with slots:
+            try:
+                if change["action"] == "add":
+                    await kc.add_user_to_group(change["user_id"], change["group_id"])
+                else:
+                    await kc.remove_user_from_group(change["user_id"], change["group_id"])
+                return dict(change, status="ok", error=None)
+            except Exception as e:
+                return dict(change, status="failed", error=str(e))
+
+    with tracer.span("apply memberships"):
+        return list(await asyncio.gather(*(run(c) for c in changes)))
@@ -0,0 +1,133 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
+from config import Config
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS resources (
+    kind TEXT NOT NULL, scope TEXT NOT NULL, name TEXT NOT NULL,
+    uid TEXT NOT NULL, status TEXT, updated REAL NOT NULL,
+    PRIMARY KEY (kind, scope, name)
+);
+CREATE TABLE IF NOT EXISTS listings (
+    kind TEXT NOT NULL, scope TEXT NOT NULL, updated REAL NOT NULL,
+    PRIMARY KEY (kind, scope)
+);
+"""
+
+class MetadataCache:
+    """
+    SQLite cache of Org/Project name -> (UUID, status) shared across CLI runs.
+
+    Entries are keyed by (kind, scope, name); the scope is the API URL for
+    orgs and API URL + principal for projects, since project listings depend
+    on the caller's org. Only provisioned (IDLE) resources are stored. A
+    complete listing is remembered separately so a cached name -> UUID map can
+    stand in for a full GET /v1/{kind}s. Anything older than `ttl` is ignored.
+    Any SQLite error disables the cache for the rest of the process.
+    """
+    def __init__(
+        self,
+        path: str = Config.METADATA_CACHE_PATH,
+        ttl: float = Config.METADATA_CACHE_TTL,
+        enabled: bool = Config.METADATA_CACHE,
+    ):
+        self.path = os.path.expanduser(path)
+        self.ttl = ttl
+        self.enabled = enabled
+        self.stats = {"hits": 0, "misses": 0}
+        self._db: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _conn(self) -> sqlite3.Connection:
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.path), mode=0o700, exist_ok=True)
+            # Used from the shared event loop thread and the CLI thread
+            self._db = sqlite3.connect(self.path, timeout=5, check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.executescript(SCHEMA)
+        return self._db
+
+    def _run(self, fn, default=None):
+        if not self.enabled:
+            return default
+        with self._lock:
+            try:
+                return fn(self._conn())
+            except sqlite3.Error as e:
+                logging.warning(f"Metadata cache disabled ({self.path}): {e}")
+                self.enabled = False
+                return default
+
+    def get(self, kind: str, scope: str, name: str) -> Optional[Tuple[str, Optional[str]]]:
+        """(uid, status) for a fresh entry, else None."""
+        row = self._run(lambda db: db.execute(
+            "SELECT uid, status FROM resources WHERE kind=? AND scope=? AND name=? AND updated>=?",
+            (kind, scope, name, time.time() - self.ttl)).fetchone())
+        self.stats["hits" if row else "misses"] += 1
+        return tuple(row) if row else None
+
+    def get_all(self, kind: str, scope: str) -> Optional[Dict[str, str]]:
+        """{name: uid} if a complete listing was stored within the TTL, else None."""
+        def read(db):
+            cutoff = time.time() - self.ttl
+            if not db.execute("SELECT 1 FROM listings WHERE kind=? AND scope=? AND updated>=?",
+                              (kind, scope, cutoff)).fetchone():
+                return None
+            rows = db.execute("SELECT name, uid FROM resources WHERE kind=? AND scope=?", (kind, scope))
+            return dict(rows.fetchall())
+        result = self._run(read)
+        self.stats["hits" if result is not None else "misses"] += 1
+        return result
+
+    def put(self, kind: str, scope: str, name: str, uid: Optional[str], status: Optional[str], ready: bool):
+        """Stores a provisioned resource; drops the entry if it is not (or no longer) ready."""
+        def write(db):
+            if ready and uid:
+                db.execute("INSERT OR REPLACE INTO resources VALUES (?, ?, ?, ?, ?, ?)",
+                           (kind, scope, name, uid, status, time.time()))
+            else:
+                db.execute("DELETE FROM resources WHERE kind=? AND scope=? AND name=?", (kind, scope, name))
+        self._run(write)
+
+    def put_all(self, kind: str, scope: str, records: Iterable[Tuple[str, Optional[str], Optional[str], bool]]):
+        """Replaces the scope with a complete listing of (name, uid, status, ready)."""
+        def write(db):
+            now = time.time()
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                db.execute("DELETE FROM resources WHERE kind=? AND scope=?", (kind, scope))
+                db.executemany("INSERT OR REPLACE INTO resources VALUES (?, ?, ?, ?, ?, ?)", [
+                    (kind, scope, name, uid, status, now)
+                    for name, uid, status, ready in records if ready and uid and name
+                ])
+                db.execute("INSERT OR REPLACE INTO listings VALUES (?, ?, ?)", (kind, scope, now))
+                db.execute("COMMIT")
+            except Exception:
+                db.execute("ROLLBACK")
+                raise
+        self._run(write)
+
+    def invalidate(self, kind: str, scope: str, name: Optional[str] = None):
+        """Forgets one entry (or the whole scope); either way the listing is no longer complete."""
+        def write(db):
+            if name is None:
+                db.execute("DELETE FROM resources WHERE kind=? AND scope=?", (kind, scope))
+            else:
+                db.execute("DELETE FROM resources WHERE kind=? AND scope=? AND name=?", (kind, scope, name))
+            db.execute("DELETE FROM listings WHERE kind=? AND scope=?", (kind, scope))
+        self._run(write)
+
+    def clear(self):
+        self._run(lambda db: db.executescript("DELETE FROM resources; DELETE FROM listings;"))
+
+_shared: Optional[MetadataCache] = None
+
+def get_metadata_cache() -> MetadataCache:
+    global _shared
+    if _shared is None:
+        _shared = MetadataCache()
+    return _shared
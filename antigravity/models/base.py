@@ -0,0 +1,101 @@
+from sys import intern
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, TypeVar
+
+T = TypeVar("T", bound="Model")
+
+# module -> class name -> class, so nested fields can name classes defined later
+_registry: Dict[str, Dict[str, type]] = {}
+
+class Nested:
+    """
+    Field holding another model (or a list of them). The parsed JSON is kept
+    as-is until the attribute is first read, then decoded once and stored
+    back; decoded lists are tuples.
+    """
+    __slots__ = ("slot", "module", "model", "many")
+
+    def __init__(self, slot: str, module: str, model: str, many: bool):
+        self.slot = slot
+        self.module = module
+        self.model = model
+        self.many = many
+
+    def resolve(self) -> Type["Model"]:
+        return _registry[self.module][self.model]
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        value = getattr(obj, self.slot)
+        if self.many:
+            if isinstance(value, list):
+                model = self.resolve()
+                value = tuple(model.from_json(v) if isinstance(v, dict) else v for v in value)
+                setattr(obj, self.slot, value)
+        elif isinstance(value, dict):
+            value = self.resolve().from_json(value)
+            setattr(obj, self.slot, value)
+        return value
+
+    def __set__(self, obj, value):
+        setattr(obj, self.slot, value)
+
+class Model:
+    """
+    Base of the generated API models (see models/generate.py). Instances use
+    __slots__ instead of a per-object dict: scalar fields are copied out of
+    the parsed JSON, nested objects are decoded on first access. Keys the
+    spec does not define are dropped.
+    """
+    __slots__ = ()
+    # (attribute, JSON key)
+    _scalars: Tuple[Tuple[str, str], ...] = ()
+    # (attribute, JSON key, model class name, is list); stored in slot "_" + attribute
+    _nested: Tuple[Tuple[str, str, str, bool], ...] = ()
+    # Scalars with a closed set of values: one shared string per value instead of one per record
+    _enums: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _registry.setdefault(cls.__module__, {})[cls.__name__] = cls
+        for attr, _, model, many in cls.__dict__.get("_nested", ()):
+            setattr(cls, attr, Nested(f"_{attr}", cls.__module__, model, many))
+
+    @classmethod
+    def from_json(cls: Type[T], data: Optional[Dict[str, Any]]) -> T:
+        obj = cls.__new__(cls)
+        get = (data or {}).get
+        for attr, key in cls._scalars:
+            setattr(obj, attr, get(key))
+        for attr in cls._enums:
+            value = getattr(obj, attr)
+            if isinstance(value, str):
+                setattr(obj, attr, intern(value))
+        for attr, key, _, _ in cls._nested:
+            setattr(obj, f"_{attr}", get(key))
+        return obj
+
+    @classmethod
+    def from_list(cls: Type[T], items: Optional[Iterable[Dict[str, Any]]]) -> List[T]:
+        return [cls.from_json(item) for item in items or ()]
+
+    def to_json(self) -> Dict[str, Any]:
+        """Back to the API's JSON shape, without unset fields."""
+        data = {}
+        for attr, key in self._scalars:
+            value = getattr(self, attr)
+            if value is not None:
+                data[key] = value
+        for attr, key, _, _ in self._nested:
+            value = getattr(self, f"_{attr}")
+            if isinstance(value, Model):
+                value = value.to_json()
+            elif isinstance(value, tuple):
+                value = [v.to_json() if isinstance(v, Model) else v for v in value]
+            if value is not None:
+                data[key] = value
+        return data
+
+    def __repr__(self) -> str:
+        shown = [f"{a}={getattr(self, a)!r}" for a, _ in self._scalars if getattr(self, a) is not None][:4]
+        return f"{type(self).__name__}({', '.join(shown)})"
@@ -0,0 +1,236 @@
+# Generated by models/generate.py from openapi/amc-app-orch-catalog-openapi.yaml; do not edit.
+"""Application Catalog API models."""
+from models.base import Model
+
+
+class APIExtension(Model):
+    """APIExtensions represents some form of an extension to the external API provided by deployment pac..."""
+    __slots__ = ('description', 'display_name', 'name', 'version', '_endpoints', '_ui_extension')
+    _scalars = (('description', 'description'), ('display_name', 'displayName'), ('name', 'name'), ('version', 'version'))
+    _nested = (('endpoints', 'endpoints', 'Endpoint', True), ('ui_extension', 'uiExtension', 'UIExtension', False))
+
+
+class Application(Model):
+    """Application represents a Helm chart that can be deployed to one or more Kubernetes pods."""
+    __slots__ = ('chart_name', 'chart_version', 'create_time', 'default_profile_name', 'description', 'display_name', 'helm_registry_name', 'image_registry_name', 'kind', 'name', 'update_time', 'version', '_ignored_resources', '_profiles')
+    _scalars = (('chart_name', 'chartName'), ('chart_version', 'chartVersion'), ('create_time', 'createTime'), ('default_profile_name', 'defaultProfileName'), ('description', 'description'), ('display_name', 'displayName'), ('helm_registry_name', 'helmRegistryName'), ('image_registry_name', 'imageRegistryName'), ('kind', 'kind'), ('name', 'name'), ('update_time', 'updateTime'), ('version', 'version'))
+    _nested = (('ignored_resources', 'ignoredResources', 'ResourceReference', True), ('profiles', 'profiles', 'Profile', True))
+    _enums = ('kind',)
+
+
+class ApplicationDependency(Model):
+    """ApplicationDependency represents the dependency of one application on another within the context ..."""
+    __slots__ = ('name', 'requires')
+    _scalars = (('name', 'name'), ('requires', 'requires'))
+    _nested = ()
+
+
+class ApplicationReference(Model):
+    """ApplicationReference represents a reference to an application by its name and its version."""
+    __slots__ = ('name', 'version')
+    _scalars = (('name', 'name'), ('version', 'version'))
+    _nested = ()
+
+
+class Artifact(Model):
+    """Artifact represents a binary artifact that can be used for various purposes, e.g."""
+    __slots__ = ('artifact', 'create_time', 'description', 'display_name', 'mime_type', 'name', 'update_time')
+    _scalars = (('artifact', 'artifact'), ('create_time', 'createTime'), ('description', 'description'), ('display_name', 'displayName'), ('mime_type', 'mimeType'), ('name', 'name'), ('update_time', 'updateTime'))
+    _nested = ()
+
+
+class ArtifactReference(Model):
+    """ArtifactReference serves as a reference to an artifact, together with the artifact's purpose with..."""
+    __slots__ = ('name', 'purpose')
+    _scalars = (('name', 'name'), ('purpose', 'purpose'))
+    _nested = ()
+
+
+class CreateApplicationResponse(Model):
+    """Response message for the CreateApplication method."""
+    __slots__ = ('_application',)
+    _scalars = ()
+    _nested = (('application', 'application', 'Application', False),)
+
+
+class CreateArtifactResponse(Model):
+    """Response message for the CreateArtifact method."""
+    __slots__ = ('_artifact',)
+    _scalars = ()
+    _nested = (('artifact', 'artifact', 'Artifact', False),)
+
+
+class CreateDeploymentPackageResponse(Model):
+    """Response message for the CreateDeploymentPackage method."""
+    __slots__ = ('_deployment_package',)
+    _scalars = ()
+    _nested = (('deployment_package', 'deploymentPackage', 'DeploymentPackage', False),)
+
+
+class CreateRegistryResponse(Model):
+    """Response message for the CreateRegistry method."""
+    __slots__ = ('_registry',)
+    _scalars = ()
+    _nested = (('registry', 'registry', 'Registry', False),)
+
+
+class DeploymentPackage(Model):
+    """DeploymentPackage represents a collection of applications (referenced by their name and a version..."""
+    __slots__ = ('create_time', 'default_namespaces', 'default_profile_name', 'description', 'display_name', 'forbids_multiple_deployments', 'is_deployed', 'is_visible', 'kind', 'name', 'update_time', 'version', '_application_dependencies', '_application_references', '_artifacts', '_extensions', '_namespaces', '_profiles')
+    _scalars = (('create_time', 'createTime'), ('default_namespaces', 'defaultNamespaces'), ('default_profile_name', 'defaultProfileName'), ('description', 'description'), ('display_name', 'displayName'), ('forbids_multiple_deployments', 'forbidsMultipleDeployments'), ('is_deployed', 'isDeployed'), ('is_visible', 'isVisible'), ('kind', 'kind'), ('name', 'name'), ('update_time', 'updateTime'), ('version', 'version'))
+    _nested = (('application_dependencies', 'applicationDependencies', 'ApplicationDependency', True), ('application_references', 'applicationReferences', 'ApplicationReference', True), ('artifacts', 'artifacts', 'ArtifactReference', True), ('extensions', 'extensions', 'APIExtension', True), ('namespaces', 'namespaces', 'Namespace', True), ('profiles', 'profiles', 'DeploymentProfile', True))
+    _enums = ('kind',)
+
+
+class DeploymentProfile(Model):
+    """DeploymentProfile specifies which application profiles will be used for deployment of which appli..."""
+    __slots__ = ('application_profiles', 'create_time', 'description', 'display_name', 'name', 'update_time')
+    _scalars = (('application_profiles', 'applicationProfiles'), ('create_time', 'createTime'), ('description', 'description'), ('display_name', 'displayName'), ('name', 'name'), ('update_time', 'updateTime'))
+    _nested = ()
+
+
+class DeploymentRequirement(Model):
+    """DeploymentRequirement is a reference to the deployment package that must be deployed first, as a ..."""
+    __slots__ = ('deployment_profile_name', 'name', 'version')
+    _scalars = (('deployment_profile_name', 'deploymentProfileName'), ('name', 'name'), ('version', 'version'))
+    _nested = ()
+
+
+class Endpoint(Model):
+    """Endpoint represents an application service endpoint."""
+    __slots__ = ('app_name', 'auth_type', 'external_path', 'internal_path', 'scheme', 'service_name')
+    _scalars = (('app_name', 'appName'), ('auth_type', 'authType'), ('external_path', 'externalPath'), ('internal_path', 'internalPath'), ('scheme', 'scheme'), ('service_name', 'serviceName'))
+    _nested = ()
+
+
+class GetApplicationReferenceCountResponse(Model):
+    """Response message for the GetApplicationReferenceCount method."""
+    __slots__ = ('reference_count',)
+    _scalars = (('reference_count', 'referenceCount'),)
+    _nested = ()
+
+
+class GetApplicationResponse(Model):
+    """Response message for the GetApplication method."""
+    __slots__ = ('_application',)
+    _scalars = ()
+    _nested = (('application', 'application', 'Application', False),)
+
+
+class GetApplicationVersionsResponse(Model):
+    """Response message for the GetApplication method."""
+    __slots__ = ('_application',)
+    _scalars = ()
+    _nested = (('application', 'application', 'Application', True),)
+
+
+class GetArtifactResponse(Model):
+    """Response message for the GetArtifact method."""
+    __slots__ = ('_artifact',)
+    _scalars = ()
+    _nested = (('artifact', 'artifact', 'Artifact', False),)
+
+
+class GetDeploymentPackageResponse(Model):
+    """Response message for the GetDeploymentPackage method."""
+    __slots__ = ('_deployment_package',)
+    _scalars = ()
+    _nested = (('deployment_package', 'deploymentPackage', 'DeploymentPackage', False),)
+
+
+class GetDeploymentPackageVersionsResponse(Model):
+    """Response message for the GetDeploymentPackageVersions method."""
+    __slots__ = ('_deployment_packages',)
+    _scalars = ()
+    _nested = (('deployment_packages', 'deploymentPackages', 'DeploymentPackage', True),)
+
+
+class GetRegistryResponse(Model):
+    """Response message for the GetRegistry method."""
+    __slots__ = ('_registry',)
+    _scalars = ()
+    _nested = (('registry', 'registry', 'Registry', False),)
+
+
+class ListApplicationsResponse(Model):
+    """Response message for the ListApplications method."""
+    __slots__ = ('total_elements', '_applications')
+    _scalars = (('total_elements', 'totalElements'),)
+    _nested = (('applications', 'applications', 'Application', True),)
+
+
+class ListArtifactsResponse(Model):
+    """Response message for the ListArtifacts method."""
+    __slots__ = ('total_elements', '_artifacts')
+    _scalars = (('total_elements', 'totalElements'),)
+    _nested = (('artifacts', 'artifacts', 'Artifact', True),)
+
+
+class ListDeploymentPackagesResponse(Model):
+    """Response message for the ListDeploymentPackages method."""
+    __slots__ = ('total_elements', '_deployment_packages')
+    _scalars = (('total_elements', 'totalElements'),)
+    _nested = (('deployment_packages', 'deploymentPackages', 'DeploymentPackage', True),)
+
+
+class ListRegistriesResponse(Model):
+    """Response message for the ListRegistries method."""
+    __slots__ = ('total_elements', '_registries')
+    _scalars = (('total_elements', 'totalElements'),)
+    _nested = (('registries', 'registries', 'Registry', True),)
+
+
+class Namespace(Model):
+    """Namespace represents a complex namespace definition with predefined labels and annotations."""
+    __slots__ = ('annotations', 'labels', 'name')
+    _scalars = (('annotations', 'annotations'), ('labels', 'labels'), ('name', 'name'))
+    _nested = ()
+
+
+class ParameterTemplate(Model):
+    """ParameterTemplate describes override values for Helm chart values"""
+    __slots__ = ('default', 'display_name', 'mandatory', 'name', 'secret', 'suggested_values', 'type', 'validator')
+    _scalars = (('default', 'default'), ('display_name', 'displayName'), ('mandatory', 'mandatory'), ('name', 'name'), ('secret', 'secret'), ('suggested_values', 'suggestedValues'), ('type', 'type'), ('validator', 'validator'))
+    _nested = ()
+
+
+class Profile(Model):
+    """Profile is a set of configuration values for customizing application deployment."""
+    __slots__ = ('chart_values', 'create_time', 'description', 'display_name', 'name', 'update_time', '_deployment_requirement', '_parameter_templates')
+    _scalars = (('chart_values', 'chartValues'), ('create_time', 'createTime'), ('description', 'description'), ('display_name', 'displayName'), ('name', 'name'), ('update_time', 'updateTime'))
+    _nested = (('deployment_requirement', 'deploymentRequirement', 'DeploymentRequirement', True), ('parameter_templates', 'parameterTemplates', 'ParameterTemplate', True))
+
+
+class Registry(Model):
+    """Registry represents a repository from which various artifacts, such as application Docker\\* image..."""
+    __slots__ = ('api_type', 'auth_token', 'cacerts', 'create_time', 'description', 'display_name', 'inventory_url', 'name', 'root_url', 'type', 'update_time', 'username')
+    _scalars = (('api_type', 'apiType'), ('auth_token', 'authToken'), ('cacerts', 'cacerts'), ('create_time', 'createTime'), ('description', 'description'), ('display_name', 'displayName'), ('inventory_url', 'inventoryUrl'), ('name', 'name'), ('root_url', 'rootUrl'), ('type', 'type'), ('update_time', 'updateTime'), ('username', 'username'))
+    _nested = ()
+
+
+class ResourceReference(Model):
+    """ResourceReference represents a Kubernetes resource identifier."""
+    __slots__ = ('kind', 'name', 'namespace')
+    _scalars = (('kind', 'kind'), ('name', 'name'), ('namespace', 'namespace'))
+    _nested = ()
+
+
+class UIExtension(Model):
+    """UIExtension is an augmentation of an API extension."""
+    __slots__ = ('app_name', 'description', 'file_name', 'label', 'module_name', 'service_name')
+    _scalars = (('app_name', 'appName'), ('description', 'description'), ('file_name', 'fileName'), ('label', 'label'), ('module_name', 'moduleName'), ('service_name', 'serviceName'))
+    _nested = ()
+
+
+class Upload(Model):
+    """Upload represents a single file-upload record."""
+    __slots__ = ('artifact', 'file_name')
+    _scalars = (('artifact', 'artifact'), ('file_name', 'fileName'))
+    _nested = ()
+
+
+class UploadCatalogEntitiesResponse(Model):
+    """Response message for the UploadCatalogItems method"""
+    __slots__ = ('error_messages', 'session_id', 'upload_number')
+    _scalars = (('error_messages', 'errorMessages'), ('session_id', 'sessionId'), ('upload_number', 'uploadNumber'))
+    _nested = ()
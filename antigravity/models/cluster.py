@@ -0,0 +1,117 @@
+# Generated by models/generate.py from openapi/amc-cluster-manager-openapi.yaml; do not edit.
+"""Cluster Manager 2.0 models."""
+from models.base import Model
+
+
+class ClusterDetailInfo(Model):
+    __slots__ = ('kubernetes_version', 'labels', 'name', 'template', '_control_plane_ready', '_infrastructure_ready', '_lifecycle_phase', '_node_health', '_nodes', '_provider_status')
+    _scalars = (('kubernetes_version', 'kubernetesVersion'), ('labels', 'labels'), ('name', 'name'), ('template', 'template'))
+    _nested = (('control_plane_ready', 'controlPlaneReady', 'GenericStatus', False), ('infrastructure_ready', 'infrastructureReady', 'GenericStatus', False), ('lifecycle_phase', 'lifecyclePhase', 'GenericStatus', False), ('node_health', 'nodeHealth', 'GenericStatus', False), ('nodes', 'nodes', 'NodeInfo', True), ('provider_status', 'providerStatus', 'GenericStatus', False))
+
+
+class ClusterInfo(Model):
+    __slots__ = ('kubernetes_version', 'labels', 'name', 'node_quantity', '_control_plane_ready', '_infrastructure_ready', '_lifecycle_phase', '_node_health', '_provider_status')
+    _scalars = (('kubernetes_version', 'kubernetesVersion'), ('labels', 'labels'), ('name', 'name'), ('node_quantity', 'nodeQuantity'))
+    _nested = (('control_plane_ready', 'controlPlaneReady', 'GenericStatus', False), ('infrastructure_ready', 'infrastructureReady', 'GenericStatus', False), ('lifecycle_phase', 'lifecyclePhase', 'GenericStatus', False), ('node_health', 'nodeHealth', 'GenericStatus', False), ('provider_status', 'providerStatus', 'GenericStatus', False))
+
+
+class ClusterLabels(Model):
+    __slots__ = ('labels',)
+    _scalars = (('labels', 'labels'),)
+    _nested = ()
+
+
+class ClusterNetwork(Model):
+    """Cluster network configuration, including pod and service CIDR blocks."""
+    __slots__ = ('_pods', '_services')
+    _scalars = ()
+    _nested = (('pods', 'pods', 'NetworkRanges', False), ('services', 'services', 'NetworkRanges', False))
+
+
+class ClusterSpec(Model):
+    __slots__ = ('labels', 'name', 'template', '_nodes')
+    _scalars = (('labels', 'labels'), ('name', 'name'), ('template', 'template'))
+    _nested = (('nodes', 'nodes', 'NodeSpec', True),)
+
+
+class ClusterSummary(Model):
+    __slots__ = ('error', 'in_progress', 'ready', 'total_clusters', 'unknown')
+    _scalars = (('error', 'error'), ('in_progress', 'inProgress'), ('ready', 'ready'), ('total_clusters', 'totalClusters'), ('unknown', 'unknown'))
+    _nested = ()
+
+
+class ClusterTemplateInfo(Model):
+    __slots__ = ('name', 'version')
+    _scalars = (('name', 'name'), ('version', 'version'))
+    _nested = ()
+
+
+class DefaultTemplateInfo(Model):
+    __slots__ = ('name', 'version')
+    _scalars = (('name', 'name'), ('version', 'version'))
+    _nested = ()
+
+
+class GenericStatus(Model):
+    """A generic status object."""
+    __slots__ = ('indicator', 'message', 'timestamp')
+    _scalars = (('indicator', 'indicator'), ('message', 'message'), ('timestamp', 'timestamp'))
+    _nested = ()
+    _enums = ('indicator',)
+
+
+class KubeconfigInfo(Model):
+    __slots__ = ('id', 'kubeconfig')
+    _scalars = (('id', 'id'), ('kubeconfig', 'kubeconfig'))
+    _nested = ()
+
+
+class NetworkRanges(Model):
+    __slots__ = ('cidr_blocks',)
+    _scalars = (('cidr_blocks', 'cidrBlocks'),)
+    _nested = ()
+
+
+class NodeInfo(Model):
+    __slots__ = ('id', 'role', '_status')
+    _scalars = (('id', 'id'), ('role', 'role'))
+    _nested = (('status', 'status', 'StatusInfo', False),)
+
+
+class NodeSpec(Model):
+    __slots__ = ('id', 'role')
+    _scalars = (('id', 'id'), ('role', 'role'))
+    _nested = ()
+    _enums = ('role',)
+
+
+class ProblemDetails(Model):
+    __slots__ = ('message',)
+    _scalars = (('message', 'message'),)
+    _nested = ()
+
+
+class StatusInfo(Model):
+    __slots__ = ('condition', 'reason', 'timestamp')
+    _scalars = (('condition', 'condition'), ('reason', 'reason'), ('timestamp', 'timestamp'))
+    _nested = ()
+    _enums = ('condition',)
+
+
+class TemplateInfo(Model):
+    __slots__ = ('cluster_labels', 'clusterconfiguration', 'controlplaneprovidertype', 'description', 'infraprovidertype', 'kubernetes_version', 'name', 'version', '_cluster_network')
+    _scalars = (('cluster_labels', 'cluster-labels'), ('clusterconfiguration', 'clusterconfiguration'), ('controlplaneprovidertype', 'controlplaneprovidertype'), ('description', 'description'), ('infraprovidertype', 'infraprovidertype'), ('kubernetes_version', 'kubernetesVersion'), ('name', 'name'), ('version', 'version'))
+    _nested = (('cluster_network', 'clusterNetwork', 'ClusterNetwork', False),)
+    _enums = ('controlplaneprovidertype', 'infraprovidertype')
+
+
+class TemplateInfoList(Model):
+    __slots__ = ('total_elements', '_default_template_info', '_template_info_list')
+    _scalars = (('total_elements', 'totalElements'),)
+    _nested = (('default_template_info', 'defaultTemplateInfo', 'DefaultTemplateInfo', False), ('template_info_list', 'templateInfoList', 'TemplateInfo', True))
+
+
+class VersionList(Model):
+    __slots__ = ('version_list',)
+    _scalars = (('version_list', 'versionList'),)
+    _nested = ()
@@ -0,0 +1,160 @@
+"""
+Generates the response models in models/ from the OpenAPI specs in ../openapi.
+
+    python models/generate.py            # rewrite every module
+    python models/generate.py --check    # fail if a module is out of date
+
+Every object schema (and every inline object inside one) becomes a Model
+subclass with __slots__; properties are snake_cased. Properties that hold
+objects or lists of objects are decoded lazily (see models/base.py);
+everything else (strings, enums, maps, oneOf) is kept as parsed, with
+enum values interned.
+"""
+import argparse
+import keyword
+import os
+import re
+import sys
+from typing import Dict, List, Optional, Tuple
+import yaml
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SPEC_DIR = os.path.join(os.path.dirname(os.path.dirname(HERE)), "openapi")
+
+# module -> spec file
+SPECS = {
+    "tenancy": "orch-utils.tenancy-datamodel.openapi.yaml",
+    "infra": "amc-infra-core-edge-infrastructure-manager-openapi-all.yaml",
+    "cluster": "amc-cluster-manager-openapi.yaml",
+    "catalog": "amc-app-orch-catalog-openapi.yaml",
+}
+
+def class_name(key: str) -> str:
+    """org.Org.Get -> OrgGet, clusterNetwork -> ClusterNetwork"""
+    parts: List[str] = []
+    for p in re.split(r"[^A-Za-z0-9]+", key):
+        if p and (not parts or parts[-1].lower() != p.lower()):
+            parts.append(p[0].upper() + p[1:])
+    return "".join(parts)
+
+def attr_name(key: str) -> str:
+    """hostNics -> host_nics, uID -> u_id, IPAddress -> ip_address"""
+    name = re.sub(r"(?<=[a-z0-9])([A-Z])", r"_\1", key)
+    name = re.sub(r"(?<=[A-Z])([A-Z][a-z])", r"_\1", name)
+    name = re.sub(r"[^A-Za-z0-9_]", "_", name).lower()
+    if name[0].isdigit():
+        name = f"_{name}"
+    return f"{name}_" if keyword.iskeyword(name) else name
+
+def summary(text: Optional[str]) -> str:
+    text = " ".join((text or "").split())
+    first = re.split(r"(?<=\.)\s", text, maxsplit=1)[0]
+    return (first[:97] + "...") if len(first) > 100 else first
+
+class Generator:
+    def __init__(self, spec: Dict):
+        self.schemas: Dict[str, Dict] = spec.get("components", {}).get("schemas", {})
+        self.classes: Dict[str, Tuple[str, List, List, List]] = {}   # name -> (doc, scalars, nested, enums)
+
+    def _deref(self, schema: Dict) -> Tuple[Optional[str], Dict]:
+        ref = schema.get("$ref")
+        if ref:
+            key = ref.rsplit("/", 1)[-1]
+            return key, self.schemas.get(key, {})
+        return None, schema
+
+    @staticmethod
+    def _is_object(schema: Dict) -> bool:
+        return bool(schema.get("properties")) or bool(schema.get("allOf"))
+
+    def _properties(self, schema: Dict) -> Dict[str, Dict]:
+        props: Dict[str, Dict] = {}
+        for part in schema.get("allOf", []):
+            props.update(self._properties(self._deref(part)[1]))
+        props.update(schema.get("properties") or {})
+        return props
+
+    def _model_for(self, schema: Dict, inline_name: str) -> Optional[str]:
+        """Class name for an object-valued schema, generating inline classes; None for scalars."""
+        key, target = self._deref(schema)
+        if not self._is_object(target):
+            return None
+        if key:
+            return self.add(class_name(key), target)
+        return self.add(inline_name, target)
+
+    def add(self, name: str, schema: Dict) -> str:
+        if name in self.classes:
+            return name
+        self.classes[name] = ("", [], [], [])   # reserve before recursing (self-references)
+        scalars, nested, enums, used = [], [], [], set()
+        for key, prop in self._properties(schema).items():
+            attr = attr_name(key)
+            while attr in used:
+                attr += "_"
+            used.add(attr)
+            _, target = self._deref(prop)
+            many = target.get("type") == "array"
+            item = target.get("items", {}) if many else prop
+            model = self._model_for(item, name + class_name(key) + ("Item" if many else ""))
+            if model:
+                nested.append((attr, key, model, many))
+            else:
+                scalars.append((attr, key))
+                if "enum" in target:
+                    enums.append(attr)
+        self.classes[name] = (summary(schema.get("description") or schema.get("title")), scalars, nested, enums)
+        return name
+
+    def run(self) -> Dict[str, Tuple[str, List, List, List]]:
+        for key, schema in self.schemas.items():
+            if self._is_object(schema):
+                self.add(class_name(key), schema)
+            elif schema.get("type") == "array":
+                self._model_for(schema.get("items", {}), class_name(key) + "Item")
+        return self.classes
+
+def render(module: str, spec_file: str) -> str:
+    with open(os.path.join(SPEC_DIR, spec_file)) as f:
+        spec = yaml.safe_load(f)
+    classes = Generator(spec).run()
+    out = [
+        f"# Generated by models/generate.py from openapi/{spec_file}; do not edit.",
+        f'"""{summary(spec.get("info", {}).get("title")) or module} models."""',
+        "from models.base import Model",
+    ]
+    for name in sorted(classes):
+        doc, scalars, nested, enums = classes[name]
+        slots = [a for a, _ in scalars] + [f"_{a}" for a, *_ in nested]
+        out += ["", "", f"class {name}(Model):"]
+        if doc:
+            doc = doc.replace("\\", "\\\\").replace('"', "'")
+            out.append(f'    """{doc}"""')
+        out.append(f"    __slots__ = {tuple(slots)!r}")
+        out.append(f"    _scalars = {tuple(scalars)!r}")
+        out.append(f"    _nested = {tuple(nested)!r}")
+        if enums:
+            out.append(f"    _enums = {tuple(enums)!r}")
+    return "\n".join(out) + "\n"
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate models/ from the OpenAPI specs")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if a generated module is stale")
+    opts = parser.parse_args()
+    stale = []
+    for module, spec_file in SPECS.items():
+        path = os.path.join(HERE, f"{module}.py")
+        code = render(module, spec_file)
+        current = open(path).read() if os.path.exists(path) else None
+        if code == current:
+            continue
+        stale.append(path)
+        if not opts.check:
+            with open(path, "w") as f:
+                f.write(code)
+    for path in stale:
+        print(f"{'stale' if opts.check else 'wrote'}: {os.path.relpath(path)}")
+    return 1 if opts.check and stale else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,423 @@
+# Generated by models/generate.py from openapi/amc-infra-core-edge-infrastructure-manager-openapi-all.yaml; do not edit.
+"""Edge Infrastructure Manager models."""
+from models.base import Model
+
+
+class Host(Model):
+    """A host resource."""
+    __slots__ = ('bios_release_date', 'bios_vendor', 'bios_version', 'bmc_ip', 'bmc_kind', 'cpu_architecture', 'cpu_capabilities', 'cpu_cores', 'cpu_model', 'cpu_sockets', 'cpu_threads', 'cpu_topology', 'current_power_state', 'current_state', 'desired_power_state', 'desired_state', 'host_status', 'host_status_indicator', 'host_status_timestamp', 'hostname', 'memory_bytes', 'name', 'note', 'onboarding_status', 'onboarding_status_indicator', 'onboarding_status_timestamp', 'product_name', 'registration_status', 'registration_status_indicator', 'registration_status_timestamp', 'resource_id', 'serial_number', 'site_id', 'uuid', '_host_gpus', '_host_nics', '_host_storages', '_host_usbs', '_inherited_metadata', '_instance', '_metadata', '_provider', '_site', '_timestamps')
+    _scalars = (('bios_release_date', 'biosReleaseDate'), ('bios_vendor', 'biosVendor'), ('bios_version', 'biosVersion'), ('bmc_ip', 'bmcIp'), ('bmc_kind', 'bmcKind'), ('cpu_architecture', 'cpuArchitecture'), ('cpu_capabilities', 'cpuCapabilities'), ('cpu_cores', 'cpuCores'), ('cpu_model', 'cpuModel'), ('cpu_sockets', 'cpuSockets'), ('cpu_threads', 'cpuThreads'), ('cpu_topology', 'cpuTopology'), ('current_power_state', 'currentPowerState'), ('current_state', 'currentState'), ('desired_power_state', 'desiredPowerState'), ('desired_state', 'desiredState'), ('host_status', 'hostStatus'), ('host_status_indicator', 'hostStatusIndicator'), ('host_status_timestamp', 'hostStatusTimestamp'), ('hostname', 'hostname'), ('memory_bytes', 'memoryBytes'), ('name', 'name'), ('note', 'note'), ('onboarding_status', 'onboardingStatus'), ('onboarding_status_indicator', 'onboardingStatusIndicator'), ('onboarding_status_timestamp', 'onboardingStatusTimestamp'), ('product_name', 'productName'), ('registration_status', 'registrationStatus'), ('registration_status_indicator', 'registrationStatusIndicator'), ('registration_status_timestamp', 'registrationStatusTimestamp'), ('resource_id', 'resourceId'), ('serial_number', 'serialNumber'), ('site_id', 'siteId'), ('uuid', 'uuid'))
+    _nested = (('host_gpus', 'hostGpus', 'HostResourcesGPU', True), ('host_nics', 'hostNics', 'HostResourcesInterface', True), ('host_storages', 'hostStorages', 'HostResourcesStorage', True), ('host_usbs', 'hostUsbs', 'HostResourcesUSB', True), ('inherited_metadata', 'inheritedMetadata', 'MetadataJoin', False), ('instance', 'instance', 'Instance', False), ('metadata', 'metadata', 'HostMetadataItem', True), ('provider', 'provider', 'Provider', False), ('site', 'site', 'Site', False), ('timestamps', 'timestamps', 'Timestamps', False))
+    _enums = ('bmc_kind', 'current_power_state', 'current_state', 'desired_power_state', 'desired_state', 'host_status_indicator', 'onboarding_status_indicator', 'registration_status_indicator')
+
+
+class HostEvent(Model):
+    """Event for a host."""
+    __slots__ = ('event_kind', '_host')
+    _scalars = (('event_kind', 'eventKind'),)
+    _nested = (('host', 'host', 'Host', False),)
+    _enums = ('event_kind',)
+
+
+class HostMetadataItem(Model):
+    __slots__ = ('key', 'value')
+    _scalars = (('key', 'key'), ('value', 'value'))
+    _nested = ()
+
+
+class HostOperationWithNote(Model):
+    """A freeform field associated with the host invalidate or delete operations to store the reason for..."""
+    __slots__ = ('note',)
+    _scalars = (('note', 'note'),)
+    _nested = ()
+
+
+class HostRegisterInfo(Model):
+    """Host registration information."""
+    __slots__ = ('auto_onboard', 'name', 'serial_number', 'uuid', '_timestamps')
+    _scalars = (('auto_onboard', 'autoOnboard'), ('name', 'name'), ('serial_number', 'serialNumber'), ('uuid', 'uuid'))
+    _nested = (('timestamps', 'timestamps', 'Timestamps', False),)
+
+
+class HostResourcesGPU(Model):
+    """The set of available host GPU cards."""
+    __slots__ = ('capabilities', 'description', 'device_name', 'pci_id', 'product', 'vendor', '_timestamps')
+    _scalars = (('capabilities', 'capabilities'), ('description', 'description'), ('device_name', 'deviceName'), ('pci_id', 'pciId'), ('product', 'product'), ('vendor', 'vendor'))
+    _nested = (('timestamps', 'timestamps', 'Timestamps', False),)
+
+
+class HostResourcesInterface(Model):
+    """The set of available host interfaces."""
+    __slots__ = ('bmc_interface', 'device_name', 'mac_addr', 'mtu', 'pci_identifier', 'sriov_enabled', 'sriov_vfs_num', 'sriov_vfs_total', '_ipaddresses', '_link_state', '_timestamps')
+    _scalars = (('bmc_interface', 'bmcInterface'), ('device_name', 'deviceName'), ('mac_addr', 'macAddr'), ('mtu', 'mtu'), ('pci_identifier', 'pciIdentifier'), ('sriov_enabled', 'sriovEnabled'), ('sriov_vfs_num', 'sriovVfsNum'), ('sriov_vfs_total', 'sriovVfsTotal'))
+    _nested = (('ipaddresses', 'ipaddresses', 'IPAddress', True), ('link_state', 'linkState', 'LinkState', False), ('timestamps', 'timestamps', 'Timestamps', False))
+
+
+class HostResourcesStorage(Model):
+    """The set of available host storage capabilities."""
+    __slots__ = ('capacity_bytes', 'device_name', 'model', 'serial', 'vendor', 'wwid', '_timestamps')
+    _scalars = (('capacity_bytes', 'capacityBytes'), ('device_name', 'deviceName'), ('model', 'model'), ('serial', 'serial'), ('vendor', 'vendor'), ('wwid', 'wwid'))
+    _nested = (('timestamps', 'timestamps', 'Timestamps', False),)
+
+
+class HostResourcesUSB(Model):
+    """The set of host USB resources."""
+    __slots__ = ('addr', 'bus', 'class_', 'device_name', 'id_product', 'id_vendor', 'serial', '_timestamps')
+    _scalars = (('addr', 'addr'), ('bus', 'bus'), ('class_', 'class'), ('device_name', 'deviceName'), ('id_product', 'idProduct'), ('id_vendor', 'idVendor'), ('serial', 'serial'))
+    _nested = (('timestamps', 'timestamps', 'Timestamps', False),)
+
+
+class HostsList(Model):
+    """A list of host objects."""
+    __slots__ = ('has_next', 'total_elements', '_hosts')
+    _scalars = (('has_next', 'hasNext'), ('total_elements', 'totalElements'))
+    _nested = (('hosts', 'hosts', 'Host', True),)
+
+
+class HostsSummary(Model):
+    """A summary of host object status."""
+    __slots__ = ('error', 'running', 'total', 'unallocated')
+    _scalars = (('error', 'error'), ('running', 'running'), ('total', 'total'), ('unallocated', 'unallocated'))
+    _nested = ()
+
+
+class IPAddress(Model):
+    """An IP address represented using the CIDR notation, and additional information identifying the con..."""
+    __slots__ = ('address', 'config_method', 'status', 'status_detail', '_timestamps')
+    _scalars = (('address', 'address'), ('config_method', 'configMethod'), ('status', 'status'), ('status_detail', 'statusDetail'))
+    _nested = (('timestamps', 'timestamps', 'Timestamps', False),)
+    _enums = ('config_method', 'status')
+
+
+class Instance(Model):
+    """An instance resource."""
+    __slots__ = ('current_state', 'desired_state', 'host_id', 'instance_id', 'instance_status', 'instance_status_detail', 'instance_status_indicator', 'instance_status_timestamp', 'kind', 'local_account_id', 'name', 'os_id', 'provisioning_status', 'provisioning_status_indicator', 'provisioning_status_timestamp', 'resource_id', 'security_feature', 'trusted_attestation_status', 'trusted_attestation_status_indicator', 'trusted_attestation_status_timestamp', 'update_status', 'update_status_detail', 'update_status_indicator', 'update_status_timestamp', '_current_os', '_desired_os', '_host', '_local_account', '_os', '_timestamps', '_workload_members')
+    _scalars = (('current_state', 'currentState'), ('desired_state', 'desiredState'), ('host_id', 'hostID'), ('instance_id', 'instanceID'), ('instance_status', 'instanceStatus'), ('instance_status_detail', 'instanceStatusDetail'), ('instance_status_indicator', 'instanceStatusIndicator'), ('instance_status_timestamp', 'instanceStatusTimestamp'), ('kind', 'kind'), ('local_account_id', 'localAccountID'), ('name', 'name'), ('os_id', 'osID'), ('provisioning_status', 'provisioningStatus'), ('provisioning_status_indicator', 'provisioningStatusIndicator'), ('provisioning_status_timestamp', 'provisioningStatusTimestamp'), ('resource_id', 'resourceId'), ('security_feature', 'securityFeature'), ('trusted_attestation_status', 'trustedAttestationStatus'), ('trusted_attestation_status_indicator', 'trustedAttestationStatusIndicator'), ('trusted_attestation_status_timestamp', 'trustedAttestationStatusTimestamp'), ('update_status', 'updateStatus'), ('update_status_detail', 'updateStatusDetail'), ('update_status_indicator', 'updateStatusIndicator'), ('update_status_timestamp', 'updateStatusTimestamp'))
+    _nested = (('current_os', 'currentOs', 'OperatingSystemResource', False), ('desired_os', 'desiredOs', 'OperatingSystemResource', False), ('host', 'host', 'Host', False), ('local_account', 'localAccount', 'LocalAccount', False), ('os', 'os', 'OperatingSystemResource', False), ('timestamps', 'timestamps', 'Timestamps', False), ('workload_members', 'workloadMembers', 'WorkloadMember', True))
+    _enums = ('current_state', 'desired_state', 'instance_status_indicator', 'kind', 'provisioning_status_indicator', 'security_feature', 'trusted_attestation_status_indicator', 'update_status_indicator')
+
+
+class InstanceEvent(Model):
+    """Event for an instance."""
+    __slots__ = ('event_kind', '_instance')
+    _scalars = (('event_kind', 'eventKind'),)
+    _nested = (('instance', 'instance', 'Instance', False),)
+    _enums = ('event_kind',)
+
+
+class InstanceList(Model):
+    """A list of instance objects."""
+    __slots__ = ('has_next', 'total_elements', '_instances')
+    _scalars = (('has_next', 'hasNext'), ('total_elements', 'totalElements'))
+    _nested = (('instances', 'instances', 'Instance', True),)
+
+
+class LinkState(Model):
+    """A generic structure to define the state of a link."""
+    __slots__ = ('timestamp', 'type', '_timestamps')
+    _scalars = (('timestamp', 'timestamp'), ('type', 'type'))
+    _nested = (('timestamps', 'timestamps', 'Timestamps', False),)
+    _enums = ('type',)
+
+
+class LocalAccount(Model):
+    """A local account resource."""
+    __slots__ = ('local_account_id', 'resource_id', 'ssh_key', 'username', '_timestamps')
+    _scalars = (('local_account_id', 'localAccountID'), ('resource_id', 'resourceId'), ('ssh_key', 'sshKey'), ('username', 'username'))
+    _nested = (('timestamps', 'timestamps', 'Timestamps', False),)
+
+
+class LocalAccountList(Model):
+    """A list of local account objects."""
+    __slots__ = ('has_next', 'total_elements', '_local_accounts')
+    _scalars = (('has_next', 'hasNext'), ('total_elements', 'totalElements'))
+    _nested = (('local_accounts', 'localAccounts', 'LocalAccount', True),)
+
+
+class LocationNode(Model):
+    """A location node's resource, region, or site."""
+    __slots__ = ('name', 'parent_id', 'resource_id', 'type')
+    _scalars = (('name', 'name'), ('parent_id', 'parentId'), ('resource_id', 'resourceId'), ('type', 'type'))
+    _nested = ()
+    _enums = ('type',)
+
+
+class LocationNodeList(Model):
+    """A LocationNodeList object."""
+    __slots__ = ('output_elements', 'total_elements', '_nodes')
+    _scalars = (('output_elements', 'outputElements'), ('total_elements', 'totalElements'))
+    _nested = (('nodes', 'nodes', 'LocationNode', True),)
+
+
+class MetadataItem(Model):
+    __slots__ = ('key', 'value')
+    _scalars = (('key', 'key'), ('value', 'value'))
+    _nested = ()
+
+
+class MetadataJoin(Model):
+    """The joint set of location's and host's logical metadata."""
+    __slots__ = ('_location', '_ou')
+    _scalars = ()
+    _nested = (('location', 'location', 'MetadataJoinLocationItem', True), ('ou', 'ou', 'MetadataJoinOuItem', True))
+
+
+class MetadataJoinLocationItem(Model):
+    __slots__ = ('key', 'value')
+    _scalars = (('key', 'key'), ('value', 'value'))
+    _nested = ()
+
+
+class MetadataJoinOuItem(Model):
+    __slots__ = ('key', 'value')
+    _scalars = (('key', 'key'), ('value', 'value'))
+    _nested = ()
+
+
+class OU(Model):
+    """An OU resource."""
+    __slots__ = ('name', 'ou_id', 'ou_kind', 'parent_ou', 'resource_id', '_inherited_metadata', '_metadata', '_timestamps')
+    _scalars = (('name', 'name'), ('ou_id', 'ouID'), ('ou_kind', 'ouKind'), ('parent_ou', 'parentOu'), ('resource_id', 'resourceId'))
+    _nested = (('inherited_metadata', 'inheritedMetadata', 'OUInheritedMetadataItem', True), ('metadata', 'metadata', 'OUMetadataItem', True), ('timestamps', 'timestamps', 'Timestamps', False))
+
+
+class OUInheritedMetadataItem(Model):
+    __slots__ = ('key', 'value')
+    _scalars = (('key', 'key'), ('value', 'value'))
+    _nested = ()
+
+
+class OUMetadataItem(Model):
+    __slots__ = ('key', 'value')
+    _scalars = (('key', 'key'), ('value', 'value'))
+    _nested = ()
+
+
+class OUsList(Model):
+    """A list of OU objects."""
+    __slots__ = ('has_next', 'total_elements', '_o_us')
+    _scalars = (('has_next', 'hasNext'), ('total_elements', 'totalElements'))
+    _nested = (('o_us', 'OUs', 'OU', True),)
+
+
+class OperatingSystemResource(Model):
+    """An OS resource."""
+    __slots__ = ('architecture', 'image_id', 'image_url', 'installed_packages', 'kernel_command', 'name', 'os_provider', 'os_resource_id', 'os_type', 'platform_bundle', 'profile_name', 'profile_version', 'repo_url', 'resource_id', 'security_feature', 'sha256', 'update_sources', '_timestamps')
+    _scalars = (('architecture', 'architecture'), ('image_id', 'imageId'), ('image_url', 'imageUrl'), ('installed_packages', 'installedPackages'), ('kernel_command', 'kernelCommand'), ('name', 'name'), ('os_provider', 'osProvider'), ('os_resource_id', 'osResourceID'), ('os_type', 'osType'), ('platform_bundle', 'platformBundle'), ('profile_name', 'profileName'), ('profile_version', 'profileVersion'), ('repo_url', 'repoUrl'), ('resource_id', 'resourceId'), ('security_feature', 'securityFeature'), ('sha256', 'sha256'), ('update_sources', 'updateSources'))
+    _nested = (('timestamps', 'timestamps', 'Timestamps', False),)
+    _enums = ('os_provider', 'os_type', 'security_feature')
+
+
+class OperatingSystemResourceList(Model):
+    """A list of OS resource objects."""
+    __slots__ = ('has_next', 'total_elements', '_operating_system_resources')
+    _scalars = (('has_next', 'hasNext'), ('total_elements', 'totalElements'))
+    _nested = (('operating_system_resources', 'OperatingSystemResources', 'OperatingSystemResource', True),)
+
+
+class ProblemDetails(Model):
+    """Carries a message in an HTTP error response."""
+    __slots__ = ('message',)
+    _scalars = (('message', 'message'),)
+    _nested = ()
+
+
+class Provider(Model):
+    """A provider resource."""
+    __slots__ = ('api_credentials', 'api_endpoint', 'config', 'name', 'provider_id', 'provider_kind', 'provider_vendor', 'resource_id', '_timestamps')
+    _scalars = (('api_credentials', 'apiCredentials'), ('api_endpoint', 'apiEndpoint'), ('config', 'config'), ('name', 'name'), ('provider_id', 'providerID'), ('provider_kind', 'providerKind'), ('provider_vendor', 'providerVendor'), ('resource_id', 'resourceId'))
+    _nested = (('timestamps', 'timestamps', 'Timestamps', False),)
+    _enums = ('provider_kind', 'provider_vendor')
+
+
+class ProviderList(Model):
+    """A list of provider objects."""
+    __slots__ = ('has_next', 'total_elements', '_providers')
+    _scalars = (('has_next', 'hasNext'), ('total_elements', 'totalElements'))
+    _nested = (('providers', 'providers', 'Provider', True),)
+
+
+class Proxy(Model):
+    """The proxy information."""
+    __slots__ = ('ftp_proxy', 'http_proxy', 'https_proxy', 'no_proxy')
+    _scalars = (('ftp_proxy', 'ftpProxy'), ('http_proxy', 'httpProxy'), ('https_proxy', 'httpsProxy'), ('no_proxy', 'noProxy'))
+    _nested = ()
+
+
+class Region(Model):
+    """A region resource"""
+    __slots__ = ('name', 'parent_id', 'region_id', 'resource_id', 'total_sites', '_inherited_metadata', '_metadata', '_parent_region', '_timestamps')
+    _scalars = (('name', 'name'), ('parent_id', 'parentId'), ('region_id', 'regionID'), ('resource_id', 'resourceId'), ('total_sites', 'totalSites'))
+    _nested = (('inherited_metadata', 'inheritedMetadata', 'RegionInheritedMetadataItem', True), ('metadata', 'metadata', 'RegionMetadataItem', True), ('parent_region', 'parentRegion', 'Region', False), ('timestamps', 'timestamps', 'Timestamps', False))
+
+
+class RegionInheritedMetadataItem(Model):
+    __slots__ = ('key', 'value')
+    _scalars = (('key', 'key'), ('value', 'value'))
+    _nested = ()
+
+
+class RegionMetadataItem(Model):
+    __slots__ = ('key', 'value')
+    _scalars = (('key', 'key'), ('value', 'value'))
+    _nested = ()
+
+
+class RegionsList(Model):
+    """A list of region objects."""
+    __slots__ = ('has_next', 'total_elements', '_regions')
+    _scalars = (('has_next', 'hasNext'), ('total_elements', 'totalElements'))
+    _nested = (('regions', 'regions', 'Region', True),)
+
+
+class RepeatedSchedule(Model):
+    """A repeated-schedule resource."""
+    __slots__ = ('cron_day_month', 'cron_day_week', 'cron_hours', 'cron_minutes', 'cron_month', 'duration_seconds', 'name', 'repeated_schedule_id', 'resource_id', 'schedule_status', 'target_host_id', 'target_region_id', 'target_site_id', '_target_host', '_target_region', '_target_site', '_timestamps')
+    _scalars = (('cron_day_month', 'cronDayMonth'), ('cron_day_week', 'cronDayWeek'), ('cron_hours', 'cronHours'), ('cron_minutes', 'cronMinutes'), ('cron_month', 'cronMonth'), ('duration_seconds', 'durationSeconds'), ('name', 'name'), ('repeated_schedule_id', 'repeatedScheduleID'), ('resource_id', 'resourceId'), ('schedule_status', 'scheduleStatus'), ('target_host_id', 'targetHostId'), ('target_region_id', 'targetRegionId'), ('target_site_id', 'targetSiteId'))
+    _nested = (('target_host', 'targetHost', 'Host', False), ('target_region', 'targetRegion', 'Region', False), ('target_site', 'targetSite', 'Site', False), ('timestamps', 'timestamps', 'Timestamps', False))
+    _enums = ('schedule_status',)
+
+
+class RepeatedSchedulesList(Model):
+    """A list of repeated schedule objects."""
+    __slots__ = ('has_next', 'total_elements', '_repeated_schedules')
+    _scalars = (('has_next', 'hasNext'), ('total_elements', 'totalElements'))
+    _nested = (('repeated_schedules', 'RepeatedSchedules', 'RepeatedSchedule', True),)
+
+
+class SchedulesListJoin(Model):
+    """List of all schedule objects, repeated and single."""
+    __slots__ = ('has_next', 'total_elements', '_repeated_schedules', '_single_schedules')
+    _scalars = (('has_next', 'hasNext'), ('total_elements', 'totalElements'))
+    _nested = (('repeated_schedules', 'RepeatedSchedules', 'RepeatedSchedule', True), ('single_schedules', 'SingleSchedules', 'SingleSchedule', True))
+
+
+class SingleSchedule(Model):
+    """A single schedule resource."""
+    __slots__ = ('end_seconds', 'name', 'resource_id', 'schedule_status', 'single_schedule_id', 'start_seconds', 'target_host_id', 'target_region_id', 'target_site_id', '_target_host', '_target_region', '_target_site', '_timestamps')
+    _scalars = (('end_seconds', 'endSeconds'), ('name', 'name'), ('resource_id', 'resourceId'), ('schedule_status', 'scheduleStatus'), ('single_schedule_id', 'singleScheduleID'), ('start_seconds', 'startSeconds'), ('target_host_id', 'targetHostId'), ('target_region_id', 'targetRegionId'), ('target_site_id', 'targetSiteId'))
+    _nested = (('target_host', 'targetHost', 'Host', False), ('target_region', 'targetRegion', 'Region', False), ('target_site', 'targetSite', 'Site', False), ('timestamps', 'timestamps', 'Timestamps', False))
+    _enums = ('schedule_status',)
+
+
+class SingleSchedulesList(Model):
+    """A list of single schedule objects."""
+    __slots__ = ('has_next', 'total_elements', '_single_schedules')
+    _scalars = (('has_next', 'hasNext'), ('total_elements', 'totalElements'))
+    _nested = (('single_schedules', 'SingleSchedules', 'SingleSchedule', True),)
+
+
+class Site(Model):
+    """A site resource."""
+    __slots__ = ('dns_servers', 'docker_registries', 'metrics_endpoint', 'name', 'ou_id', 'region_id', 'resource_id', 'site_id', 'site_lat', 'site_lng', '_inherited_metadata', '_metadata', '_ou', '_provider', '_proxy', '_region', '_timestamps')
+    _scalars = (('dns_servers', 'dnsServers'), ('docker_registries', 'dockerRegistries'), ('metrics_endpoint', 'metricsEndpoint'), ('name', 'name'), ('ou_id', 'ouId'), ('region_id', 'regionId'), ('resource_id', 'resourceId'), ('site_id', 'siteID'), ('site_lat', 'siteLat'), ('site_lng', 'siteLng'))
+    _nested = (('inherited_metadata', 'inheritedMetadata', 'MetadataJoin', False), ('metadata', 'metadata', 'SiteMetadataItem', True), ('ou', 'ou', 'OU', False), ('provider', 'provider', 'Provider', False), ('proxy', 'proxy', 'Proxy', False), ('region', 'region', 'Region', False), ('timestamps', 'timestamps', 'Timestamps', False))
+
+
+class SiteMetadataItem(Model):
+    __slots__ = ('key', 'value')
+    _scalars = (('key', 'key'), ('value', 'value'))
+    _nested = ()
+
+
+class SitesList(Model):
+    """A list of site objects."""
+    __slots__ = ('has_next', 'total_elements', '_sites')
+    _scalars = (('has_next', 'hasNext'), ('total_elements', 'totalElements'))
+    _nested = (('sites', 'sites', 'Site', True),)
+
+
+class TelemetryLogsGroup(Model):
+    """Telemetry group that defines a set of log types to collect."""
+    __slots__ = ('collector_kind', 'groups', 'name', 'telemetry_logs_group_id', '_timestamps')
+    _scalars = (('collector_kind', 'collectorKind'), ('groups', 'groups'), ('name', 'name'), ('telemetry_logs_group_id', 'telemetryLogsGroupId'))
+    _nested = (('timestamps', 'timestamps', 'Timestamps', False),)
+    _enums = ('collector_kind',)
+
+
+class TelemetryLogsGroupList(Model):
+    """A list of log group objects."""
+    __slots__ = ('has_next', 'total_elements', '_telemetry_logs_groups', '_timestamps')
+    _scalars = (('has_next', 'hasNext'), ('total_elements', 'totalElements'))
+    _nested = (('telemetry_logs_groups', 'TelemetryLogsGroups', 'TelemetryLogsGroup', True), ('timestamps', 'timestamps', 'Timestamps', False))
+
+
+class TelemetryLogsProfile(Model):
+    """A telemetry log profile for a hierarchy object."""
+    __slots__ = ('log_level', 'logs_group_id', 'profile_id', 'target_instance', 'target_region', 'target_site', '_logs_group', '_timestamps')
+    _scalars = (('log_level', 'logLevel'), ('logs_group_id', 'logsGroupId'), ('profile_id', 'profileId'), ('target_instance', 'targetInstance'), ('target_region', 'targetRegion'), ('target_site', 'targetSite'))
+    _nested = (('logs_group', 'logsGroup', 'TelemetryLogsGroup', False), ('timestamps', 'timestamps', 'Timestamps', False))
+    _enums = ('log_level',)
+
+
+class TelemetryLogsProfileList(Model):
+    """A list of telemetry log profiles."""
+    __slots__ = ('has_next', 'total_elements', '_telemetry_logs_profiles', '_timestamps')
+    _scalars = (('has_next', 'hasNext'), ('total_elements', 'totalElements'))
+    _nested = (('telemetry_logs_profiles', 'TelemetryLogsProfiles', 'TelemetryLogsProfile', True), ('timestamps', 'timestamps', 'Timestamps', False))
+
+
+class TelemetryMetricsGroup(Model):
+    """A definition of metric groups to monitor."""
+    __slots__ = ('collector_kind', 'groups', 'name', 'telemetry_metrics_group_id', '_timestamps')
+    _scalars = (('collector_kind', 'collectorKind'), ('groups', 'groups'), ('name', 'name'), ('telemetry_metrics_group_id', 'telemetryMetricsGroupId'))
+    _nested = (('timestamps', 'timestamps', 'Timestamps', False),)
+    _enums = ('collector_kind',)
+
+
+class TelemetryMetricsGroupList(Model):
+    """A list of telemetry groups, which defines a set of metrics to collect."""
+    __slots__ = ('has_next', 'total_elements', '_telemetry_metrics_groups', '_timestamps')
+    _scalars = (('has_next', 'hasNext'), ('total_elements', 'totalElements'))
+    _nested = (('telemetry_metrics_groups', 'TelemetryMetricsGroups', 'TelemetryMetricsGroup', True), ('timestamps', 'timestamps', 'Timestamps', False))
+
+
+class TelemetryMetricsProfile(Model):
+    """A telemetry metric profile for a hierarchy object."""
+    __slots__ = ('metrics_group_id', 'metrics_interval', 'profile_id', 'target_instance', 'target_region', 'target_site', '_metrics_group', '_timestamps')
+    _scalars = (('metrics_group_id', 'metricsGroupId'), ('metrics_interval', 'metricsInterval'), ('profile_id', 'profileId'), ('target_instance', 'targetInstance'), ('target_region', 'targetRegion'), ('target_site', 'targetSite'))
+    _nested = (('metrics_group', 'metricsGroup', 'TelemetryMetricsGroup', False), ('timestamps', 'timestamps', 'Timestamps', False))
+
+
+class TelemetryMetricsProfileList(Model):
+    """A list of telemetry metric profiles."""
+    __slots__ = ('has_next', 'total_elements', '_telemetry_metrics_profiles', '_timestamps')
+    _scalars = (('has_next', 'hasNext'), ('total_elements', 'totalElements'))
+    _nested = (('telemetry_metrics_profiles', 'TelemetryMetricsProfiles', 'TelemetryMetricsProfile', True), ('timestamps', 'timestamps', 'Timestamps', False))
+
+
+class Timestamps(Model):
+    """A structure to hold Update and Create timestamps."""
+    __slots__ = ('created_at', 'updated_at')
+    _scalars = (('created_at', 'createdAt'), ('updated_at', 'updatedAt'))
+    _nested = ()
+
+
+class Workload(Model):
+    """A generic way to group compute resources to obtain a workload."""
+    __slots__ = ('external_id', 'kind', 'name', 'resource_id', 'status', 'workload_id', '_members', '_timestamps')
+    _scalars = (('external_id', 'externalId'), ('kind', 'kind'), ('name', 'name'), ('resource_id', 'resourceId'), ('status', 'status'), ('workload_id', 'workloadId'))
+    _nested = (('members', 'members', 'WorkloadMember', True), ('timestamps', 'timestamps', 'Timestamps', False))
+    _enums = ('kind',)
+
+
+class WorkloadList(Model):
+    """A list of workload objects."""
+    __slots__ = ('has_next', 'total_elements', '_workloads')
+    _scalars = (('has_next', 'hasNext'), ('total_elements', 'totalElements'))
+    _nested = (('workloads', 'Workloads', 'Workload', True),)
+
+
+class WorkloadMember(Model):
+    """A member of a workload."""
+    __slots__ = ('instance_id', 'kind', 'resource_id', 'workload_id', 'workload_member_id', '_instance', '_member', '_timestamps', '_workload')
+    _scalars = (('instance_id', 'instanceId'), ('kind', 'kind'), ('resource_id', 'resourceId'), ('workload_id', 'workloadId'), ('workload_member_id', 'workloadMemberId'))
+    _nested = (('instance', 'instance', 'Instance', False), ('member', 'member', 'Instance', False), ('timestamps', 'timestamps', 'Timestamps', False), ('workload', 'workload', 'Workload', False))
+    _enums = ('kind',)
+
+
+class WorkloadMemberList(Model):
+    """A list of workload member objects."""
+    __slots__ = ('has_next', 'total_elements', '_workload_members')
+    _scalars = (('has_next', 'hasNext'), ('total_elements', 'totalElements'))
+    _nested = (('workload_members', 'WorkloadMembers', 'WorkloadMember', True),)
@@ -0,0 +1,201 @@
+# Generated by models/generate.py from openapi/orch-utils.tenancy-datamodel.openapi.yaml; do not edit.
+"""Nexus API GW APIs models."""
+from models.base import Model
+
+
+class NetworkGet(Model):
+    __slots__ = ('_spec', '_status')
+    _scalars = ()
+    _nested = (('spec', 'spec', 'NetworkGetSpec', False), ('status', 'status', 'NetworkGetStatus', False))
+
+
+class NetworkGetSpec(Model):
+    __slots__ = ('description', 'type')
+    _scalars = (('description', 'description'), ('type', 'type'))
+    _nested = ()
+
+
+class NetworkGetStatus(Model):
+    __slots__ = ('_status',)
+    _scalars = ()
+    _nested = (('status', 'status', 'NetworkGetStatusStatus', False),)
+
+
+class NetworkGetStatusStatus(Model):
+    __slots__ = ('current_state',)
+    _scalars = (('current_state', 'currentState'),)
+    _nested = ()
+
+
+class NetworkListItem(Model):
+    __slots__ = ('name', '_spec', '_status')
+    _scalars = (('name', 'name'),)
+    _nested = (('spec', 'spec', 'NetworkListItemSpec', False), ('status', 'status', 'NetworkListItemStatus', False))
+
+
+class NetworkListItemSpec(Model):
+    __slots__ = ('description', 'type')
+    _scalars = (('description', 'description'), ('type', 'type'))
+    _nested = ()
+
+
+class NetworkListItemStatus(Model):
+    __slots__ = ('_status',)
+    _scalars = ()
+    _nested = (('status', 'status', 'NetworkListItemStatusStatus', False),)
+
+
+class NetworkListItemStatusStatus(Model):
+    __slots__ = ('current_state',)
+    _scalars = (('current_state', 'currentState'),)
+    _nested = ()
+
+
+class NetworkPost(Model):
+    __slots__ = ('description', 'type')
+    _scalars = (('description', 'description'), ('type', 'type'))
+    _nested = ()
+
+
+class NetworkStatus(Model):
+    __slots__ = ('_status',)
+    _scalars = ()
+    _nested = (('status', 'status', 'NetworkStatusStatus', False),)
+
+
+class NetworkStatusStatus(Model):
+    __slots__ = ('current_state',)
+    _scalars = (('current_state', 'currentState'),)
+    _nested = ()
+
+
+class OrgGet(Model):
+    __slots__ = ('_spec', '_status')
+    _scalars = ()
+    _nested = (('spec', 'spec', 'OrgGetSpec', False), ('status', 'status', 'OrgGetStatus', False))
+
+
+class OrgGetSpec(Model):
+    __slots__ = ('description',)
+    _scalars = (('description', 'description'),)
+    _nested = ()
+
+
+class OrgGetStatus(Model):
+    __slots__ = ('_org_status',)
+    _scalars = ()
+    _nested = (('org_status', 'orgStatus', 'OrgGetStatusOrgStatus', False),)
+
+
+class OrgGetStatusOrgStatus(Model):
+    __slots__ = ('message', 'status_indicator', 'time_stamp', 'u_id')
+    _scalars = (('message', 'message'), ('status_indicator', 'statusIndicator'), ('time_stamp', 'timeStamp'), ('u_id', 'uID'))
+    _nested = ()
+
+
+class OrgListItem(Model):
+    __slots__ = ('name', '_spec', '_status')
+    _scalars = (('name', 'name'),)
+    _nested = (('spec', 'spec', 'OrgListItemSpec', False), ('status', 'status', 'OrgListItemStatus', False))
+
+
+class OrgListItemSpec(Model):
+    __slots__ = ('description',)
+    _scalars = (('description', 'description'),)
+    _nested = ()
+
+
+class OrgListItemStatus(Model):
+    __slots__ = ('_org_status',)
+    _scalars = ()
+    _nested = (('org_status', 'orgStatus', 'OrgListItemStatusOrgStatus', False),)
+
+
+class OrgListItemStatusOrgStatus(Model):
+    __slots__ = ('message', 'status_indicator', 'time_stamp', 'u_id')
+    _scalars = (('message', 'message'), ('status_indicator', 'statusIndicator'), ('time_stamp', 'timeStamp'), ('u_id', 'uID'))
+    _nested = ()
+
+
+class OrgPost(Model):
+    __slots__ = ('description',)
+    _scalars = (('description', 'description'),)
+    _nested = ()
+
+
+class OrgStatus(Model):
+    __slots__ = ('_org_status',)
+    _scalars = ()
+    _nested = (('org_status', 'orgStatus', 'OrgStatusOrgStatus', False),)
+
+
+class OrgStatusOrgStatus(Model):
+    __slots__ = ('message', 'status_indicator', 'time_stamp', 'u_id')
+    _scalars = (('message', 'message'), ('status_indicator', 'statusIndicator'), ('time_stamp', 'timeStamp'), ('u_id', 'uID'))
+    _nested = ()
+
+
+class ProjectGet(Model):
+    __slots__ = ('_spec', '_status')
+    _scalars = ()
+    _nested = (('spec', 'spec', 'ProjectGetSpec', False), ('status', 'status', 'ProjectGetStatus', False))
+
+
+class ProjectGetSpec(Model):
+    __slots__ = ('description',)
+    _scalars = (('description', 'description'),)
+    _nested = ()
+
+
+class ProjectGetStatus(Model):
+    __slots__ = ('_project_status',)
+    _scalars = ()
+    _nested = (('project_status', 'projectStatus', 'ProjectGetStatusProjectStatus', False),)
+
+
+class ProjectGetStatusProjectStatus(Model):
+    __slots__ = ('message', 'status_indicator', 'time_stamp', 'u_id')
+    _scalars = (('message', 'message'), ('status_indicator', 'statusIndicator'), ('time_stamp', 'timeStamp'), ('u_id', 'uID'))
+    _nested = ()
+
+
+class ProjectListItem(Model):
+    __slots__ = ('name', '_spec', '_status')
+    _scalars = (('name', 'name'),)
+    _nested = (('spec', 'spec', 'ProjectListItemSpec', False), ('status', 'status', 'ProjectListItemStatus', False))
+
+
+class ProjectListItemSpec(Model):
+    __slots__ = ('description',)
+    _scalars = (('description', 'description'),)
+    _nested = ()
+
+
+class ProjectListItemStatus(Model):
+    __slots__ = ('_project_status',)
+    _scalars = ()
+    _nested = (('project_status', 'projectStatus', 'ProjectListItemStatusProjectStatus', False),)
+
+
+class ProjectListItemStatusProjectStatus(Model):
+    __slots__ = ('message', 'status_indicator', 'time_stamp', 'u_id')
+    _scalars = (('message', 'message'), ('status_indicator', 'statusIndicator'), ('time_stamp', 'timeStamp'), ('u_id', 'uID'))
+    _nested = ()
+
+
+class ProjectPost(Model):
+    __slots__ = ('description',)
+    _scalars = (('description', 'description'),)
+    _nested = ()
+
+
+class ProjectStatus(Model):
+    __slots__ = ('_project_status',)
+    _scalars = ()
+    _nested = (('project_status', 'projectStatus', 'ProjectStatusProjectStatus', False),)
+
+
+class ProjectStatusProjectStatus(Model):
+    __slots__ = ('message', 'status_indicator', 'time_stamp', 'u_id')
+    _scalars = (('message', 'message'), ('status_indicator', 'statusIndicator'), ('time_stamp', 'timeStamp'), ('u_id', 'uID'))
+    _nested = ()
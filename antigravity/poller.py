@@ -0,0 +1,190 @@
+import asyncio
+import contextvars
+from collections import deque
+import logging
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+from config import Config
+from tracing import get_tracer
+
+Fetch = Callable[[List[str]], Awaitable[Dict[str, Any]]]
+
+class Watch:
+    def __init__(self, source: str, key: str, check: Callable[[Any], bool], future: asyncio.Future):
+        self.source = source
+        self.key = key
+        self.check = check
+        self.future = future
+        self.registered = time.monotonic()
+        self.ready_at: Optional[float] = None
+        self.polls = 0
+        self.last_seen: Any = None
+
+    @property
+    def time_to_ready(self) -> Optional[float]:
+        return None if self.ready_at is None else self.ready_at - self.registered
+
+class Poller:
+    """
+    Watches many pending resources and satisfies them all from one list call
+    per source per tick (e.g. one GET /v1/orgs for every pending org).
+
+    Each source is a coroutine taking the pending keys and returning {key: item}. A watch resolves with
+    its item as soon as check(item) is True and is dropped from later ticks.
+    The tick interval resets to `interval` when a tick made progress and
+    otherwise grows by `backoff` up to `max_interval`, with +/- `jitter`.
+    `history` bounds the resolved watches kept for metrics() (None: all).
+    """
+    def __init__(
+        self,
+        interval: float = Config.POLL_INTERVAL,
+        max_interval: float = Config.POLL_MAX_INTERVAL,
+        timeout: float = Config.POLL_TIMEOUT,
+        backoff: float = 1.5,
+        jitter: float = 0.2,
+        history: Optional[int] = None,
+    ):
+        self.interval = interval
+        self.max_interval = max_interval
+        self.timeout = timeout
+        self.backoff = backoff
+        self.jitter = jitter
+        self.sources: Dict[str, Fetch] = {}
+        self.pending: List[Watch] = []
+        self.completed: "deque[Watch]" = deque(maxlen=history)
+        self.list_calls = 0
+        self.errors = 0
+        self._runner: Optional[asyncio.Task] = None
+
+    def add_source(self, name: str, fetch: Fetch):
+        self.sources[name] = fetch
+
+    def watch(self, source: str, key: str, check: Optional[Callable[[Any], bool]] = None) -> asyncio.Future:
+        """Registers a pending resource; the returned future resolves with its item."""
+        if source not in self.sources:
+            raise ValueError(f"Unknown poll source: {source}")
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append(Watch(source, key, check or (lambda item: item is not None), future))
+        if self._runner is None or self._runner.done():
+            # Fresh context: list calls are traced under "poll", not the first watcher's span
+            self._runner = asyncio.create_task(self._run(), context=contextvars.Context())
+        return future
+
+    async def wait_for(self, source: str, keys: Iterable[str],
+                       check: Optional[Callable[[Any], bool]] = None) -> Dict[str, Any]:
+        """Watches several keys of one source and returns {key: item} once all are ready."""
+        keys = list(keys)
+        items = await asyncio.gather(*(self.watch(source, k, check) for k in keys))
+        return dict(zip(keys, items))
+
+    async def _tick(self):
+        by_source: Dict[str, List[Watch]] = {}
+        for w in self.pending:
+            if not w.future.done():
+                by_source.setdefault(w.source, []).append(w)
+
+        async def poll(source: str, watches: List[Watch]) -> int:
+            self.list_calls += 1
+            try:
+                items = await self.sources[source]([w.key for w in watches])
+            except Exception as e:
+                self.errors += 1
+                logging.warning(f"Polling {source} failed: {e}")
+                return 0
+            resolved = 0
+            for w in watches:
+                if w.future.done():  # cancelled by the caller
+                    continue
+                w.polls += 1
+                w.last_seen = items.get(w.key)
+                try:
+                    ready = w.check(w.last_seen)
+                except Exception as e:
+                    w.future.set_exception(e)
+                    continue
+                if ready:
+                    w.ready_at = time.monotonic()
+                    w.future.set_result(w.last_seen)
+                    resolved += 1
+            return resolved
+
+        results = await asyncio.gather(*(poll(s, ws) for s, ws in by_source.items()))
+        return sum(results)
+
+    def _expire(self):
+        now = time.monotonic()
+        for w in self.pending:
+            if not w.future.done() and now - w.registered >= self.timeout:
+                w.future.set_exception(TimeoutError(
+                    f"Timed out waiting for {w.source} {w.key} (last seen: {w.last_seen!r})"))
+
+    async def _run(self):
+        with get_tracer().span("poll"):
+            await self._loop()
+
+    async def _loop(self):
+        delay = self.interval
+        while self.pending:
+            progressed = await self._tick()
+            self._expire()
+            for w in [w for w in self.pending if w.future.done()]:
+                self.pending.remove(w)
+                if w.ready_at is not None:
+                    self.completed.append(w)
+            if not self.pending:
+                break
+            delay = self.interval if progressed else min(delay * self.backoff, self.max_interval)
+            await asyncio.sleep(delay * random.uniform(1 - self.jitter, 1 + self.jitter))
+
+    def metrics(self) -> List[Dict]:
+        """Per-resource time-to-ready for every watch that resolved."""
+        return [
+            {"source": w.source, "key": w.key, "seconds": w.time_to_ready, "polls": w.polls}
+            for w in self.completed
+        ]
+
+async def wait_for_one(fetch: Fetch, key: str, check: Optional[Callable[[Any], bool]] = None, **options) -> Any:
+    """
+    Waits for a single resource on a Poller of its own, for the interactive
+    create/delete commands. `check` also sees every intermediate item, so it
+    can report progress; `options` are passed to Poller.
+    """
+    poller = Poller(**options)
+    poller.add_source("resource", fetch)
+    return await poller.watch("resource", key, check)
+
+def org_source(emf) -> Fetch:
+    """One GET /v1/orgs keyed by org name (AsyncEMFClient)."""
+    async def fetch(keys):
+        return {r.name: r for r in await emf.list_org_records()}
+    return fetch
+
+def project_source(emf) -> Fetch:
+    """One GET /v1/projects keyed by project name (AsyncEMFClient scoped to an org)."""
+    async def fetch(keys):
+        return {r.name: r for r in await emf.list_project_records()}
+    return fetch
+
+def group_source(kc) -> Fetch:
+    """Pending group names resolved in one batch through the client's GroupIndex."""
+    async def fetch(keys):
+        return await kc.groups.resolve(keys)
+    return fetch
+
+def cluster_source(clusters, project: str) -> Fetch:
+    """
+    Pending clusters of one Project (AsyncClusterClient). Each tick makes one
+    GET /clusters/summary; the cluster list is only fetched again when the
+    summary's total/ready/error counts changed since the last listing.
+    """
+    last = {"counts": None, "items": {}}
+
+    async def fetch(keys):
+        summary = await clusters.cluster_summary(project)
+        counts = (summary.total_clusters, summary.ready, summary.error)
+        if counts != last["counts"] or any(k not in last["items"] for k in keys):
+            last["items"] = {c.name: c for c in await clusters.all_clusters(project)}
+            last["counts"] = counts
+        return last["items"]
+    return fetch
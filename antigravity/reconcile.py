@@ -0,0 +1,257 @@
+import asyncio
+from typing import Dict, List, Optional, Set
+from client_keycloak import AsyncKeycloakClient
+from client_emf import AsyncEMFClient, Resource
+from bulk import Provisioner, TaskGraph
+from config import Config
+from tracing import get_tracer
+from utils import ROLE_SUFFIXES, ORG_ADMIN_SUFFIX, ORG_ADMIN_PROJECT_SUFFIXES, ONBOARDING_SUFFIX
+
+class Snapshot:
+    """Live state read in bulk before planning."""
+    def __init__(self):
+        self.orgs: Dict[str, Resource] = {}
+        self.projects: Dict[str, Resource] = {}      # "org/project" -> record
+        self.users: Dict[str, str] = {}              # lowercase username -> id
+        self.memberships: Dict[str, Set[str]] = {}   # user id -> group names
+        self.errors: List[str] = []
+        self.failed: Set[str] = set()                # orgs whose projects could not be listed
+
+class Action:
+    """One planned step; `deps` are keys of other actions in the same plan."""
+    __slots__ = ("key", "tenant", "kind", "target", "suffixes", "deps")
+
+    def __init__(self, key: str, tenant: str, kind: str, target: str,
+                 suffixes: Optional[List[str]] = None, deps: Optional[List[str]] = None):
+        self.key = key
+        self.tenant = tenant
+        self.kind = kind
+        self.target = target
+        self.suffixes = suffixes or []
+        self.deps = deps or []
+
+    @property
+    def label(self) -> str:
+        if self.kind == "add groups":
+            scope = self.key.split(":", 3)[3]
+            return f"add {self.target} to {scope} {', '.join(self.suffixes)}"
+        return f"{self.kind} {self.target}"
+
+    @property
+    def writes(self) -> int:
+        """API writes this step issues (waits are reads only)."""
+        if self.kind == "add groups":
+            return len(self.suffixes)
+        return 0 if self.kind.startswith("wait") else 1
+
+class Reconciler:
+    """
+    Declarative counterpart of the org/project/user commands: snapshots live
+    state with bulk listings, diffs it against a manifest (see bulk.load_manifest)
+    and plans only the missing creates and group memberships. Existing users are
+    matched by username; memberships are only ever added. Orgs whose Projects
+    cannot be listed are left out of the plan rather than read as empty.
+
+    Scopes are "org:{org}" or "project:{org}/{project}".
+    """
+    def __init__(self, kc: AsyncKeycloakClient, emf: AsyncEMFClient, workers: int = Config.BULK_WORKERS):
+        self.kc = kc
+        self.emf = emf
+        self.workers = workers
+        self.provisioner = Provisioner(kc, emf)
+        self.snapshot = Snapshot()
+        self.orgs: Dict[str, Dict] = {}
+        # lowercase username -> {"username", "password", "email", "tenant", "groups": {scope: [suffixes]}}
+        self.desired: Dict[str, Dict] = {}
+        self._slots = asyncio.Semaphore(Config.MEMBERSHIP_CONCURRENCY)
+        self._relogged: Set[str] = set()
+
+    def _want(self, username: str, password: str, email: Optional[str], tenant: str, scope: str, suffixes: List[str]):
+        spec = self.desired.setdefault(username.lower(), {
+            "username": username, "password": password, "email": email, "tenant": tenant, "groups": {},
+        })
+        wanted = spec["groups"].setdefault(scope, [])
+        wanted.extend(s for s in suffixes if s not in wanted)
+
+    def load(self, orgs: List[Dict]):
+        """Derives the desired users and memberships from a validated manifest."""
+        self.orgs = {o["name"]: o for o in orgs}
+        for org in orgs:
+            o = org["name"]
+            admin = org.get("admin")
+            if admin:
+                self._want(f"{o}-admin", admin["password"], None, o, f"org:{o}", [ORG_ADMIN_SUFFIX])
+            for proj in org["projects"]:
+                p = proj["name"]
+                scope = f"project:{o}/{p}"
+                if admin:
+                    self._want(f"{o}-admin", admin["password"], None, o, scope, ORG_ADMIN_PROJECT_SUFFIXES)
+                if proj.get("onboarding"):
+                    self._want(f"{o}-{p}-onboard", proj["onboarding"]["password"], None, o, scope, [ONBOARDING_SUFFIX])
+                for u in proj["users"]:
+                    for level, suffix in ROLE_SUFFIXES[u["role"]]:
+                        self._want(u["username"], u["password"], u.get("email"), o,
+                                   f"org:{o}" if level == "org" else scope, [suffix])
+
+    @staticmethod
+    def _org_of(scope: str) -> str:
+        return scope.partition(":")[2].partition("/")[0]
+
+    def _uuid(self, scope: str) -> Optional[str]:
+        kind, _, name = scope.partition(":")
+        return (self.provisioner.org_uuids if kind == "org" else self.provisioner.proj_uuids).get(name)
+
+    def _group_names(self, scope: str, suffixes: List[str]) -> Optional[List[str]]:
+        uuid = self._uuid(scope)
+        return [f"{uuid}_{s}" for s in suffixes] if uuid else None
+
+    async def take_snapshot(self):
+        """Orgs, users and groups in one listing each; projects per org; memberships per relevant user."""
+        snap = self.snapshot
+        prov = self.provisioner
+        with get_tracer().span("snapshot"):
+            records, snap.users, _ = await asyncio.gather(
+                self.emf.list_org_records(), self.kc.user_snapshot(), self.kc.groups.load())
+            snap.orgs = {r.name: r for r in records if r.name}
+            for name, r in snap.orgs.items():
+                if r.uid and r.ready:
+                    prov.org_uuids[name] = r.uid
+
+            workers = asyncio.Semaphore(self.workers)
+
+            async def projects(org: Dict):
+                async with workers:
+                    try:
+                        client = await prov.org_client(org)
+                        for r in await client.list_project_records():
+                            snap.projects[f"{org['name']}/{r.name}"] = r
+                            if r.uid and r.ready:
+                                prov.proj_uuids[f"{org['name']}/{r.name}"] = r.uid
+                    except Exception as e:
+                        # Unknown Projects would all be planned as creates; leave the whole tenant alone
+                        snap.failed.add(org["name"])
+                        snap.errors.append(f"{org['name']}: cannot list projects as {org['name']}-admin: {e}")
+
+            # Projects are only visible to the org admin, so orgs without one have none we can see
+            await asyncio.gather(*(
+                projects(o) for o in self.orgs.values()
+                if o["projects"] and o["name"] in snap.orgs and f"{o['name']}-admin".lower() in snap.users
+            ))
+
+            async def groups_of(user_id: str):
+                async with self._slots:
+                    snap.memberships[user_id] = {g["name"] for g in await self.kc.get_user_groups(user_id)}
+
+            # Only users that exist and could already be in one of their desired groups
+            index = self.kc.groups.by_name
+            relevant = set()
+            for username, spec in self.desired.items():
+                user_id = snap.users.get(username)
+                if not user_id:
+                    continue
+                for scope, suffixes in spec["groups"].items():
+                    names = self._group_names(scope, suffixes) or []
+                    if any(n in index for n in names):
+                        relevant.add(user_id)
+                        break
+            await asyncio.gather(*(groups_of(u) for u in relevant))
+
+    def plan(self) -> List[Action]:
+        """Minimal ordered list of steps turning the snapshot into the manifest (tenants that failed to snapshot excluded)."""
+        snap = self.snapshot
+        actions: List[Action] = []
+        keys: Set[str] = set()
+        orgs = {o: org for o, org in self.orgs.items() if o not in snap.failed}
+
+        def add(action: Action):
+            action.deps = [d for d in action.deps if d in keys]
+            actions.append(action)
+            keys.add(action.key)
+
+        for o, org in orgs.items():
+            if o not in snap.orgs:
+                add(Action(f"org:{o}", o, "create org", o))
+            elif not self._uuid(f"org:{o}"):
+                add(Action(f"org:{o}", o, "wait for org", o))
+
+        for username, spec in self.desired.items():
+            if username not in snap.users and any(self._org_of(sc) in orgs for sc in spec["groups"]):
+                add(Action(f"user:{username}", spec["tenant"], "create user", spec["username"]))
+
+        def grants(level: str):
+            for username, spec in self.desired.items():
+                current = snap.memberships.get(snap.users.get(username), set())
+                for scope, suffixes in spec["groups"].items():
+                    if not scope.startswith(level) or self._org_of(scope) not in orgs:
+                        continue
+                    names = self._group_names(scope, suffixes)
+                    missing = [s for i, s in enumerate(suffixes) if names is None or names[i] not in current]
+                    if missing:
+                        add(Action(f"grant:{username}:{scope}", spec["tenant"], "add groups", spec["username"],
+                                   missing, deps=[f"user:{username}", scope]))
+
+        # Org admins need their org group before they can create projects
+        grants("org:")
+        for o, org in orgs.items():
+            admin = f"{o}-admin".lower()
+            for proj in org["projects"]:
+                key = f"{o}/{proj['name']}"
+                deps = [f"org:{o}", f"user:{admin}", f"grant:{admin}:org:{o}"]
+                if key not in snap.projects:
+                    add(Action(f"project:{key}", o, "create project", key, deps=deps))
+                elif not self._uuid(f"project:{key}"):
+                    add(Action(f"project:{key}", o, "wait for project", key, deps=deps))
+        grants("project:")
+        return actions
+
+    async def _ensure_admin_claims(self, org: Dict, keys: Set[str]):
+        # A freshly granted org admin needs a new token carrying the group claim
+        admin = f"{org['name']}-admin".lower()
+        relogin = f"grant:{admin}:org:{org['name']}" in keys and org["name"] not in self._relogged
+        if relogin:
+            self._relogged.add(org["name"])
+        await self.provisioner.org_client(org, force=relogin)
+
+    async def _create_user(self, username: str):
+        spec = self.desired[username]
+        self.snapshot.users[username] = await self.kc.create_user(spec["username"], spec["password"], spec["email"])
+
+    async def _add_groups(self, username: str, scope: str, suffixes: List[str]):
+        names = self._group_names(scope, suffixes)
+        if names is None:
+            raise Exception(f"No UUID for {scope}")
+        groups = await self.provisioner.poller.wait_for("groups", names)
+        user_id = self.snapshot.users[username]
+
+        async def put(group: Dict):
+            async with self._slots:
+                await self.kc.add_user_to_group(user_id, group["id"])
+
+        await asyncio.gather(*(put(groups[n]) for n in names))
+
+    def build(self, actions: List[Action]) -> TaskGraph:
+        prov = self.provisioner
+        keys = {a.key for a in actions}
+        graph = TaskGraph()
+        for a in actions:
+            if a.kind == "create org":
+                fn = lambda a=a: prov.create_org(self.orgs[a.target])
+            elif a.kind == "wait for org":
+                fn = lambda a=a: prov.wait_org(a.target)
+            elif a.kind in ("create project", "wait for project"):
+                o, _, p = a.target.partition("/")
+                proj = next(x for x in self.orgs[o]["projects"] if x["name"] == p)
+
+                async def fn(a=a, org=self.orgs[o], proj=proj):
+                    await self._ensure_admin_claims(org, keys)
+                    if a.kind == "create project":
+                        await prov.create_project(org, proj)
+                    else:
+                        await prov.wait_project(org, proj["name"])
+            elif a.kind == "create user":
+                fn = lambda a=a: self._create_user(a.key.split(":", 1)[1])
+            else:
+                _, username, scope = a.key.split(":", 2)
+                fn = lambda username=username, scope=scope, a=a: self._add_groups(username, scope, a.suffixes)
+            graph.add(a.key, a.tenant, a.label, fn, deps=a.deps)
+        return graph
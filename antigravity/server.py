@@ -0,0 +1,353 @@
+import asyncio
+import hmac
+import ipaddress
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+from aiohttp import web
+from client_keycloak import AsyncKeycloakClient, LoginFailed
+from client_emf import AsyncEMFClient
+from bulk import Provisioner
+from config import Config
+from memberships import apply_memberships
+from teardown import Teardown
+from transport import CircuitOpenError, get_transport
+from utils import ORG_ADMIN_PROJECT_SUFFIXES, ORG_ADMIN_SUFFIX, ONBOARDING_SUFFIX, ROLE_SUFFIXES, role_groups
+
+class QueueFull(Exception):
+    pass
+
+class BadRequest(Exception):
+    """Invalid request parameters or body; answered with 400."""
+
+class NotFound(Exception):
+    """The addressed Org or Project does not exist; answered with 404."""
+
+class WorkQueue:
+    """
+    Runs operations at most `workers` at a time, in arrival order. Once
+    `size` operations are waiting, new ones are rejected instead of queued.
+    Keeps per-operation counts and latencies for /stats.
+    """
+    def __init__(self, workers: int = Config.SERVE_WORKERS, size: int = Config.SERVE_QUEUE_SIZE):
+        self.workers = workers
+        self.size = size
+        self.slots = asyncio.Semaphore(workers)
+        self.waiting = 0
+        self.running = 0
+        self.ops: Dict[str, Dict] = {}
+
+    async def run(self, name: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        if self.waiting >= self.size:
+            raise QueueFull(f"{self.waiting} operations already queued")
+        op = self.ops.setdefault(name, {"count": 0, "failed": 0, "seconds": 0.0, "max": 0.0, "queued": 0.0})
+        arrived = time.time()
+        self.waiting += 1
+        try:
+            await self.slots.acquire()
+        finally:
+            self.waiting -= 1
+        started = time.time()
+        self.running += 1
+        try:
+            return await fn()
+        except Exception:
+            op["failed"] += 1
+            raise
+        finally:
+            self.running -= 1
+            self.slots.release()
+            elapsed = time.time() - started
+            op["count"] += 1
+            op["seconds"] += elapsed
+            op["max"] = max(op["max"], elapsed)
+            op["queued"] += started - arrived
+
+    def snapshot(self) -> Dict:
+        ops = {name: {"count": o["count"], "failed": o["failed"],
+                      "avg_seconds": round(o["seconds"] / o["count"], 3) if o["count"] else 0.0,
+                      "max_seconds": round(o["max"], 3),
+                      "avg_queued_seconds": round(o["queued"] / o["count"], 3) if o["count"] else 0.0}
+               for name, o in self.ops.items()}
+        return {"workers": self.workers, "running": self.running, "waiting": self.waiting, "ops": ops}
+
+def is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+def _error(status: int, message: str) -> web.Response:
+    return web.json_response({"error": message}, status=status)
+
+async def _body(request: web.Request, *required: str) -> Dict:
+    """The JSON object body, with a non-empty string for every `required` field."""
+    try:
+        body = await request.json()
+    except ValueError as e:
+        raise BadRequest(f"body is not valid JSON: {e}")
+    if not isinstance(body, dict):
+        raise BadRequest("body must be a JSON object")
+    missing = [f for f in required if not isinstance(body.get(f), str) or not body[f]]
+    if missing:
+        raise BadRequest(f"missing field(s): {', '.join(missing)}")
+    return body
+
+class Server:
+    """
+    Local REST API over the org/project/user operations (`main.py serve`).
+    It runs on the shared event loop with the platform admin session, the
+    HTTP pools, the metadata cache and a Provisioner (Org Admin sessions,
+    multiplexed poller) that stay warm across requests.
+
+    Org-scoped routes need the {org}-admin password: the X-Org-Admin-Password
+    header, else the credentials file. The first successful login for an Org
+    is reused (and refreshed) for later requests with the same password; any
+    other password needs its own successful login (401 otherwise).
+    """
+    def __init__(self, kc: AsyncKeycloakClient, emf: AsyncEMFClient, credentials: Optional[Dict[str, str]] = None,
+                 workers: int = Config.SERVE_WORKERS, queue_size: int = Config.SERVE_QUEUE_SIZE,
+                 token: str = Config.SERVE_TOKEN):
+        self.kc = kc
+        self.emf = emf
+        self.credentials = dict(credentials or {})
+        self.token = token
+        self.queue = WorkQueue(workers, queue_size)
+        # A long-lived poller only keeps recent waits for /stats
+        self.provisioner = Provisioner(kc, emf, poll_history=1000)
+        self.started = time.time()
+        self._runner: Optional[web.AppRunner] = None
+
+    # Plumbing
+
+    def _authorized(self, request: web.Request) -> bool:
+        # Constant-time; bytes, since compare_digest rejects non-ASCII str
+        sent = request.headers.get("Authorization", "").encode("utf-8", "surrogateescape")
+        return hmac.compare_digest(sent, f"Bearer {self.token}".encode())
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        if self.token and request.path != "/healthz" and not self._authorized(request):
+            return _error(401, "missing or invalid bearer token")
+        try:
+            return await handler(request)
+        except web.HTTPException:
+            raise
+        except QueueFull as e:
+            return web.json_response({"error": f"busy: {e}"}, status=503, headers={"Retry-After": "1"})
+        except CircuitOpenError as e:
+            return _error(503, str(e))
+        except LoginFailed as e:
+            return _error(401, str(e))
+        except BadRequest as e:
+            return _error(400, f"invalid request: {e}")
+        except NotFound as e:
+            return _error(404, str(e))
+        except TimeoutError as e:
+            return _error(504, str(e) or "timed out waiting for the backend")
+        except Exception as e:
+            return _error(502, str(e))
+
+    def _org(self, request: web.Request, name: str) -> Dict:
+        password = request.headers.get("X-Org-Admin-Password") or self.credentials.get(name)
+        if not password:
+            raise BadRequest(f"X-Org-Admin-Password is required for {name}")
+        return {"name": name, "admin": {"password": password}}
+
+    async def _org_uuid(self, name: str) -> str:
+        uid = self.provisioner.org_uuids.get(name) or await self.emf.get_org_uuid(name)
+        if not uid:
+            raise NotFound(f"Organization {name} not found")
+        return uid
+
+    async def _join(self, user_id: str, names):
+        """Waits for the groups (one listing per tick for every request) and adds the missing memberships."""
+        names = list(names)
+        await self.provisioner.poller.wait_for("groups", names)
+        failed = [c for c in await apply_memberships(self.kc, {user_id: names}) if c["status"] != "ok"]
+        if failed:
+            raise Exception(f"Add to {failed[0]['group']}: {failed[0]['error']}")
+
+    # Handlers
+
+    async def health(self, request: web.Request) -> web.Response:
+        return web.json_response({"status": "ok", "uptime": round(time.time() - self.started, 1)})
+
+    async def stats(self, request: web.Request) -> web.Response:
+        return web.json_response({"queue": self.queue.snapshot(), "http": get_transport().stats.snapshot(),
+                                  "polls": self.provisioner.poller.list_calls})
+
+    async def list_orgs(self, request: web.Request) -> web.Response:
+        records = await self.queue.run("list orgs", self.emf.list_org_records)
+        return web.json_response([r.to_dict() for r in records])
+
+    async def create_org(self, request: web.Request) -> web.Response:
+        body = await _body(request, "name")
+        name, password = body["name"], body.get("admin_password")
+
+        async def run():
+            await self.provisioner.create_org({"name": name, "description": body.get("description") or f"Description for {name}"})
+            uid = self.provisioner.org_uuids[name]
+            admin = None
+            if password:
+                admin = f"{name}-admin"
+                await self._join(await self.kc.create_user(admin, password), [f"{uid}_{ORG_ADMIN_SUFFIX}"])
+                self.credentials[name] = password
+            return {"name": name, "uid": uid, "admin": admin}
+
+        return web.json_response(await self.queue.run("create org", run), status=201)
+
+    async def delete_org(self, request: web.Request) -> web.Response:
+        name = request.match_info["org"]
+        cascade = request.query.get("cascade", "false").lower() == "true"
+        keep_users = request.query.get("keep_users", "false").lower() == "true"
+
+        async def run():
+            if not cascade:
+                if not await self.emf.delete_org(name):
+                    raise NotFound(f"Organization {name} not found")
+                await self.provisioner.poller.watch("orgs", name, lambda r: r is None)
+                self.provisioner.forget_org(name)
+                return {"name": name, "deleted": ["org"]}
+            teardown = Teardown(self.kc, self.emf, {name: self._org(request, name)["admin"]["password"]}, keep_users)
+            await teardown.take_snapshot()
+            if teardown.missing:
+                raise NotFound(f"Organization {name} not found")
+            if teardown.errors:
+                raise Exception(teardown.errors[0])
+            graph = teardown.build(teardown.plan())
+            await graph.run_async(Config.TEARDOWN_WORKERS)
+            failed = [f"{t.label}: {t.error}" for t in graph.tasks.values() if t.status != "ok"]
+            if failed:
+                raise Exception("; ".join(failed))
+            self.provisioner.forget_org(name)
+            self.credentials.pop(name, None)
+            return {"name": name, "deleted": [t.label for t in graph.tasks.values()]}
+
+        return web.json_response(await self.queue.run("delete org", run))
+
+    async def list_projects(self, request: web.Request) -> web.Response:
+        org = self._org(request, request.match_info["org"])
+
+        async def run():
+            return await (await self.provisioner.org_client(org)).list_project_records()
+
+        records = await self.queue.run("list projects", run)
+        return web.json_response([dict(r.to_dict(), org=org["name"]) for r in records])
+
+    async def create_project(self, request: web.Request) -> web.Response:
+        org = self._org(request, request.match_info["org"])
+        body = await _body(request, "name")
+        name, onboarding_password = body["name"], body.get("onboarding_password")
+
+        async def run():
+            prov = self.provisioner
+            await prov.create_project(org, {"name": name, "description": body.get("description") or f"Project {name} in {org['name']}"})
+            uid = prov.proj_uuids[f"{org['name']}/{name}"]
+            # Same groups as `project create`: the Org Admin gets every project group but onboarding
+            admin = await self.kc.get_user(f"{org['name']}-admin")
+            steps = []
+            if admin:
+                steps.append(self._join(admin["id"], [f"{uid}_{s}" for s in ORG_ADMIN_PROJECT_SUFFIXES]))
+            onboarding = None
+            if onboarding_password:
+                onboarding = f"{org['name']}-{name}-onboard"
+                user_id = await self.kc.create_user(onboarding, onboarding_password)
+                steps.append(self._join(user_id, [f"{uid}_{ONBOARDING_SUFFIX}"]))
+            await asyncio.gather(*steps)
+            return {"org": org["name"], "name": name, "uid": uid, "onboarding_user": onboarding}
+
+        return web.json_response(await self.queue.run("create project", run), status=201)
+
+    async def list_users(self, request: web.Request) -> web.StreamResponse:
+        """Streams users as NDJSON while they are fetched, page by page."""
+        limit = request.query.get("limit")
+        if limit is not None:
+            if not limit.isdigit():
+                raise BadRequest(f"limit must be a non-negative integer, got {limit!r}")
+            limit = int(limit)
+        resp = web.StreamResponse(headers={"Content-Type": "application/x-ndjson"})
+
+        async def run():
+            await resp.prepare(request)
+            try:
+                async for u in self.kc.iter_users(request.query.get("search"), limit=limit):
+                    await resp.write(json.dumps(u).encode() + b"\n")
+            except Exception as e:
+                # Headers are already sent; the last line reports the failure
+                await resp.write(json.dumps({"error": str(e)}).encode() + b"\n")
+                raise
+            finally:
+                await resp.write_eof()
+
+        try:
+            await self.queue.run("list users", run)
+        except Exception:
+            if not resp.prepared:
+                raise
+        return resp
+
+    async def create_user(self, request: web.Request) -> web.Response:
+        """
+        {"username", "password", "email"?, "grants"?: [{"org", "project"?, "role"}]};
+        roles as in `user grant` (Project Admin, Project User, Onboarding).
+        """
+        body = await _body(request, "username", "password")
+        grants = body.get("grants") or []
+        if not isinstance(grants, list) or not all(isinstance(g, dict) for g in grants):
+            raise BadRequest("grants must be a list of objects")
+        for g in grants:
+            if not g.get("org"):
+                raise BadRequest("every grant needs an org")
+            if g.get("role") not in ROLE_SUFFIXES:
+                raise BadRequest(f"unknown role {g.get('role')!r} (one of: {', '.join(ROLE_SUFFIXES)})")
+            if g["role"] != "Project Admin" and not g.get("project"):
+                raise BadRequest(f"role {g['role']} needs a project")
+
+        async def run():
+            user_id = await self.kc.create_user(body["username"], body["password"], body.get("email"))
+            names = []
+            for g in grants:
+                org_uuid = await self._org_uuid(g["org"])
+                proj_uuid = None
+                if g.get("project"):
+                    client = await self.provisioner.org_client(self._org(request, g["org"]))
+                    proj_uuid = await client.get_project_uuid(g["project"])
+                    if not proj_uuid:
+                        raise NotFound(f"Project {g['org']}/{g['project']} not found")
+                names += role_groups(g["role"], org_uuid, proj_uuid)
+            if names:
+                await self._join(user_id, names)
+            return {"id": user_id, "username": body["username"], "groups": names}
+
+        return web.json_response(await self.queue.run("create user", run), status=201)
+
+    # Server
+
+    def app(self) -> web.Application:
+        app = web.Application(middlewares=[self._middleware])
+        app.add_routes([
+            web.get("/healthz", self.health),
+            web.get("/stats", self.stats),
+            web.get("/v1/orgs", self.list_orgs),
+            web.post("/v1/orgs", self.create_org),
+            web.delete("/v1/orgs/{org}", self.delete_org),
+            web.get("/v1/orgs/{org}/projects", self.list_projects),
+            web.post("/v1/orgs/{org}/projects", self.create_project),
+            web.get("/v1/users", self.list_users),
+            web.post("/v1/users", self.create_user),
+        ])
+        return app
+
+    async def start(self, host: str = Config.SERVE_HOST, port: int = Config.SERVE_PORT):
+        if not self.token and not is_loopback(host):
+            raise ValueError(f"Refusing to listen on {host} without SERVE_TOKEN; bind 127.0.0.1 or set a token")
+        self._runner = web.AppRunner(self.app(), access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+
+    async def stop(self):
+        if self._runner:
+            await self._runner.cleanup()
@@ -0,0 +1,140 @@
+import asyncio
+from typing import Dict, List, Tuple
+from client_keycloak import AsyncKeycloakClient
+from client_emf import AsyncEMFClient
+from bulk import Provisioner, TaskGraph
+from config import Config
+from reconcile import Action
+from tracing import get_tracer
+from utils import split_group_name
+
+def _gone(record) -> bool:
+    return record is None
+
+class Teardown:
+    """
+    Cascading delete of whole tenants, the reverse of Reconciler: each Org's
+    Projects (deleted concurrently across Orgs), then the Org, then the
+    Keycloak users that belonged only to the deleted tenants. Deletions are
+    confirmed through the shared poller, so every pending Project of an Org
+    and every pending Org is checked with one list call per tick.
+
+    Projects are only visible to the Org Admin, so every Org needs its
+    {org}-admin password (`credentials`); that user is deleted last.
+    """
+    def __init__(self, kc: AsyncKeycloakClient, emf: AsyncEMFClient, credentials: Dict[str, str],
+                 keep_users: bool = False, workers: int = Config.BULK_WORKERS):
+        self.kc = kc
+        self.emf = emf
+        self.keep_users = keep_users
+        self.workers = workers
+        self.provisioner = Provisioner(kc, emf)
+        self.orgs: Dict[str, Dict] = {o: {"name": o, "admin": {"password": p}} for o, p in credentials.items()}
+        self.projects: Dict[str, List[str]] = {}
+        # lowercase username -> {"id", "username", "tenant"}
+        self.users: Dict[str, Dict] = {}
+        self.kept: List[Tuple[str, str]] = []     # (username, reason)
+        self.missing: List[str] = []              # requested Orgs that do not exist
+        self.errors: List[str] = []
+        self._slots = asyncio.Semaphore(Config.MEMBERSHIP_CONCURRENCY)
+
+    async def take_snapshot(self):
+        """Orgs, users and groups in one listing each; Projects per Org; members of every tenant group."""
+        prov = self.provisioner
+        with get_tracer().span("snapshot"):
+            records, users, _ = await asyncio.gather(
+                self.emf.list_org_records(), self.kc.user_snapshot(), self.kc.groups.load())
+            live = {r.name: r for r in records if r.name}
+            self.missing = sorted(o for o in self.orgs if o not in live)
+            for o in self.missing:
+                del self.orgs[o]
+            owners = {live[o].uid: o for o in self.orgs if live[o].uid}   # Org/Project UUID -> Org
+            workers = asyncio.Semaphore(self.workers)
+
+            async def projects(org: Dict):
+                async with workers:
+                    try:
+                        client = await prov.org_client(org)
+                        records = await client.list_project_records()
+                    except Exception as e:
+                        # Without the Org's Projects a cascade is not safe; leave the whole tenant alone
+                        self.errors.append(f"{org['name']}: cannot list projects as {org['name']}-admin: {e}")
+                        return
+                    self.projects[org["name"]] = sorted(r.name for r in records if r.name)
+                    owners.update((r.uid, org["name"]) for r in records if r.uid)
+
+            await asyncio.gather(*(projects(o) for o in list(self.orgs.values())))
+            for o in [o for o in self.orgs if o not in self.projects]:
+                del self.orgs[o]
+            owners = {uid: o for uid, o in owners.items() if o in self.orgs}
+            if not self.keep_users:
+                await self._find_users(users, owners)
+
+    async def _find_users(self, users: Dict[str, str], owners: Dict[str, str]):
+        """Members of the tenants' groups plus the conventional {org}-admin / {org}-{project}-onboard users."""
+        async def members(group: Dict, org: str):
+            async with self._slots:
+                return [(m["id"], m["username"], org) for m in await self.kc.group_members(group["id"])]
+
+        candidates: Dict[str, Tuple[str, str]] = {}   # user id -> (username, org)
+        groups = [(g, owners[uid]) for uid in owners for g in self.kc.groups.for_uuid(uid).values()]
+        for found in await asyncio.gather(*(members(g, o) for g, o in groups)):
+            for user_id, username, org in found:
+                candidates.setdefault(user_id, (username, org))
+        for o in self.orgs:
+            for username in [f"{o}-admin"] + [f"{o}-{p}-onboard" for p in self.projects[o]]:
+                user_id = users.get(username.lower())
+                if user_id:
+                    candidates.setdefault(user_id, (username, o))
+
+        async def check(user_id: str, username: str, org: str):
+            if username.lower() == Config.KEYCLOAK_ADMIN_USER.lower():
+                self.kept.append((username, "platform admin"))
+                return
+            async with self._slots:
+                groups = await self.kc.get_user_groups(user_id)
+            # Users that also belong to anything else (another Org, org-admin-group, ...) are kept
+            foreign = [g["name"] for g in groups if split_group_name(g["name"])[0] not in owners]
+            if foreign:
+                self.kept.append((username, f"also in {foreign[0]}"))
+            else:
+                self.users[username.lower()] = {"id": user_id, "username": username, "tenant": org}
+
+        await asyncio.gather(*(check(i, u, o) for i, (u, o) in candidates.items()))
+
+    def plan(self) -> List[Action]:
+        """Projects first, then their Org; users (the {org}-admin among them) once their Org is gone."""
+        actions: List[Action] = []
+        for o in sorted(self.orgs):
+            project_keys = [f"project:{o}/{p}" for p in self.projects[o]]
+            for p in self.projects[o]:
+                actions.append(Action(f"project:{o}/{p}", o, "delete project", f"{o}/{p}"))
+            actions.append(Action(f"org:{o}", o, "delete org", o, deps=project_keys))
+        for username in sorted(self.users):
+            user = self.users[username]
+            actions.append(Action(f"user:{username}", user["tenant"], "delete user", user["username"],
+                                  deps=[f"org:{user['tenant']}"]))
+        return actions
+
+    async def _delete_project(self, org: str, project: str):
+        client = await self.provisioner.org_client(self.orgs[org])
+        await client.delete_project(project)
+        await self.provisioner.poller.watch(f"projects:{org}", project, _gone)
+
+    async def _delete_org(self, org: str):
+        await self.emf.delete_org(org)
+        await self.provisioner.poller.watch("orgs", org, _gone)
+
+    def build(self, actions: List[Action]) -> TaskGraph:
+        graph = TaskGraph()
+        for a in actions:
+            if a.kind == "delete project":
+                o, _, p = a.target.partition("/")
+                fn = lambda o=o, p=p: self._delete_project(o, p)
+            elif a.kind == "delete org":
+                fn = lambda a=a: self._delete_org(a.target)
+            else:
+                user_id = self.users[a.key.split(":", 1)[1]]["id"]
+                fn = lambda user_id=user_id: self.kc.delete_user(user_id)
+            graph.add(a.key, a.tenant, a.label, fn, deps=a.deps)
+        return graph
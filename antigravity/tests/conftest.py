@@ -0,0 +1,30 @@
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+# The CLI is a set of flat modules; tests import them the way main.py does
+sys.path.insert(0, os.path.dirname(HERE))
+sys.path.insert(0, os.path.join(os.path.dirname(HERE), "benchmarks"))
+
+# Must be set before config.py is imported: no token/metadata caches on disk, fast polling
+os.environ.update({
+    "TOKEN_CACHE": "false",
+    "METADATA_CACHE": "false",
+    "POLL_INTERVAL": "0.05",
+    "POLL_MAX_INTERVAL": "0.2",
+})
+
+import pytest  # noqa: E402
+
+@pytest.fixture(scope="session")
+def cluster():
+    """benchmarks/fake_server.py on a background thread; clients created in the test talk to it."""
+    from config import Config
+    from fake_server import FakeCluster
+    cluster = FakeCluster(provision_delay=0, admin_user=Config.KEYCLOAK_ADMIN_USER, admin_pass=Config.KEYCLOAK_ADMIN_PASS)
+    url = cluster.start()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(Config, "KEYCLOAK_URL", url)
+        mp.setattr(Config, "EMF_API_URL", url)
+        yield cluster
+    cluster.stop()
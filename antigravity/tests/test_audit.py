@@ -0,0 +1,53 @@
+from audit import SINGLE_ONBOARDING, SINGLE_ORG, TenancyAudit
+from utils import ONBOARDING_SUFFIX, ORG_ADMIN_SUFFIX
+
+ACME, GLOBEX = "a" * 36, "b" * 36
+WEB, API, OPS = "1" * 36, "2" * 36, "3" * 36     # WEB, API in acme; OPS in globex
+UNMAPPED = "9" * 36                              # a Project of an Org without credentials
+
+def _audit(members):
+    """An audit as load() leaves it; members: {username: [(UUID, suffix)]}."""
+    audit = TenancyAudit(None, None)
+    audit.org_names = {ACME: "acme", GLOBEX: "globex"}
+    audit.owner = {ACME: ACME, GLOBEX: GLOBEX, WEB: ACME, API: ACME, OPS: GLOBEX}
+    audit.labels = {ACME: "acme", GLOBEX: "globex", WEB: "acme/web", API: "acme/api", OPS: "globex/ops"}
+    for username, groups in members.items():
+        user_id = f"id-{username}"
+        audit.usernames[user_id] = username
+        for uuid, suffix in groups:
+            group_id = f"{uuid}_{suffix}"
+            audit.groups[group_id] = (uuid, suffix)
+            audit.members.setdefault(user_id, set()).add(group_id)
+    return audit
+
+def test_clean_realm():
+    audit = _audit({
+        "acme-admin": [(ACME, ORG_ADMIN_SUFFIX), (WEB, "Edge-Manager-Group"), (API, "Host-Manager-Group")],
+        "acme-web-onboard": [(WEB, ONBOARDING_SUFFIX)],
+        "globex-user": [(OPS, "Edge-Operator-Group"), (OPS, ONBOARDING_SUFFIX)],
+    })
+    assert audit.check() == []
+    assert audit.memberships == 6
+
+def test_user_in_two_orgs():
+    audit = _audit({"drifter": [(ACME, ORG_ADMIN_SUFFIX), (OPS, "Edge-Manager-Group")]})
+    [v] = audit.check()
+    assert (v.username, v.user_id, v.rule, v.detail) == ("drifter", "id-drifter", SINGLE_ORG, "acme, globex")
+
+def test_user_onboarding_in_two_projects():
+    audit = _audit({"onboarder": [(WEB, ONBOARDING_SUFFIX), (API, ONBOARDING_SUFFIX)]})
+    [v] = audit.check()
+    assert (v.rule, v.detail) == (SINGLE_ONBOARDING, "acme/api, acme/web")
+
+def test_both_rules_sorted_by_user():
+    audit = _audit({
+        "zed": [(WEB, ONBOARDING_SUFFIX), (OPS, ONBOARDING_SUFFIX)],
+        "amy": [(ACME, ORG_ADMIN_SUFFIX), (GLOBEX, ORG_ADMIN_SUFFIX)],
+    })
+    assert [(v.username, v.rule) for v in audit.check()] == [
+        ("amy", SINGLE_ORG), ("zed", SINGLE_ONBOARDING), ("zed", SINGLE_ORG)]
+
+def test_groups_of_unmapped_projects_are_not_violations():
+    audit = _audit({"someone": [(ACME, ORG_ADMIN_SUFFIX), (UNMAPPED, "Edge-Manager-Group")]})
+    assert audit.check() == []
+    assert audit.unmapped == {UNMAPPED}
@@ -0,0 +1,127 @@
+import asyncio
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from client_cluster import AsyncClusterClient, ClusterFailed, cluster_ready, cluster_state
+from clusters import ClusterProvisioner
+from config import Config
+from models.cluster import ClusterInfo, ClusterSummary
+from transport import AsyncTransport
+
+IDLE, ERROR, BUSY = "STATUS_INDICATION_IDLE", "STATUS_INDICATION_ERROR", "STATUS_INDICATION_IN_PROGRESS"
+
+def _cluster(name="c1", phase=IDLE, message=None, **statuses):
+    data = {"name": name, "lifecyclePhase": {"indicator": phase, "message": message}}
+    data.update({key: {"indicator": value} for key, value in statuses.items()})
+    return ClusterInfo.from_json(data)
+
+def test_cluster_state():
+    assert cluster_state(None) == "in_progress"
+    assert cluster_state(ClusterInfo.from_json({"name": "c1"})) == "in_progress"
+    assert cluster_state(_cluster(providerStatus=IDLE, controlPlaneReady=IDLE, nodeHealth=IDLE)) == "ready"
+    assert cluster_state(_cluster(providerStatus=IDLE, controlPlaneReady=BUSY)) == "in_progress"
+    assert cluster_state(_cluster(phase=BUSY, nodeHealth=ERROR)) == "error"
+
+def test_cluster_ready_raises_on_error():
+    assert cluster_ready(_cluster()) is True
+    assert cluster_ready(_cluster(phase=BUSY)) is False
+    with pytest.raises(ClusterFailed, match="no nodes"):
+        cluster_ready(_cluster(phase=ERROR, message="no nodes"))
+
+class FakeClusters:
+    """
+    Cluster Manager in memory: "dup" already exists, "broken" is rejected,
+    "bad" ends in error; the others are ready `polls` listings after creation.
+    """
+    def __init__(self, polls=2):
+        self.polls = polls
+        self.created = {}
+        self.summaries = 0
+        self.listings = 0
+
+    async def create_cluster(self, project, spec):
+        if spec["name"] == "broken":
+            raise Exception("Error Create cluster broken: 400 - invalid template")
+        if spec["name"] == "dup":
+            return False
+        self.created[(project, spec["name"])] = 0
+        return True
+
+    def _info(self, project, name):
+        seen = self.created[(project, name)]
+        if name == "bad" and seen >= 1:
+            return _cluster(name, ERROR, "provisioning failed")
+        return _cluster(name, IDLE if seen >= self.polls else BUSY)
+
+    async def cluster_summary(self, project):
+        self.summaries += 1
+        for key in self.created:
+            if key[0] == project:
+                self.created[key] += 1
+        infos = [self._info(p, n) for p, n in self.created if p == project]
+        return ClusterSummary.from_json({"totalClusters": len(infos),
+                                         "ready": sum(cluster_state(c) == "ready" for c in infos),
+                                         "error": sum(cluster_state(c) == "error" for c in infos)})
+
+    async def all_clusters(self, project):
+        self.listings += 1
+        return [self._info(p, n) for p, n in self.created if p == project]
+
+def _provision(monkeypatch, specs, **kwargs):
+    monkeypatch.setattr(Config, "CLUSTER_POLL_INTERVAL", 0.01)
+    fake = FakeClusters()
+    results = []
+    provisioner = ClusterProvisioner(fake, workers=2, on_result=results.append, **kwargs)
+    counts = asyncio.run(provisioner.create({"project": p, "name": n, "nodes": [{"id": n, "role": "all"}]}
+                                            for p, n in specs))
+    return counts, results, fake
+
+def test_provisioner_waits_for_every_cluster(monkeypatch):
+    specs = [("p1", "a"), ("p1", "b"), ("p1", "bad"), ("p2", "c"), ("p2", "broken")]
+    counts, results, fake = _provision(monkeypatch, specs)
+    assert counts == {"ready": 3, "error": 1, "failed": 1}
+    final = {r["name"]: r for r in results if r["status"] != "created"}
+    assert final["bad"]["error"] == "provisioning failed"
+    assert "invalid template" in final["broken"]["error"]
+    assert all(final[n]["seconds"] is not None for n in ("a", "b", "c"))
+    # One summary per project per tick, however many clusters are pending there
+    assert fake.summaries == 4
+
+def test_provisioner_without_wait_reports_create_results(monkeypatch):
+    counts, results, fake = _provision(monkeypatch, [("p1", "a"), ("p1", "dup")], wait=False)
+    assert counts == {"created": 1, "exists": 1}
+    assert fake.summaries == 0
+
+def test_provisioner_times_out(monkeypatch):
+    counts, results, _ = _provision(monkeypatch, [("p1", "a")], timeout=0)
+    assert counts == {"timeout": 1}
+    assert "Timed out waiting for clusters:p1 a" in results[-1]["error"]
+
+def test_retried_create_answered_with_409_counts_as_created():
+    """The first POST creates the cluster but its response is lost (502); the retry gets a 409."""
+    statuses = []
+
+    async def create(request: web.Request) -> web.Response:
+        statuses.append(409 if statuses else 502)
+        return web.json_response({"message": "x"}, status=statuses[-1], headers={"Retry-After": "0"})
+
+    async def main(monkeypatch):
+        app = web.Application()
+        app.router.add_post("/v2/projects/{project}/clusters", create)
+        server = TestServer(app)
+        await server.start_server()
+        monkeypatch.setattr(Config, "EMF_API_URL", str(server.make_url("")).rstrip("/"))
+        transport = AsyncTransport(retries=2)
+        try:
+            clusters = AsyncClusterClient(token="t", transport=transport)
+            retried = await clusters.create_cluster("p1", {"name": "c1"})
+            statuses.clear()
+            statuses.append(502)  # the next request gets the 409 straight away
+            first = await clusters.create_cluster("p1", {"name": "c1"})
+            return retried, first
+        finally:
+            await transport.close()
+            await server.close()
+
+    with pytest.MonkeyPatch.context() as mp:
+        assert asyncio.run(main(mp)) == (True, False)
@@ -0,0 +1,73 @@
+import asyncio
+import time
+import credentials
+from client_emf import Resource
+from client_keycloak import LoginFailed
+from credentials import iter_org_projects, load_credentials
+
+# Seconds each org's login takes
+DELAYS = {"slow": 0.3, "a": 0.1, "b": 0.1, "c": 0.1, "bad": 0.05}
+
+class FakeKeycloak:
+    running = 0
+    peak = 0
+
+    async def login(self, username, password):
+        cls = FakeKeycloak
+        cls.running += 1
+        cls.peak = max(cls.peak, cls.running)
+        try:
+            await asyncio.sleep(DELAYS[username[:-len("-admin")]])
+        finally:
+            cls.running -= 1
+        if password != "ok":
+            raise LoginFailed(f"Error Login failed: 401 - invalid credentials for {username}")
+        self.org = username[:-len("-admin")]
+
+class FakeEMF:
+    def __init__(self, auth):
+        self.org = auth.org
+
+    async def list_project_records(self):
+        return [Resource("project", f"{self.org}-p{i}", None, f"uid-{i}", "IDLE", None, None) for i in range(2)]
+
+def _collect(monkeypatch, passwords, workers):
+    monkeypatch.setattr(credentials, "AsyncKeycloakClient", FakeKeycloak)
+    monkeypatch.setattr(credentials, "AsyncEMFClient", FakeEMF)
+    FakeKeycloak.running = FakeKeycloak.peak = 0
+
+    async def main():
+        start = time.monotonic()
+        return [(org, [r.name for r in records], error, time.monotonic() - start)
+                async for org, records, error in iter_org_projects(passwords, workers)]
+
+    return asyncio.run(main())
+
+def test_orgs_are_queried_concurrently_up_to_workers(monkeypatch):
+    results = _collect(monkeypatch, {"a": "ok", "b": "ok", "c": "ok"}, workers=2)
+    assert FakeKeycloak.peak == 2
+    assert sorted(r[0] for r in results) == ["a", "b", "c"]
+    # Two rounds of 0.1s, not three
+    assert results[-1][3] < 0.28
+
+def test_failed_login_is_reported_without_stopping_the_others(monkeypatch):
+    results = {r[0]: r for r in _collect(monkeypatch, {"a": "ok", "bad": "wrong", "b": "ok"}, workers=3)}
+    assert results["bad"][1] == [] and "401" in results["bad"][2]
+    assert results["a"][1:3] == (["a-p0", "a-p1"], None)
+    assert results["b"][2] is None
+
+def test_results_stream_in_completion_order(monkeypatch):
+    results = _collect(monkeypatch, {"slow": "ok", "a": "ok"}, workers=2)
+    assert [r[0] for r in results] == ["a", "slow"]
+    # The fast org is yielded while the slow one is still logging in
+    assert results[0][3] < 0.2
+
+def test_load_credentials_accepts_plain_and_manifest_files(tmp_path, monkeypatch):
+    monkeypatch.setenv("GLOBEX_PASS", "from-env")
+    plain = tmp_path / "creds.yaml"
+    plain.write_text("acme: s3cret\nglobex: {password_env: GLOBEX_PASS}\n")
+    assert load_credentials(str(plain)) == {"acme": "s3cret", "globex": "from-env"}
+
+    manifest = tmp_path / "tenants.yaml"
+    manifest.write_text("orgs:\n  - name: acme\n    admin: {password: s3cret}\n  - name: initech\n")
+    assert load_credentials(str(manifest)) == {"acme": "s3cret"}
@@ -0,0 +1,61 @@
+import asyncio
+from client_keycloak import GroupIndex
+
+ORG = "11111111-1111-1111-1111-111111111111"
+NEW = "22222222-2222-2222-2222-222222222222"
+
+class FakeKeycloak:
+    """Just the group listing GroupIndex uses; records every call."""
+    def __init__(self, names):
+        self.groups = [{"id": f"id-{n}", "name": n} for n in names]
+        self.calls = []
+
+    async def list_all_groups(self, search=None):
+        self.calls.append(search)
+        return [g for g in self.groups if search is None or search in g["name"]]
+
+def test_lookup_by_path_loads_once():
+    kc = FakeKeycloak([f"{ORG}_Project-Manager-Group", f"{ORG}_Edge-Manager-Group", "admins"])
+    index = GroupIndex(kc)
+
+    async def main():
+        return [await index.get(f"{ORG}_Project-Manager-Group"), await index.get("admins")]
+
+    pm, admins = asyncio.run(main())
+    assert pm["id"] == f"id-{ORG}_Project-Manager-Group"
+    assert admins["id"] == "id-admins"
+    assert set(index.for_uuid(ORG)) == {"Project-Manager-Group", "Edge-Manager-Group"}
+    assert kc.calls == [None]
+
+def test_group_created_after_load_is_found_by_a_targeted_search():
+    kc = FakeKeycloak([f"{ORG}_Project-Manager-Group"])
+    index = GroupIndex(kc)
+
+    async def main():
+        await index.load()
+        kc.groups.append({"id": "new", "name": f"{NEW}_Project-Manager-Group"})
+        return await index.resolve([f"{ORG}_Project-Manager-Group", f"{NEW}_Project-Manager-Group"])
+
+    groups = asyncio.run(main())
+    assert groups[f"{NEW}_Project-Manager-Group"]["id"] == "new"
+    assert index.for_uuid(NEW) == {"Project-Manager-Group": groups[f"{NEW}_Project-Manager-Group"]}
+    # The known group is served from the index; only the new UUID is searched
+    assert kc.calls == [None, NEW]
+
+def test_miss_refetches_and_stays_none_until_the_group_exists():
+    kc = FakeKeycloak([])
+    index = GroupIndex(kc, search_limit=1)
+    name = f"{NEW}_Edge-Onboarding-Group"
+
+    async def main():
+        results = [await index.get(name), await index.get(name), (await index.resolve([name], refresh=False))[name]]
+        kc.groups.append({"id": "onb", "name": name})
+        results.append(await index.get(name))
+        # More missing prefixes than search_limit: one full reload instead of a search each
+        await index.resolve(["a", "b"])
+        return results
+
+    results = asyncio.run(main())
+    assert results[:3] == [None, None, None]
+    assert results[3]["id"] == "onb"
+    assert kc.calls == [None, NEW, NEW, None]
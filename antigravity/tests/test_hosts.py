@@ -0,0 +1,90 @@
+import asyncio
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from client_infra import AsyncInfraClient
+from config import Config
+from hosts import host_key, load_done_hosts, load_hosts
+from transport import AsyncTransport
+
+UUID = "6f1c2a4e-0b7d-4c1e-9a55-3d2f7e8b9c10"
+
+def _csv(tmp_path, text, name="hosts.csv"):
+    path = tmp_path / name
+    path.write_text(text)
+    return str(path)
+
+def test_load_hosts(tmp_path):
+    path = _csv(tmp_path, "name,serial,uuid,autoOnboard\n"
+                          "edge-1,ABC12345,,yes\n"
+                          " edge-2 ,,6F1C2A4E0B7D4C1E9A553D2F7E8B9C10,\n")
+    assert load_hosts(path, auto_onboard=False) == [
+        {"name": "edge-1", "serialNumber": "ABC12345", "uuid": None, "autoOnboard": True},
+        {"name": "edge-2", "serialNumber": None, "uuid": UUID, "autoOnboard": False},
+    ]
+    assert load_hosts(path, auto_onboard=True)[1]["autoOnboard"] is True
+
+@pytest.mark.parametrize("row,error", [
+    ("edge-1,,", "Line 2: 'serialNumber' or 'uuid' is required"),
+    ("a-name-well-over-twenty-chars,ABC12345,", "Line 2: invalid name"),
+    ("edge-1,AB-12,", "Line 2: invalid serialNumber 'AB-12'"),
+    ("edge-1,,not-a-uuid", "Line 2: invalid uuid 'not-a-uuid'"),
+    ("edge-1,ABC12345,\nedge-2,abc12345,", "Line 3: duplicate host 'abc12345'"),
+])
+def test_load_hosts_rejects_invalid_rows(tmp_path, row, error):
+    path = _csv(tmp_path, f"name,serialNumber,uuid\n{row}\n")
+    with pytest.raises(ValueError, match=error):
+        load_hosts(path)
+
+def test_resume_skips_only_hosts_marked_done(tmp_path):
+    hosts = load_hosts(_csv(tmp_path, f"name,serialNumber,uuid\na,SERIAL001,\nb,SERIAL002,\nc,,{UUID}\nd,SERIAL004,\n"))
+    results = _csv(tmp_path, "name,serialNumber,uuid,status,resourceId,error\n"
+                             "a,serial001,,registered,host-1,\n"
+                             f"c,,{UUID.upper()},exists,,\n"
+                             "b,SERIAL002,,failed,,Error Register host SERIAL002: 500 - boom\n",
+                   "hosts.results.csv")
+    assert load_done_hosts(str(tmp_path / "missing.csv")) == set()
+    done = load_done_hosts(results)
+    assert [h["name"] for h in hosts if host_key(h) not in done] == ["b", "d"]
+
+def test_retried_registration_answered_with_409_counts_as_registered():
+    """The first POST registers the host but its response is lost (502); the retry gets a 409."""
+    registered = []
+    statuses = []
+
+    async def register(request: web.Request) -> web.Response:
+        body = await request.json()
+        if registered:
+            statuses.append(409)
+            return web.json_response({"message": "host already registered"}, status=409)
+        registered.append({"resourceId": "host-1", "name": body["name"], "serialNumber": body["serialNumber"]})
+        statuses.append(502)
+        return web.json_response({}, status=502, headers={"Retry-After": "0"})
+
+    async def list_hosts(request: web.Request) -> web.Response:
+        found = [h for h in registered if request.query.get("filter") == f'serialNumber="{h["serialNumber"]}"']
+        return web.json_response({"hosts": found, "hasNext": False, "totalElements": len(found)})
+
+    async def main(monkeypatch):
+        app = web.Application()
+        app.router.add_post("/v1/projects/{project}/compute/hosts/register", register)
+        app.router.add_get("/v1/projects/{project}/compute/hosts", list_hosts)
+        server = TestServer(app)
+        await server.start_server()
+        monkeypatch.setattr(Config, "EMF_API_URL", str(server.make_url("")).rstrip("/"))
+        transport = AsyncTransport(retries=0)
+        try:
+            results = []
+            infra = AsyncInfraClient(token="t", transport=transport)
+            counts = await infra.register_hosts("p", [{"name": "edge-1", "serialNumber": "ABC12345"}],
+                                                rate=100, retries=2, on_result=results.append)
+            return counts, results
+        finally:
+            await transport.close()
+            await server.close()
+
+    with pytest.MonkeyPatch.context() as mp:
+        counts, results = asyncio.run(main(mp))
+    assert statuses == [502, 409]
+    assert counts == {"registered": 1, "exists": 0, "failed": 0}
+    assert results[0]["resourceId"] == "host-1"
@@ -0,0 +1,81 @@
+import asyncio
+import gc
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from client_infra import AsyncInfraClient
+from config import Config
+from transport import AsyncTransport
+
+def _run_hosts(scenario, fail_after=None, total=10):
+    """
+    Runs scenario(infra) against a hosts listing of `total` hosts that answers
+    500 for offsets >= fail_after. Returns (scenario result, offsets requested, loop errors).
+    """
+    offsets = []
+    errors = []
+
+    async def list_hosts(request: web.Request) -> web.Response:
+        offset, size = int(request.query["offset"]), int(request.query["pageSize"])
+        offsets.append(offset)
+        if fail_after is not None and offset >= fail_after:
+            await asyncio.sleep(0.05)
+            return web.json_response({"message": "boom"}, status=500)
+        hosts = [{"resourceId": f"host-{i:04d}", "name": f"h{i}"} for i in range(offset, min(offset + size, total))]
+        return web.json_response({"hosts": hosts, "hasNext": offset + size < total, "totalElements": total})
+
+    async def main(monkeypatch):
+        asyncio.get_running_loop().set_exception_handler(lambda loop, ctx: errors.append(ctx["message"]))
+        app = web.Application()
+        app.router.add_get("/v1/projects/{project}/compute/hosts", list_hosts)
+        server = TestServer(app)
+        await server.start_server()
+        monkeypatch.setattr(Config, "EMF_API_URL", str(server.make_url("")).rstrip("/"))
+        transport = AsyncTransport(retries=0)
+        try:
+            result = await scenario(AsyncInfraClient(token="t", transport=transport))
+            # No request outlives the iterator (the test server's own handlers run on this loop too)
+            assert not [t for t in asyncio.all_tasks() if "AsyncInfraClient" in t.get_coro().__qualname__]
+            gc.collect()
+            return result
+        finally:
+            await transport.close()
+            await server.close()
+
+    with pytest.MonkeyPatch.context() as mp:
+        result = asyncio.run(main(mp))
+    return result, offsets, errors
+
+def test_iter_hosts_stops_at_limit_and_cancels_the_prefetch():
+    async def scenario(infra):
+        return [h.name async for h in infra.iter_hosts("p", page_size=3, limit=4)]
+
+    names, offsets, errors = _run_hosts(scenario)
+    assert names == ["h0", "h1", "h2", "h3"]
+    # page_size is capped at the limit; no page is requested after the fourth host
+    assert offsets == [0, 3] and errors == []
+
+@pytest.mark.parametrize("wait", [0, 0.1])
+def test_closing_pages_early_ends_the_prefetch(wait):
+    """wait=0 closes while the second page is in flight, 0.1 after it failed."""
+    async def scenario(infra):
+        pages = infra.iter_host_pages("p", page_size=3)
+        first = await pages.__anext__()
+        await asyncio.sleep(wait)
+        await pages.aclose()
+        return [h.name for h in first]
+
+    names, _, errors = _run_hosts(scenario, fail_after=3)
+    assert names == ["h0", "h1", "h2"]
+    assert errors == []
+
+def test_iter_host_pages_reports_a_failed_page():
+    async def scenario(infra):
+        pages = []
+        with pytest.raises(Exception, match="List hosts in p: 500"):
+            async for page in infra.iter_host_pages("p", page_size=3):
+                pages.append(len(page))
+        return pages
+
+    pages, _, errors = _run_hosts(scenario, fail_after=6)
+    assert pages == [3, 3] and errors == []
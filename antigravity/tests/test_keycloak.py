@@ -0,0 +1,41 @@
+import asyncio
+from client_keycloak import AsyncKeycloakClient
+from tokens import TokenManager
+from transport import get_transport, run_sync
+
+def test_iter_users_stops_at_limit_without_leftover_tasks(cluster):
+    async def main():
+        kc = AsyncKeycloakClient()
+        await kc.login()
+        for i in range(12):
+            await kc.create_user(f"page-user-{i}", "Passw0rd!")
+        results = {}
+        for limit in (0, 1, 5, 7):
+            before = get_transport().stats.snapshot()["requests"]
+            users = [u async for u in kc.iter_users("page-user-", page_size=5, limit=limit)]
+            # Nothing keeps running once the iterator has stopped
+            assert not [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            results[limit] = (len(users), get_transport().stats.snapshot()["requests"] - before)
+        return results
+
+    results = run_sync(main())
+    assert results[0] == (0, 0)
+    assert results[1] == (1, 1)
+    assert results[5][0] == 5 and results[5][1] == 1
+    assert results[7][0] == 7
+
+def test_concurrent_logins_share_one_grant(cluster, tmp_path):
+    async def main():
+        tokens = TokenManager(path=str(tmp_path / "tokens.json"), enabled=True)
+        clients = [AsyncKeycloakClient(tokens=tokens) for _ in range(10)]
+        await asyncio.gather(*(c.login() for c in clients))
+        assert tokens.stats["password_logins"] == 1
+        assert len({c.token for c in clients}) == 1
+        await asyncio.gather(*(c.login(force=True) for c in clients))
+        assert tokens.stats["refreshes"] + tokens.stats["password_logins"] == 2
+        # A fresh manager reads the file cache and checks the password digest
+        other = TokenManager(path=str(tmp_path / "tokens.json"), enabled=True)
+        await AsyncKeycloakClient(tokens=other).login()
+        assert other.stats == {"cache_hits": 1, "refreshes": 0, "password_logins": 0}
+
+    run_sync(main())
@@ -0,0 +1,75 @@
+import asyncio
+from memberships import apply_memberships
+
+class FakeGroups:
+    def __init__(self, names):
+        self.by_name = {n: {"id": f"id-{n}", "name": n} for n in names}
+
+    async def resolve(self, names):
+        return {n: self.by_name.get(n) for n in names}
+
+class FakeKeycloak:
+    """Group memberships in memory; tracks the calls made and how many ran at once."""
+    def __init__(self, groups, members):
+        self.groups = FakeGroups(groups)
+        self.members = {u: set(names) for u, names in members.items()}
+        self.calls = []
+        self.running = 0
+        self.peak = 0
+
+    async def get_user_groups(self, user_id):
+        return [self.groups.by_name[n] for n in sorted(self.members.get(user_id, ()))]
+
+    async def _call(self, action, user_id, group_id):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        self.calls.append((action, user_id, group_id))
+        name = group_id.removeprefix("id-")
+        if action == "add":
+            self.members.setdefault(user_id, set()).add(name)
+        else:
+            self.members[user_id].discard(name)
+
+    async def add_user_to_group(self, user_id, group_id):
+        await self._call("add", user_id, group_id)
+
+    async def remove_user_from_group(self, user_id, group_id):
+        await self._call("remove", user_id, group_id)
+
+def _apply(kc, desired, **kwargs):
+    return asyncio.run(apply_memberships(kc, desired, **kwargs))
+
+def test_nothing_to_do_makes_no_calls():
+    kc = FakeKeycloak(["a", "b"], {"u1": ["a", "b"]})
+    assert _apply(kc, {"u1": ["a", "b"]}, sync=True) == []
+    assert kc.calls == []
+
+def test_adds_only_the_missing_groups():
+    kc = FakeKeycloak(["a", "b", "c"], {"u1": ["a", "c"]})
+    changes = _apply(kc, {"u1": ["a", "b"]})
+    assert [(c["action"], c["group"], c["status"]) for c in changes] == [("add", "b", "ok")]
+    # Without sync, groups that are not desired stay
+    assert kc.members["u1"] == {"a", "b", "c"}
+
+def test_sync_removes_only_groups_in_scope():
+    kc = FakeKeycloak(["a", "x-1", "x-2", "other"], {"u1": ["a", "x-1", "x-2", "other"]})
+    changes = _apply(kc, {"u1": ["a"]}, sync=True, scope=lambda name: name.startswith("x-"))
+    assert [(c["action"], c["group"], c["status"]) for c in changes] == [("remove", "x-1", "ok"), ("remove", "x-2", "ok")]
+    assert kc.members["u1"] == {"a", "other"}
+
+def test_missing_group_is_reported_not_applied():
+    kc = FakeKeycloak(["a"], {"u1": []})
+    changes = _apply(kc, {"u1": ["a", "gone"]})
+    by_group = {c["group"]: c for c in changes}
+    assert by_group["a"]["status"] == "ok"
+    assert by_group["gone"]["status"] == "missing" and by_group["gone"]["group_id"] is None
+    assert kc.calls == [("add", "u1", "id-a")]
+
+def test_calls_are_bounded_by_concurrency():
+    groups = [f"g{i}" for i in range(5)]
+    kc = FakeKeycloak(groups, {})
+    changes = _apply(kc, {f"u{i}": groups for i in range(4)}, concurrency=3)
+    assert len(changes) == 20 and all(c["status"] == "ok" for c in changes)
+    assert kc.peak == 3
@@ -0,0 +1,107 @@
+import asyncio
+import metadata
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from typer.testing import CliRunner
+from client_emf import AsyncEMFClient, STATUS_IDLE
+from config import Config
+from metadata import MetadataCache
+from transport import AsyncTransport
+
+def _cache(tmp_path, **kwargs):
+    return MetadataCache(path=str(tmp_path / "metadata.sqlite"), enabled=True, **kwargs)
+
+def test_entries_expire_after_ttl(tmp_path, monkeypatch):
+    cache = _cache(tmp_path, ttl=60)
+    now = 1_000_000.0
+    monkeypatch.setattr(metadata.time, "time", lambda: now)
+    cache.put("org", "s", "acme", "uid-1", STATUS_IDLE, ready=True)
+    cache.put_all("project", "s", [("p1", "uid-p1", STATUS_IDLE, True), ("p2", None, "PENDING", False)])
+    assert cache.get("org", "s", "acme") == ("uid-1", STATUS_IDLE)
+    assert cache.get_all("project", "s") == {"p1": "uid-p1"}
+
+    now += 61
+    assert cache.get("org", "s", "acme") is None
+    assert cache.get_all("project", "s") is None
+    assert cache.stats == {"hits": 2, "misses": 2}
+
+def test_cache_clear_and_no_cache_flag(tmp_path, monkeypatch):
+    import main
+    cache = _cache(tmp_path)
+    cache.put("org", "s", "acme", "uid-1", STATUS_IDLE, ready=True)
+    monkeypatch.setattr(metadata, "_shared", cache)
+    runner = CliRunner()
+
+    assert runner.invoke(main.app, ["cache-clear"]).exit_code == 0
+    assert cache.get("org", "s", "acme") is None
+
+    cache.put("org", "s", "acme", "uid-1", STATUS_IDLE, ready=True)
+    assert runner.invoke(main.app, ["--no-cache", "logout"]).exit_code == 0
+    assert not cache.enabled
+    # Bypassed, not cleared
+    assert cache.get("org", "s", "acme") is None
+    cache.enabled = True
+    assert cache.get("org", "s", "acme") == ("uid-1", STATUS_IDLE)
+
+def _emf_record(kind, name):
+    return {"name": name, "status": {f"{kind}Status": {"statusIndicator": STATUS_IDLE, "uID": f"uid-{name}"}}}
+
+def _run_emf(tmp_path, scenario, cache_enabled=True):
+    """Runs scenario(make_client, cache, gets) against a test tenancy API; gets counts GET requests."""
+    gets = []
+    deleted = set()
+
+    async def get(request: web.Request) -> web.Response:
+        gets.append(request.path)
+        kind, name = request.match_info["kind"][:-1], request.match_info["name"]
+        if name in deleted:
+            return web.json_response({"error": "not found"}, status=404)
+        return web.json_response(_emf_record(kind, name))
+
+    async def delete(request: web.Request) -> web.Response:
+        deleted.add(request.match_info["name"])
+        return web.json_response({})
+
+    async def main(monkeypatch):
+        app = web.Application()
+        app.router.add_get("/v1/{kind}/{name}", get)
+        app.router.add_delete("/v1/{kind}/{name}", delete)
+        server = TestServer(app)
+        await server.start_server()
+        monkeypatch.setattr(Config, "EMF_API_URL", str(server.make_url("")).rstrip("/"))
+        transport = AsyncTransport(retries=0)
+        cache = _cache(tmp_path)
+        cache.enabled = cache_enabled
+        try:
+            # A new client per call: each has its own short-lived memo, only the cache is shared
+            await scenario(lambda: AsyncEMFClient(token="t", transport=transport, cache=cache), cache, gets)
+        finally:
+            await transport.close()
+            await server.close()
+
+    with pytest.MonkeyPatch.context() as mp:
+        asyncio.run(main(mp))
+
+@pytest.mark.parametrize("enabled,expected_gets", [(True, 1), (False, 3)])
+def test_uuid_lookups_use_the_cache_unless_disabled(tmp_path, enabled, expected_gets):
+    async def scenario(client, cache, gets):
+        for _ in range(3):
+            assert await client().get_org_uuid("acme") == "uid-acme"
+        assert len(gets) == expected_gets
+
+    _run_emf(tmp_path, scenario, enabled)
+
+def test_deleting_an_org_or_project_invalidates_it(tmp_path):
+    async def scenario(client, cache, gets):
+        emf = client()
+        assert await emf.get_org_uuid("acme") == "uid-acme"
+        assert await emf.get_project_uuid("web") == "uid-web"
+        assert await emf.delete_org("acme") and await emf.delete_project("web")
+        assert cache.get("org", emf._scope("org"), "acme") is None
+        assert cache.get("project", emf._scope("project"), "web") is None
+        assert await client().get_org_uuid("acme") is None
+        assert await client().get_project_uuid("web") is None
+        assert len(gets) == 4
+
+    _run_emf(tmp_path, scenario)
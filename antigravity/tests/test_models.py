@@ -0,0 +1,48 @@
+import os
+import subprocess
+import sys
+import pytest
+from models.infra import Host, HostsList
+from models.tenancy import OrgListItem
+
+GENERATE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "models", "generate.py")
+SPEC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(GENERATE))), "openapi")
+
+@pytest.mark.skipif(not os.path.isdir(SPEC_DIR), reason="OpenAPI specs not checked out")
+def test_generated_models_are_up_to_date():
+    run = subprocess.run([sys.executable, GENERATE, "--check"], capture_output=True, text=True)
+    assert run.returncode == 0, run.stdout + run.stderr
+
+def test_round_trip_drops_unknown_and_unset_fields():
+    data = {
+        "resourceId": "host-1", "name": "edge-1", "hostStatus": "Running",
+        "currentState": "HOST_STATE_ONBOARDED",
+        "hostNics": [{"deviceName": "eth0", "somethingNew": 1}],
+        "instance": {"name": "inst-1"},
+        "notInTheSpec": {"x": 1},
+    }
+    host = Host.from_json(data)
+    assert host.name == "edge-1" and host.serial_number is None
+    assert not hasattr(host, "not_in_the_spec")
+    # Nested objects not read yet are passed through as parsed
+    assert host.to_json() == {k: v for k, v in data.items() if k != "notInTheSpec"}
+    assert host.host_nics[0].device_name == "eth0"
+    assert host.to_json()["hostNics"] == [{"deviceName": "eth0"}]
+
+def test_nested_lists_decode_once_into_tuples():
+    page = HostsList.from_json({"hosts": [{"resourceId": "host-1", "extra": True}], "hasNext": False})
+    hosts = page.hosts
+    assert isinstance(hosts, tuple) and page.hosts is hosts
+    assert page.to_json() == {"hosts": [{"resourceId": "host-1"}], "hasNext": False}
+
+def test_missing_and_empty_input():
+    assert OrgListItem.from_json(None).to_json() == {}
+    org = OrgListItem.from_json({"name": "acme"})
+    assert org.status is None and org.spec is None
+    assert org.to_json() == {"name": "acme"}
+    assert HostsList.from_json({}).hosts is None
+    assert Host.from_list(None) == []
+
+def test_enum_values_are_shared():
+    a, b = (Host.from_json({"currentState": "".join(["HOST_STATE_", "ONBOARDED"])}) for _ in range(2))
+    assert a.current_state is b.current_state
@@ -0,0 +1,69 @@
+import csv
+import io
+import json
+import sys
+import pytest
+from typer.testing import CliRunner
+from cli_common import RecordWriter, console, get_spinner, output_format, state
+
+FIELDS = ("name", "uid", "labels")
+RECORDS = [{"name": "a", "uid": "1", "labels": {"site": "x"}}, {"name": "b", "uid": "2", "labels": None}]
+
+def _write(fmt, records):
+    out = io.StringIO()
+    with RecordWriter(fmt, FIELDS, out) as writer:
+        for r in records:
+            writer.write(r)
+    return out.getvalue()
+
+@pytest.mark.parametrize("count,expected", [
+    (0, "[]\n"),
+    (1, '[\n{"name": "a", "uid": "1", "labels": {"site": "x"}}\n]\n'),
+    (2, '[\n{"name": "a", "uid": "1", "labels": {"site": "x"}},\n{"name": "b", "uid": "2", "labels": null}\n]\n'),
+])
+def test_json_array(count, expected):
+    text = _write("json", RECORDS[:count])
+    assert text == expected
+    assert json.loads(text) == RECORDS[:count]
+
+def test_ndjson():
+    text = _write("ndjson", RECORDS)
+    assert [json.loads(line) for line in text.splitlines()] == RECORDS
+    assert _write("ndjson", []) == ""
+
+def test_csv_encodes_nested_values():
+    text = _write("csv", [dict(RECORDS[0], extra="dropped"), RECORDS[1]])
+    rows = list(csv.DictReader(io.StringIO(text)))
+    assert list(rows[0]) == list(FIELDS)
+    assert json.loads(rows[0]["labels"]) == {"site": "x"}
+    assert rows[1] == {"name": "b", "uid": "2", "labels": ""}
+    assert _write("csv", []) == "name,uid,labels\r\n"
+
+@pytest.fixture
+def table_output(monkeypatch):
+    """Restores the global output format and console stream the CLI changes."""
+    monkeypatch.setitem(state, "output", "table")
+    monkeypatch.setattr(console, "file", console.file)
+    monkeypatch.setitem(state, "kc", None)
+    monkeypatch.setitem(state, "emf", None)
+
+def test_machine_formats_move_messages_to_stderr(table_output):
+    assert output_format() == "table" and not get_spinner("x").disable
+    assert output_format("JSON") == "json"
+    assert console.file is sys.stderr
+    assert get_spinner("x").disable
+    with pytest.raises(Exception, match="must be one of"):
+        output_format("yaml")
+
+def test_list_output_is_only_records_on_stdout(cluster, table_output):
+    import main
+    from client_emf import AsyncEMFClient
+    from client_keycloak import AsyncKeycloakClient
+    from transport import run_sync
+    run_sync(AsyncEMFClient(auth=AsyncKeycloakClient()).create_org("out-1", "listed"))
+
+    result = CliRunner().invoke(main.app, ["-o", "ndjson", "org", "list"])
+    assert result.exit_code == 0, result.output
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+    assert "out-1" in [r["name"] for r in records]
+    assert all(set(r) == {"name", "uid", "status", "message", "description", "timestamp"} for r in records)
@@ -0,0 +1,104 @@
+import asyncio
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from client_emf import AsyncEMFClient
+from config import Config
+from poller import Poller, org_source, wait_for_one
+from transport import AsyncTransport
+
+def test_watch_resolves_from_one_list_call_per_tick():
+    calls = []
+
+    async def fetch(keys):
+        calls.append(sorted(keys))
+        return {k: k.upper() for k in keys} if len(calls) > 1 else {}
+
+    async def main():
+        poller = Poller(interval=0.01, jitter=0)
+        poller.add_source("things", fetch)
+        return await poller.wait_for("things", ["a", "b", "c"]), poller
+
+    items, poller = asyncio.run(main())
+    assert items == {"a": "A", "b": "B", "c": "C"}
+    assert calls == [["a", "b", "c"]] * 2
+    assert len(poller.metrics()) == 3
+
+def test_wait_for_one_reports_progress_until_ready():
+    statuses = iter(["PENDING", "PENDING", "READY"])
+    seen = []
+
+    async def fetch(keys):
+        return {"acme": next(statuses)}
+
+    def ready(status):
+        seen.append(status)
+        return status == "READY"
+
+    assert asyncio.run(wait_for_one(fetch, "acme", ready, interval=0.01, jitter=0)) == "READY"
+    assert seen == ["PENDING", "PENDING", "READY"]
+
+def test_wait_for_one_times_out():
+    async def fetch(keys):
+        return {}
+
+    with pytest.raises(TimeoutError, match="resource acme"):
+        asyncio.run(wait_for_one(fetch, "acme", interval=0.01, timeout=0.05, jitter=0))
+
+def test_failed_listing_keeps_polling():
+    """A listing that fails must not read as "gone": deletions are only confirmed by a real listing."""
+    statuses = [503, 401, 200]
+    listed = []
+
+    async def orgs(request: web.Request) -> web.Response:
+        listed.append(request.path)
+        status = statuses[min(len(listed), len(statuses)) - 1]
+        return web.json_response([] if status == 200 else {"error": "unavailable"}, status=status)
+
+    async def main(monkeypatch):
+        app = web.Application()
+        app.router.add_get("/v1/orgs", orgs)
+        server = TestServer(app)
+        await server.start_server()
+        monkeypatch.setattr(Config, "EMF_API_URL", str(server.make_url("")).rstrip("/"))
+        transport = AsyncTransport(retries=0)
+        try:
+            emf = AsyncEMFClient(token="t", transport=transport)
+            poller = Poller(interval=0.01, jitter=0)
+            poller.add_source("orgs", org_source(emf))
+            gone = await poller.watch("orgs", "acme", lambda r: r is None)
+            return gone, poller
+        finally:
+            await transport.close()
+            await server.close()
+
+    with pytest.MonkeyPatch.context() as mp:
+        gone, poller = asyncio.run(main(mp))
+    assert gone is None
+    assert len(listed) == 3
+    assert poller.errors == 2
+
+def test_emf_get_distinguishes_missing_from_errors():
+    async def org(request: web.Request) -> web.Response:
+        status = int(request.match_info["name"])
+        return web.json_response({"error": "x"}, status=status)
+
+    async def main(monkeypatch):
+        app = web.Application()
+        app.router.add_get("/v1/orgs/{name}", org)
+        server = TestServer(app)
+        await server.start_server()
+        monkeypatch.setattr(Config, "EMF_API_URL", str(server.make_url("")).rstrip("/"))
+        transport = AsyncTransport(retries=0)
+        try:
+            emf = AsyncEMFClient(token="t", transport=transport)
+            assert await emf.get_org("404", fresh=True) is None
+            for status in ("401", "403", "500"):
+                with pytest.raises(Exception, match=f": {status} -"):
+                    await emf.get_org(status, fresh=True)
+        finally:
+            await transport.close()
+            await server.close()
+
+    with pytest.MonkeyPatch.context() as mp:
+        asyncio.run(main(mp))
@@ -0,0 +1,93 @@
+import yaml
+from bulk import load_manifest
+from client_emf import STATUS_IDLE, Resource
+from reconcile import Reconciler
+from utils import ONBOARDING_SUFFIX, ORG_ADMIN_PROJECT_SUFFIXES, ORG_ADMIN_SUFFIX, PROJECT_USER_SUFFIXES
+
+MANIFEST = {"orgs": [
+    {"name": "acme", "admin": {"password": "a"}, "projects": [
+        {"name": "p1", "onboarding": {"password": "o"}, "users": [{"username": "alice", "password": "u"}]},
+    ]},
+    {"name": "beta", "admin": {"password": "b"}},
+]}
+ORG_UUID = "11111111-1111-1111-1111-111111111111"
+PROJ_UUID = "22222222-2222-2222-2222-222222222222"
+
+def _reconciler(tmp_path) -> Reconciler:
+    path = tmp_path / "tenants.yaml"
+    path.write_text(yaml.safe_dump(MANIFEST))
+    reconciler = Reconciler(None, None)
+    reconciler.load(load_manifest(str(path)))
+    return reconciler
+
+def _live(reconciler: Reconciler):
+    """Every Org, Project and user of MANIFEST exists and is ready."""
+    snap, prov = reconciler.snapshot, reconciler.provisioner
+    snap.orgs = {"acme": Resource("org", "acme", None, ORG_UUID, STATUS_IDLE, None, None),
+                 "beta": Resource("org", "beta", None, "33333333-3333-3333-3333-333333333333", STATUS_IDLE, None, None)}
+    snap.projects = {"acme/p1": Resource("project", "p1", None, PROJ_UUID, STATUS_IDLE, None, None)}
+    prov.org_uuids.update({o: r.uid for o, r in snap.orgs.items()})
+    prov.proj_uuids["acme/p1"] = PROJ_UUID
+    snap.users = {u: f"id-{u}" for u in reconciler.desired}
+
+def _by_key(actions):
+    return {a.key: a for a in actions}
+
+def test_plan_from_scratch(tmp_path):
+    reconciler = _reconciler(tmp_path)
+    actions = _by_key(reconciler.plan())
+    assert actions["org:acme"].kind == "create org"
+    assert actions["org:beta"].kind == "create org"
+    for user in ("acme-admin", "acme-p1-onboard", "alice", "beta-admin"):
+        assert actions[f"user:{user}"].kind == "create user"
+
+    # The Org Admin needs its org group before it can create the Project
+    project = actions["project:acme/p1"]
+    assert project.kind == "create project"
+    assert set(project.deps) == {"org:acme", "user:acme-admin", "grant:acme-admin:org:acme"}
+
+    grant = actions["grant:alice:project:acme/p1"]
+    assert grant.suffixes == PROJECT_USER_SUFFIXES
+    assert set(grant.deps) == {"user:alice", "project:acme/p1"}
+    assert actions["grant:acme-admin:project:acme/p1"].suffixes == ORG_ADMIN_PROJECT_SUFFIXES
+    assert actions["grant:acme-p1-onboard:project:acme/p1"].suffixes == [ONBOARDING_SUFFIX]
+
+    # Dependencies always precede their dependents
+    order = [a.key for a in reconciler.plan()]
+    for a in reconciler.plan():
+        assert all(order.index(d) < order.index(a.key) for d in a.deps)
+
+def test_plan_is_empty_when_live_state_matches(tmp_path):
+    reconciler = _reconciler(tmp_path)
+    _live(reconciler)
+    for username, spec in reconciler.desired.items():
+        reconciler.snapshot.memberships[f"id-{username}"] = {
+            name for scope, suffixes in spec["groups"].items() for name in reconciler._group_names(scope, suffixes)}
+    assert reconciler.plan() == []
+
+def test_plan_adds_only_missing_memberships(tmp_path):
+    reconciler = _reconciler(tmp_path)
+    _live(reconciler)
+    reconciler.snapshot.memberships["id-alice"] = {f"{PROJ_UUID}_{PROJECT_USER_SUFFIXES[0]}"}
+    actions = [a for a in reconciler.plan() if a.key.startswith("grant:alice:")]
+    assert len(actions) == 1
+    assert actions[0].suffixes == PROJECT_USER_SUFFIXES[1:]
+    assert actions[0].deps == []   # user and project already exist
+
+def test_plan_waits_for_unready_org(tmp_path):
+    reconciler = _reconciler(tmp_path)
+    _live(reconciler)
+    del reconciler.provisioner.org_uuids["beta"]
+    actions = _by_key(reconciler.plan())
+    assert actions["org:beta"].kind == "wait for org"
+    assert actions["grant:beta-admin:org:beta"].suffixes == [ORG_ADMIN_SUFFIX]
+    assert actions["grant:beta-admin:org:beta"].deps == ["org:beta"]
+
+def test_plan_excludes_tenants_whose_snapshot_failed(tmp_path):
+    reconciler = _reconciler(tmp_path)
+    reconciler.snapshot.orgs = {"acme": Resource("org", "acme", None, ORG_UUID, STATUS_IDLE, None, None)}
+    reconciler.provisioner.org_uuids["acme"] = ORG_UUID
+    reconciler.snapshot.failed.add("acme")
+    actions = reconciler.plan()
+    assert actions
+    assert all(a.tenant == "beta" for a in actions)
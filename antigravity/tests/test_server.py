@@ -0,0 +1,105 @@
+import asyncio
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+from transport import run_sync
+
+def _serve(scenario, **kwargs):
+    """Runs scenario(client) against a Server on the shared event loop, like `main.py serve`."""
+    from client_emf import AsyncEMFClient
+    from client_keycloak import AsyncKeycloakClient
+    from server import Server
+
+    async def main():
+        kc = AsyncKeycloakClient()
+        await kc.login()
+        server = Server(kc, AsyncEMFClient(auth=kc), **kwargs)
+        client = TestClient(TestServer(server.app()))
+        await client.start_server()
+        try:
+            await scenario(client)
+        finally:
+            await client.close()
+
+    run_sync(main())
+
+def test_bearer_token_required(cluster):
+    async def scenario(client):
+        assert (await client.get("/healthz")).status == 200
+        assert (await client.get("/v1/orgs")).status == 401
+        for sent in ("Bearer nope", "Bearer s3cre", "s3cret", "Bearer s3crét"):
+            assert (await client.get("/v1/orgs", headers={"Authorization": sent})).status == 401, sent
+        assert (await client.get("/v1/orgs", headers={"Authorization": "Bearer s3cret"})).status == 200
+
+    _serve(scenario, token="s3cret")
+
+def test_invalid_requests_get_400(cluster):
+    async def scenario(client):
+        for body in ("not json", "[1]", "{}", '{"name": 5}'):
+            resp = await client.post("/v1/orgs", data=body)
+            assert resp.status == 400, body
+        assert (await client.get("/v1/users", params={"limit": "x"})).status == 400
+        resp = await client.post("/v1/users", json={"username": "u", "password": "p",
+                                                     "grants": [{"org": "acme", "role": "Boss"}]})
+        assert resp.status == 400
+        resp = await client.post("/v1/users", json={"username": "u", "password": "p",
+                                                     "grants": [{"org": "acme", "role": "Project User"}]})
+        assert resp.status == 400
+        assert (await client.get("/v1/orgs/acme/projects")).status == 400   # no password
+
+    _serve(scenario, token="")
+
+def test_unknown_org_gets_404(cluster):
+    async def scenario(client):
+        assert (await client.delete("/v1/orgs/missing")).status == 404
+
+    _serve(scenario, token="")
+
+def test_org_admin_password_checked_against_cached_session(cluster):
+    async def scenario(client):
+        resp = await client.post("/v1/orgs", json={"name": "acme", "admin_password": "Right-Pw1"})
+        assert resp.status == 201, await resp.text()
+        resp = await client.post("/v1/orgs/acme/projects", json={"name": "p1"},
+                                 headers={"X-Org-Admin-Password": "Right-Pw1"})
+        assert resp.status == 201, await resp.text()
+
+        # The session created above must not serve another password
+        for password, status in (("Right-Pw1", 200), ("wrong", 401), ("Right-Pw1", 200)):
+            resp = await client.get("/v1/orgs/acme/projects", headers={"X-Org-Admin-Password": password})
+            assert resp.status == status, password
+        names = [p["name"] for p in await (await client.get(
+            "/v1/orgs/acme/projects", headers={"X-Org-Admin-Password": "Right-Pw1"})).json()]
+        assert names == ["p1"]
+
+    _serve(scenario, token="")
+
+def test_refuses_public_address_without_token():
+    from server import Server, is_loopback
+    assert is_loopback("127.0.0.1") and is_loopback("::1") and is_loopback("localhost")
+    assert not is_loopback("0.0.0.0") and not is_loopback("example.com")
+    with pytest.raises(ValueError):
+        asyncio.run(Server(None, None, token="").start("0.0.0.0", 0))
+
+def test_work_queue_rejects_when_full():
+    from server import QueueFull, WorkQueue
+
+    async def main():
+        queue = WorkQueue(workers=1, size=1)
+        release = asyncio.Event()
+
+        async def op():
+            await release.wait()
+            return "done"
+
+        running = asyncio.create_task(queue.run("op", op))
+        await asyncio.sleep(0)
+        waiting = asyncio.create_task(queue.run("op", op))
+        await asyncio.sleep(0)
+        assert (queue.running, queue.waiting) == (1, 1)
+        with pytest.raises(QueueFull):
+            await queue.run("op", op)
+        release.set()
+        assert await asyncio.gather(running, waiting) == ["done", "done"]
+        assert queue.snapshot()["ops"]["op"]["count"] == 2
+        assert queue.snapshot()["ops"]["op"]["failed"] == 0
+
+    asyncio.run(main())
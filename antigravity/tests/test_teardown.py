@@ -0,0 +1,35 @@
+from teardown import Teardown
+
+def _teardown() -> Teardown:
+    teardown = Teardown(None, None, {"acme": "a", "beta": "b"})
+    teardown.projects = {"acme": ["p1", "p2"], "beta": []}
+    teardown.users = {
+        "acme-admin": {"id": "1", "username": "acme-admin", "tenant": "acme"},
+        "alice": {"id": "2", "username": "alice", "tenant": "acme"},
+        "beta-admin": {"id": "3", "username": "beta-admin", "tenant": "beta"},
+    }
+    return teardown
+
+def test_plan_deletes_projects_then_org_then_users():
+    actions = {a.key: a for a in _teardown().plan()}
+    assert actions["project:acme/p1"].deps == []
+    assert actions["project:acme/p2"].deps == []
+    assert actions["org:acme"].deps == ["project:acme/p1", "project:acme/p2"]
+    assert actions["org:beta"].deps == []
+    # The {org}-admin is needed until the Org delete has gone through
+    assert actions["user:acme-admin"].deps == ["org:acme"]
+    assert actions["user:alice"].deps == ["org:acme"]
+    assert actions["user:beta-admin"].deps == ["org:beta"]
+    assert {a.kind for a in actions.values()} == {"delete project", "delete org", "delete user"}
+
+def test_plan_order_respects_dependencies():
+    actions = _teardown().plan()
+    order = [a.key for a in actions]
+    for a in actions:
+        assert all(order.index(d) < order.index(a.key) for d in a.deps)
+
+def test_build_matches_plan():
+    teardown = _teardown()
+    actions = teardown.plan()
+    graph = teardown.build(actions)
+    assert list(graph.tasks) == [a.key for a in actions]
@@ -0,0 +1,121 @@
+import asyncio
+import time
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from transport import AsyncTransport, CircuitBreaker, CircuitOpenError, backoff_delay
+
+async def _serve(statuses, calls):
+    """Test server answering the n-th request with statuses[n] (the last one repeats)."""
+    async def handler(request: web.Request) -> web.Response:
+        calls.append(request.method)
+        status = statuses[min(len(calls), len(statuses)) - 1]
+        return web.json_response({"n": len(calls)}, status=status, headers={"Retry-After": "0"})
+
+    app = web.Application()
+    app.router.add_route("*", "/r", handler)
+    server = TestServer(app)
+    await server.start_server()
+    return server
+
+def _run(statuses, method="GET", **kwargs):
+    """Sends one request through a fresh transport; returns (response or exception, calls, transport)."""
+    calls = []
+
+    async def main():
+        server = await _serve(statuses, calls)
+        transport = AsyncTransport(retries=3)
+        try:
+            return await transport.request(method, str(server.make_url("/r")), **kwargs), transport
+        except Exception as e:
+            return e, transport
+        finally:
+            await transport.close()
+            await server.close()
+
+    result, transport = asyncio.run(main())
+    return result, calls, transport
+
+def test_429_is_retried_for_any_method():
+    resp, calls, transport = _run([429, 200], "POST")
+    assert resp.status_code == 200
+    assert calls == ["POST", "POST"]
+    assert transport.stats.snapshot()["throttled"] == 1
+
+def test_5xx_retried_for_idempotent_methods_only():
+    resp, calls, _ = _run([503, 502, 200], "GET")
+    assert resp.status_code == 200 and len(calls) == 3
+
+    resp, calls, _ = _run([503, 200], "POST")
+    assert resp.status_code == 503 and len(calls) == 1
+
+    resp, calls, _ = _run([503, 200], "POST", idempotent=True)
+    assert resp.status_code == 200 and len(calls) == 2
+
+def test_client_errors_are_not_retried():
+    resp, calls, _ = _run([404, 200], "GET")
+    assert resp.status_code == 404 and len(calls) == 1
+
+def test_last_response_returned_when_retries_run_out():
+    resp, calls, _ = _run([500], "DELETE", retries=2)
+    assert resp.status_code == 500 and len(calls) == 3
+
+def test_429_throttles_the_backend():
+    _, _, transport = _run([429, 200], "GET")
+    [backend] = transport.backends.values()
+    assert backend.limiter.paused_until > 0
+
+def test_breaker_opens_and_fails_fast():
+    calls = []
+
+    async def main():
+        server = await _serve([500], calls)
+        transport = AsyncTransport(retries=0)
+        url = str(server.make_url("/r"))
+        transport.backend(url).breaker.threshold = 2
+        try:
+            for _ in range(2):
+                assert (await transport.get(url)).status_code == 500
+            with pytest.raises(CircuitOpenError):
+                await transport.get(url)
+        finally:
+            await transport.close()
+            await server.close()
+
+    asyncio.run(main())
+    assert len(calls) == 2
+
+def test_breaker_half_open_allows_one_trial():
+    breaker = CircuitBreaker("test", threshold=2, cooldown=0.05)
+    breaker.failure()
+    breaker.check()
+    breaker.failure()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+    time.sleep(0.06)
+    assert breaker.state == "half-open"
+    breaker.check()
+    with pytest.raises(CircuitOpenError):
+        breaker.check()   # only one trial at a time
+
+    breaker.failure()     # a failed trial re-opens it at once
+    assert breaker.state == "open"
+    time.sleep(0.06)
+    breaker.check()
+    breaker.success()
+    assert breaker.state == "closed"
+    breaker.check()
+
+def test_breaker_disabled_with_zero_threshold():
+    breaker = CircuitBreaker("test", threshold=0, cooldown=60)
+    for _ in range(10):
+        breaker.failure()
+    assert breaker.state == "closed"
+
+def test_backoff_delay_honours_retry_after():
+    assert backoff_delay(0, "2") == 2.0
+    assert backoff_delay(0, "120") == 30.0
+    assert 0 <= backoff_delay(3, "soon") <= 4.0
+    assert 0 <= backoff_delay(10) <= 30.0
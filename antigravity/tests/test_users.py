@@ -0,0 +1,107 @@
+import asyncio
+import time
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from client_keycloak import AsyncKeycloakClient
+from config import Config
+from transport import AsyncTransport, get_transport, run_sync
+
+def _users(*names):
+    return [{"username": n, "password": "Passw0rd!"} for n in names]
+
+def test_create_users_reports_created_and_existing(cluster):
+    async def main():
+        kc = AsyncKeycloakClient()
+        await kc.create_user("cu-taken", "Passw0rd!")
+        before = get_transport().stats.snapshot()["requests"]
+        results = await kc.create_users(_users("cu-taken", "cu-new", "cu-known"), existing={"cu-known": "known-id"})
+        return results, get_transport().stats.snapshot()["requests"] - before
+
+    results, requests = run_sync(main())
+    by_name = {r["username"]: r for r in results}
+    assert by_name["cu-taken"]["status"] == "exists" and by_name["cu-taken"]["id"]
+    assert by_name["cu-new"]["status"] == "created" and by_name["cu-new"]["id"]
+    assert by_name["cu-known"] == {"username": "cu-known", "id": "known-id", "status": "exists", "error": None}
+    # Users in the snapshot are not POSTed: two POSTs plus the lookup after the 409
+    assert requests == 3
+
+def test_partial_import_batches_and_skips_existing(cluster):
+    async def main():
+        kc = AsyncKeycloakClient()
+        await kc.create_user("pi-taken", "Passw0rd!")
+        before = get_transport().stats.snapshot()["requests"]
+        results = await kc.partial_import_users(_users("pi-1", "pi-taken", "pi-2", "pi-3", "pi-4"), batch_size=2)
+        return results, get_transport().stats.snapshot()["requests"] - before
+
+    results, requests = run_sync(main())
+    assert [(r["username"], r["status"]) for r in results] == [
+        ("pi-1", "created"), ("pi-taken", "exists"), ("pi-2", "created"), ("pi-3", "created"), ("pi-4", "created")]
+    assert all(r["id"] for r in results)
+    assert requests == 3
+
+async def _keycloak(handlers, monkeypatch):
+    """Test server for the admin API routes in `handlers`; returns (server, client, transport)."""
+    app = web.Application()
+    for method, path, handler in handlers:
+        app.router.add_route(method, f"/admin/realms/{Config.KEYCLOAK_REALM}{path}", handler)
+    server = TestServer(app)
+    await server.start_server()
+    monkeypatch.setattr(Config, "KEYCLOAK_URL", str(server.make_url("")).rstrip("/"))
+    transport = AsyncTransport(retries=2)
+    kc = AsyncKeycloakClient(transport=transport)
+    # Skip the token endpoint
+    kc._session = {"access_token": "t", "expires_at": time.time() + 3600}
+    kc.token = "t"
+    return server, kc, transport
+
+def test_retried_post_answered_with_409_counts_as_created():
+    """The first POST creates the user but its response is lost (502); the retry gets a 409."""
+    users = {}
+    posts = []
+
+    async def create(request: web.Request) -> web.Response:
+        body = await request.json()
+        posts.append(body["username"])
+        if body["username"] in users:
+            return web.json_response({"errorMessage": "User exists with same username"}, status=409)
+        users[body["username"]] = {"id": f"id-{body['username']}", "username": body["username"]}
+        return web.json_response({}, status=502, headers={"Retry-After": "0"})
+
+    async def find(request: web.Request) -> web.Response:
+        user = users.get(request.query["username"])
+        return web.json_response([user] if user else [])
+
+    async def main(monkeypatch):
+        server, kc, transport = await _keycloak([("POST", "/users", create), ("GET", "/users", find)], monkeypatch)
+        try:
+            return await kc.create_users(_users("lost"))
+        finally:
+            await transport.close()
+            await server.close()
+
+    with pytest.MonkeyPatch.context() as mp:
+        results = asyncio.run(main(mp))
+    assert results == [{"username": "lost", "id": "id-lost", "status": "created", "error": None}]
+    assert posts == ["lost", "lost"]
+
+def test_failed_import_batch_is_reported_not_resent():
+    calls = []
+
+    async def partial_import(request: web.Request) -> web.Response:
+        calls.append(request.path)
+        return web.json_response({"error": "unavailable"}, status=503, headers={"Retry-After": "0"})
+
+    async def main(monkeypatch):
+        server, kc, transport = await _keycloak([("POST", "/partialImport", partial_import)], monkeypatch)
+        try:
+            return await kc.partial_import_users(_users("a", "b", "c"), batch_size=2)
+        finally:
+            await transport.close()
+            await server.close()
+
+    with pytest.MonkeyPatch.context() as mp:
+        results = asyncio.run(main(mp))
+    assert [r["status"] for r in results] == ["failed"] * 3
+    assert results[0]["error"].startswith("503")
+    assert len(calls) == 2
@@ -0,0 +1,168 @@
+import asyncio
+import hashlib
+import json
+import os
+import secrets
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from config import Config
+
+try:
+    import fcntl
+except ImportError:  # non-POSIX: fall back to the in-process lock only
+    fcntl = None
+
+class TokenManager:
+    """
+    Caches access/refresh tokens per (realm, client_id, username) in a 0600
+    JSON file so repeated CLI invocations skip Keycloak's password grant.
+
+    A cached access token is reused until shortly before it expires, then
+    renewed with grant_type=refresh_token; the password grant is only used
+    when there is no usable refresh token. Entries are bound to a salted
+    PBKDF2 digest of the password, so a wrong password never hits the cache.
+
+    The file I/O and the digest run in a worker thread, off the event loop.
+    Concurrent requests for the same user and password share one renewal.
+    """
+    def __init__(
+        self,
+        path: str = Config.TOKEN_CACHE_PATH,
+        enabled: bool = Config.TOKEN_CACHE,
+        skew: int = Config.TOKEN_REFRESH_SKEW,
+    ):
+        self.path = os.path.expanduser(path)
+        self.enabled = enabled
+        self.skew = skew
+        self._memory: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._inflight: Dict[Tuple[str, str, bool], asyncio.Future] = {}
+        self.stats = {"cache_hits": 0, "refreshes": 0, "password_logins": 0}
+
+    @staticmethod
+    def key(realm: str, client_id: str, username: str) -> str:
+        return f"{realm}|{client_id}|{username}"
+
+    @staticmethod
+    def _digest(password: str, salt: str) -> str:
+        return hashlib.pbkdf2_hmac("sha256", password.encode(), bytes.fromhex(salt), 100_000).hex()
+
+    def _locked_file(self):
+        os.makedirs(os.path.dirname(self.path), mode=0o700, exist_ok=True)
+        fd = os.open(self.path + ".lock", os.O_RDWR | os.O_CREAT, 0o600)
+        if fcntl:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        return fd
+
+    def _read(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def load(self, key: str) -> Optional[Dict]:
+        if key in self._memory:
+            return self._memory[key]
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._read().get(key)
+        if entry:
+            self._memory[key] = entry
+        return entry
+
+    def save(self, key: str, entry: Optional[Dict]):
+        if entry is None:
+            self._memory.pop(key, None)
+        else:
+            self._memory[key] = entry
+        if not self.enabled:
+            return
+        with self._lock:
+            fd = self._locked_file()
+            try:
+                data = self._read()
+                if entry is None:
+                    data.pop(key, None)
+                else:
+                    data[key] = entry
+                tmp = f"{self.path}.{os.getpid()}.tmp"
+                with open(os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w") as f:
+                    json.dump(data, f)
+                os.replace(tmp, self.path)
+            finally:
+                os.close(fd)
+
+    def _entry(self, data: Dict, password: str, salt: str) -> Dict:
+        now = time.time()
+        refresh_in = data.get("refresh_expires_in") or 0
+        return {
+            "access_token": data["access_token"],
+            "refresh_token": data.get("refresh_token"),
+            "expires_at": now + data.get("expires_in", 60),
+            # refresh_expires_in == 0 means the refresh token does not expire (offline)
+            "refresh_expires_at": now + refresh_in if refresh_in else now + 10 * 365 * 86400,
+            "salt": salt,
+            "secret": self._digest(password, salt),
+        }
+
+    async def token_for(self, kc, username: str, password: str, force: bool = False) -> Dict:
+        """
+        Returns a token entry for the user, from cache, refresh grant or password grant.
+        force=True skips the cached access token (e.g. to pick up new group claims).
+        """
+        key = self.key(kc.realm, Config.KEYCLOAK_CLIENT_ID, username)
+        flight = (key, password, force)
+        future = self._inflight.get(flight)
+        if future is None:
+            future = asyncio.ensure_future(self._token(kc, key, username, password, force))
+            self._inflight[flight] = future
+            future.add_done_callback(lambda _: self._inflight.pop(flight, None))
+        # A cancelled caller must not cancel the renewal the others are waiting for
+        return await asyncio.shield(future)
+
+    async def _token(self, kc, key: str, username: str, password: str, force: bool) -> Dict:
+        entry = self._memory.get(key)
+        if entry is None and self.enabled:
+            entry = await asyncio.to_thread(self.load, key)
+        if entry and entry.get("secret") != await asyncio.to_thread(self._digest, password, entry["salt"]):
+            entry = None
+
+        now = time.time()
+        if entry and not force and entry["expires_at"] - self.skew > now:
+            self.stats["cache_hits"] += 1
+            return entry
+
+        data = None
+        if entry and entry.get("refresh_token") and entry["refresh_expires_at"] - self.skew > now:
+            try:
+                data = await kc.refresh_grant(entry["refresh_token"])
+                self.stats["refreshes"] += 1
+            except Exception:
+                data = None  # refresh token revoked or session ended
+        if data is None:
+            data = await kc.password_grant(username, password)
+            self.stats["password_logins"] += 1
+
+        entry = await asyncio.to_thread(self._entry, data, password, entry["salt"] if entry else secrets.token_hex(16))
+        await asyncio.to_thread(self.save, key, entry)
+        return entry
+
+    def clear(self):
+        """Forgets every cached token."""
+        self._memory.clear()
+        with self._lock:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+
+_shared: Optional[TokenManager] = None
+
+def get_token_manager() -> TokenManager:
+    global _shared
+    if _shared is None:
+        _shared = TokenManager()
+    return _shared
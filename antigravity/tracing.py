@@ -0,0 +1,209 @@
+import asyncio
+import contextvars
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+from urllib.parse import urlsplit
+
+# Path segments following these collection names are identifiers
+COLLECTIONS = {
+    "realms": "realm", "users": "user", "groups": "group", "orgs": "org",
+    "projects": "project", "hosts": "host", "clusters": "cluster", "templates": "template",
+}
+# Fixed sub-resources that look like identifiers by position
+LITERALS = {"summary", "register", "count"}
+
+LATENCY_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10]
+
+def template_path(url: str) -> str:
+    """/admin/realms/master/users/<id>/groups -> /admin/realms/{realm}/users/{user}/groups"""
+    segments = urlsplit(url).path.split("/")
+    out = []
+    for i, seg in enumerate(segments):
+        prev = segments[i - 1] if i else ""
+        if seg and prev in COLLECTIONS and seg not in LITERALS:
+            out.append("{" + COLLECTIONS[prev] + "}")
+        else:
+            out.append(seg)
+    return "/".join(out)
+
+class RequestRecord:
+    __slots__ = ("method", "path", "status", "bytes", "seconds", "retry", "start")
+
+    def __init__(self, method: str, path: str, status: int, nbytes: int, seconds: float, retry: bool, start: float):
+        self.method = method
+        self.path = path
+        self.status = status
+        self.bytes = nbytes
+        self.seconds = seconds
+        self.retry = retry
+        self.start = start
+
+    def to_dict(self) -> Dict:
+        return {s: getattr(self, s) for s in self.__slots__}
+
+class Span:
+    """A logical step (create org, wait for IDLE, group sync) and the requests made under it."""
+    __slots__ = ("name", "parent", "children", "requests", "start", "end")
+
+    def __init__(self, name: str, parent: Optional["Span"] = None):
+        self.name = name
+        self.parent = parent
+        self.children: List[Span] = []
+        self.requests: List[RequestRecord] = []
+        self.start = time.monotonic()
+        self.end: Optional[float] = None
+
+    @property
+    def duration(self) -> float:
+        return (self.end or time.monotonic()) - self.start
+
+    @property
+    def path(self) -> str:
+        return self.name if self.parent is None else f"{self.parent.path}/{self.name}"
+
+    def walk(self) -> Iterator["Span"]:
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def request_count(self) -> int:
+        return sum(len(s.requests) for s in self.walk())
+
+    def to_dict(self, origin: float) -> Dict:
+        return {
+            "name": self.name,
+            "start": round(self.start - origin, 6),
+            "seconds": round(self.duration, 6),
+            "requests": [dict(r.to_dict(), start=round(r.start - origin, 6)) for r in self.requests],
+            "children": [c.to_dict(origin) for c in self.children],
+        }
+
+_current: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("antigravity_span", default=None)
+
+class Tracer:
+    """
+    Records every HTTP call made through the transport and groups them into
+    spans. Disabled by default; span() and record() are no-ops until enabled.
+
+    Spans opened in coroutines are tracked per task (contextvars); spans opened
+    by the synchronous CLI code go on a plain stack, which coroutines running
+    on the shared loop fall back to.
+    """
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.root = Span("command")
+        self._stack: List[Span] = [self.root]
+        self._lock = threading.Lock()
+
+    def current(self) -> Span:
+        return _current.get() or self._stack[-1]
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[Optional[Span]]:
+        if not self.enabled:
+            yield None
+            return
+        try:
+            asyncio.get_running_loop()
+            in_loop = True
+        except RuntimeError:
+            in_loop = False
+
+        parent = self.current()
+        span = Span(name, parent)
+        with self._lock:
+            parent.children.append(span)
+        if in_loop:
+            token = _current.set(span)
+        else:
+            self._stack.append(span)
+        try:
+            yield span
+        finally:
+            span.end = time.monotonic()
+            if in_loop:
+                _current.reset(token)
+            else:
+                self._stack.remove(span)
+
+    def record(self, method: str, url: str, status: int, nbytes: int, seconds: float, retry: bool = False):
+        if not self.enabled:
+            return
+        rec = RequestRecord(method, template_path(url), status, nbytes, seconds, retry, time.monotonic() - seconds)
+        span = self.current()
+        with self._lock:
+            span.requests.append(rec)
+
+    def finish(self):
+        self.root.end = time.monotonic()
+
+    def records(self) -> List[RequestRecord]:
+        return [r for s in self.root.walk() for r in s.requests]
+
+    def to_json(self) -> str:
+        return json.dumps(self.root.to_dict(self.root.start), indent=2)
+
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition of request counts, latency histograms, bytes and span durations."""
+        series: Dict[tuple, Dict] = {}
+        for r in self.records():
+            s = series.setdefault((r.method, r.path, str(r.status)), {
+                "count": 0, "sum": 0.0, "bytes": 0, "retries": 0, "buckets": [0] * len(LATENCY_BUCKETS)})
+            s["count"] += 1
+            s["sum"] += r.seconds
+            s["bytes"] += r.bytes
+            s["retries"] += r.retry
+            for i, le in enumerate(LATENCY_BUCKETS):
+                if r.seconds <= le:
+                    s["buckets"][i] += 1
+
+        def labels(key, **extra) -> str:
+            pairs = dict(zip(("method", "path", "status"), key), **extra)
+            return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs.items()) + "}"
+
+        lines = [
+            "# HELP antigravity_http_requests_total HTTP requests issued by the CLI.",
+            "# TYPE antigravity_http_requests_total counter",
+        ]
+        lines += [f"antigravity_http_requests_total{labels(k)} {s['count']}" for k, s in series.items()]
+        lines += [
+            "# HELP antigravity_http_request_duration_seconds HTTP request latency.",
+            "# TYPE antigravity_http_request_duration_seconds histogram",
+        ]
+        for k, s in series.items():
+            for le, n in zip(LATENCY_BUCKETS, s["buckets"]):
+                lines.append(f"antigravity_http_request_duration_seconds_bucket{labels(k, le=str(le))} {n}")
+            lines.append(f"antigravity_http_request_duration_seconds_bucket{labels(k, le='+Inf')} {s['count']}")
+            lines.append(f"antigravity_http_request_duration_seconds_sum{labels(k)} {s['sum']:.6f}")
+            lines.append(f"antigravity_http_request_duration_seconds_count{labels(k)} {s['count']}")
+        lines += [
+            "# HELP antigravity_http_response_bytes_total Response body bytes received.",
+            "# TYPE antigravity_http_response_bytes_total counter",
+        ]
+        lines += [f"antigravity_http_response_bytes_total{labels(k)} {s['bytes']}" for k, s in series.items()]
+        lines += [
+            "# HELP antigravity_http_retries_total Requests re-sent by the transport.",
+            "# TYPE antigravity_http_retries_total counter",
+        ]
+        lines += [f"antigravity_http_retries_total{labels(k)} {s['retries']}" for k, s in series.items()]
+        lines += [
+            "# HELP antigravity_span_duration_seconds Wall time of each traced step.",
+            "# TYPE antigravity_span_duration_seconds gauge",
+        ]
+        for span in self.root.walk():
+            lines.append(f'antigravity_span_duration_seconds{{span="{_escape(span.path)}"}} {span.duration:.6f}')
+        return "\n".join(lines) + "\n"
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+_shared: Optional[Tracer] = None
+
+def get_tracer() -> Tracer:
+    global _shared
+    if _shared is None:
+        _shared = Tracer()
+    return _shared
@@ -0,0 +1,392 @@
+import asyncio
+import atexit
+import json
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Coroutine, Dict, Iterator, Optional
+from urllib.parse import urlsplit
+import aiohttp
+from config import Config
+from tracing import get_tracer
+
+# Responses worth sending an idempotent request again for
+RETRY_STATUS = {429, 500, 502, 503, 504}
+IDEMPOTENT = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+class ConnectionStats:
+    """Thread-safe counters for opened connections vs. issued requests."""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.new_connections = 0
+        self.reused_connections = 0
+        self.requests = 0
+        self.retries = 0
+        self.throttled = 0
+
+    def record_connection(self):
+        with self._lock:
+            self.new_connections += 1
+
+    def record_reuse(self):
+        with self._lock:
+            self.reused_connections += 1
+
+    def record_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def record_retry(self, throttled: bool):
+        with self._lock:
+            self.retries += 1
+            self.throttled += throttled
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "new_connections": self.new_connections,
+                "reused_connections": self.reused_connections,
+                "retries": self.retries,
+                "throttled": self.throttled,
+            }
+
+class Response:
+    """Fully-read HTTP response exposing the requests-style attributes the clients use."""
+    def __init__(self, status_code: int, headers: Dict[str, str], content: bytes, url: str = ""):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+        # Set by AsyncTransport.request; > 1 when earlier attempts may have reached the server
+        self.attempts = 1
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+class CircuitOpenError(Exception):
+    pass
+
+class CircuitBreaker:
+    """
+    Fails requests fast once a backend looks down: after `threshold`
+    consecutive connection errors or 5xx responses it opens for `cooldown`
+    seconds, then lets one trial request through (half-open). A success
+    closes it again, a failure re-opens it. threshold <= 0 disables it.
+    """
+    def __init__(self, name: str, threshold: int = Config.HTTP_BREAKER_THRESHOLD,
+                 cooldown: float = Config.HTTP_BREAKER_COOLDOWN):
+        self.name = name
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial_at: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        return "half-open" if time.monotonic() - self.opened_at >= self.cooldown else "open"
+
+    def check(self):
+        """Raises CircuitOpenError unless a request may be sent now."""
+        state = self.state
+        if state == "closed":
+            return
+        now = time.monotonic()
+        # A trial that never reported back (e.g. cancelled) is replaced after another cooldown
+        if state == "half-open" and (self.trial_at is None or now - self.trial_at >= self.cooldown):
+            self.trial_at = now
+            return
+        wait = max(0.0, self.cooldown - (now - self.opened_at))
+        raise CircuitOpenError(f"{self.name} is unavailable after {self.failures} consecutive failures; "
+                               f"next attempt in {wait:.0f}s")
+
+    def success(self):
+        self.failures = 0
+        self.opened_at = None
+        self.trial_at = None
+
+    def failure(self):
+        self.failures += 1
+        if self.trial_at is not None or (self.threshold > 0 and self.failures >= self.threshold):
+            self.opened_at = time.monotonic()
+            self.trial_at = None
+
+class Backend:
+    """Rate limit and circuit breaker shared by every request to one backend (Keycloak, EMF or another host)."""
+    def __init__(self, name: str, rate: float):
+        self.name = name
+        self.limiter = TokenBucket(rate)
+        self.breaker = CircuitBreaker(name)
+
+class AsyncTransport:
+    """
+    Shared HTTP layer for the EMF and Keycloak clients.
+    One aiohttp session (keep-alive pool per host) lives on the shared event
+    loop; a semaphore bounds the number of requests in flight.
+
+    Every request waits for its backend's token bucket (KEYCLOAK_RATE,
+    EMF_RATE) and circuit breaker. 429 responses are retried for any method;
+    5xx responses and connection errors only for idempotent ones (GET, PUT,
+    DELETE, or idempotent=True), with backoff honouring Retry-After. A 429
+    also pauses and slows down the whole backend, not just the one request.
+    """
+    def __init__(
+        self,
+        pool_size: int = Config.HTTP_POOL_SIZE,
+        max_in_flight: int = Config.HTTP_MAX_IN_FLIGHT,
+        connect_timeout: float = Config.HTTP_CONNECT_TIMEOUT,
+        read_timeout: float = Config.HTTP_READ_TIMEOUT,
+        verify: bool = Config.VERIFY_SSL,
+        retries: int = Config.HTTP_RETRIES,
+    ):
+        self.pool_size = pool_size
+        self.max_in_flight = max_in_flight
+        self.timeout = aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+        self.verify = verify
+        self.retries = retries
+        self.stats = ConnectionStats()
+        self.tracer = get_tracer()
+        self.backends: Dict[str, Backend] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    def backend(self, url: str) -> Backend:
+        """The Backend for a URL: "keycloak" and "emf" by configured base URL, else one per host."""
+        if Config.KEYCLOAK_URL and url.startswith(Config.KEYCLOAK_URL):
+            name, rate = "keycloak", Config.KEYCLOAK_RATE
+        elif Config.EMF_API_URL and url.startswith(Config.EMF_API_URL):
+            name, rate = "emf", Config.EMF_RATE
+        else:
+            name, rate = urlsplit(url).netloc, 0
+        backend = self.backends.get(name)
+        if backend is None:
+            backend = self.backends[name] = Backend(name, rate)
+        return backend
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        trace = aiohttp.TraceConfig()
+
+        async def on_request(session, ctx, params):
+            self.stats.record_request()
+
+        async def on_create(session, ctx, params):
+            self.stats.record_connection()
+
+        async def on_reuse(session, ctx, params):
+            self.stats.record_reuse()
+
+        trace.on_request_start.append(on_request)
+        trace.on_connection_create_end.append(on_create)
+        trace.on_connection_reuseconn.append(on_reuse)
+        return trace
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        # Created lazily so the session binds to the loop that uses it
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_in_flight,
+                limit_per_host=self.pool_size,
+                ssl=None if self.verify else False,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self.timeout,
+                trace_configs=[self._trace_config()],
+                trust_env=True,  # honour http(s)_proxy / no_proxy
+            )
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+        return self._session
+
+    async def request(self, method: str, url: str, idempotent: Optional[bool] = None,
+                      retries: Optional[int] = None, **kwargs) -> Response:
+        """
+        Sends a request, retrying as described on the class; returns the last
+        response, or raises the last connection error or CircuitOpenError.
+        idempotent=True allows retrying a POST that is safe to repeat.
+        """
+        backend = self.backend(url)
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT
+        retries = self.retries if retries is None else retries
+        for attempt in range(retries + 1):
+            backend.breaker.check()
+            await backend.limiter.acquire()
+            try:
+                resp = await self._send(method, url, attempt > 0, **kwargs)
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                backend.breaker.failure()
+                if not idempotent or attempt == retries:
+                    raise
+                self.stats.record_retry(False)
+                await asyncio.sleep(backoff_delay(attempt))
+                continue
+            if resp.status_code >= 500:
+                backend.breaker.failure()
+            else:
+                backend.breaker.success()
+            resp.attempts = attempt + 1
+            throttled = resp.status_code == 429
+            if attempt == retries or not (throttled or (idempotent and resp.status_code in RETRY_STATUS)):
+                return resp
+            delay = backoff_delay(attempt, resp.headers.get("Retry-After"))
+            if throttled:
+                backend.limiter.throttle(delay)
+            self.stats.record_retry(throttled)
+            await asyncio.sleep(delay)
+
+    async def _send(self, method: str, url: str, retry: bool, **kwargs) -> Response:
+        """One attempt; retry=True marks a re-sent request in the trace."""
+        session = self._ensure_session()
+        async with self._slots:
+            start = time.monotonic()
+            status, body = 0, b""
+            try:
+                async with session.request(method, url, **kwargs) as resp:
+                    status = resp.status
+                    body = await resp.read()
+                    return Response(resp.status, dict(resp.headers), body, str(resp.url))
+            finally:
+                # status 0: the request failed before a response arrived
+                self.tracer.record(method, url, status, len(body), time.monotonic() - start, retry)
+
+    async def get(self, url: str, **kwargs) -> Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs) -> Response:
+        return await self.request("PUT", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs) -> Response:
+        return await self.request("DELETE", url, **kwargs)
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+class TokenBucket:
+    """
+    Allows `rate` acquisitions per second on average, in bursts of up to
+    `burst`; rate <= 0 disables it. throttle() (on a 429) halves the rate and
+    holds every caller back for the server's Retry-After; each acquisition
+    afterwards wins back 1% of the configured rate.
+    """
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = float(burst or max(1, int(rate)))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+
+    def throttle(self, pause: float = 0.0):
+        self.paused_until = max(self.paused_until, time.monotonic() + pause)
+        if self.max_rate > 0:
+            self.rate = max(self.max_rate / 16, self.rate / 2)
+
+    async def acquire(self):
+        pause = self.paused_until - time.monotonic()
+        if pause > 0:
+            await asyncio.sleep(pause)
+        if self.max_rate <= 0:
+            return
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        async with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 100)
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+def backoff_delay(attempt: int, retry_after: Optional[str] = None, base: float = 0.5, cap: float = 30.0) -> float:
+    """Seconds to wait before retry `attempt` (0-based): Retry-After if the server sent one, else full-jitter backoff."""
+    if retry_after:
+        try:
+            return min(cap, max(0.0, float(retry_after)))
+        except ValueError:
+            try:
+                return min(cap, max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time()))
+            except (TypeError, ValueError):
+                pass
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+class LoopThread:
+    """A single background event loop that synchronous callers submit coroutines to."""
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name="antigravity-loop", daemon=True)
+        self.thread.start()
+
+    def run(self, coro: Coroutine) -> Any:
+        if threading.current_thread() is self.thread:
+            raise RuntimeError("run_sync() called from the event loop; await the async client instead")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def stop(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=5)
+
+_shared: Optional[AsyncTransport] = None
+_loop: Optional[LoopThread] = None
+_shared_lock = threading.Lock()
+
+def _shutdown():
+    if _loop is not None:
+        if _shared is not None:
+            _loop.run(_shared.close())
+        _loop.stop()
+
+def get_loop() -> LoopThread:
+    global _loop
+    with _shared_lock:
+        if _loop is None:
+            _loop = LoopThread()
+            atexit.register(_shutdown)
+        return _loop
+
+def get_transport() -> AsyncTransport:
+    """Returns the process-wide transport used by default by all clients."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = AsyncTransport()
+        return _shared
+
+def run_sync(coro: Coroutine) -> Any:
+    """Runs a coroutine on the shared event loop and blocks for its result."""
+    return get_loop().run(coro)
+
+def sync_iter(agen: AsyncIterator) -> Iterator:
+    """Consumes an async generator from synchronous code, one item per loop round trip."""
+    try:
+        while True:
+            try:
+                yield run_sync(agen.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        run_sync(agen.aclose())
+
+def sync_method(name: str):
+    """Builds a blocking method that forwards to the same-named coroutine on `self.aio`."""
+    def method(self, *args, **kwargs):
+        return run_sync(getattr(self.aio, name)(*args, **kwargs))
+    method.__name__ = name
+    return method
@@ -0,0 +1,33 @@
+import csv
+from typing import Dict, List
+import yaml
+from utils import read_secret
+
+def load_users(path: str) -> List[Dict]:
+    """
+    Loads users for bulk creation from CSV (header: username,password[,email])
+    or from a YAML/JSON list (optionally under a "users" key).
+    Passwords can also come from `password_env`.
+    """
+    if path.lower().endswith(".csv"):
+        with open(path, newline="") as f:
+            rows = [dict(r) for r in csv.DictReader(f)]
+    else:
+        with open(path) as f:
+            data = yaml.safe_load(f) or []
+        rows = data.get("users", []) if isinstance(data, dict) else data
+
+    users, seen = [], set()
+    for i, row in enumerate(rows, 1):
+        username = (row.get("username") or "").strip()
+        if not username:
+            raise ValueError(f"Row {i}: 'username' is required")
+        if username.lower() in seen:
+            raise ValueError(f"Row {i}: duplicate username '{username}'")
+        seen.add(username.lower())
+        users.append({
+            "username": username,
+            "password": read_secret(row, username),
+            "email": (row.get("email") or "").strip() or None,
+        })
+    return users
@@ -1,41 +1,25 @@
-import time
-from typing import Callable, Any, Optional
-import requests
-from config import Config
+import os
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Type
 
-def poll_until(
-    action: Callable[[], Any],
-    check: Callable[[Any], bool],
-    interval: int = Config.POLL_INTERVAL,
-    timeout: int = Config.POLL_TIMEOUT,
-    description: str = "Polling...",
-    on_retry: Optional[Callable[[Any], None]] = None
-) -> Any:
-    """
-    Polls the action function until the check function returns True.
-    Returns the result of action().
-    Raises TimeoutError if timeout is reached.
-    """
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-        try:
-            result = action()
-            if check(result):
-                return result
-            
-            if on_retry:
-                on_retry(result)
-        except Exception as e:
-            # We might want to suppress transient errors or just log them
-            pass
-        
-        time.sleep(interval)
-    
-    raise TimeoutError(f"Timed out waiting for: {description}")
+if TYPE_CHECKING:
+    from transport import Response
 
-def handle_request_error(response: requests.Response, context: str):
+# Keycloak group suffixes created by EMF for every Org / Project
+ORG_ADMIN_SUFFIX = "Project-Manager-Group"
+ONBOARDING_SUFFIX = "Edge-Onboarding-Group"
+PROJECT_USER_SUFFIXES = ["Edge-Manager-Group", "Edge-Onboarding-Group", "Edge-Operator-Group", "Host-Manager-Group"]
+# Org Admin gets every project group except onboarding
+ORG_ADMIN_PROJECT_SUFFIXES = ["Edge-Manager-Group", "Edge-Operator-Group", "Host-Manager-Group"]
+# Groups per role as (scope, suffix); scope is "org" or "project"
+ROLE_SUFFIXES = {
+    "Project Admin": [("org", ORG_ADMIN_SUFFIX)],
+    "Project User": [("project", s) for s in PROJECT_USER_SUFFIXES],
+    "Onboarding": [("project", ONBOARDING_SUFFIX)],
+}
+
+def handle_request_error(response: "Response", context: str, error: Type[Exception] = Exception):
     """
-    Raises a clean exception from a failed request.
+    Raises a clean exception (of type `error`) from a failed request.
     """
     try:
         data = response.json()
@@ -43,4 +27,43 @@ def handle_request_error(response: requests.Response, context: str):
     except Exception:
         error_msg = response.text
 
-    raise Exception(f"Error {context}: {response.status_code} - {error_msg}")
+    raise error(f"Error {context}: {response.status_code} - {error_msg}")
+
+def split_group_name(name: str) -> Tuple[Optional[str], str]:
+    """Splits "{uuid}_{suffix}" group names; returns (None, name) for other groups."""
+    uuid, sep, suffix = name.partition("_")
+    if sep and len(uuid) == 36:
+        return uuid, suffix
+    return None, name
+
+def role_groups(role: str, org_uuid: str, proj_uuid: Optional[str] = None) -> List[str]:
+    """
+    Maps a role name to the Keycloak group names it requires.
+    "Project Admin" is org-wide (createProjectAdmin in kc-utils.sh),
+    "Project User" and "Onboarding" are per project.
+    """
+    if role not in ROLE_SUFFIXES:
+        raise ValueError(f"Unknown role: {role}")
+    return [f"{org_uuid if scope == 'org' else proj_uuid}_{s}" for scope, s in ROLE_SUFFIXES[role]]
+
+def read_secret(spec: Dict, what: str) -> str:
+    """Resolves `password`, `password_env` or `password_file` (e.g. a mounted secret) from a manifest entry."""
+    if spec.get("password"):
+        return str(spec["password"])
+    env = spec.get("password_env")
+    if env:
+        value = os.getenv(env)
+        if not value:
+            raise ValueError(f"{what}: environment variable {env} is not set")
+        return value
+    path = spec.get("password_file")
+    if path:
+        try:
+            with open(os.path.expanduser(path)) as f:
+                value = f.read().strip()
+        except OSError as e:
+            raise ValueError(f"{what}: cannot read {path}: {e.strerror}")
+        if not value:
+            raise ValueError(f"{what}: {path} is empty")
+        return value
+    raise ValueError(f"{what}: 'password', 'password_env' or 'password_file' is required")